@@ -0,0 +1,56 @@
+# pylint: skip-file
+"""add song indexes
+
+Indexes for the library queries: artist lookups (with title / album as
+tie-breakers), case-insensitive sorts on title, artist and album, and the
+date_added, year and video_id columns.
+
+Revision ID: 3b7c9e2d41a6
+Revises: f4e41e18858a
+Create Date: 2026-10-18 12:00:00
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3b7c9e2d41a6"
+down_revision: Union[str, None] = "f4e41e18858a"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SONG_INDEXES = {
+    "ix_songs_artist_title": ["artist", "title"],
+    "ix_songs_artist_album": ["artist", "album"],
+    "ix_songs_title_nocase": [sa.text("title COLLATE NOCASE")],
+    "ix_songs_artist_nocase": [sa.text("artist COLLATE NOCASE")],
+    "ix_songs_album_nocase": [sa.text("album COLLATE NOCASE")],
+    "ix_songs_date_added": ["date_added"],
+    "ix_songs_year": ["year"],
+    "ix_songs_video_id": ["video_id"],
+}
+
+
+def _existing_indexes() -> set:
+    # ensure_db_schema may already have created them from the model
+    inspector = sa.inspect(op.get_bind())
+    return {index["name"] for index in inspector.get_indexes("songs")}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    existing = _existing_indexes()
+    for name, columns in SONG_INDEXES.items():
+        if name not in existing:
+            op.create_index(name, "songs", columns)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    existing = _existing_indexes()
+    for name in SONG_INDEXES:
+        if name in existing:
+            op.drop_index(name, table_name="songs")
@@ -0,0 +1,69 @@
+# pylint: skip-file
+"""song sort indexes with id
+
+Keyset pagination orders songs by (sort column, id), so each sort index
+gains id as its last column.
+
+Revision ID: 8e1f0a5c7d92
+Revises: 3b7c9e2d41a6
+Create Date: 2026-10-18 13:00:00
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8e1f0a5c7d92"
+down_revision: Union[str, None] = "3b7c9e2d41a6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (old index, new index, sort column)
+SORT_INDEXES = [
+    (
+        "ix_songs_title_nocase",
+        "ix_songs_title_nocase_id",
+        sa.text("title COLLATE NOCASE"),
+    ),
+    (
+        "ix_songs_artist_nocase",
+        "ix_songs_artist_nocase_id",
+        sa.text("artist COLLATE NOCASE"),
+    ),
+    (
+        "ix_songs_album_nocase",
+        "ix_songs_album_nocase_id",
+        sa.text("album COLLATE NOCASE"),
+    ),
+    ("ix_songs_date_added", "ix_songs_date_added_id", "date_added"),
+    ("ix_songs_year", "ix_songs_year_id", "year"),
+]
+
+
+def _existing_indexes() -> set:
+    # ensure_db_schema may already have created the new ones from the model
+    inspector = sa.inspect(op.get_bind())
+    return {index["name"] for index in inspector.get_indexes("songs")}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    existing = _existing_indexes()
+    for old, new, column in SORT_INDEXES:
+        if new not in existing:
+            op.create_index(new, "songs", [column, "id"])
+        if old in existing:
+            op.drop_index(old, table_name="songs")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    existing = _existing_indexes()
+    for old, new, column in SORT_INDEXES:
+        if old not in existing:
+            op.create_index(old, "songs", [column])
+        if new in existing:
+            op.drop_index(new, table_name="songs")
@@ -0,0 +1,84 @@
+# pylint: skip-file
+"""move cold song columns to side tables
+
+Lyrics go to song_lyrics and the description and raw YouTube metadata to
+song_details, keyed by song id, so scans of songs read far fewer pages.
+
+Revision ID: 5d2a9c4e7b13
+Revises: 8e1f0a5c7d92
+Create Date: 2026-10-18 14:00:00
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5d2a9c4e7b13"
+down_revision: Union[str, None] = "8e1f0a5c7d92"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SIDE_TABLES = {
+    "song_lyrics": ["plain_lyrics", "synced_lyrics"],
+    "song_details": [
+        "description",
+        "youtube_thumbnail_urls",
+        "youtube_tags",
+        "youtube_categories",
+        "youtube_raw_metadata",
+    ],
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    inspector = sa.inspect(op.get_bind())
+    existing_tables = inspector.get_table_names()
+    song_columns = {column["name"] for column in inspector.get_columns("songs")}
+    moved = False
+    for table, columns in SIDE_TABLES.items():
+        # ensure_db_schema may already have created the table from the model
+        if table not in existing_tables:
+            op.create_table(
+                table,
+                sa.Column(
+                    "song_id",
+                    sa.String(),
+                    sa.ForeignKey("songs.id", ondelete="CASCADE"),
+                    primary_key=True,
+                ),
+                *(sa.Column(column, sa.Text(), nullable=True) for column in columns),
+            )
+        legacy = [column for column in columns if column in song_columns]
+        if not legacy:
+            continue
+        names = ", ".join(legacy)
+        has_value = " OR ".join(f"{column} IS NOT NULL" for column in legacy)
+        op.execute(
+            f"INSERT OR IGNORE INTO {table} (song_id, {names}) "
+            f"SELECT id, {names} FROM songs WHERE {has_value}"
+        )
+        for column in legacy:
+            op.drop_column("songs", column)
+        moved = True
+    if moved:
+        # Dropped columns leave each songs page as sparse as before;
+        # rebuilding the file packs the narrow rows densely
+        with op.get_context().autocommit_block():
+            op.execute("VACUUM")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table, columns in SIDE_TABLES.items():
+        for column in columns:
+            op.add_column("songs", sa.Column(column, sa.Text(), nullable=True))
+        assignments = ", ".join(
+            f"{column} = (SELECT {column} FROM {table} WHERE song_id = songs.id)"
+            for column in columns
+        )
+        op.execute(f"UPDATE songs SET {assignments}")
+        op.drop_table(table)
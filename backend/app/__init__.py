@@ -11,6 +11,7 @@ from .api import register_blueprints
 from .config import get_config
 from .jobs import init_celery
 from .utils.error_handlers import register_error_handlers
+from .utils.query_stats import register_query_stats
 from .websockets import init_socketio
 
 
@@ -53,5 +54,8 @@ def create_app(config_class=None):
     register_blueprints(app)
     # Register global error handlers
     register_error_handlers(app)
+    # Report per-request SQL statistics and check query budgets
+    if app.config.get("SQL_STATS"):
+        register_query_stats(app)
 
     return app
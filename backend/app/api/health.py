@@ -6,3 +6,30 @@ health_bp = Blueprint("health", __name__, url_prefix="/api")
 @health_bp.route("/health", methods=["GET"])
 def health():
     return jsonify({"status": "ok"}), 200
+
+
+@health_bp.route("/health/events", methods=["GET"])
+def event_metrics():
+    """
+    Event bus queue depth, drop count and handler latency, the events and
+    bytes broadcast per job, the job event journal's write counters and the
+    messages relayed over the event transport.
+    """
+    from app.services.job_journal import get_job_journal
+    from app.utils.event_transport import get_event_relay
+    from app.utils.events import event_bus
+    from app.websockets.job_throttle import get_broadcast_stats
+
+    journal = get_job_journal()
+    relay = get_event_relay()
+    return (
+        jsonify(
+            dict(
+                event_bus.get_metrics(),
+                broadcast=get_broadcast_stats(),
+                journal=journal.get_metrics() if journal is not None else {},
+                transport=relay.get_metrics() if relay is not None else {},
+            )
+        ),
+        200,
+    )
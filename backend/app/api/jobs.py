@@ -5,6 +5,7 @@ These endpoints provide access to job processing and status.
 
 from app.db.models import JobStatus
 from app.services import JobsService
+from app.utils.fast_json import json_response
 from flask import Blueprint, jsonify, request
 
 jobs_bp = Blueprint("jobs", __name__, url_prefix="/api/jobs")
@@ -18,36 +19,54 @@ def get_job_status():
     return jsonify(stats)
 
 
+def _parse_statuses(value):
+    """Parse a comma-separated status filter; raises ValueError if invalid."""
+    if not value:
+        return None
+    return [JobStatus(status.strip()) for status in value.split(",") if status.strip()]
+
+
+def _jobs_page(statuses=None, include_dismissed=False, dismissed_only=False):
+    """List one page of jobs using the request's limit and cursor arguments."""
+    try:
+        jobs, next_cursor = jobs_service.list_jobs(
+            statuses=statuses,
+            include_dismissed=include_dismissed,
+            limit=request.args.get("limit", type=int),
+            cursor=request.args.get("cursor") or None,
+            dismissed_only=dismissed_only,
+        )
+    except ValueError:
+        return jsonify({"error": "Invalid cursor"}), 400
+    return json_response(
+        {"jobs": jobs_service.serialize_jobs(jobs), "nextCursor": next_cursor}
+    )
+
+
 @jobs_bp.route("/", methods=["GET"])
 def get_jobs():
-    """List all jobs with their status"""
+    """
+    List jobs, newest first, one page at a time.
+
+    Query parameters: status (comma-separated), include_dismissed, limit and
+    cursor (the nextCursor of the previous page).
+    """
     status_filter = request.args.get("status", None)
     include_dismissed = request.args.get("include_dismissed", "false").lower() == "true"
 
-    if status_filter:
-        try:
-            status = JobStatus(status_filter)
-            jobs = jobs_service.get_jobs_by_status(status)
-            # Filter dismissed jobs unless explicitly requested
-            if not include_dismissed:
-                jobs = [job for job in jobs if not job.dismissed]
-        except ValueError:
-            return jsonify({"error": f"Invalid status: {status_filter}"}), 400
-    else:
-        # Default to active jobs (non-dismissed) unless explicitly requested
-        if include_dismissed:
-            jobs = jobs_service.get_all_jobs(include_dismissed=True)
-        else:
-            jobs = jobs_service.get_active_jobs()
+    try:
+        statuses = _parse_statuses(status_filter)
+    except ValueError:
+        return jsonify({"error": f"Invalid status: {status_filter}"}), 400
 
-    return jsonify({"jobs": [job.to_dict() for job in jobs]})
+    # Default to active jobs (non-dismissed) unless explicitly requested
+    return _jobs_page(statuses, include_dismissed=include_dismissed)
 
 
 @jobs_bp.route("/dismissed", methods=["GET"])
 def get_dismissed_jobs():
-    """List all dismissed jobs"""
-    jobs = jobs_service.get_dismissed_jobs()
-    return jsonify({"jobs": [job.to_dict() for job in jobs]})
+    """List dismissed jobs, newest first, one page at a time"""
+    return _jobs_page(dismissed_only=True)
 
 
 @jobs_bp.route("/<job_id>", methods=["GET"])
@@ -61,6 +80,17 @@ def get_job(job_id):
     return jsonify(job_details)
 
 
+@jobs_bp.route("/<job_id>/events", methods=["GET"])
+def get_job_events(job_id):
+    """Get the journaled event history of a job and its phase durations"""
+    history = jobs_service.get_job_events(job_id)
+
+    if not history["events"] and not jobs_service.get_job(job_id):
+        return jsonify({"error": "Job not found"}), 404
+
+    return json_response(history)
+
+
 @jobs_bp.route("/<job_id>/cancel", methods=["POST"])
 def cancel_job(job_id):
     """Cancel a pending or in-progress job"""
@@ -1,70 +1,45 @@
 """Songs API Artists Module"""
 
 from app.db.database import get_db_session
-from app.db.models.song import DbSong
+from app.db.models.song import SONG_FIELDS, DbSong
 from app.exceptions import DatabaseError, ValidationError
+from app.repositories.artist_repository import ArtistRepository
 from app.repositories.song_repository import SongRepository
 from app.schemas.song import Song
 from app.utils.error_handlers import handle_api_error
+from app.utils.library_cache import library_cached
+from app.utils.query_stats import query_budget
+from app.utils.validation import parse_fields_param
 from flask import jsonify, request
 
 from . import logger, song_bp
 
 
 @song_bp.route("/artists", methods=["GET"])
+@query_budget(7)
+@library_cached
 @handle_api_error
 def get_artists():
     """Get all unique artists with song counts and optional filtering.
 
     Query Parameters:
         search: Optional search term to filter artists
+        letter: Optional first letter to filter artists
         limit: Maximum number of artists to return (default: 100)
         offset: Number of artists to skip (default: 0)
     """
     try:
         search_term = request.args.get("search", "").strip()
+        letter = request.args.get("letter", "").strip()
         limit = min(int(request.args.get("limit", 100)), 200)  # Cap at 200
         offset = int(request.args.get("offset", 0))
 
-        # Get artists with song counts from database
+        # Read from the artist summaries, not the songs table
         with get_db_session() as session:
-            repo = SongRepository(session)
-            from sqlalchemy import func
-
-            artists_query = session.query(
-                DbSong.artist,
-                func.count(DbSong.id).label(
-                    "song_count"
-                ),  # pylint: disable=not-callable
+            artists, total_count = ArtistRepository(session).fetch_page(
+                search=search_term, letter=letter, limit=limit, offset=offset
             )
-            if search_term:
-                artists_query = artists_query.filter(
-                    DbSong.artist.ilike(f"%{search_term}%")
-                )
-            artists_query = artists_query.group_by(DbSong.artist).order_by(
-                DbSong.artist
-            )
-            artists = artists_query.offset(offset).limit(limit).all()
-            artists = [
-                {
-                    "name": artist,
-                    "songCount": song_count,
-                    "firstLetter": artist[0].upper() if artist else "?",
-                }
-                for artist, song_count in artists
-            ]
-
-        total_count = 0
-        with get_db_session() as session:
-            repo = SongRepository(session)
-            from sqlalchemy import func
-
-            total_query = session.query(DbSong.artist).distinct()
-            if search_term:
-                total_query = total_query.filter(
-                    DbSong.artist.ilike(f"%{search_term}%")
-                )
-            total_count = total_query.count()
+            artists = [artist.to_dict() for artist in artists]
 
         response = {
             "artists": artists,
@@ -97,7 +72,40 @@ def get_artists():
         )
 
 
+@song_bp.route("/artists/letters", methods=["GET"])
+@query_budget(6)
+@handle_api_error
+def get_artist_letters():
+    """Get the letters artists are listed under, for jump navigation.
+
+    Each letter comes with its number of artists and the offset of its first
+    artist in /artists (with the same search).
+
+    Query Parameters:
+        search: Optional search term to filter artists
+    """
+    try:
+        search_term = request.args.get("search", "").strip()
+        with get_db_session() as session:
+            letters = ArtistRepository(session).fetch_letters(search=search_term)
+        return jsonify({"letters": letters})
+
+    except ConnectionError as e:
+        raise DatabaseError(
+            "Database connection failed while fetching artist letters",
+            "DATABASE_CONNECTION_ERROR",
+            {"error": str(e)},
+        )
+    except Exception as e:
+        raise DatabaseError(
+            "Unexpected error fetching artist letters",
+            "ARTIST_LETTERS_FETCH_ERROR",
+            {"error": str(e)},
+        )
+
+
 @song_bp.route("/by-artist/<string:artist_name>", methods=["GET"])
+@query_budget(4)
 @handle_api_error
 def get_songs_by_artist_route(artist_name: str):
     """Get songs for a specific artist with pagination.
@@ -107,12 +115,14 @@ def get_songs_by_artist_route(artist_name: str):
         offset: Number of songs to skip (default: 0)
         sort: Sort order - 'title', 'album', 'year', 'dateAdded' (default: 'title')
         direction: 'asc' or 'desc' (default: 'asc')
+        fields: Comma-separated song fields to return (default: all)
     """
     try:
         limit = min(int(request.args.get("limit", 20)), 100)  # Cap at 100 per page
         offset = int(request.args.get("offset", 0))
         sort_by = request.args.get("sort", "title")
         direction = request.args.get("direction", "asc")
+        fields = parse_fields_param(request.args.get("fields"), SONG_FIELDS)
 
         # Validate sort parameters
         valid_sorts = ["title", "album", "year", "dateAdded"]
@@ -131,7 +141,11 @@ def get_songs_by_artist_route(artist_name: str):
         # Get songs for artist from database
         with get_db_session() as session:
             repo = SongRepository(session)
-            base_query = session.query(DbSong).filter(DbSong.artist == artist_name)
+            base_query = (
+                session.query(DbSong)
+                .options(*repo.load_options(fields))
+                .filter(DbSong.artist == artist_name)
+            )
             sort_field = getattr(DbSong, sort_by, DbSong.title)
             if direction.lower() == "desc":
                 base_query = base_query.order_by(sort_field.desc())
@@ -142,10 +156,13 @@ def get_songs_by_artist_route(artist_name: str):
             songs_data = {"songs": songs, "total": total_count}
 
             # Convert DbSong objects to Pydantic Song models for API response
-            songs = [
-                Song.model_validate(song.to_dict()).model_dump()
-                for song in songs_data["songs"]
-            ]
+            if fields is not None:
+                songs = [song.to_dict(fields) for song in songs_data["songs"]]
+            else:
+                songs = [
+                    Song.model_validate(song.to_dict()).model_dump()
+                    for song in songs_data["songs"]
+                ]
             total_count = songs_data["total"]
 
             response = {
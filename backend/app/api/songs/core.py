@@ -3,6 +3,7 @@
 import uuid
 
 from app.db.database import get_db_session
+from app.db.models.song import SONG_FIELDS
 from app.exceptions import (
     DatabaseError,
     FileOperationError,
@@ -15,18 +16,30 @@ from app.schemas.requests import CreateSongRequest, UpdateSongRequest
 from app.schemas.song import Song
 from app.services.file_service import FileService
 from app.utils.error_handlers import handle_api_error
-from app.utils.validation import validate_json_request
+from app.utils.library_cache import library_cached
+from app.utils.query_stats import query_budget
+from app.utils.validation import parse_fields_param, validate_json_request
 from flask import jsonify, request
 
 from . import logger, song_bp
 
+# Songs per page when paging by cursor without a limit
+SONGS_PAGE_SIZE = 100
+
 
 @song_bp.route("", methods=["GET"])
+@query_budget(5)
+@library_cached
 @handle_api_error
 def get_songs():
     """
     Endpoint to get a list of processed songs with metadata.
-    Supports query params: limit, offset, sort_by, direction.
+    Supports query params: limit, offset, sort_by, direction, and fields (a
+    comma-separated list of song fields to return instead of all of them).
+
+    With a cursor param (empty for the first page) pages are read by keyset
+    instead of offset, and the response is {"songs": [...], "nextCursor"},
+    where nextCursor is the cursor of the following page (null on the last).
     """
     logger.info("Received request for /api/songs")
 
@@ -37,23 +50,47 @@ def get_songs():
         offset = request.args.get("offset", type=int, default=0)
         sort_by = request.args.get("sort_by", default="date_added")
         direction = request.args.get("direction", default="desc").lower()
+        fields = parse_fields_param(request.args.get("fields"), SONG_FIELDS)
 
         # Validate sort_by
         valid_sort_fields = {"date_added", "title", "artist", "album", "year"}
         if sort_by not in valid_sort_fields:
             sort_by = "date_added"
 
+        if "cursor" in request.args:
+            with get_db_session() as session:
+                try:
+                    songs, next_cursor = SongRepository(session).fetch_page(
+                        sort_by=sort_by,
+                        direction=direction,
+                        limit=limit or SONGS_PAGE_SIZE,
+                        cursor=request.args.get("cursor") or None,
+                        fields=fields,
+                    )
+                except ValueError as e:
+                    raise ValidationError("Invalid cursor", "INVALID_CURSOR") from e
+                response_data = [song.to_dict(fields) for song in songs]
+
+            logger.info("Returning %s songs.", len(response_data))
+            return jsonify({"songs": response_data, "nextCursor": next_cursor})
+
         with get_db_session() as session:
             repo = SongRepository(session)
             # Build filters dict if needed (currently none)
             songs = repo.fetch_all(
-                sort_by=sort_by, direction=direction, limit=limit, offset=offset
+                sort_by=sort_by,
+                direction=direction,
+                limit=limit,
+                offset=offset,
+                fields=fields,
             )
-            response_data = [song.to_dict() for song in songs]
+            response_data = [song.to_dict(fields) for song in songs]
 
         logger.info("Returning %s songs.", len(response_data))
         return jsonify(response_data)
 
+    except ValidationError:
+        raise  # Let error handlers deal with it
     except ConnectionError as e:
         logger.error(
             "Database connection failed retrieving songs: %s", e, exc_info=True
@@ -73,21 +110,29 @@ def get_songs():
 
 
 @song_bp.route("/<string:song_id>", methods=["GET"])
+@query_budget(3)
 @handle_api_error
 def get_song_details(song_id: str):
-    """Endpoint to get details for a specific song - direct database access."""
+    """
+    Endpoint to get details for a specific song - direct database access.
+    Supports the fields query param, like the song list.
+    """
     logger.info("Received request for song details: %s", song_id)
 
     try:
+        fields = parse_fields_param(request.args.get("fields"), SONG_FIELDS)
         # Get song directly from database
         with get_db_session() as session:
             repo = SongRepository(session)
-            db_song = repo.fetch(song_id)
+            db_song = repo.fetch(song_id, fields)
         if not db_song:
             raise ResourceNotFoundError("Song", song_id)
 
-        song = Song.model_validate(db_song.to_dict())
-        response = song.model_dump(mode="json")
+        if fields is not None:
+            response = db_song.to_dict(fields)
+        else:
+            song = Song.model_validate(db_song.to_dict())
+            response = song.model_dump(mode="json")
 
         logger.info("Returning details for song %s", song_id)
         return jsonify(response), 200
@@ -1,17 +1,28 @@
 """Songs API Search Module"""
 
+from collections import defaultdict
+
 from app.db.database import get_db_session
-from app.db.models.song import DbSong
+from app.db.models.song import SONG_FIELDS, DbSong
 from app.exceptions import DatabaseError, ValidationError
+from app.repositories.song_repository import SongRepository
 from app.schemas.song import Song
 from app.utils.error_handlers import handle_api_error
+from app.utils.library_cache import library_cached
+from app.utils.query_stats import query_budget
+from app.utils.validation import parse_fields_param
 from flask import jsonify, request
 from sqlalchemy import func, or_
 
 from . import logger, song_bp
 
+# Songs listed under each artist when grouping search results by artist
+ARTIST_SAMPLE_SONGS = 5
+
 
 @song_bp.route("/search", methods=["GET"])
+@query_budget(6)
+@library_cached
 @handle_api_error
 def search_songs():
     """Enhanced search with pagination and artist grouping options.
@@ -23,6 +34,7 @@ def search_songs():
         group_by_artist: If true, group results by artist (default: false)
         sort: Sort order (default: 'relevance')
         direction: 'asc' or 'desc' (default: 'desc')
+        fields: Comma-separated song fields to return (default: all)
     """
     try:
         query = request.args.get("q", "").strip()
@@ -44,6 +56,7 @@ def search_songs():
         group_by_artist = request.args.get("group_by_artist", "false").lower() == "true"
         sort_by = request.args.get("sort", "relevance")
         direction = request.args.get("direction", "desc")
+        fields = parse_fields_param(request.args.get("fields"), SONG_FIELDS)
 
         # Validate parameters
         if direction not in ["asc", "desc"]:
@@ -72,19 +85,35 @@ def search_songs():
                 )
                 total_artists = artist_query.count()
                 artist_results = artist_query.offset(offset).limit(limit).all()
+                # The first songs of every artist on the page in one query
+                rank = (
+                    func.row_number()  # pylint: disable=not-callable
+                    .over(partition_by=DbSong.artist, order_by=DbSong.id)
+                    .label("artist_rank")
+                )
+                ranked = (
+                    session.query(DbSong.id, rank)
+                    .filter(DbSong.artist.in_([artist for artist, _ in artist_results]))
+                    .subquery()
+                )
+                songs_by_artist = defaultdict(list)
+                for song in (
+                    session.query(DbSong)
+                    .options(*SongRepository.load_options(fields))
+                    .join(ranked, ranked.c.id == DbSong.id)
+                    .filter(ranked.c.artist_rank <= ARTIST_SAMPLE_SONGS)
+                    .order_by(DbSong.id)
+                ):
+                    songs_by_artist[song.artist].append(song.to_dict(fields))
                 artists_data = []
                 total_songs = 0
                 for artist, count in artist_results:
-                    songs_query = (
-                        session.query(DbSong).filter(DbSong.artist == artist).limit(5)
-                    )
-                    songs = songs_query.all()
                     total_songs += count
                     artists_data.append(
                         {
                             "artist": artist,
                             "songCount": count,
-                            "songs": songs,
+                            "songs": songs_by_artist[artist],
                         }
                     )
                 search_results = {
@@ -99,7 +128,11 @@ def search_songs():
                     },
                 }
             else:
-                base_query = session.query(DbSong).filter(search_filter)
+                base_query = (
+                    session.query(DbSong)
+                    .options(*SongRepository.load_options(fields))
+                    .filter(search_filter)
+                )
                 if sort_by == "relevance":
                     base_query = base_query.order_by(
                         DbSong.title,
@@ -136,10 +169,13 @@ def search_songs():
             }
         else:
             # Flat list of songs - convert using new pattern
-            songs = [
-                Song.model_validate(song.to_dict()).model_dump()
-                for song in search_results["songs"]
-            ]
+            if fields is not None:
+                songs = [song.to_dict(fields) for song in search_results["songs"]]
+            else:
+                songs = [
+                    Song.model_validate(song.to_dict()).model_dump()
+                    for song in search_results["songs"]
+                ]
             response = {"songs": songs, "pagination": search_results["pagination"]}
 
         logger.info(
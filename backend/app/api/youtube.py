@@ -3,7 +3,13 @@ import logging
 
 from app.api.responses import success_response
 from app.exceptions import NetworkError, ServiceError, ValidationError
-from app.schemas.requests import YouTubeDownloadRequest
+from app.config import get_config
+from app.schemas.requests import YouTubeDownloadRequest, YouTubeImportRequest
+from app.services.admission_service import (
+    AdmissionService,
+    get_client_id,
+    song_in_karaoke_queue,
+)
 from app.services.youtube_service import YouTubeService
 from app.utils.error_handlers import handle_api_error
 from app.utils.validation import validate_json_request
@@ -66,6 +72,14 @@ def search_youtube_endpoint():
 def download_youtube_endpoint(validated_data: YouTubeDownloadRequest):
     """Download and process YouTube video - thin controller delegating to service"""
 
+    # Refuse new work up front when the separation backlog is full
+    client_id = get_client_id(request)
+    admission = AdmissionService().admit(
+        client_id,
+        song_duration_ms=validated_data.durationMs,
+        for_karaoke_queue=song_in_karaoke_queue(validated_data.song_id),
+    )
+
     # Delegate to service layer for job creation and orchestration
     # The service will handle song creation if needed
     youtube_service = YouTubeService()
@@ -74,6 +88,8 @@ def download_youtube_endpoint(validated_data: YouTubeDownloadRequest):
         video_id_or_url=validated_data.video_id,
         artist=validated_data.artist or "",
         title=validated_data.title or "",
+        client_id=client_id,
+        duration_ms=validated_data.durationMs,
     )
 
     logger.info(
@@ -88,7 +104,65 @@ def download_youtube_endpoint(validated_data: YouTubeDownloadRequest):
             "jobId": job_id,
             "status": "pending",
             "message": "YouTube processing job created",
+            **admission.to_dict(),
         },
         message="YouTube processing started",
         status_code=202,
     )
+
+
+@youtube_bp.route("/import", methods=["POST"])
+@handle_api_error
+@validate_json_request(YouTubeImportRequest)
+def import_youtube_endpoint(validated_data: YouTubeImportRequest):
+    """Import a playlist or a list of videos as one parent job - thin controller"""
+    max_videos = get_config().BULK_IMPORT_MAX_VIDEOS
+    youtube_service = YouTubeService()
+
+    if validated_data.playlistUrl:
+        videos = youtube_service.get_playlist_entries(
+            validated_data.playlistUrl, max_entries=max_videos
+        )
+        if not videos:
+            raise ValidationError("Playlist has no videos", "EMPTY_PLAYLIST")
+    else:
+        videos = [{"video_id": video_id} for video_id in validated_data.videoIds]
+        if len(videos) > max_videos:
+            raise ValidationError(
+                f"At most {max_videos} videos can be imported at once",
+                "TOO_MANY_VIDEOS",
+                {"maxVideos": max_videos},
+            )
+
+    # The whole import is admitted or refused as one request
+    client_id = get_client_id(request)
+    admission_service = AdmissionService()
+    admission = admission_service.admit(
+        client_id,
+        cost_seconds=sum(
+            admission_service.job_cost_seconds(video.get("duration_ms"))
+            for video in videos
+        ),
+    )
+
+    result = youtube_service.import_videos_async(
+        videos, client_id=client_id, source=validated_data.playlistUrl
+    )
+
+    logger.info(
+        "YouTube import %s queued %s videos, skipped %s",
+        result["parentJobId"],
+        len(result["jobs"]),
+        len(result["skipped"]),
+    )
+
+    if not result["jobs"]:
+        return success_response(
+            data=result, message="All videos are already in the library"
+        )
+
+    return success_response(
+        data={**result, **admission.to_dict()},
+        message=f"Importing {len(result['jobs'])} videos",
+        status_code=202,
+    )
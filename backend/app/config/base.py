@@ -76,6 +76,122 @@ class BaseConfig:
         "CELERY_RESULT_BACKEND", "redis://localhost:6379/0"
     )
 
+    # SQLite connection profile: durable, balanced or throughput (see
+    # app/db/sqlite_profiles.py)
+    SQLITE_PROFILE = os.environ.get("SQLITE_PROFILE", "balanced")
+
+    # Let ensure_db_schema move cold song columns into song_lyrics and
+    # song_details on startup (drops them from songs and runs VACUUM).
+    # Normally Alembic migration 5d2a9c4e7b13 does this
+    MIGRATE_SONG_SIDE_COLUMNS_ON_BOOT = (
+        os.environ.get("MIGRATE_SONG_SIDE_COLUMNS_ON_BOOT", "false").lower() == "true"
+    )
+
+    # Per-request SQL statistics (see app/utils/query_stats.py): query count
+    # and time as response headers, a warning when one query repeats
+    # SQL_STATS_REPEAT_WARN times, and failures over a view's query budget
+    # when SQL_QUERY_BUDGET_ENFORCE is set
+    SQL_STATS = os.environ.get("SQL_STATS", "false").lower() == "true"
+    SQL_STATS_REPEAT_WARN = int(os.environ.get("SQL_STATS_REPEAT_WARN", 10))
+    SQL_QUERY_BUDGET_ENFORCE = (
+        os.environ.get("SQL_QUERY_BUDGET_ENFORCE", "false").lower() == "true"
+    )
+
+    # Job Executor: "celery" (Redis broker + worker) or "local" (in-process
+    # worker pool with a SQLite-backed queue, for single-box installs)
+    JOB_EXECUTOR = os.environ.get("JOB_EXECUTOR", "celery")
+
+    # Log jobs-table diagnostics when a job lookup misses (full table scans)
+    JOB_REPOSITORY_DIAGNOSTICS = (
+        os.environ.get("JOB_REPOSITORY_DIAGNOSTICS", "false").lower() == "true"
+    )
+
+    # Event Bus: run event handlers (websocket broadcasts) on a dispatcher
+    # thread instead of the publishing one, merging queued updates per job
+    EVENT_BUS_ASYNC = os.environ.get("EVENT_BUS_ASYNC", "true").lower() == "true"
+    EVENT_BUS_COALESCE_MS = int(os.environ.get("EVENT_BUS_COALESCE_MS", 50))
+    EVENT_BUS_MAX_QUEUE = int(os.environ.get("EVENT_BUS_MAX_QUEUE", 10000))
+
+    # Most job_updated broadcasts per job per second (0 disables throttling);
+    # the latest state is always delivered, status changes immediately
+    JOB_BROADCAST_MAX_HZ = float(os.environ.get("JOB_BROADCAST_MAX_HZ", 2))
+
+    # Cross-process job event transport between Celery workers and API nodes:
+    # "redis" (pub/sub), "file" (one machine, e.g. tests) or "socketio" (workers
+    # emit through the Socket.IO message queue themselves)
+    EVENT_TRANSPORT = os.environ.get("EVENT_TRANSPORT", "redis")
+    EVENT_TRANSPORT_URL = os.environ.get(
+        "EVENT_TRANSPORT_URL", os.environ.get("REDIS_URL", "redis://localhost:6379/0")
+    )
+    EVENT_TRANSPORT_CHANNEL = os.environ.get("EVENT_TRANSPORT_CHANNEL", "job_events")
+    EVENT_TRANSPORT_PATH = os.environ.get(
+        "EVENT_TRANSPORT_PATH", str(LOG_DIR / "job_events.ndjson")
+    )
+    EVENT_TRANSPORT_BATCH_MS = int(os.environ.get("EVENT_TRANSPORT_BATCH_MS", 100))
+
+    # Recent job events kept for clients resuming with subscribe_to_jobs(since=)
+    JOB_EVENT_BUFFER_SIZE = int(os.environ.get("JOB_EVENT_BUFFER_SIZE", 1000))
+
+    # Append-only job event journal (job_events table), written in batches
+    JOB_EVENT_JOURNAL = os.environ.get("JOB_EVENT_JOURNAL", "true").lower() == "true"
+    JOB_EVENT_JOURNAL_FLUSH_MS = int(os.environ.get("JOB_EVENT_JOURNAL_FLUSH_MS", 1000))
+    JOB_EVENT_JOURNAL_BATCH_SIZE = int(
+        os.environ.get("JOB_EVENT_JOURNAL_BATCH_SIZE", 500)
+    )
+    # Most jobs replayed from the journal to a resuming client before it
+    # gets a snapshot instead
+    JOB_EVENT_REPLAY_LIMIT = int(os.environ.get("JOB_EVENT_REPLAY_LIMIT", 500))
+
+    # Jobs returned per page by the jobs API and websocket snapshot
+    JOBS_PAGE_SIZE = int(os.environ.get("JOBS_PAGE_SIZE", 50))
+    JOBS_MAX_PAGE_SIZE = int(os.environ.get("JOBS_MAX_PAGE_SIZE", 500))
+
+    # Rows per executemany in SongRepository bulk_create/bulk_update/upsert_many
+    SONG_BULK_CHUNK_SIZE = int(os.environ.get("SONG_BULK_CHUNK_SIZE", 500))
+
+    # Library reads (song list, artists, search): how long the library
+    # version read for their ETags is trusted before reading it again (writes
+    # by job workers show up within this), and how many responses are cached
+    LIBRARY_VERSION_TTL_MS = int(os.environ.get("LIBRARY_VERSION_TTL_MS", 1000))
+    LIBRARY_RESPONSE_CACHE_SIZE = int(
+        os.environ.get("LIBRARY_RESPONSE_CACHE_SIZE", 128)
+    )
+
+    # Job ETA Estimation
+    JOB_WORKER_CONCURRENCY = int(os.environ.get("JOB_WORKER_CONCURRENCY", 1))
+    JOB_ETA_HISTORY_SIZE = int(os.environ.get("JOB_ETA_HISTORY_SIZE", 20))
+
+    # Admission Control (seconds of predicted processing work; 0 disables)
+    ADMISSION_MAX_PENDING_SECONDS = int(
+        os.environ.get("ADMISSION_MAX_PENDING_SECONDS", 4 * 3600)
+    )
+    ADMISSION_QUEUE_HEADROOM_SECONDS = int(
+        os.environ.get("ADMISSION_QUEUE_HEADROOM_SECONDS", 1800)
+    )
+    ADMISSION_MAX_CLIENT_PENDING_SECONDS = int(
+        os.environ.get("ADMISSION_MAX_CLIENT_PENDING_SECONDS", 3600)
+    )
+    # Reverse proxies in front of the API; clients are identified by the
+    # X-Forwarded-For entry the nearest one appended (0: by remote address)
+    TRUSTED_PROXY_COUNT = int(os.environ.get("TRUSTED_PROXY_COUNT", 0))
+
+    # Job Retention (cleanup_old_jobs)
+    JOB_RETENTION_DAYS = int(os.environ.get("JOB_RETENTION_DAYS", 30))  # 0 keeps all
+    JOB_RETENTION_ARCHIVE = (
+        os.environ.get("JOB_RETENTION_ARCHIVE", "true").lower() == "true"
+    )
+    JOB_EVENT_RETENTION_DAYS = int(
+        os.environ.get("JOB_EVENT_RETENTION_DAYS", 14)
+    )  # 0 keeps all
+    TEMP_FILE_MAX_AGE_HOURS = int(os.environ.get("TEMP_FILE_MAX_AGE_HOURS", 24))
+    JOB_CLEANUP_INTERVAL_HOURS = float(os.environ.get("JOB_CLEANUP_INTERVAL_HOURS", 24))
+
+    # Bulk Import
+    BULK_IMPORT_MAX_VIDEOS = int(os.environ.get("BULK_IMPORT_MAX_VIDEOS", 200))
+    BULK_IMPORT_RATE_PER_MINUTE = float(
+        os.environ.get("BULK_IMPORT_RATE_PER_MINUTE", 6)
+    )
+
     # Redis Configuration (fallback support)
     REDIS_URL = os.environ.get("REDIS_URL", "redis://localhost:6379/0")
 
@@ -15,6 +15,10 @@ class TestingConfig(BaseConfig):
     DATABASE_URL = "sqlite:///:memory:"
     SQLALCHEMY_DATABASE_URI = DATABASE_URL
 
+    # Fail requests that run more SQL statements than their view's budget
+    SQL_STATS = True
+    SQL_QUERY_BUDGET_ENFORCE = True
+
     @property
     def DEFAULT_CORS_ORIGINS(self) -> list[str]:
         """Default CORS origins for testing environment."""
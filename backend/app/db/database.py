@@ -3,6 +3,7 @@
 Database utility functions
 """
 
+import hashlib
 import logging
 from contextlib import contextmanager
 from pathlib import Path
@@ -12,6 +13,7 @@ logger = logging.getLogger(__name__)
 
 from app.config import get_config
 from app.services import file_management
+from app.utils.query_stats import install_query_stats
 from sqlalchemy import (
     Boolean,
     Column,
@@ -30,6 +32,20 @@ from sqlalchemy import (
 from sqlalchemy.orm import Session, sessionmaker
 
 from .models import Base, DbSong
+from .models.song import SIDE_COLUMNS
+from .sqlite_profiles import install_profile
+
+# Indexes of earlier schema versions that model indexes have replaced; they
+# only cost writes now, so ensure_db_schema drops them
+SUPERSEDED_INDEXES = {
+    "songs": [
+        "ix_songs_title_nocase",
+        "ix_songs_artist_nocase",
+        "ix_songs_album_nocase",
+        "ix_songs_date_added",
+        "ix_songs_year",
+    ],
+}
 
 # Get configuration and create database engine
 config = get_config()
@@ -60,36 +76,31 @@ if DATABASE_URL.startswith("sqlite:"):
         pool_recycle=3600,  # Recycle connections every hour
         echo=False,  # Set to True for SQL debugging if needed
     )
+    # Pragmas are per connection: set them on every pooled connection
+    try:
+        install_profile(engine, config.SQLITE_PROFILE)
+    except ValueError as e:
+        logger.warning(f"{e}; using the balanced profile")
+        install_profile(engine, "balanced")
 else:
     engine = create_engine(DATABASE_URL)
 
+if config.SQL_STATS:
+    install_query_stats(engine)
+
 # Create session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
 # Initialize the database
 def init_db():
-    """Initialize the database with tables from models"""
-    Base.metadata.create_all(bind=engine)
+    """
+    Initialize the database with tables from models.
 
-    # Configure SQLite for better concurrency if using SQLite
-    if config.DATABASE_URL.startswith("sqlite:"):
-        try:
-            with engine.connect() as connection:
-                from sqlalchemy import text
-
-                # Enable WAL mode for better concurrency
-                connection.execute(text("PRAGMA journal_mode=WAL;"))
-                # Set reasonable timeout
-                connection.execute(text("PRAGMA busy_timeout=30000;"))
-                # Enable foreign keys
-                connection.execute(text("PRAGMA foreign_keys=ON;"))
-                # Set synchronous mode for better reliability
-                connection.execute(text("PRAGMA synchronous=FULL;"))
-                connection.commit()
-                logger.info("SQLite configured with WAL mode for better concurrency")
-        except Exception as e:
-            logger.warning(f"Failed to configure SQLite pragmas: {e}")
+    SQLite pragmas (WAL, busy timeout, synchronous, ...) are applied to each
+    connection as it is opened, see ``sqlite_profiles``.
+    """
+    Base.metadata.create_all(bind=engine)
 
 
 def force_db_sync():
@@ -108,6 +119,39 @@ def force_db_sync():
             logger.warning(f"Failed to execute WAL checkpoint: {e}")
 
 
+def compact_database(bind=None) -> int:
+    """
+    Return free SQLite pages to the filesystem and report the bytes reclaimed.
+
+    Databases created with ``auto_vacuum=INCREMENTAL`` are compacted with
+    ``PRAGMA incremental_vacuum``; anything else gets a full ``VACUUM``.
+    Nothing is done when the file has no free pages.
+    """
+    bind = bind if bind is not None else engine
+    if bind.dialect.name != "sqlite":
+        return 0
+
+    from sqlalchemy import text
+
+    with bind.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+        page_size = connection.execute(text("PRAGMA page_size")).scalar()
+        free_pages = connection.execute(text("PRAGMA freelist_count")).scalar()
+        if not free_pages:
+            return 0
+        pages_before = connection.execute(text("PRAGMA page_count")).scalar()
+        if connection.execute(text("PRAGMA auto_vacuum")).scalar() == 2:
+            connection.execute(text("PRAGMA incremental_vacuum")).fetchall()
+        else:
+            connection.execute(text("VACUUM"))
+        pages_after = connection.execute(text("PRAGMA page_count")).scalar()
+        # Shrink the WAL file too now that the rewritten pages are checkpointed
+        connection.execute(text("PRAGMA wal_checkpoint(TRUNCATE)")).fetchall()
+
+    reclaimed = (pages_before - pages_after) * page_size
+    logger.info(f"Database compaction reclaimed {reclaimed} bytes")
+    return reclaimed
+
+
 # SQLAlchemy session middleware for route handlers (placeholder, can be implemented if needed)
 class DBSessionMiddleware:
     """Middleware to manage database sessions in web requests"""
@@ -115,30 +159,73 @@ class DBSessionMiddleware:
     pass
 
 
-def ensure_db_schema():
-    """Ensure the database schema is up to date with the latest model definitions"""
-    # Check if we're using SQLite and get the database path
-    if config.DATABASE_URL.startswith("sqlite:"):
-        # Extract path from sqlite:///path/to/db
-        db_path_str = config.DATABASE_URL.replace("sqlite:///", "")
-        db_path = Path(db_path_str)
+def schema_version(metadata=Base.metadata) -> int:
+    """
+    Fingerprint of the model schema: any added or changed table, column or
+    index, or newly superseded index, gives a different number.
+    ensure_db_schema stores it in SQLite's ``user_version`` once the
+    database matches the models.
+    """
+    digest = hashlib.sha256()
+    for table in sorted(metadata.tables.values(), key=lambda t: t.name):
+        digest.update(table.name.encode())
+        for column in table.columns:
+            digest.update(f"{column.name}:{column.type!r}:{column.nullable}".encode())
+        for index in sorted(table.indexes, key=lambda i: i.name or ""):
+            expressions = ",".join(str(e) for e in index.expressions)
+            digest.update(f"{index.name}:{expressions}".encode())
+    digest.update(repr(sorted(SUPERSEDED_INDEXES.items())).encode())
+    # user_version is a signed 32-bit integer, and 0 means never stamped
+    return int(digest.hexdigest()[:7], 16) or 1
+
+
+def read_schema_stamp(bind=None) -> int:
+    """The schema version stamped in a SQLite database (0 if none)."""
+    bind = bind if bind is not None else engine
+    with bind.connect() as connection:
+        return connection.exec_driver_sql("PRAGMA user_version").scalar() or 0
 
-        if not db_path.exists() or db_path.stat().st_size == 0:
+
+def _write_schema_stamp(bind, version: int) -> None:
+    with bind.begin() as connection:
+        connection.exec_driver_sql(f"PRAGMA user_version = {int(version)}")
+
+
+def ensure_db_schema(bind=None):
+    """
+    Ensure the database schema is up to date with the latest model definitions
+
+    On SQLite the result is stamped with schema_version(), so later starts
+    cost one query until the models change; introspection and DDL only run
+    on a mismatch. ``PRAGMA user_version = 0`` forces a full check.
+    """
+    bind = bind if bind is not None else engine
+    if bind.dialect.name != "sqlite":
+        # For non-SQLite databases, just ensure schema exists
+        Base.metadata.create_all(bind=bind)
+        return
+
+    version = schema_version()
+    db_path = bind.url.database
+    if db_path and db_path != ":memory:":
+        if not Path(db_path).exists() or Path(db_path).stat().st_size == 0:
             logger.info("Creating database schema from scratch")
-            Base.metadata.create_all(bind=engine)
+            Base.metadata.create_all(bind=bind)
+            _write_schema_stamp(bind, version)
             return
-    else:
-        # For non-SQLite databases, just ensure schema exists
-        Base.metadata.create_all(bind=engine)
+
+    if read_schema_stamp(bind) == version:
+        logger.debug("Database schema matches version %s", version)
         return
 
-    # If DB exists, check for missing tables and columns
+    # The models changed since the last check: look for missing tables,
+    # columns and indexes
     try:
-        inspector = inspect(engine)
+        inspector = inspect(bind)
         existing_tables = inspector.get_table_names()
     except Exception as e:
         logger.warning(f"Could not inspect existing database, recreating schema: {e}")
-        Base.metadata.create_all(bind=engine)
+        Base.metadata.create_all(bind=bind)
         return
 
     # First, create any missing tables
@@ -149,14 +236,14 @@ def ensure_db_schema():
 
     if tables_to_create:
         logger.info(f"Creating missing tables: {[t.name for t in tables_to_create]}")
-        Base.metadata.create_all(bind=engine, tables=tables_to_create)
-        return  # If we created tables, we're done
+        Base.metadata.create_all(bind=bind, tables=tables_to_create)
 
     # Check for missing columns in existing tables
+    complete = True
     for table in Base.metadata.tables.values():
         table_name = table.name
         if table_name not in existing_tables:
-            continue  # Skip if table doesn't exist (shouldn't happen after above check)
+            continue  # Just created with all its columns
 
         try:
             existing_columns = {
@@ -164,6 +251,7 @@ def ensure_db_schema():
             }
         except Exception as e:
             logger.warning(f"Could not inspect table {table_name}, skipping: {e}")
+            complete = False
             continue
 
         missing_columns = set()
@@ -175,10 +263,10 @@ def ensure_db_schema():
         if missing_columns:
             logger.info(f"Missing columns in {table_name}: {missing_columns}")
             # Add columns using direct SQL
-            with engine.connect() as connection:
+            with bind.connect() as connection:
                 for col_name in missing_columns:
                     col = table.columns[col_name]
-                    col_type = col.type.compile(dialect=engine.dialect)
+                    col_type = col.type.compile(dialect=bind.dialect)
 
                     # Handle nullability
                     nullable = "" if col.nullable else "NOT NULL"
@@ -203,6 +291,123 @@ def ensure_db_schema():
                         logger.info(f"Added column: {sql}")
                     except Exception as e:
                         logger.error(f"Error adding column {col_name}: {e}")
+                        complete = False
+
+    if "songs" in existing_tables and not _check_side_columns(bind):
+        complete = False
+
+    if not _drop_superseded_indexes(existing_tables, bind):
+        complete = False
+
+    if _ensure_indexes(existing_tables, bind) and complete:
+        _write_schema_stamp(bind, version)
+        logger.info("Database schema updated to version %s", version)
+
+
+def _check_side_columns(bind=None) -> bool:
+    """
+    Look for cold song columns left in songs by a database from before the
+    side tables (song_lyrics, song_details). Moving them drops columns and
+    rewrites the file, which is the job of Alembic migration 5d2a9c4e7b13;
+    it only happens here when MIGRATE_SONG_SIDE_COLUMNS_ON_BOOT is set.
+    Returns whether songs is free of them now.
+    """
+    bind = bind if bind is not None else engine
+    existing = {column["name"] for column in inspect(bind).get_columns("songs")}
+    legacy = [name for name in SIDE_COLUMNS if name in existing]
+    if not legacy:
+        return True
+
+    if not config.MIGRATE_SONG_SIDE_COLUMNS_ON_BOOT:
+        logger.warning(
+            f"songs still has columns that moved to side tables: {legacy}. "
+            "Run `alembic upgrade head` to move them, or set "
+            "MIGRATE_SONG_SIDE_COLUMNS_ON_BOOT=true to move them on startup"
+        )
+        return False
+    return _move_side_columns(bind, legacy)
+
+
+def _move_side_columns(bind, legacy) -> bool:
+    """
+    Copy the ``legacy`` song columns into their side tables and drop them
+    from songs in one transaction, then VACUUM. Returns whether it worked.
+    """
+    logger.warning(
+        f"MIGRATE_SONG_SIDE_COLUMNS_ON_BOOT is set: moving song columns "
+        f"{legacy} to side tables, dropping them from songs and vacuuming "
+        "the database"
+    )
+    try:
+        with bind.begin() as connection:
+            for relationship in dict.fromkeys(SIDE_COLUMNS.values()):
+                table = getattr(DbSong, relationship).property.mapper.local_table
+                columns = [
+                    name for name in legacy if SIDE_COLUMNS[name] == relationship
+                ]
+                if not columns:
+                    continue
+                names = ", ".join(columns)
+                has_value = " OR ".join(f"{name} IS NOT NULL" for name in columns)
+                connection.exec_driver_sql(
+                    f"INSERT OR IGNORE INTO {table.name} (song_id, {names}) "
+                    f"SELECT id, {names} FROM songs WHERE {has_value}"
+                )
+            for name in legacy:
+                connection.exec_driver_sql(f"ALTER TABLE songs DROP COLUMN {name}")
+    except Exception as e:
+        logger.error(f"Error moving song columns to side tables: {e}")
+        return False
+
+    # Dropped columns leave each songs page as sparse as before; rebuilding
+    # the file once packs the narrow rows densely
+    try:
+        with bind.connect().execution_options(
+            isolation_level="AUTOCOMMIT"
+        ) as connection:
+            connection.exec_driver_sql("VACUUM")
+    except Exception as e:
+        logger.warning(f"Could not vacuum after moving song columns: {e}")
+    return True
+
+
+def _ensure_indexes(table_names, bind=None) -> bool:
+    """
+    Create model indexes missing from tables that predate them.
+    Returns whether all of them exist now.
+    """
+    bind = bind if bind is not None else engine
+    complete = True
+    for table in Base.metadata.tables.values():
+        if table.name not in table_names:
+            continue
+        for index in table.indexes:
+            try:
+                index.create(bind=bind, checkfirst=True)
+            except Exception as e:
+                logger.error(f"Error creating index {index.name}: {e}")
+                complete = False
+    return complete
+
+
+def _drop_superseded_indexes(table_names, bind=None) -> bool:
+    """
+    Drop the SUPERSEDED_INDEXES of existing tables.
+    Returns whether none of them is left.
+    """
+    bind = bind if bind is not None else engine
+    complete = True
+    for table_name, index_names in SUPERSEDED_INDEXES.items():
+        if table_name not in table_names:
+            continue
+        for index_name in index_names:
+            try:
+                with bind.begin() as connection:
+                    connection.exec_driver_sql(f"DROP INDEX IF EXISTS {index_name}")
+            except Exception as e:
+                logger.error(f"Error dropping index {index_name}: {e}")
+                complete = False
+    return complete
 
 
 @contextmanager
@@ -3,20 +3,43 @@ Database models package exports
 """
 
 # Import all models so they can be imported from the package
+from .artist import DbArtistSummary
 from .base import UNKNOWN_ARTIST, Base
-from .job import DbJob, Job, JobStatus
+from .job import (
+    DbJob,
+    DbJobArchive,
+    DbJobEvent,
+    DbJobPhaseTiming,
+    DbJobStatusCount,
+    Job,
+    JobPhase,
+    JobStatus,
+)
+from .library import DbLibraryVersion
+from .local_task import DbLocalTask, LocalTaskStatus
 from .queue import KaraokeQueueItem
-from .song import DbSong  # Only DbSong now - cancer removed
+from .song import DbSong, DbSongDetails, DbSongLyrics
 from .user import User
 
 # Make all models available when importing from this package
 __all__ = [
     "Base",
     "UNKNOWN_ARTIST",
+    "DbArtistSummary",
     "DbJob",
+    "DbJobArchive",
+    "DbJobEvent",
+    "DbJobPhaseTiming",
+    "DbJobStatusCount",
     "Job",
+    "JobPhase",
     "JobStatus",
+    "DbLibraryVersion",
+    "DbLocalTask",
+    "LocalTaskStatus",
     "KaraokeQueueItem",
     "DbSong",
+    "DbSongDetails",
+    "DbSongLyrics",
     "User",
 ]
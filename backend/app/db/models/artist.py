@@ -0,0 +1,48 @@
+"""
+Artist summary model.
+"""
+
+from sqlalchemy import Column, Index, Integer, String
+
+from .base import Base
+
+
+def normalize_artist(name: str) -> str:
+    """Artist name as searched and sorted: case-folded, whitespace collapsed."""
+    return " ".join(name.split()).casefold()
+
+
+def artist_first_letter(name: str) -> str:
+    """Letter an artist is listed under in the artist browser."""
+    normalized = normalize_artist(name)
+    return normalized[:1].upper()[:1] or "?"
+
+
+class DbArtistSummary(Base):
+    """
+    Number of songs per artist, maintained by SongRepository on every song
+    write so that the artist browser never groups the songs table.
+    """
+
+    __tablename__ = "artist_summaries"
+    name = Column(String, primary_key=True)  # As stored on songs.artist
+    normalized_name = Column(String, nullable=False)
+    first_letter = Column(String, nullable=False)
+    song_count = Column(Integer, nullable=False, default=0)
+
+    __table_args__ = (
+        # Listing order, also serves per-letter pages
+        Index(
+            "ix_artist_summaries_letter_name",
+            "first_letter",
+            "normalized_name",
+            "name",
+        ),
+    )
+
+    def to_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "songCount": self.song_count,
+            "firstLetter": self.first_letter,
+        }
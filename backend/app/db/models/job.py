@@ -2,13 +2,14 @@
 Job-related models: Enum, dataclass, SQLAlchemy, and store.
 """
 
+import json
 import logging
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
 from typing import Any, Optional
 
-from sqlalchemy import Boolean, Column, DateTime, Integer, String, Text
+from sqlalchemy import Boolean, Column, DateTime, Float, Index, Integer, String, Text
 
 from .base import Base
 
@@ -27,9 +28,35 @@ class JobStatus(str, Enum):
     CANCELLED = "cancelled"
 
 
-@dataclass
+class JobPhase(str, Enum):
+    """Timed phases a job moves through, in pipeline order."""
+
+    QUEUE_WAIT = "queue_wait"
+    DOWNLOAD = "download"
+    DECODE = "decode"
+    SEPARATION = "separation"
+    ENCODE = "encode"
+    THUMBNAIL = "thumbnail"
+    FINALIZE = "finalize"
+
+
+def _iso(value: Optional[datetime]) -> Optional[str]:
+    """Format a timestamp for the wire; naive values are taken to be UTC."""
+    if value is None or not isinstance(value, datetime):
+        return value
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.isoformat()
+
+
+@dataclass(slots=True)
 class Job:
-    """Data class representing a job with its current status and progress."""
+    """
+    Data class representing a job with its current status and progress.
+
+    Slotted to keep many jobs compact; the dictionary form sent to clients
+    is built once and reused for as long as the fields are unchanged.
+    """
 
     id: str
     filename: str
@@ -46,6 +73,12 @@ class Job:
     error: Optional[str] = None
     notes: Optional[str] = None
     dismissed: bool = False  # Track if job is dismissed from UI
+    phase: Optional[str] = None  # Current JobPhase value while running
+    phase_started_at: Optional[datetime] = None
+    parent_job_id: Optional[str] = None  # Set on the children of a bulk import
+    _wire: Optional[tuple[tuple, dict[str, Any]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self):
         if self.created_at is None:
@@ -53,18 +86,65 @@ class Job:
         if isinstance(self.status, str):
             self.status = JobStatus(self.status)
 
-    """Convert the job to a dictionary representation for serialization."""
+    @property
+    def is_import(self) -> bool:
+        """Whether this is the parent job of a bulk import."""
+        try:
+            notes = json.loads(self.notes or "{}")
+        except (TypeError, ValueError):
+            return False
+        return isinstance(notes, dict) and bool(notes.get("import"))
 
     def to_dict(self) -> dict[str, Any]:
-        data = asdict(self)
-        for key in ["created_at", "started_at", "completed_at"]:
-            if data[key] is not None and isinstance(data[key], datetime):
-                if data[key].tzinfo is None:
-                    data[key] = data[key].replace(tzinfo=timezone.utc).isoformat()
-                else:
-                    data[key] = data[key].isoformat()
-        data["status"] = self.status.value
-        return data
+        """Convert the job to a dictionary representation for serialization."""
+        # Comparing the field values is far cheaper than rebuilding the dict
+        key = (
+            self.id,
+            self.filename,
+            self.status,
+            self.progress,
+            self.status_message,
+            self.task_id,
+            self.song_id,
+            self.title,
+            self.artist,
+            self.created_at,
+            self.started_at,
+            self.completed_at,
+            self.error,
+            self.notes,
+            self.dismissed,
+            self.phase,
+            self.phase_started_at,
+            self.parent_job_id,
+        )
+        cached = self._wire
+        if cached is not None and cached[0] == key:
+            wire = cached[1]
+        else:
+            wire = {
+                "id": self.id,
+                "filename": self.filename,
+                "status": self.status.value,
+                "progress": self.progress,
+                "status_message": self.status_message,
+                "task_id": self.task_id,
+                "song_id": self.song_id,
+                "title": self.title,
+                "artist": self.artist,
+                "created_at": _iso(self.created_at),
+                "started_at": _iso(self.started_at),
+                "completed_at": _iso(self.completed_at),
+                "error": self.error,
+                "notes": self.notes,
+                "dismissed": self.dismissed,
+                "phase": self.phase,
+                "phase_started_at": _iso(self.phase_started_at),
+                "parent_job_id": self.parent_job_id,
+            }
+            self._wire = (key, wire)
+        # Callers may add to the result (e.g. estimates); keep the cache intact
+        return dict(wire)
 
 
 class DbJob(Base):
@@ -73,41 +153,216 @@ class DbJob(Base):
     __tablename__ = "jobs"
     id = Column(String, primary_key=True)
     filename = Column(String, nullable=False)
-    status = Column(String, nullable=False, default=JobStatus.PENDING.value)
+    status = Column(String, nullable=False, default=JobStatus.PENDING.value, index=True)
     progress = Column(Integer, default=0)
     status_message = Column(Text, nullable=True)
     task_id = Column(String, nullable=True)
-    song_id = Column(String, nullable=True)
+    song_id = Column(String, nullable=True, index=True)
     title = Column(String, nullable=True)
     artist = Column(String, nullable=True)
-    created_at = Column(DateTime, default=datetime.now(timezone.utc))
+    created_at = Column(DateTime, default=datetime.now(timezone.utc), index=True)
     started_at = Column(DateTime, nullable=True)
     completed_at = Column(DateTime, nullable=True)
     error = Column(Text, nullable=True)
     notes = Column(Text, nullable=True)
-    dismissed = Column(Boolean, default=False)  # Track if job is dismissed from UI
+    dismissed = Column(
+        Boolean, default=False, index=True
+    )  # Track if job is dismissed from UI
 
     # Legacy fields that exist in database
     phase_message = Column(Text, nullable=True)
     phase = Column(String, nullable=False, default="created")
     retry_count = Column(Integer, default=0)
 
-    def to_job(self) -> Job:
-        """Convert database job to domain job object."""
+    phase_started_at = Column(DateTime, nullable=True)
+    parent_job_id = Column(String, nullable=True, index=True)
+
+    @classmethod
+    def from_job(cls, job: Job) -> "DbJob":
+        """Build a new database row from a domain job object."""
+        return cls(
+            id=job.id,
+            filename=job.filename,
+            status=job.status.value,
+            progress=job.progress,
+            status_message=job.status_message,
+            task_id=job.task_id,
+            song_id=job.song_id,
+            title=job.title,
+            artist=job.artist,
+            created_at=job.created_at,
+            started_at=job.started_at,
+            completed_at=job.completed_at,
+            error=job.error,
+            notes=job.notes,
+            dismissed=job.dismissed,
+            phase=job.phase or "created",
+            phase_started_at=job.phase_started_at,
+            parent_job_id=job.parent_job_id,
+        )
+
+    # Columns that map one-to-one onto the fields of Job, in field order
+    JOB_COLUMNS = (
+        "id",
+        "filename",
+        "status",
+        "progress",
+        "status_message",
+        "task_id",
+        "song_id",
+        "title",
+        "artist",
+        "created_at",
+        "started_at",
+        "completed_at",
+        "error",
+        "notes",
+        "dismissed",
+        "phase",
+        "phase_started_at",
+        "parent_job_id",
+    )
+
+    @classmethod
+    def job_columns(cls) -> list[Any]:
+        """Column attributes to select for ``row_to_job``."""
+        return [getattr(cls, name) for name in cls.JOB_COLUMNS]
+
+    @staticmethod
+    def row_to_job(row: Any) -> Job:
+        """
+        Build a Job from a row of ``job_columns()``, for list queries that
+        need no ORM entity per row.
+        """
+        (
+            job_id,
+            filename,
+            status,
+            progress,
+            status_message,
+            task_id,
+            song_id,
+            title,
+            artist,
+            created_at,
+            started_at,
+            completed_at,
+            error,
+            notes,
+            dismissed,
+            phase,
+            phase_started_at,
+            parent_job_id,
+        ) = row
         return Job(
-            id=self.id,  # type: ignore[assignment]
-            filename=self.filename,  # type: ignore[assignment]
-            status=JobStatus(self.status),  # type: ignore[assignment]
-            progress=self.progress,  # type: ignore[assignment]
-            status_message=self.status_message,  # type: ignore[assignment]
-            task_id=self.task_id,  # type: ignore[assignment]
-            song_id=self.song_id,  # type: ignore[assignment]
-            title=self.title,  # type: ignore[assignment]
-            artist=self.artist,  # type: ignore[assignment]
-            created_at=self.created_at,  # type: ignore[assignment]
-            started_at=self.started_at,  # type: ignore[assignment]
-            completed_at=self.completed_at,  # type: ignore[assignment]
-            error=self.error,  # type: ignore[assignment]
-            notes=self.notes,  # type: ignore[assignment]
-            dismissed=self.dismissed or False,  # type: ignore[assignment]
+            job_id,
+            filename,
+            JobStatus(status),
+            progress,
+            status_message,
+            task_id,
+            song_id,
+            title,
+            artist,
+            created_at,
+            started_at,
+            completed_at,
+            error,
+            notes,
+            dismissed or False,
+            phase if phase != "created" else None,
+            phase_started_at,
+            parent_job_id,
         )
+
+    def to_job(self) -> Job:
+        """Convert database job to domain job object."""
+        return self.row_to_job([getattr(self, name) for name in self.JOB_COLUMNS])
+
+
+class DbJobPhaseTiming(Base):
+    """Database model for the measured duration of one phase of one job."""
+
+    __tablename__ = "job_phase_timings"
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    job_id = Column(String, nullable=False, index=True)
+    phase = Column(String, nullable=False, index=True)
+    started_at = Column(DateTime, nullable=False)
+    duration_seconds = Column(Float, nullable=False)
+    song_duration_ms = Column(
+        Integer, nullable=True
+    )  # Audio length the phase worked on
+    host = Column(String, nullable=True)  # Worker hostname, for per-host throughput
+
+
+class DbJobEvent(Base):
+    """
+    Database model for one entry of the append-only job event journal.
+
+    Rows are written in batches by ``JobEventJournal`` and never updated;
+    ``seq`` is the sequence number the event was broadcast with (None for
+    events journaled where they originated, before crossing the event
+    transport).
+    """
+
+    __tablename__ = "job_events"
+    __table_args__ = (Index("ix_job_events_job_id_id", "job_id", "id"),)
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    seq = Column(Integer, nullable=True, index=True)
+    job_id = Column(String, nullable=False)
+    event = Column(String, nullable=False)
+    status = Column(String, nullable=True)
+    phase = Column(String, nullable=True)
+    progress = Column(Integer, nullable=True)
+    data = Column(Text, nullable=False)  # The job as broadcast, as JSON
+    created_at = Column(DateTime, nullable=False, index=True)
+
+
+class DbJobArchive(Base):
+    """Database model for terminal jobs moved out of ``jobs`` by retention."""
+
+    __tablename__ = "jobs_archive"
+    id = Column(String, primary_key=True)
+    filename = Column(String, nullable=False)
+    status = Column(String, nullable=False)
+    status_message = Column(Text, nullable=True)
+    task_id = Column(String, nullable=True)
+    song_id = Column(String, nullable=True, index=True)
+    title = Column(String, nullable=True)
+    artist = Column(String, nullable=True)
+    created_at = Column(DateTime, nullable=True)
+    started_at = Column(DateTime, nullable=True)
+    completed_at = Column(DateTime, nullable=True)
+    error = Column(Text, nullable=True)
+    notes = Column(Text, nullable=True)
+    parent_job_id = Column(String, nullable=True)
+    archived_at = Column(DateTime, nullable=False)
+
+    # Columns copied verbatim from ``jobs`` when archiving
+    COPIED_COLUMNS = (
+        "id",
+        "filename",
+        "status",
+        "status_message",
+        "task_id",
+        "song_id",
+        "title",
+        "artist",
+        "created_at",
+        "started_at",
+        "completed_at",
+        "error",
+        "notes",
+        "parent_job_id",
+    )
+
+
+class DbJobStatusCount(Base):
+    """
+    Number of jobs in each status, maintained by JobRepository on every
+    status transition so that job statistics are a single small read.
+    """
+
+    __tablename__ = "job_status_counts"
+    status = Column(String, primary_key=True)
+    count = Column(Integer, nullable=False, default=0)
@@ -0,0 +1,21 @@
+"""
+Library version model.
+"""
+
+from sqlalchemy import Column, Integer
+
+from .base import Base
+
+# The only row of the library_version table
+LIBRARY_VERSION_ID = 1
+
+
+class DbLibraryVersion(Base):
+    """
+    Counter bumped by SongRepository in every transaction that writes songs,
+    so readers can tell whether the library changed without reading it.
+    """
+
+    __tablename__ = "library_version"
+    id = Column(Integer, primary_key=True, default=LIBRARY_VERSION_ID)
+    version = Column(Integer, nullable=False, default=0)
@@ -0,0 +1,37 @@
+"""
+Persistent task queue SQLAlchemy model for the local job executor.
+"""
+
+from enum import Enum
+
+from sqlalchemy import Column, DateTime, Integer, String, Text
+
+from .base import Base
+
+
+class LocalTaskStatus(str, Enum):
+    """Lifecycle of a locally executed task."""
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+    REVOKED = "revoked"
+
+
+class DbLocalTask(Base):
+    """A task queued for the in-process executor (JOB_EXECUTOR=local)."""
+
+    __tablename__ = "local_tasks"
+    id = Column(String, primary_key=True)  # Same ID as the job's task_id
+    name = Column(String, nullable=False)  # Celery task name
+    args = Column(Text, nullable=False)  # JSON-encoded positional arguments
+    status = Column(
+        String, nullable=False, default=LocalTaskStatus.QUEUED.value, index=True
+    )
+    available_at = Column(DateTime, nullable=False)  # Not started before this
+    created_at = Column(DateTime, nullable=False)
+    started_at = Column(DateTime, nullable=True)
+    finished_at = Column(DateTime, nullable=True)
+    attempts = Column(Integer, nullable=False, default=0)
+    error = Column(Text, nullable=True)
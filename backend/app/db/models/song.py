@@ -3,9 +3,21 @@ Song database model - Single source of truth.
 """
 
 from datetime import datetime, timezone
-from typing import Literal, Optional
+from operator import attrgetter
+from typing import Any, Callable, Dict, Iterable, List, Literal, Optional, Tuple
 
-from sqlalchemy import Boolean, Column, DateTime, Float, Integer, String, Text
+from sqlalchemy import (
+    Boolean,
+    Column,
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+)
+from sqlalchemy.ext.associationproxy import association_proxy
 from sqlalchemy.orm import relationship
 
 from .base import UNKNOWN_ARTIST, Base
@@ -13,6 +25,54 @@ from .base import UNKNOWN_ARTIST, Base
 SongStatus = Literal["processing", "queued", "processed", "error"]
 
 
+class DbSongLyrics(Base):
+    """Lyrics of a song, read by the player but by no library listing."""
+
+    __tablename__ = "song_lyrics"
+    song_id = Column(
+        String, ForeignKey("songs.id", ondelete="CASCADE"), primary_key=True
+    )
+    plain_lyrics = Column(Text, nullable=True)
+    synced_lyrics = Column(Text, nullable=True)
+
+
+class DbSongDetails(Base):
+    """Large, rarely read YouTube metadata of a song."""
+
+    __tablename__ = "song_details"
+    song_id = Column(
+        String, ForeignKey("songs.id", ondelete="CASCADE"), primary_key=True
+    )
+    # Song/video description
+    description = Column(Text, nullable=True)
+    # JSON arrays as strings
+    youtube_thumbnail_urls = Column(Text, nullable=True)
+    youtube_tags = Column(Text, nullable=True)
+    youtube_categories = Column(Text, nullable=True)
+    # JSON string
+    youtube_raw_metadata = Column(Text, nullable=True)
+
+
+# Cold columns kept out of the songs table, by the DbSong relationship that
+# loads their side table. DbSong has a proxy attribute for each.
+SIDE_COLUMNS: Dict[str, str] = {
+    "plain_lyrics": "lyrics",
+    "synced_lyrics": "lyrics",
+    "description": "details",
+    "youtube_thumbnail_urls": "details",
+    "youtube_tags": "details",
+    "youtube_categories": "details",
+    "youtube_raw_metadata": "details",
+}
+
+
+def _side_column(relationship_name: str, column: str, side_class: type) -> Any:
+    # Reads None while the side row is missing, creates it on first write
+    return association_proxy(
+        relationship_name, column, creator=lambda value: side_class(**{column: value})
+    )
+
+
 class DbSong(Base):
     __tablename__ = "songs"
     id = Column(String, primary_key=True)
@@ -31,7 +91,6 @@ class DbSong(Base):
     uploader_id = Column(String, nullable=True)
     channel = Column(String, nullable=True)
     channel_id = Column(String, nullable=True)
-    description = Column(Text, nullable=True)  # Song/video description
 
     # Phase 1A = Column(Text, nullable=True)
     upload_date = Column(DateTime, nullable=True)
@@ -42,8 +101,6 @@ class DbSong(Base):
     year = Column(Integer, nullable=True)
     genre = Column(String, nullable=True)
     language = Column(String, nullable=True)
-    plain_lyrics = Column(Text, nullable=True)
-    synced_lyrics = Column(Text, nullable=True)
     channel_name = Column(String, nullable=True)  # Legacy field
 
     # Phase 1B = Column(Integer, nullable=True)
@@ -54,84 +111,160 @@ class DbSong(Base):
     itunes_preview_url = Column(String, nullable=True)
 
     # Phase 1B = Column(Integer, nullable=True)
-    youtube_thumbnail_urls = Column(Text, nullable=True)  # JSON array as string
-    youtube_tags = Column(Text, nullable=True)  # JSON array as string
-    youtube_categories = Column(Text, nullable=True)  # JSON array as string
     youtube_channel_id = Column(String, nullable=True)
     youtube_channel_name = Column(String, nullable=True)
 
-    # Phase 1B = Column(Text, nullable=True)  # JSON string
-    youtube_raw_metadata = Column(Text, nullable=True)  # JSON string
+    # Library listings filter on artist and sort on every listed column; text
+    # sorts are case-insensitive, so those columns are indexed COLLATE NOCASE.
+    # Sort indexes end with id, the tie-breaker of keyset pagination.
+    # tests/unit/test_db/test_song_query_plans.py keeps the hot queries on them.
+    __table_args__ = (
+        Index("ix_songs_artist_title", artist, title),
+        Index("ix_songs_artist_album", artist, album),
+        Index("ix_songs_title_nocase_id", title.collate("NOCASE"), id),
+        Index("ix_songs_artist_nocase_id", artist.collate("NOCASE"), id),
+        Index("ix_songs_album_nocase_id", album.collate("NOCASE"), id),
+        Index("ix_songs_date_added_id", date_added, id),
+        Index("ix_songs_year_id", year, id),
+        Index("ix_songs_video_id", video_id),
+    )
 
     queue_items = relationship(
         "KaraokeQueueItem", back_populates="song", cascade="all, delete-orphan"
     )
 
-    def to_dict(self) -> dict:
-        """Convert to API response format - replaces to_pydantic()"""
-        # Extract year from release_date if available
-        year_value = None
-        if self.year is not None:
-            year_value = self.year
-        elif self.release_date is not None:
-            try:
-                year_value = (
-                    int(str(self.release_date).split("-")[0])
-                    if "-" in str(self.release_date)
-                    else int(str(self.release_date))
-                )
-            except (ValueError, AttributeError):
-                year_value = None
-
-        return {
-            "id": self.id,
-            "title": self.title,
-            "artist": self.artist,
-            "durationMs": self.duration_ms,
-            "status": "processed",
-            "dateAdded": (
-                self.date_added.isoformat() if self.date_added is not None else None
-            ),
-            # File paths for API
-            "vocalPath": (
-                f"/api/songs/{self.id}/vocal" if self.vocals_path is not None else None
-            ),
-            "instrumentalPath": (
-                f"/api/songs/{self.id}/instrumental"
-                if self.instrumental_path is not None
-                else None
-            ),
-            "originalPath": (
-                f"/api/songs/{self.id}/original"
-                if self.original_path is not None
-                else None
-            ),
-            "thumbnail": self.thumbnail_path,
-            # YouTube data (convert to camelCase)
-            "videoId": self.video_id,
-            "sourceUrl": self.source_url,
-            "uploader": self.uploader,
-            "uploaderId": self.uploader_id,
-            "channel": self.channel,
-            "channelId": self.channel_id,
-            "channelName": self.youtube_channel_name or self.channel_name,
-            "description": self.description,
-            "uploadDate": (
-                self.upload_date.isoformat() if self.upload_date is not None else None
-            ),
-            # Metadata
-            "mbid": self.mbid,
-            "metadataId": self.mbid,  # Alias for frontend compatibility
-            "album": self.album,
-            "releaseTitle": self.album,  # Legacy alias
-            "releaseId": self.release_id,
-            "releaseDate": self.release_date,
-            "year": year_value,
-            "genre": self.genre,
-            "language": self.language,
-            # Lyrics
-            "plainLyrics": self.plain_lyrics,
-            "syncedLyrics": self.synced_lyrics,
-            # System
-            "source": self.source,
-        }
+    # Side tables of the cold columns, loaded on first access unless a query
+    # asks for them (SongRepository.load_options)
+    lyrics = relationship(
+        DbSongLyrics, uselist=False, lazy="select", cascade="all, delete-orphan"
+    )
+    details = relationship(
+        DbSongDetails, uselist=False, lazy="select", cascade="all, delete-orphan"
+    )
+    plain_lyrics = _side_column("lyrics", "plain_lyrics", DbSongLyrics)
+    synced_lyrics = _side_column("lyrics", "synced_lyrics", DbSongLyrics)
+    description = _side_column("details", "description", DbSongDetails)
+    youtube_thumbnail_urls = _side_column(
+        "details", "youtube_thumbnail_urls", DbSongDetails
+    )
+    youtube_tags = _side_column("details", "youtube_tags", DbSongDetails)
+    youtube_categories = _side_column("details", "youtube_categories", DbSongDetails)
+    youtube_raw_metadata = _side_column(
+        "details", "youtube_raw_metadata", DbSongDetails
+    )
+
+    @classmethod
+    def field_columns(cls, fields: Iterable[str]) -> List[Any]:
+        """Songs table columns needed to serialize the given API fields."""
+        names = dict.fromkeys(
+            name for field in fields for name in SONG_FIELDS[field][0]
+        )
+        return [getattr(cls, name) for name in names if name not in SIDE_COLUMNS]
+
+    @classmethod
+    def field_relationships(cls, fields: Optional[Iterable[str]] = None) -> List[Any]:
+        """Side tables needed to serialize the given API fields (default: all)."""
+        if fields is None:
+            return [cls.lyrics, cls.details]
+        names = dict.fromkeys(
+            SIDE_COLUMNS[name]
+            for field in fields
+            for name in SONG_FIELDS[field][0]
+            if name in SIDE_COLUMNS
+        )
+        return [getattr(cls, name) for name in names]
+
+    def to_dict(self, fields: Optional[Iterable[str]] = None) -> dict:
+        """
+        Convert to API response format - replaces to_pydantic().
+
+        ``fields`` limits the output to those API fields (all by default), so
+        only their columns have to be loaded.
+        """
+        if fields is None:
+            fields = SONG_FIELDS
+        return {field: SONG_FIELDS[field][1](self) for field in fields}
+
+
+def _iso(name: str) -> Callable[[DbSong], Optional[str]]:
+    def get(song: DbSong) -> Optional[str]:
+        value = getattr(song, name)
+        return value.isoformat() if value is not None else None
+
+    return get
+
+
+def _track_url(name: str, track: str) -> Callable[[DbSong], Optional[str]]:
+    def get(song: DbSong) -> Optional[str]:
+        if getattr(song, name) is None:
+            return None
+        return f"/api/songs/{song.id}/{track}"
+
+    return get
+
+
+def _year(song: DbSong) -> Optional[int]:
+    # Extract year from release_date if available
+    if song.year is not None:
+        return song.year
+    if song.release_date is None:
+        return None
+    try:
+        return (
+            int(str(song.release_date).split("-")[0])
+            if "-" in str(song.release_date)
+            else int(str(song.release_date))
+        )
+    except (ValueError, AttributeError):
+        return None
+
+
+def _column(name: str) -> Tuple[Tuple[str, ...], Callable[[DbSong], Any]]:
+    return (name,), attrgetter(name)
+
+
+# API field -> (columns it is computed from, how to compute it), in response order
+SONG_FIELDS: Dict[str, Tuple[Tuple[str, ...], Callable[[DbSong], Any]]] = {
+    "id": _column("id"),
+    "title": _column("title"),
+    "artist": _column("artist"),
+    "durationMs": _column("duration_ms"),
+    "status": ((), lambda song: "processed"),
+    "dateAdded": (("date_added",), _iso("date_added")),
+    # File paths for API
+    "vocalPath": (("vocals_path",), _track_url("vocals_path", "vocal")),
+    "instrumentalPath": (
+        ("instrumental_path",),
+        _track_url("instrumental_path", "instrumental"),
+    ),
+    "originalPath": (("original_path",), _track_url("original_path", "original")),
+    "thumbnail": _column("thumbnail_path"),
+    # YouTube data (convert to camelCase)
+    "videoId": _column("video_id"),
+    "sourceUrl": _column("source_url"),
+    "uploader": _column("uploader"),
+    "uploaderId": _column("uploader_id"),
+    "channel": _column("channel"),
+    "channelId": _column("channel_id"),
+    "channelName": (
+        ("youtube_channel_name", "channel_name"),
+        lambda song: song.youtube_channel_name or song.channel_name,
+    ),
+    "description": _column("description"),
+    "uploadDate": (("upload_date",), _iso("upload_date")),
+    # Metadata
+    "mbid": _column("mbid"),
+    "metadataId": _column("mbid"),  # Alias for frontend compatibility
+    "album": _column("album"),
+    "releaseTitle": _column("album"),  # Legacy alias
+    "releaseId": _column("release_id"),
+    "releaseDate": _column("release_date"),
+    "year": (("year", "release_date"), _year),
+    "genre": _column("genre"),
+    "language": _column("language"),
+    # Lyrics
+    "plainLyrics": _column("plain_lyrics"),
+    "syncedLyrics": _column("synced_lyrics"),
+    # System
+    "source": _column("source"),
+}
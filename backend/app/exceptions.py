@@ -54,6 +54,21 @@ class JobError(ServiceError):
     """Raised when job processing operations fail"""
 
 
+class QueueFullError(ServiceError):
+    """Raised when the processing backlog cannot accept more work"""
+
+    def __init__(
+        self,
+        message: str,
+        retry_after_seconds: int,
+        error_code: str = "QUEUE_FULL",
+        details: Optional[dict] = None,
+    ):
+        self.retry_after_seconds = retry_after_seconds
+        details = {**(details or {}), "retryAfterSeconds": retry_after_seconds}
+        super().__init__(message, error_code, details)
+
+
 class ConfigurationError(KaraokeBaseError):
     """Raised when configuration is invalid"""
 
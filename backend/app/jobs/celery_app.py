@@ -5,6 +5,12 @@ import multiprocessing
 from app.config import get_config
 from app.config.logging import setup_logging
 from celery import Celery  # type: ignore
+from celery.signals import (  # type: ignore
+    worker_init,
+    worker_process_init,
+    worker_process_shutdown,
+    worker_shutdown,
+)
 from dotenv import load_dotenv
 
 logger = logging.getLogger(__name__)
@@ -35,10 +41,78 @@ celery.conf.update(
     enable_utc=True,
     broker_connection_retry=True,
     broker_connection_retry_on_startup=True,
+    beat_schedule={
+        "cleanup-old-jobs": {
+            "task": "cleanup_old_jobs",
+            "schedule": config.JOB_CLEANUP_INTERVAL_HOURS * 3600,
+        },
+    },
     **celery_logging_config,
 )
 
 
+@worker_init.connect
+def _ensure_db_schema(**_kwargs):
+    """Create missing tables before the first task (one query when current)."""
+    from app.db.database import ensure_db_schema
+
+    ensure_db_schema()
+
+
+@worker_init.connect
+@worker_process_init.connect
+def _start_event_dispatcher(**_kwargs):
+    """Keep websocket emits off the task threads that publish job events."""
+    from app.utils.events import start_event_dispatcher
+
+    start_event_dispatcher()
+
+
+@worker_shutdown.connect
+@worker_process_shutdown.connect
+def _stop_event_dispatcher(**_kwargs):
+    """Deliver queued job events before the worker exits."""
+    from app.utils.events import event_bus
+
+    event_bus.stop_async()
+
+
+@worker_init.connect
+@worker_process_init.connect
+def _start_event_relay(**_kwargs):
+    """Hand this worker's job events to the API nodes over the transport."""
+    from app.utils.event_transport import start_event_relay
+
+    start_event_relay(receive=False)
+
+
+@worker_shutdown.connect
+@worker_process_shutdown.connect
+def _stop_event_relay(**_kwargs):
+    """Send job events still batched before the worker exits."""
+    from app.utils.event_transport import stop_event_relay
+
+    stop_event_relay()
+
+
+@worker_init.connect
+@worker_process_init.connect
+def _start_job_journal(**_kwargs):
+    """Journal the job events this worker broadcasts."""
+    from app.services.job_journal import start_job_journal
+
+    start_job_journal()
+
+
+@worker_shutdown.connect
+@worker_process_shutdown.connect
+def _stop_job_journal(**_kwargs):
+    """Write journaled events still queued before the worker exits."""
+    from app.services.job_journal import stop_job_journal
+
+    stop_job_journal()
+
+
 def init_celery(app):
     """Initialize Celery with Flask app context."""
     if not app:
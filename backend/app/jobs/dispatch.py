@@ -0,0 +1,70 @@
+"""
+Task dispatch that works with either job executor.
+
+Services queue background work through ``send_task`` instead of calling
+Celery directly, so the same code runs against a Celery worker
+(JOB_EXECUTOR=celery, the default) or the in-process executor
+(JOB_EXECUTOR=local, see ``local_executor``).
+"""
+
+import logging
+import uuid
+from typing import Any, List, Optional
+
+from app.config import get_config
+
+logger = logging.getLogger(__name__)
+
+
+def uses_local_executor() -> bool:
+    """Whether jobs run in the brokerless local executor."""
+    return get_config().JOB_EXECUTOR == "local"
+
+
+def send_task(
+    name: str,
+    args: List[Any],
+    task_id: Optional[str] = None,
+    countdown: Optional[float] = None,
+) -> str:
+    """Queue a task by name and return its task ID."""
+    if uses_local_executor():
+        from .local_executor import get_local_executor
+
+        executor = get_local_executor()
+        if executor is not None:
+            return executor.submit(name, args, task_id, countdown)
+        # No executor in this process (e.g. a script); the API process's
+        # executor picks the task up from the shared queue table
+        from app.repositories import LocalTaskRepository
+
+        task_id = task_id or str(uuid.uuid4())
+        LocalTaskRepository().enqueue(task_id, name, args, countdown)
+        return task_id
+
+    from .celery_app import celery
+
+    task = celery.send_task(name, args=args, task_id=task_id, countdown=countdown)
+    return task.id
+
+
+def revoke_task(task_id: str, terminate: bool = False) -> None:
+    """Cancel a queued task, and kill it if it is running and ``terminate``."""
+    try:
+        if uses_local_executor():
+            from app.repositories import LocalTaskRepository
+
+            from .local_executor import get_local_executor
+
+            executor = get_local_executor()
+            if executor is not None:
+                executor.revoke(task_id, terminate)
+            else:
+                LocalTaskRepository().revoke(task_id)
+            return
+
+        from .celery_app import celery
+
+        celery.control.revoke(task_id, terminate=terminate)
+    except Exception as e:
+        logger.warning("Failed to revoke task %s: %s", task_id, e)
@@ -4,12 +4,13 @@ Celery task definitions for audio processing
 
 import shutil
 import traceback
-from datetime import datetime
+from datetime import datetime, timezone
 
 from app.config.logging import get_structured_logger
-from app.db.models import JobStatus
+from app.db.models import JobPhase, JobStatus
 from app.repositories import JobRepository
 from app.services import FileService, audio, file_management
+from app.services.job_timing import JobPhaseTimer
 from celery.utils.log import get_task_logger
 
 from .celery_app import celery
@@ -22,48 +23,6 @@ structured_logger = get_structured_logger(
 job_repository = JobRepository()
 
 
-def _broadcast_job_event(job, was_created=False):
-    """
-    Broadcast a job event via WebSocket if available.
-
-    Args:
-        job: The job object
-        was_created: Whether this is a newly created job
-    """
-    try:
-        from app.websockets.jobs_ws import (
-            broadcast_job_cancelled,
-            broadcast_job_completed,
-            broadcast_job_created,
-            broadcast_job_failed,
-            broadcast_job_update,
-        )
-
-        job_data = job.to_dict()
-
-        # Determine the appropriate broadcast function
-        if was_created:
-            broadcast_job_created(job_data)
-        else:
-            # Map job status to appropriate event type
-            if job.status == JobStatus.COMPLETED:
-                broadcast_job_completed(job_data)
-            elif job.status == JobStatus.FAILED:
-                broadcast_job_failed(job_data)
-            elif job.status == JobStatus.CANCELLED:
-                broadcast_job_cancelled(job_data)
-            else:
-                # For PENDING, PROCESSING, or other statuses
-                broadcast_job_update(job_data)
-
-    except ImportError:
-        # WebSocket not available, silently continue
-        pass
-    except Exception as e:
-        # Log the error but don't fail the operation
-        logger.warning("Failed to broadcast job event: %s", e)
-
-
 class AudioProcessingError(Exception):
     """Custom exception for audio processing errors"""
 
@@ -124,9 +83,19 @@ def process_audio_job(self, job_id):
     filepath = song_dir / "original.mp3"
     filename = filepath.name
 
+    from app.db.database import get_db_session
+    from app.repositories.song_repository import SongRepository
+
+    with get_db_session() as session:
+        song_duration_ms = (
+            SongRepository(session).fetch_durations([song_id]).get(song_id)
+        )
+    timer = JobPhaseTimer(job, job_repository, song_duration_ms)
+    timer.record_queue_wait()
+
     # Update job status to processing
     job.status = JobStatus.PROCESSING
-    job.started_at = datetime.now()
+    job.started_at = datetime.now(timezone.utc)
     job_repository.update(job)
 
     # Create a stop event (for compatibility with audio.separate_audio)
@@ -180,16 +149,18 @@ def process_audio_job(self, job_id):
             song_dir=song_dir,  # Pass the song directory
             status_callback=lambda msg: update_progress(20, msg),
             stop_event=stop_event,
+            phase_callback=timer.start,
         ):
             raise AudioProcessingError("Audio separation failed")
 
+        timer.start(JobPhase.FINALIZE)
+        timer.finish()
+
         job.status = JobStatus.COMPLETED
         job.progress = 100
-        job.completed_at = datetime.now()
+        job.completed_at = datetime.now(timezone.utc)
         job_repository.update(job)
 
-        _broadcast_job_event(job)
-
         return {
             "status": "success",
             "job_id": job_id,
@@ -207,9 +178,10 @@ def process_audio_job(self, job_id):
         }
 
     except audio.StopProcessingError:
+        timer.finish(record=False)
         job.status = JobStatus.CANCELLED
         job.error = "Processing was manually stopped"
-        job.completed_at = datetime.now()
+        job.completed_at = datetime.now(timezone.utc)
         job_repository.update(job)
         # Use song_dir here which is based on song_id, not job_id
         if song_dir.exists():
@@ -218,12 +190,13 @@ def process_audio_job(self, job_id):
         return {"status": "cancelled", "job_id": job_id, "filename": filename}
 
     except Exception as e:
+        timer.finish(record=False)
         error_message = str(e)
         logger.error("Error processing job %s: %s", job_id, error_message)
         traceback.print_exc()
         job.status = JobStatus.FAILED
         job.error = error_message
-        job.completed_at = datetime.now()
+        job.completed_at = datetime.now(timezone.utc)
         job_repository.update(job)
         return {
             "status": "error",
@@ -237,9 +210,14 @@ def process_audio_job(self, job_id):
 def cleanup_old_jobs(self):
     """
     Periodically clean up old job records and temporary files
+
+    Scheduled by Celery beat every JOB_CLEANUP_INTERVAL_HOURS; see
+    RetentionService for the individual steps.
     """
     logger.info("Running job cleanup task")
-    # Implement cleanup logic here
+    from app.services.retention_service import RetentionService
+
+    return RetentionService(job_repository, celery_app=celery).run()
 
 
 @celery.task(bind=True, name="process_youtube_job", max_retries=3)
@@ -271,7 +249,7 @@ def process_youtube_job(self, job_id, video_id, metadata):
     song_id = job.song_id
     if not song_id:
         logger.error("Job %s has no associated song_id", job_id)
-        return {"status": "error", "message": "No song ID associated with job"}    
+        return {"status": "error", "message": "No song ID associated with job"}
 
     # Verify the song exists
     from app.db.database import get_db_session
@@ -285,16 +263,19 @@ def process_youtube_job(self, job_id, video_id, metadata):
         # Mark job as failed
         job.status = JobStatus.FAILED
         job.error = f"Song {song_id} not found in database"
-        job.completed_at = datetime.now()
+        job.completed_at = datetime.now(timezone.utc)
         job_repository.update(job)
         return {"status": "error", "message": f"Song {song_id} not found"}
 
+    timer = JobPhaseTimer(job, job_repository, db_song.duration_ms)
+    timer.record_queue_wait()
+
     # Update job status to downloading
     job.status = JobStatus.DOWNLOADING
     job.status_message = "Downloading video from YouTube"
-    job.started_at = datetime.now()
+    job.started_at = datetime.now(timezone.utc)
     job.progress = 5
-    job_repository.update(job)
+    timer.start(JobPhase.DOWNLOAD)  # Persists the status change along with the phase
 
     def update_progress(progress, message, status=None):
         """Update job progress and status."""
@@ -336,12 +317,16 @@ def process_youtube_job(self, job_id, video_id, metadata):
 
         update_progress(10, "Starting YouTube download")
 
-        youtube_service.download_video(
+        _, downloaded_metadata = youtube_service.download_video(
             video_id_or_url=video_id,
             song_id=song_id,
             artist=metadata.get("artist"),
             title=metadata.get("title"),
         )
+        # Scale the download and audio phases by the real song length
+        timer.song_duration_ms = (
+            downloaded_metadata.get("duration_ms") or timer.song_duration_ms
+        )
 
         update_progress(
             30, "Download complete, starting audio processing", JobStatus.PROCESSING
@@ -371,6 +356,7 @@ def process_youtube_job(self, job_id, video_id, metadata):
             song_dir=song_dir,
             status_callback=audio_progress_callback,
             stop_event=stop_event,
+            phase_callback=timer.start,
         ):
             raise AudioProcessingError("Audio separation failed")
 
@@ -382,6 +368,7 @@ def process_youtube_job(self, job_id, video_id, metadata):
         update_progress(93, "Downloading thumbnail")
 
         # Phase 3A: Download thumbnail (separate from stepper-sensitive operations)
+        timer.start(JobPhase.THUMBNAIL)
         try:
             thumbnail_url = youtube_service.fetch_and_save_thumbnail(video_id, song_id)
             if thumbnail_url:
@@ -393,6 +380,7 @@ def process_youtube_job(self, job_id, video_id, metadata):
             logger.warning("Thumbnail download failed for %s: %s", video_id, e)
             update_progress(95, "Thumbnail download failed, continuing")
 
+        timer.start(JobPhase.FINALIZE)
         update_progress(99, "Finalizing processing")
 
         # Phase 1A Task 3: Update database with audio file paths after processing
@@ -439,15 +427,14 @@ def process_youtube_job(self, job_id, video_id, metadata):
             logger.error("Error updating audio paths for song %s: %s", song_id, e)
 
         # Any cleanup or final processing steps can go here
+        timer.finish()
 
         job.status = JobStatus.COMPLETED
         job.progress = 100
         job.status_message = "Processing complete"
-        job.completed_at = datetime.now()
+        job.completed_at = datetime.now(timezone.utc)
         job_repository.update(job)
 
-        _broadcast_job_event(job)
-
         return {
             "status": "success",
             "job_id": job_id,
@@ -461,9 +448,10 @@ def process_youtube_job(self, job_id, video_id, metadata):
         }
 
     except audio.StopProcessingError:
+        timer.finish(record=False)
         job.status = JobStatus.CANCELLED
         job.error = "Processing was manually stopped"
-        job.completed_at = datetime.now()
+        job.completed_at = datetime.now(timezone.utc)
         job_repository.update(job)
         # Use song_dir here which is based on song_id, not job_id
         if song_dir.exists():
@@ -472,65 +460,36 @@ def process_youtube_job(self, job_id, video_id, metadata):
         return {"status": "cancelled", "job_id": job_id}
 
     except Exception as e:
+        timer.finish(record=False)
         error_message = str(e)
         logger.error("Error processing YouTube job %s: %s", job_id, error_message)
         traceback.print_exc()
         job.status = JobStatus.FAILED
         job.error = error_message
-        job.completed_at = datetime.now()
+        job.completed_at = datetime.now(timezone.utc)
         job_repository.update(job)
         return {"status": "error", "job_id": job_id, "error": error_message}
 
 
-# Event system integration
-def _handle_job_event(event):
+# Subscribe to job events when module is imported
+def _setup_event_subscriptions():
     """
-    Handle job events from the event system.
+    Broadcast this process's job events to websocket clients.
 
-    This replaces the direct function calls from models.
+    JobRepository publishes every change on the event bus; the jobs
+    websocket handler is its only broadcaster, subscribed idempotently.
+    Local executor workers forward their events to the API process instead,
+    and Celery workers with an event transport hand them to the API nodes
+    (see ``app.utils.event_transport``), which makes the handler a no-op.
     """
-    try:
-        from app.db.models import Job, JobStatus
-        from app.utils.events import JobEvent
-
-        if isinstance(event, JobEvent):
-            # Reconstruct job object from event data
-            job_data = event.job_data
-            job = Job(
-                id=job_data["id"],
-                filename=job_data.get("filename", ""),
-                status=JobStatus(job_data["status"]),
-                title=job_data.get("title"),
-                artist=job_data.get("artist"),
-                status_message=job_data.get(
-                    "message"
-                ),  # Use status_message instead of message
-                progress=job_data.get("progress", 0),
-                error=job_data.get("error"),
-                task_id=job_data.get("task_id"),
-                song_id=job_data.get("song_id"),
-                notes=job_data.get("notes"),
-                created_at=job_data.get("created_at"),
-                started_at=job_data.get("started_at"),
-                completed_at=job_data.get("completed_at"),
-                dismissed=job_data.get("dismissed", False),
-            )
+    from .local_executor import in_local_worker
 
-            # Use the existing broadcast function
-            _broadcast_job_event(job, event.was_created)
-
-    except Exception as e:
-        logger.error("Error handling job event: %s", e, exc_info=True)
-
-
-# Subscribe to job events when module is imported
-def _setup_event_subscriptions():
-    """Set up event subscriptions for the jobs module."""
+    if in_local_worker():
+        return
     try:
-        from app.utils.events import subscribe_to_job_events
+        from app.websockets.jobs_ws import subscribe_job_broadcasts
 
-        subscribe_to_job_events(_handle_job_event)
-        logger.info("Jobs module subscribed to job events")
+        subscribe_job_broadcasts()
     except Exception as e:
         logger.error("Failed to set up job event subscriptions: %s", e)
 
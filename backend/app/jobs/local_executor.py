@@ -0,0 +1,230 @@
+"""
+Brokerless job executor for single-box deployments (JOB_EXECUTOR=local).
+
+Tasks are persisted in the ``local_tasks`` table and run in the API process's
+own pool of worker processes, at most JOB_WORKER_CONCURRENCY at a time. Each
+task gets a fresh process so it can be terminated on cancel and so model
+memory is returned when it ends. Workers run the regular Celery task bodies
+eagerly (``Task.apply``), so job status handling is identical to the Celery
+worker, and forward their job events to the API process, which publishes
+them on its own event bus for the websocket layer. Neither a broker nor the
+Socket.IO message queue is needed.
+"""
+
+import json
+import logging
+import multiprocessing
+import queue
+import threading
+import time
+import uuid
+from typing import Any, Callable, Dict, List, Optional
+
+from app.config import get_config
+from app.db.models import LocalTaskStatus
+from app.repositories import LocalTaskRepository
+
+logger = logging.getLogger(__name__)
+
+_in_worker = False
+_executor: Optional["LocalExecutor"] = None
+
+
+def in_local_worker() -> bool:
+    """Whether the current process is a local executor worker."""
+    return _in_worker
+
+
+def _worker_main(task_id: str, name: str, args: List[Any], event_queue) -> None:
+    """Entry point of a worker process: run one task and forward its events."""
+    global _in_worker
+    _in_worker = True
+
+    from app.jobs import jobs  # noqa: F401  Registers the task functions
+    from app.jobs.celery_app import celery
+    from app.utils.events import event_bus, subscribe_to_job_events
+
+    # Jobs are broadcast by the API process; here events are only forwarded
+    event_bus.clear_subscribers()
+    subscribe_to_job_events(
+        lambda event: event_queue.put((event.job_id, event.job_data, event.was_created))
+    )
+
+    result = celery.tasks[name].apply(args=args, task_id=task_id)
+    event_queue.close()
+    event_queue.join_thread()  # Flush forwarded events before exiting
+    if result.failed():
+        raise SystemExit(1)
+
+
+class LocalExecutor:
+    """Runs queued tasks in a bounded set of worker processes."""
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        repository: Optional[LocalTaskRepository] = None,
+        poll_interval: float = 1.0,
+        cleanup_interval: Optional[float] = None,
+        start_background_task: Optional[Callable[..., Any]] = None,
+        sleep: Optional[Callable[[float], Any]] = None,
+        worker_target: Callable[..., None] = _worker_main,
+    ):
+        config = get_config()
+        self.workers = max(1, workers or config.JOB_WORKER_CONCURRENCY)
+        self.repository = repository or LocalTaskRepository()
+        self.poll_interval = poll_interval
+        self.cleanup_interval = (
+            config.JOB_CLEANUP_INTERVAL_HOURS * 3600
+            if cleanup_interval is None
+            else cleanup_interval
+        )
+        # Under eventlet the loop must yield cooperatively; callers pass
+        # socketio.start_background_task and socketio.sleep
+        self._start_background_task = start_background_task or self._start_thread
+        self._sleep = sleep or time.sleep
+        self._worker_target = worker_target
+        self._context = multiprocessing.get_context("spawn")
+        self._events = self._context.Queue()
+        self._running: Dict[str, Any] = {}
+        self._wake = False
+        self._stopped = False
+        self._last_poll = 0.0
+        self._last_cleanup = time.monotonic()
+
+    @staticmethod
+    def _start_thread(target: Callable[[], None]) -> threading.Thread:
+        thread = threading.Thread(target=target, name="local-executor", daemon=True)
+        thread.start()
+        return thread
+
+    # --- Public API ---
+
+    def start(self) -> None:
+        """Resume interrupted tasks and start the dispatch loop."""
+        self.repository.requeue_running()
+        self._stopped = False
+        self._start_background_task(self._loop)
+        logger.info("Local job executor started with %d workers", self.workers)
+
+    def stop(self, terminate: bool = True) -> None:
+        """
+        Stop dispatching. Running workers are terminated by default; their
+        tasks stay marked running and are re-queued on the next start.
+        """
+        self._stopped = True
+        if terminate:
+            for process in list(self._running.values()):
+                process.terminate()
+                process.join(5)
+            self._running.clear()
+
+    def submit(
+        self,
+        name: str,
+        args: List[Any],
+        task_id: Optional[str] = None,
+        countdown: Optional[float] = None,
+    ) -> str:
+        """Queue a task and return its ID."""
+        task_id = task_id or str(uuid.uuid4())
+        self.repository.enqueue(task_id, name, args, countdown)
+        self._wake = True
+        return task_id
+
+    def revoke(self, task_id: str, terminate: bool = False) -> bool:
+        """Cancel a queued task, or kill a running one when ``terminate``."""
+        previous = self.repository.revoke(task_id)
+        process = self._running.get(task_id)
+        if previous == LocalTaskStatus.RUNNING.value and process and terminate:
+            process.terminate()
+        return previous is not None
+
+    # --- Dispatch loop ---
+
+    def _loop(self) -> None:
+        while not self._stopped:
+            try:
+                self.run_once()
+            except Exception as e:
+                logger.error("Local executor loop error: %s", e, exc_info=True)
+            self._sleep(0.1)
+        self._drain_events()
+
+    def run_once(self) -> None:
+        """One pass: relay events, reap finished workers, start due tasks."""
+        self._drain_events()
+        self._reap()
+
+        now = time.monotonic()
+        if self.cleanup_interval and now - self._last_cleanup >= self.cleanup_interval:
+            self._last_cleanup = now
+            self.submit("cleanup_old_jobs", [])
+
+        if len(self._running) >= self.workers:
+            return
+        if not self._wake and now - self._last_poll < self.poll_interval:
+            return
+        self._wake = False
+        self._last_poll = now
+        while len(self._running) < self.workers:
+            task = self.repository.claim_next()
+            if task is None:
+                break
+            self._launch(task.id, task.name, task.args)
+
+    def _launch(self, task_id: str, name: str, args_json: str) -> None:
+        process = self._context.Process(
+            target=self._worker_target,
+            args=(task_id, name, json.loads(args_json), self._events),
+            name=f"local-task-{task_id[:8]}",
+        )
+        process.start()
+        self._running[task_id] = process
+        logger.info("Started local task %s (%s) in pid %s", task_id, name, process.pid)
+
+    def _reap(self) -> None:
+        for task_id, process in list(self._running.items()):
+            if process.is_alive():
+                continue
+            del self._running[task_id]
+            if process.exitcode == 0:
+                self.repository.finish(task_id, LocalTaskStatus.DONE)
+            else:
+                # No-op for revoked tasks, which are no longer marked running
+                self.repository.finish(
+                    task_id,
+                    LocalTaskStatus.FAILED,
+                    f"Worker exited with code {process.exitcode}",
+                )
+            process.close()
+
+    def _drain_events(self) -> None:
+        from app.utils.events import publish_job_event
+
+        while True:
+            try:
+                job_id, job_data, was_created = self._events.get_nowait()
+            except queue.Empty:
+                return
+            publish_job_event(job_id, job_data, was_created)
+
+
+def get_local_executor() -> Optional[LocalExecutor]:
+    """The executor running in this process, if one was started."""
+    return _executor
+
+
+def start_local_executor(socketio=None) -> LocalExecutor:
+    """Create and start this process's executor (idempotent)."""
+    global _executor
+    if _executor is None:
+        if socketio is not None:
+            _executor = LocalExecutor(
+                start_background_task=socketio.start_background_task,
+                sleep=socketio.sleep,
+            )
+        else:
+            _executor = LocalExecutor()
+        _executor.start()
+    return _executor
@@ -69,6 +69,30 @@ if __name__ == "__main__":
     debug = os.environ.get("FLASK_DEBUG", "False").lower() == "true"
     use_reloader = os.environ.get("FLASK_USE_RELOADER", "true").lower() == "true"
 
+    # Broadcast job events from a dispatcher thread, off the request and
+    # database code paths that publish them
+    from app.services.job_journal import start_job_journal
+    from app.utils.events import start_event_dispatcher
+
+    start_event_dispatcher()
+    start_job_journal()
+
+    # Receive job events from Celery workers (and other API nodes); with the
+    # reloader only the child process that serves clients listens
+    if not use_reloader or os.environ.get("WERKZEUG_RUN_MAIN") == "true":
+        from app.utils.event_transport import start_event_relay
+
+        start_event_relay(receive=True)
+
+    # Run jobs in-process when configured; with the reloader only the child
+    # process that actually serves requests starts the executor
+    if config.JOB_EXECUTOR == "local" and (
+        not use_reloader or os.environ.get("WERKZEUG_RUN_MAIN") == "true"
+    ):
+        from app.jobs.local_executor import start_local_executor
+
+        start_local_executor(socketio)
+
     print(f"Starting Open Karaoke Studio API Server on http://0.0.0.0:{port}")
     print(f"Debug mode: {debug}")
 
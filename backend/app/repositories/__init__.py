@@ -2,8 +2,12 @@
 Repository layer for data access operations.
 """
 
+from .job_event_repository import JobEventRepository
 from .job_repository import JobRepository
+from .local_task_repository import LocalTaskRepository
 
 __all__ = [
+    "JobEventRepository",
     "JobRepository",
+    "LocalTaskRepository",
 ]
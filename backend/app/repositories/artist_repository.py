@@ -0,0 +1,172 @@
+"""
+Repository for the artist summary table behind the artist browser.
+"""
+
+import logging
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+
+from app.db.models import DbArtistSummary, DbSong
+from app.db.models.artist import artist_first_letter, normalize_artist
+from sqlalchemy import func
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Query, Session
+
+logger = logging.getLogger(__name__)
+
+
+def adjust_artist_counts(session: Session, deltas: "Counter[str]") -> None:
+    """
+    Apply song count changes per artist in the caller's transaction, so the
+    summaries commit or roll back together with the songs they describe.
+    """
+    deltas = Counter({name: delta for name, delta in deltas.items() if delta})
+    if not deltas:
+        return
+    if session.query(DbArtistSummary.name).first() is None:
+        # Not seeded yet: the first read counts the songs directly
+        return
+    statement = sqlite_insert(DbArtistSummary)
+    statement = statement.on_conflict_do_update(
+        index_elements=[DbArtistSummary.name],
+        set_={"song_count": DbArtistSummary.song_count + statement.excluded.song_count},
+    )
+    session.execute(
+        statement,
+        [
+            {
+                "name": name,
+                "normalized_name": normalize_artist(name),
+                "first_letter": artist_first_letter(name),
+                "song_count": delta,
+            }
+            for name, delta in deltas.items()
+        ],
+    )
+    session.query(DbArtistSummary).filter(
+        DbArtistSummary.name.in_(list(deltas)), DbArtistSummary.song_count <= 0
+    ).delete(synchronize_session=False)
+
+
+class ArtistRepository:
+    """
+    Paginated artist listing, search and per-letter navigation over the
+    artist summaries, which SongRepository keeps in step with the songs.
+
+    Args:
+        db (Session): SQLAlchemy database session.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def fetch_page(
+        self,
+        *,
+        search: Optional[str] = None,
+        letter: Optional[str] = None,
+        limit: int = 100,
+        offset: int = 0,
+    ) -> Tuple[List[DbArtistSummary], int]:
+        """
+        Fetch one page of artists in browser order (by first letter, then name).
+
+        Args:
+            search: Only artists whose name contains this, ignoring case
+            letter: Only artists listed under this letter
+            limit: Maximum number of artists to return
+            offset: Number of artists to skip
+
+        Returns:
+            (artists, total number of matching artists)
+        """
+        self._ensure_seeded()
+        query = self._filtered(search)
+        if letter:
+            query = query.filter(DbArtistSummary.first_letter == letter.upper())
+        total = query.count()
+        artists = (
+            query.order_by(
+                DbArtistSummary.first_letter,
+                DbArtistSummary.normalized_name,
+                DbArtistSummary.name,
+            )
+            .offset(offset)
+            .limit(limit)
+            .all()
+        )
+        return artists, total
+
+    def fetch_letters(self, *, search: Optional[str] = None) -> List[Dict]:
+        """
+        Letters that have artists, with the number of artists under each and
+        the offset of its first artist in fetch_page, for jump navigation.
+        """
+        self._ensure_seeded()
+        rows = (
+            self._filtered(search)
+            .with_entities(
+                DbArtistSummary.first_letter,
+                func.count(),  # pylint: disable=not-callable
+            )
+            .group_by(DbArtistSummary.first_letter)
+            .order_by(DbArtistSummary.first_letter)
+            .all()
+        )
+        letters, offset = [], 0
+        for letter, count in rows:
+            letters.append({"letter": letter, "artistCount": count, "offset": offset})
+            offset += count
+        return letters
+
+    def _filtered(self, search: Optional[str]) -> Query:
+        query = self.db.query(DbArtistSummary)
+        if search:
+            query = query.filter(
+                DbArtistSummary.normalized_name.like(f"%{normalize_artist(search)}%")
+            )
+        return query
+
+    def _ensure_seeded(self) -> None:
+        if self.db.query(DbArtistSummary.name).first() is None:
+            self.reconcile()
+
+    def reconcile(self) -> Dict[str, int]:
+        """
+        Reset the artist summaries to the actual song counts, seeding them if
+        they do not exist yet.
+
+        Returns:
+            The corrections applied to existing summaries, by artist
+        """
+        actual = dict(
+            self.db.query(
+                DbSong.artist, func.count(DbSong.id)  # pylint: disable=not-callable
+            ).group_by(DbSong.artist)
+        )
+        stored = {row.name: row for row in self.db.query(DbArtistSummary)}
+        seeding = not stored
+        corrections: Dict[str, int] = {}
+        for name, count in actual.items():
+            row = stored.pop(name, None)
+            if row is None:
+                self.db.add(
+                    DbArtistSummary(
+                        name=name,
+                        normalized_name=normalize_artist(name),
+                        first_letter=artist_first_letter(name),
+                        song_count=count,
+                    )
+                )
+                if not seeding:
+                    corrections[name] = count
+            elif row.song_count != count:
+                corrections[name] = count - row.song_count  # type: ignore[operator]
+                row.song_count = count  # type: ignore[assignment]
+        for name, row in stored.items():
+            corrections[name] = -row.song_count  # type: ignore[assignment]
+            self.db.delete(row)
+        self.db.commit()
+        if corrections:
+            logger.warning("Corrected drifted artist summaries: %s", corrections)
+        return corrections
@@ -0,0 +1,88 @@
+"""
+Repository for the append-only job event journal.
+"""
+
+import logging
+from datetime import datetime
+from typing import Any, List, Optional
+
+from app.db.models import DbJobEvent
+from sqlalchemy import func, insert
+
+logger = logging.getLogger(__name__)
+
+
+class JobEventRepository:
+    """Repository class for appending and reading journaled job events."""
+
+    def __init__(self):
+        from app.db.database import get_db_session
+
+        self.get_db_session = get_db_session
+
+    def append_many(self, rows: List[dict[str, Any]]) -> None:
+        """Insert a batch of events in one transaction."""
+        if not rows:
+            return
+        with self.get_db_session() as session:
+            session.execute(insert(DbJobEvent), rows)
+            session.commit()
+
+    def get_job_events(self, job_id: str) -> List[DbJobEvent]:
+        """Every journaled event of a job, oldest first."""
+        with self.get_db_session() as session:
+            events = (
+                session.query(DbJobEvent)
+                .filter(DbJobEvent.job_id == job_id)
+                .order_by(DbJobEvent.id.asc())
+                .all()
+            )
+            session.expunge_all()
+            return events
+
+    def has_seq(self, seq: int) -> bool:
+        """Whether the event broadcast with ``seq`` is still journaled."""
+        with self.get_db_session() as session:
+            return (
+                session.query(DbJobEvent.id).filter(DbJobEvent.seq == seq).first()
+                is not None
+            )
+
+    def latest_since(self, seq: int, limit: int) -> Optional[List[DbJobEvent]]:
+        """
+        The newest event of each job changed after ``seq``, oldest first.
+
+        Returns:
+            The events, or None if more than ``limit`` jobs changed
+        """
+        with self.get_db_session() as session:
+            latest = (
+                session.query(func.max(DbJobEvent.id))
+                .filter(DbJobEvent.seq > seq)
+                .group_by(DbJobEvent.job_id)
+                .limit(limit + 1)
+                .all()
+            )
+            if len(latest) > limit:
+                return None
+            events = (
+                session.query(DbJobEvent)
+                .filter(DbJobEvent.id.in_([event_id for (event_id,) in latest]))
+                .order_by(DbJobEvent.seq.asc())
+                .all()
+            )
+            session.expunge_all()
+            return events
+
+    def purge_before(self, cutoff: datetime) -> int:
+        """Delete events recorded before ``cutoff``, returning how many."""
+        with self.get_db_session() as session:
+            count = (
+                session.query(DbJobEvent)
+                .filter(DbJobEvent.created_at < cutoff)
+                .delete(synchronize_session=False)
+            )
+            session.commit()
+        if count:
+            logger.info("Purged %d journaled job events", count)
+        return count
@@ -4,52 +4,121 @@ Repository for job data access operations.
 
 import logging
 import traceback
-from typing import List, Optional
-
-from app.db.models import DbJob, Job, JobStatus
+from collections import Counter
+from datetime import datetime, timezone
+from typing import List, Optional, Sequence, Tuple
+
+from app.config import get_config
+from app.db.models import (
+    DbJob,
+    DbJobArchive,
+    DbJobPhaseTiming,
+    DbJobStatusCount,
+    Job,
+    JobStatus,
+)
+from sqlalchemy import and_, func, insert, literal, or_, select
+from sqlalchemy.orm import Query, Session
+
+from .pagination import decode_cursor, encode_cursor
 
 logger = logging.getLogger(__name__)
 
 
+def _newest_first(query: Query) -> Query:
+    # The id tie-break gives equal timestamps a stable order for cursors
+    return query.order_by(DbJob.created_at.desc(), DbJob.id.desc())
+
+
+def _adjust_status_counts(session: Session, deltas: "Counter[str]") -> None:
+    """
+    Apply status count changes in the caller's transaction, so counters
+    commit or roll back together with the jobs they describe.
+    """
+    for status, delta in deltas.items():
+        if delta:
+            # Rows exist once reconcile_stats has seeded them; until then
+            # this is a no-op and the seed counts the jobs directly
+            session.query(DbJobStatusCount).filter(
+                DbJobStatusCount.status == status
+            ).update(
+                {DbJobStatusCount.count: DbJobStatusCount.count + delta},
+                synchronize_session=False,
+            )
+
+
+def _count_transition(
+    session: Session, old_status: Optional[str], new_status: Optional[str]
+) -> None:
+    if old_status != new_status:
+        deltas: "Counter[str]" = Counter()
+        if old_status:
+            deltas[old_status] -= 1
+        if new_status:
+            deltas[new_status] += 1
+        _adjust_status_counts(session, deltas)
+
+
+def _transition_status(
+    session: Session, job_id: str, expected: Optional[str], new: Optional[str]
+) -> None:
+    """
+    Move a job from status ``expected`` to ``new`` (None deletes it) and
+    count the transition, in the caller's transaction.
+
+    The write only matches while the job still has ``expected``, so two
+    writers that read the same status cannot both count leaving it: the
+    second finds the row changed, reads the status again (its write lock
+    keeps that read current) and counts from there.
+    """
+    if expected == new:
+        return
+    query = session.query(DbJob).filter(DbJob.id == job_id)
+
+    def write(statuses: Query) -> int:
+        if new is None:
+            return statuses.delete(synchronize_session=False)
+        return statuses.update({DbJob.status: new}, synchronize_session=False)
+
+    if not write(query.filter(DbJob.status == expected)):
+        current = query.with_entities(DbJob.status).scalar()
+        if current is None or current == new:
+            # Deleted, or already moved (and counted) by the other writer
+            return
+        write(query)
+        expected = current
+    _count_transition(session, expected, new)
+
+
 class JobRepository:
     """Repository class for managing job persistence in the database."""
 
     def __init__(self):
-        from app.db.database import SessionLocal, engine, get_db_session
+        # Tables are created by ensure_db_schema when the API or a worker
+        # starts; repositories are constructed per task and must stay cheap
+        from app.db.database import SessionLocal, get_db_session
 
         self.get_db_session = get_db_session
         self.SessionLocal = SessionLocal
-
-        DbJob.__table__.create(bind=engine, checkfirst=True)
+        # Opt-in table diagnostics on failed lookups (JOB_REPOSITORY_DIAGNOSTICS)
+        self.diagnostics = get_config().JOB_REPOSITORY_DIAGNOSTICS
 
     def create(self, job: Job) -> None:
         """Create or update a job in the database."""
         try:
             was_created = False
+            status_changed = False
 
             with self.get_db_session() as session:
                 db_job = session.query(DbJob).filter(DbJob.id == job.id).first()
                 if not db_job:
                     was_created = True
-                    db_job = DbJob(
-                        id=job.id,
-                        filename=job.filename,
-                        status=job.status.value,
-                        progress=job.progress,
-                        status_message=job.status_message,
-                        task_id=job.task_id,
-                        song_id=job.song_id,
-                        title=job.title,
-                        artist=job.artist,
-                        created_at=job.created_at,
-                        started_at=job.started_at,
-                        completed_at=job.completed_at,
-                        error=job.error,
-                        notes=job.notes,
-                        dismissed=job.dismissed,
-                    )
+                    db_job = DbJob.from_job(job)
                     session.add(db_job)
+                    _count_transition(session, None, job.status.value)
                 else:
+                    status_changed = db_job.status != job.status.value
+                    _transition_status(session, job.id, db_job.status, job.status.value)  # type: ignore[arg-type]
                     db_job.filename = job.filename  # type: ignore
                     db_job.status = job.status.value  # type: ignore
                     db_job.progress = job.progress  # type: ignore
@@ -63,6 +132,9 @@ class JobRepository:
                     db_job.error = job.error  # type: ignore
                     db_job.notes = job.notes  # type: ignore
                     db_job.dismissed = job.dismissed  # type: ignore
+                    db_job.phase = job.phase or "created"  # type: ignore
+                    db_job.phase_started_at = job.phase_started_at  # type: ignore
+                    db_job.parent_job_id = job.parent_job_id  # type: ignore
 
                 session.flush()
                 session.commit()
@@ -92,6 +164,9 @@ class JobRepository:
                 )
                 publish_job_event(job.id, job.to_dict(), was_created)
 
+            if job.parent_job_id and status_changed:
+                self.refresh_parent(job.parent_job_id)
+
         except Exception as e:
             logger.error("Error saving job %s: %s", job.id, e)
             traceback.print_exc()
@@ -100,37 +175,30 @@ class JobRepository:
     def get_job(self, job_id: str) -> Optional[Job]:
         """Retrieve a job from the database by its ID."""
         try:
-            logger.debug("Attempting to retrieve job %s from database", job_id)
-
             with self.get_db_session() as session:
-                from app.db.database import engine
-
-                logger.debug("Database engine URL: %s", engine.url)
-
-                # First, let's check how many jobs exist in total
-                total_jobs = session.query(DbJob).count()
-                logger.debug("Total jobs in database: %s", total_jobs)
-
-                # Check for jobs with similar IDs (for debugging)
-                all_job_ids = session.query(DbJob.id).all()
-                logger.debug(
-                    "All job IDs in database: %s...",
-                    [job.id for job in all_job_ids[:5]],
-                )  # Log first 5
-
-                db_job = session.query(DbJob).filter(DbJob.id == job_id).first()
+                db_job = session.get(DbJob, job_id)
                 if not db_job:
                     logger.debug("Job %s not found in database", job_id)
+                    if self.diagnostics:
+                        self._log_diagnostics(session)
                     return None
-                else:
-                    logger.debug("Found job %s with status %s", job_id, db_job.status)
-                    return db_job.to_job()
+                return db_job.to_job()
 
         except Exception as e:
             logger.error("Error getting job %s: %s", job_id, e)
             traceback.print_exc()
             return None
 
+    @staticmethod
+    def _log_diagnostics(session: Session) -> None:
+        """Log what the jobs table holds; scans the whole table."""
+        from app.db.database import engine
+
+        logger.debug("Database engine URL: %s", engine.url)
+        logger.debug("Total jobs in database: %s", session.query(DbJob).count())
+        sample = session.query(DbJob.id).limit(5).all()
+        logger.debug("Sample job IDs in database: %s", [row.id for row in sample])
+
     def get_by_id(self, job_id: str) -> Optional[Job]:
         """Retrieve a job from the database by its ID (standard naming convention)."""
         return self.get_job(job_id)
@@ -139,24 +207,199 @@ class JobRepository:
         """Update an existing job in the database (standard naming convention)."""
         return self.create(job)
 
+    def create_many(self, jobs: List[Job], session: Optional[Session] = None) -> None:
+        """
+        Insert many new jobs in a single transaction.
+
+        When ``session`` is given the rows join the caller's pending changes
+        (e.g. the songs the jobs belong to) and are committed together with
+        them. Creation events are published once the commit succeeds.
+        """
+        if not jobs:
+            return
+        deltas = Counter(job.status.value for job in jobs)
+        try:
+            if session is not None:
+                session.add_all([DbJob.from_job(job) for job in jobs])
+                _adjust_status_counts(session, deltas)
+                session.commit()
+            else:
+                with self.get_db_session() as own_session:
+                    own_session.add_all([DbJob.from_job(job) for job in jobs])
+                    _adjust_status_counts(own_session, deltas)
+                    own_session.commit()
+        except Exception as e:
+            logger.error("Error saving %d jobs: %s", len(jobs), e)
+            raise
+
+        from app.utils.events import publish_job_event
+
+        for job in jobs:
+            publish_job_event(job.id, job.to_dict(), True)
+
+    def get_child_jobs(self, parent_job_id: str) -> List[Job]:
+        """Get the children of a bulk import job, oldest first."""
+        try:
+            with self.get_db_session() as session:
+                db_jobs = (
+                    session.query(*DbJob.job_columns())
+                    .filter(DbJob.parent_job_id == parent_job_id)
+                    .order_by(DbJob.created_at.asc())
+                    .all()
+                )
+                return [DbJob.row_to_job(row) for row in db_jobs]
+        except Exception as e:
+            logger.error(
+                "Error getting child jobs of %s: %s", parent_job_id, e, exc_info=True
+            )
+            return []
+
+    def refresh_parent(self, parent_job_id: str) -> Optional[Job]:
+        """
+        Recompute a parent job's status and progress from its children.
+
+        Finished children count as 100%; the parent completes once every child
+        has finished, and fails only if none of them succeeded.
+        """
+        terminal = {
+            JobStatus.COMPLETED.value,
+            JobStatus.FAILED.value,
+            JobStatus.CANCELLED.value,
+        }
+        try:
+            with self.get_db_session() as session:
+                rows = (
+                    session.query(
+                        DbJob.status, func.count(DbJob.id), func.sum(DbJob.progress)
+                    )
+                    .filter(DbJob.parent_job_id == parent_job_id)
+                    .group_by(DbJob.status)
+                    .all()
+                )
+                parent = session.query(DbJob).filter(DbJob.id == parent_job_id).first()
+                if not parent or not rows or parent.status in terminal:
+                    return None
+
+                counts = {status: count for status, count, _ in rows}
+                total = sum(counts.values())
+                completed = counts.get(JobStatus.COMPLETED.value, 0)
+                failed = counts.get(JobStatus.FAILED.value, 0) + counts.get(
+                    JobStatus.CANCELLED.value, 0
+                )
+                work = sum(
+                    100 * count if status in terminal else (progress or 0)
+                    for status, count, progress in rows
+                )
+
+                now = datetime.now(timezone.utc)
+                if completed + failed == total:
+                    status = JobStatus.COMPLETED if completed else JobStatus.FAILED
+                    parent.completed_at = now  # type: ignore
+                elif counts.get(JobStatus.PENDING.value, 0) < total:
+                    status = JobStatus.PROCESSING
+                else:
+                    status = JobStatus.PENDING
+                if status != JobStatus.PENDING and parent.started_at is None:
+                    parent.started_at = now  # type: ignore
+                _transition_status(session, parent_job_id, parent.status, status.value)  # type: ignore[arg-type]
+                parent.status = status.value  # type: ignore
+                parent.progress = work // total  # type: ignore
+                message = f"{completed}/{total} imported"
+                if failed:
+                    message += f", {failed} failed"
+                parent.status_message = message  # type: ignore
+                session.commit()
+                job = parent.to_job()
+
+            from app.utils.events import publish_job_event
+
+            publish_job_event(job.id, job.to_dict(), False)
+            return job
+        except Exception as e:
+            # Aggregate progress is cosmetic; never fail the child's update
+            logger.warning("Error refreshing parent job %s: %s", parent_job_id, e)
+            return None
+
     def get_all_jobs(self) -> List[Job]:
         """Retrieve all jobs from the database."""
         try:
             with self.get_db_session() as session:
-                db_jobs = session.query(DbJob).all()
-                return [db_job.to_job() for db_job in db_jobs]
+                db_jobs = _newest_first(session.query(*DbJob.job_columns())).all()
+                return [DbJob.row_to_job(row) for row in db_jobs]
         except Exception as e:
             logger.error("Error getting all jobs: %s", e, exc_info=True)
             return []
 
+    def list_jobs(
+        self,
+        statuses: Optional[Sequence[JobStatus]] = None,
+        dismissed: Optional[bool] = None,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[Job], Optional[str]]:
+        """
+        Get one page of jobs, newest first.
+
+        Args:
+            statuses: Only jobs in one of these statuses (all when None)
+            dismissed: Only dismissed (True) or active (False) jobs; both when None
+            limit: Maximum number of jobs to return
+            cursor: The next_cursor of the previous page
+
+        Returns:
+            (jobs, next_cursor); next_cursor is None on the last page
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        query_filters = []
+        if statuses:
+            query_filters.append(
+                DbJob.status.in_([status.value for status in statuses])
+            )
+        if dismissed is not None:
+            query_filters.append(DbJob.dismissed.is_(dismissed))
+        if cursor:
+            created_at, job_id = decode_cursor(cursor, 2)
+            # NULL timestamps sort last in descending order
+            if created_at is None:
+                query_filters.append(
+                    and_(DbJob.created_at.is_(None), DbJob.id < job_id)
+                )
+            else:
+                query_filters.append(
+                    or_(
+                        DbJob.created_at < created_at,
+                        and_(DbJob.created_at == created_at, DbJob.id < job_id),
+                        DbJob.created_at.is_(None),
+                    )
+                )
+
+        with self.get_db_session() as session:
+            db_jobs = (
+                _newest_first(
+                    session.query(*DbJob.job_columns()).filter(*query_filters)
+                )
+                .limit(limit + 1)
+                .all()
+            )
+            next_cursor = None
+            if len(db_jobs) > limit:
+                db_jobs = db_jobs[:limit]
+                last = db_jobs[-1]
+                next_cursor = encode_cursor(last.created_at, last.id)
+            return [DbJob.row_to_job(row) for row in db_jobs], next_cursor
+
     def get_jobs_by_status(self, status: JobStatus) -> List[Job]:
         """Get jobs filtered by status."""
         try:
             with self.get_db_session() as session:
-                db_jobs = (
-                    session.query(DbJob).filter(DbJob.status == status.value).all()
-                )
-                return [db_job.to_job() for db_job in db_jobs]
+                db_jobs = _newest_first(
+                    session.query(*DbJob.job_columns()).filter(
+                        DbJob.status == status.value
+                    )
+                ).all()
+                return [DbJob.row_to_job(row) for row in db_jobs]
         except Exception as e:
             logger.error(
                 "Error getting jobs by status %s: %s", status, e, exc_info=True
@@ -169,7 +412,7 @@ class JobRepository:
             with self.get_db_session() as session:
                 db_job = session.query(DbJob).filter(DbJob.id == job_id).first()
                 if db_job:
-                    session.delete(db_job)
+                    _transition_status(session, job_id, db_job.status, None)  # type: ignore[arg-type]
                     session.commit()
                     return True
                 return False
@@ -197,62 +440,204 @@ class JobRepository:
             return False
 
     def get_stats(self) -> dict[str, int]:
-        """Get job statistics."""
+        """Get job statistics from the maintained per-status counters."""
         try:
             with self.get_db_session() as session:
-                total = session.query(DbJob).count()
-                pending = (
-                    session.query(DbJob)
-                    .filter(DbJob.status == JobStatus.PENDING.value)
-                    .count()
-                )
-                processing = (
-                    session.query(DbJob)
-                    .filter(DbJob.status == JobStatus.PROCESSING.value)
-                    .count()
+                counts = dict(
+                    session.query(DbJobStatusCount.status, DbJobStatusCount.count)
                 )
-                completed = (
-                    session.query(DbJob)
-                    .filter(DbJob.status == JobStatus.COMPLETED.value)
-                    .count()
+            if not counts:
+                # First use on this database: seed the counters
+                self.reconcile_stats()
+                with self.get_db_session() as session:
+                    counts = dict(
+                        session.query(DbJobStatusCount.status, DbJobStatusCount.count)
+                    )
+        except Exception as e:
+            logger.error("Error getting job statistics: %s", e, exc_info=True)
+            counts = {}
+        return self._format_stats(counts)
+
+    @staticmethod
+    def _format_stats(counts: dict[str, int]) -> dict[str, int]:
+        def count(status: JobStatus) -> int:
+            return max(0, counts.get(status.value, 0))
+
+        failed = count(JobStatus.FAILED)
+        cancelled = count(JobStatus.CANCELLED)
+        return {
+            "total": sum(max(0, value) for value in counts.values()),
+            "queue_length": count(JobStatus.PENDING),
+            "active_jobs": count(JobStatus.PROCESSING),
+            "completed_jobs": count(JobStatus.COMPLETED),
+            "failed_jobs": failed + cancelled,
+            "raw_failed": failed,
+            "raw_cancelled": cancelled,
+        }
+
+    @staticmethod
+    def _count_by_status(session: Session) -> dict[str, int]:
+        """Count jobs per status with a single GROUP BY query."""
+        return dict(
+            session.query(DbJob.status, func.count(DbJob.id)).group_by(DbJob.status)
+        )
+
+    def reconcile_stats(self) -> dict[str, int]:
+        """
+        Reset the status counters to the actual number of jobs per status,
+        seeding them if they do not exist yet.
+
+        Returns:
+            The corrections applied to existing counters, by status
+        """
+        corrections: dict[str, int] = {}
+        with self.get_db_session() as session:
+            actual = self._count_by_status(session)
+            stored = {row.status: row for row in session.query(DbJobStatusCount)}
+            for status in {*(s.value for s in JobStatus), *actual}:
+                count = actual.get(status, 0)
+                row = stored.get(status)
+                if row is None:
+                    session.add(DbJobStatusCount(status=status, count=count))
+                elif row.count != count:
+                    corrections[status] = count - row.count  # type: ignore[operator]
+                    row.count = count  # type: ignore[assignment]
+            session.commit()
+        if corrections:
+            logger.warning("Corrected drifted job status counters: %s", corrections)
+        return corrections
+
+    def get_unfinished_jobs(self) -> List[Job]:
+        """Get all pending or running jobs, oldest first (queue order)."""
+        terminal = [
+            JobStatus.COMPLETED.value,
+            JobStatus.FAILED.value,
+            JobStatus.CANCELLED.value,
+        ]
+        try:
+            with self.get_db_session() as session:
+                db_jobs = (
+                    session.query(*DbJob.job_columns())
+                    .filter(DbJob.status.notin_(terminal))
+                    .order_by(DbJob.created_at.asc())
+                    .all()
                 )
-                failed = (
-                    session.query(DbJob)
-                    .filter(DbJob.status == JobStatus.FAILED.value)
-                    .count()
+                return [DbJob.row_to_job(row) for row in db_jobs]
+        except Exception as e:
+            logger.error("Error getting unfinished jobs: %s", e, exc_info=True)
+            return []
+
+    def record_phase_timing(
+        self,
+        job_id: str,
+        phase: str,
+        started_at: datetime,
+        duration_seconds: float,
+        song_duration_ms: Optional[int] = None,
+        host: Optional[str] = None,
+    ) -> None:
+        """Persist the measured duration of one job phase."""
+        try:
+            with self.get_db_session() as session:
+                session.add(
+                    DbJobPhaseTiming(
+                        job_id=job_id,
+                        phase=phase,
+                        started_at=started_at,
+                        duration_seconds=duration_seconds,
+                        song_duration_ms=song_duration_ms,
+                        host=host,
+                    )
                 )
-                cancelled = (
-                    session.query(DbJob)
-                    .filter(DbJob.status == JobStatus.CANCELLED.value)
-                    .count()
+                session.commit()
+        except Exception as e:
+            # Timing history is advisory; never fail a job because of it
+            logger.warning("Error recording %s timing for job %s: %s", phase, job_id, e)
+
+    def get_recent_phase_timings(
+        self, phase: str, limit: int = 20, host: Optional[str] = None
+    ) -> List[DbJobPhaseTiming]:
+        """Get the most recent timings for a phase, optionally for one host."""
+        try:
+            with self.get_db_session() as session:
+                query = session.query(DbJobPhaseTiming).filter(
+                    DbJobPhaseTiming.phase == phase
                 )
-                return {
-                    "total": total,
-                    "queue_length": pending,
-                    "active_jobs": processing,
-                    "completed_jobs": completed,
-                    "failed_jobs": failed + cancelled,
-                    "raw_failed": failed,
-                    "raw_cancelled": cancelled,
-                }
+                if host:
+                    query = query.filter(DbJobPhaseTiming.host == host)
+                timings = query.order_by(DbJobPhaseTiming.id.desc()).limit(limit).all()
+                session.expunge_all()
+                return timings
         except Exception as e:
-            logger.error("Error getting job statistics: %s", e, exc_info=True)
-            return {
-                "total": 0,
-                "queue_length": 0,
-                "active_jobs": 0,
-                "completed_jobs": 0,
-                "failed_jobs": 0,
-                "raw_failed": 0,
-                "raw_cancelled": 0,
-            }
+            logger.error("Error getting %s timings: %s", phase, e, exc_info=True)
+            return []
+
+    def purge_terminal_jobs(
+        self, older_than: datetime, archive: bool = True, batch_size: int = 500
+    ) -> List[Optional[str]]:
+        """
+        Remove finished jobs that ended before ``older_than``.
+
+        Jobs are copied to ``jobs_archive`` first unless ``archive`` is False.
+        Work is done in batches, each in its own transaction, so writers are
+        never blocked for long.
+
+        Returns:
+            The Celery task IDs of the removed jobs
+        """
+        terminal = [
+            JobStatus.COMPLETED.value,
+            JobStatus.FAILED.value,
+            JobStatus.CANCELLED.value,
+        ]
+        ended_at = func.coalesce(DbJob.completed_at, DbJob.created_at)
+        task_ids: List[Optional[str]] = []
+        with self.get_db_session() as session:
+            while True:
+                rows = (
+                    session.query(DbJob.id, DbJob.task_id, DbJob.status)
+                    .filter(DbJob.status.in_(terminal), ended_at < older_than)
+                    .limit(batch_size)
+                    .all()
+                )
+                if not rows:
+                    break
+                ids = [job_id for job_id, _, _ in rows]
+                if archive:
+                    columns = DbJobArchive.COPIED_COLUMNS
+                    archived_at = datetime.now(timezone.utc)
+                    session.execute(
+                        insert(DbJobArchive)
+                        .prefix_with("OR REPLACE", dialect="sqlite")
+                        .from_select(
+                            [*columns, "archived_at"],
+                            select(
+                                *(getattr(DbJob, column) for column in columns),
+                                literal(archived_at, DbJobArchive.archived_at.type),
+                            ).where(DbJob.id.in_(ids)),
+                        )
+                    )
+                session.query(DbJob).filter(DbJob.id.in_(ids)).delete(
+                    synchronize_session=False
+                )
+                removed: "Counter[str]" = Counter()
+                for _, _, status in rows:
+                    removed[status] -= 1
+                _adjust_status_counts(session, removed)
+                session.commit()
+                task_ids.extend(task_id for _, task_id, _ in rows)
+        return task_ids
 
     def get_active_jobs(self) -> List[Job]:
         """Get all non-dismissed jobs for the main UI."""
         try:
             with self.get_db_session() as session:
-                db_jobs = session.query(DbJob).filter(DbJob.dismissed.is_(False)).all()
-                return [db_job.to_job() for db_job in db_jobs]
+                db_jobs = _newest_first(
+                    session.query(*DbJob.job_columns()).filter(
+                        DbJob.dismissed.is_(False)
+                    )
+                ).all()
+                return [DbJob.row_to_job(row) for row in db_jobs]
         except Exception as e:
             logger.error("Error getting active jobs: %s", e, exc_info=True)
             return []
@@ -261,8 +646,12 @@ class JobRepository:
         """Get all dismissed jobs for management/history view."""
         try:
             with self.get_db_session() as session:
-                db_jobs = session.query(DbJob).filter(DbJob.dismissed.is_(True)).all()
-                return [db_job.to_job() for db_job in db_jobs]
+                db_jobs = _newest_first(
+                    session.query(*DbJob.job_columns()).filter(
+                        DbJob.dismissed.is_(True)
+                    )
+                ).all()
+                return [DbJob.row_to_job(row) for row in db_jobs]
         except Exception as e:
             logger.error("Error getting dismissed jobs: %s", e, exc_info=True)
             return []
@@ -0,0 +1,56 @@
+"""
+Repository for the library version, which changes whenever songs are written.
+"""
+
+from app.db.models import DbLibraryVersion
+from app.db.models.library import LIBRARY_VERSION_ID
+from sqlalchemy import event, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+_CHANGED = "library_version_changed"
+
+# Library writes committed by this process, so its readers can drop a cached
+# version as soon as it is stale instead of waiting for it to expire
+_local_commits = 0
+
+
+def bump_library_version(session: Session) -> None:
+    """
+    Increment the library version in the caller's transaction, so the new
+    version commits or rolls back together with the songs it covers.
+    """
+    statement = sqlite_insert(DbLibraryVersion).values(id=LIBRARY_VERSION_ID, version=1)
+    statement = statement.on_conflict_do_update(
+        index_elements=[DbLibraryVersion.id],
+        set_={"version": DbLibraryVersion.version + 1},
+    )
+    session.execute(statement)
+    session.info[_CHANGED] = True
+
+
+def read_library_version(session: Session) -> int:
+    """The committed library version, 0 before the first song write."""
+    version = session.execute(
+        select(DbLibraryVersion.version).where(
+            DbLibraryVersion.id == LIBRARY_VERSION_ID
+        )
+    ).scalar()
+    return version or 0
+
+
+def local_library_commits() -> int:
+    """Number of transactions bumping the library version this process committed."""
+    return _local_commits
+
+
+@event.listens_for(Session, "after_commit")
+def _count_library_commit(session: Session) -> None:
+    global _local_commits  # pylint: disable=global-statement
+    if session.info.pop(_CHANGED, False):
+        _local_commits += 1
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_library_change(session: Session) -> None:
+    session.info.pop(_CHANGED, None)
@@ -0,0 +1,169 @@
+"""
+Repository for the local executor's persistent task queue.
+"""
+
+import json
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Any, List, Optional
+
+from app.db.models import DbLocalTask, LocalTaskStatus
+
+logger = logging.getLogger(__name__)
+
+
+def _utcnow() -> datetime:
+    # Stored naive, like the other DateTime columns read back from SQLite
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+class LocalTaskRepository:
+    """Repository class for queuing and claiming locally executed tasks."""
+
+    def __init__(self):
+        from app.db.database import get_db_session
+
+        self.get_db_session = get_db_session
+
+    def enqueue(
+        self,
+        task_id: str,
+        name: str,
+        args: List[Any],
+        countdown: Optional[float] = None,
+    ) -> None:
+        """Queue a task, to be started no earlier than ``countdown`` seconds."""
+        now = _utcnow()
+        with self.get_db_session() as session:
+            session.add(
+                DbLocalTask(
+                    id=task_id,
+                    name=name,
+                    args=json.dumps(args),
+                    status=LocalTaskStatus.QUEUED.value,
+                    available_at=now + timedelta(seconds=countdown or 0),
+                    created_at=now,
+                    attempts=0,
+                )
+            )
+            session.commit()
+
+    def claim_next(self) -> Optional[DbLocalTask]:
+        """
+        Atomically move the oldest due task from queued to running.
+
+        The status check in the UPDATE makes the claim safe when more than
+        one process polls the same queue.
+        """
+        now = _utcnow()
+        with self.get_db_session() as session:
+            while True:
+                task = (
+                    session.query(DbLocalTask)
+                    .filter(
+                        DbLocalTask.status == LocalTaskStatus.QUEUED.value,
+                        DbLocalTask.available_at <= now,
+                    )
+                    .order_by(DbLocalTask.available_at.asc())
+                    .first()
+                )
+                if task is None:
+                    return None
+                claimed = (
+                    session.query(DbLocalTask)
+                    .filter(
+                        DbLocalTask.id == task.id,
+                        DbLocalTask.status == LocalTaskStatus.QUEUED.value,
+                    )
+                    .update(
+                        {
+                            DbLocalTask.status: LocalTaskStatus.RUNNING.value,
+                            DbLocalTask.started_at: now,
+                            DbLocalTask.attempts: DbLocalTask.attempts + 1,
+                        },
+                        synchronize_session=False,
+                    )
+                )
+                session.commit()
+                if claimed:
+                    session.refresh(task)
+                    session.expunge(task)
+                    return task
+
+    def finish(
+        self, task_id: str, status: LocalTaskStatus, error: Optional[str] = None
+    ) -> None:
+        """Record the outcome of a running task."""
+        with self.get_db_session() as session:
+            session.query(DbLocalTask).filter(
+                DbLocalTask.id == task_id,
+                DbLocalTask.status == LocalTaskStatus.RUNNING.value,
+            ).update(
+                {
+                    DbLocalTask.status: status.value,
+                    DbLocalTask.finished_at: _utcnow(),
+                    DbLocalTask.error: error,
+                },
+                synchronize_session=False,
+            )
+            session.commit()
+
+    def revoke(self, task_id: str) -> Optional[str]:
+        """
+        Mark a queued or running task as revoked.
+
+        Returns:
+            The status the task had before, or None if it was not revocable
+        """
+        with self.get_db_session() as session:
+            task = session.query(DbLocalTask).filter(DbLocalTask.id == task_id).first()
+            if task is None or task.status not in (
+                LocalTaskStatus.QUEUED.value,
+                LocalTaskStatus.RUNNING.value,
+            ):
+                return None
+            previous = task.status
+            task.status = LocalTaskStatus.REVOKED.value  # type: ignore
+            task.finished_at = _utcnow()  # type: ignore
+            session.commit()
+            return previous
+
+    def requeue_running(self) -> int:
+        """Return tasks left running by a previous process to the queue."""
+        with self.get_db_session() as session:
+            count = (
+                session.query(DbLocalTask)
+                .filter(DbLocalTask.status == LocalTaskStatus.RUNNING.value)
+                .update(
+                    {DbLocalTask.status: LocalTaskStatus.QUEUED.value},
+                    synchronize_session=False,
+                )
+            )
+            session.commit()
+        if count:
+            logger.info("Re-queued %d interrupted local tasks", count)
+        return count
+
+    def get_unfinished_task_ids(self) -> List[str]:
+        """IDs of tasks that are queued or running."""
+        with self.get_db_session() as session:
+            rows = (
+                session.query(DbLocalTask.id)
+                .filter(
+                    DbLocalTask.status.in_(
+                        [LocalTaskStatus.QUEUED.value, LocalTaskStatus.RUNNING.value]
+                    )
+                )
+                .all()
+            )
+            return [task_id for (task_id,) in rows]
+
+    def get_status(self, task_id: str) -> Optional[LocalTaskStatus]:
+        """Current status of a task, or None if unknown."""
+        with self.get_db_session() as session:
+            row = (
+                session.query(DbLocalTask.status)
+                .filter(DbLocalTask.id == task_id)
+                .first()
+            )
+            return LocalTaskStatus(row[0]) if row else None
@@ -12,22 +12,137 @@ Methods:
         Retrieves a single song by its unique identifier.
 
     fetch_all(
-        *, filters=None, sort_by=None, direction="desc", limit=None, offset=None
+        *, filters=None, sort_by=None, direction="desc", limit=None, offset=None,
+        fields=None
         Retrieves a list of songs with optional filtering, sorting, and pagination.
 
+    fetch_page(
+        *, sort_by="date_added", direction="desc", limit=50, cursor=None,
+        fields=None
+        Retrieves one page of songs by cursor, with the cursor of the next page.
+
     update(song_id: str, **fields) -> Optional[DbSong]:
         Updates an existing song's fields by its ID and returns the updated record.
 
+    bulk_create(rows, chunk_size=None) -> int:
+        Inserts many songs in one transaction.
+
+    bulk_update(rows, chunk_size=None) -> int:
+        Updates many songs by ID in one transaction.
+
+    upsert_many(rows, chunk_size=None) -> int:
+        Inserts many songs, updating the given columns of those that exist.
+
     delete(song_id: str) -> bool:
         Deletes a song by its ID and returns True if successful, False otherwise.
 Song repository for managing song records in the database.
 
 """
 
-from typing import Any, Dict, List, Optional
+from collections import Counter
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from app.config import get_config
+from app.db.models import UNKNOWN_ARTIST, DbSong, DbSongDetails, DbSongLyrics
+from app.db.models.song import SIDE_COLUMNS
+from sqlalchemy import DateTime, insert, literal, select, tuple_, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session, load_only, selectinload
+from sqlalchemy.orm.interfaces import LoaderOption
+
+from .artist_repository import adjust_artist_counts
+from .library_version_repository import bump_library_version
+from .pagination import decode_cursor, encode_cursor
+
+# Text columns listed alphabetically regardless of case
+CASE_INSENSITIVE_SORTS = frozenset({"title", "artist", "album"})
+
+
+def _sort_key(sort_by: str) -> Any:
+    column = getattr(DbSong, sort_by)
+    if sort_by in CASE_INSENSITIVE_SORTS:
+        # Matches the NOCASE indexes, so "abba" sorts next to "ABBA"
+        return column.collate("NOCASE")
+    return column
+
+
+# Columns parsed from ISO 8601 strings by the bulk operations
+DATETIME_COLUMNS = frozenset(
+    column.name
+    for column in DbSong.__table__.columns
+    if isinstance(column.type, DateTime)
+)
+
+
+def _normalize_row(row: Dict[str, Any]) -> Dict[str, Any]:
+    row = dict(row)
+    for key in DATETIME_COLUMNS.intersection(row):
+        if isinstance(row[key], str):
+            row[key] = datetime.fromisoformat(row[key])
+    if isinstance(row.get("date_added"), datetime):
+        # date_added is kept to the second, like create() does
+        row["date_added"] = row["date_added"].replace(microsecond=0)
+    return row
+
+
+def _chunks(
+    rows: Iterable[Dict[str, Any]], size: int
+) -> Iterator[List[Dict[str, Any]]]:
+    chunk: List[Dict[str, Any]] = []
+    for row in rows:
+        chunk.append(_normalize_row(row))
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+# Model of each side table, by DbSong relationship
+SIDE_TABLES = {"lyrics": DbSongLyrics, "details": DbSongDetails}
+
 
-from app.db.models import DbSong
-from sqlalchemy.orm import Session
+def _split_rows(
+    chunk: List[Dict[str, Any]],
+) -> Tuple[List[Dict[str, Any]], Dict[str, List[Dict[str, Any]]]]:
+    """Split song rows into songs table rows and rows of each side table."""
+    songs, sides = [], {name: [] for name in SIDE_TABLES}
+    for row in chunk:
+        songs.append({k: v for k, v in row.items() if k not in SIDE_COLUMNS})
+        parts: Dict[str, Dict[str, Any]] = {}
+        for key in SIDE_COLUMNS.keys() & row.keys():
+            parts.setdefault(SIDE_COLUMNS[key], {"song_id": row["id"]})[key] = row[key]
+        for name, part in parts.items():
+            sides[name].append(part)
+    return songs, sides
+
+
+def _group_by_keys(
+    chunk: List[Dict[str, Any]],
+) -> Dict[Tuple[str, ...], List[Dict[str, Any]]]:
+    # One executemany per set of columns: every row of a statement must
+    # bind the same parameters
+    groups: Dict[Tuple[str, ...], List[Dict[str, Any]]] = {}
+    for row in chunk:
+        groups.setdefault(tuple(sorted(row)), []).append(row)
+    return groups
+
+
+def _artist_changes(
+    chunk: List[Dict[str, Any]], artists: Dict[str, str]
+) -> "Counter[str]":
+    # artists maps the IDs of songs that already exist to their artist
+    artists = dict(artists)
+    deltas: "Counter[str]" = Counter()
+    for row in chunk:
+        old = artists.get(row["id"])
+        new = row.get("artist", old or UNKNOWN_ARTIST)
+        if old is not None:
+            deltas[old] -= 1
+        deltas[new] += 1
+        artists[row["id"]] = new
+    return deltas
 
 
 class SongRepository:
@@ -49,12 +164,27 @@ class SongRepository:
             Retrieve a single song by its unique identifier.
 
         fetch_all(
-            *, filters=None, sort_by=None, direction="desc", limit=None, offset=None
+            *, filters=None, sort_by=None, direction="desc", limit=None, offset=None,
+            fields=None
             Retrieve multiple songs with optional filtering, sorting, and pagination.
 
+        fetch_page(
+            *, sort_by="date_added", direction="desc", limit=50, cursor=None,
+            fields=None
+            Retrieve one page of songs by cursor, with the cursor of the next.
+
         update(song_id: str, **fields) -> Optional[DbSong]:
             Update fields of an existing song record.
 
+        bulk_create(rows, chunk_size=None) -> int:
+            Insert many song records in one transaction.
+
+        bulk_update(rows, chunk_size=None) -> int:
+            Update many song records by ID in one transaction.
+
+        upsert_many(rows, chunk_size=None) -> int:
+            Insert or update many song records in one transaction.
+
         delete(song_id: str) -> bool:
             Delete a song record by its unique identifier.
     """
@@ -87,18 +217,67 @@ class SongRepository:
                 song_data["date_added"] = dt.strftime("%Y-%m-%dT%H:%M:%S")
         song = DbSong(**song_data)
         self.db.add(song)
+        self.db.flush()  # Applies the artist default
+        adjust_artist_counts(self.db, Counter([song.artist]))
+        bump_library_version(self.db)
         self.db.commit()
-        self.db.refresh(song)
+        self._refresh(song)
         return song
 
-    def fetch(self, song_id: str) -> Optional[DbSong]:
+    def add_many(self, songs_data: List[Dict[str, Any]]) -> List[DbSong]:
+        """
+        Stage several new songs in the session without committing, so the
+        caller can commit them together with related rows (e.g. their jobs).
+        """
+        songs = [DbSong(**song_data) for song_data in songs_data]
+        self.db.add_all(songs)
+        adjust_artist_counts(
+            self.db,
+            Counter(
+                song_data.get("artist", UNKNOWN_ARTIST) for song_data in songs_data
+            ),
+        )
+        bump_library_version(self.db)
+        return songs
+
+    @staticmethod
+    def load_options(fields: Optional[Iterable[str]] = None) -> List[LoaderOption]:
+        """
+        Loader options for songs serialized with ``to_dict(fields)``: only the
+        columns and side tables of those API fields, or everything when
+        ``fields`` is None. Side tables are read with one extra query each.
+        """
+        options: List[LoaderOption] = [
+            selectinload(relationship)
+            for relationship in DbSong.field_relationships(fields)
+        ]
+        if fields is not None:
+            options.append(load_only(DbSong.id, *DbSong.field_columns(fields)))
+        return options
+
+    def fetch(
+        self, song_id: str, fields: Optional[Iterable[str]] = None
+    ) -> Optional[DbSong]:
         """
         Fetch a single song by its ID.
+        :param fields: API fields to load (default: all, large text included)
         """
-        return self.db.query(DbSong).filter(DbSong.id == song_id).first()
+        return (
+            self.db.query(DbSong)
+            .options(*self.load_options(fields))
+            .filter(DbSong.id == song_id)
+            .first()
+        )
 
     def fetch_all(
-        self, *, filters=None, sort_by=None, direction="desc", limit=None, offset=None
+        self,
+        *,
+        filters=None,
+        sort_by=None,
+        direction="desc",
+        limit=None,
+        offset=None,
+        fields=None,
     ) -> List[DbSong]:
         """
         Fetch all songs with optional filtering, sorting, and pagination.
@@ -107,24 +286,127 @@ class SongRepository:
         :param direction: 'asc' or 'desc' (default 'desc')
         :param limit: max number of results (default None)
         :param offset: number of results to skip (default None)
+        :param fields: API fields to load (default: all, large text included)
         """
-        query = self.db.query(DbSong)
+        query = self.db.query(DbSong).options(*self.load_options(fields))
         if filters:
             for attr, value in filters.items():
                 query = query.filter(getattr(DbSong, attr) == value)
-        if sort_by:
-            sort_col = getattr(DbSong, sort_by, None)
-            if sort_col is not None:
-                if direction == "desc":
-                    query = query.order_by(sort_col.desc())
-                else:
-                    query = query.order_by(sort_col.asc())
+        if sort_by and getattr(DbSong, sort_by, None) is not None:
+            # id breaks ties, so songs with the same title keep their order
+            sort_cols = (_sort_key(sort_by), DbSong.id)
+            if direction == "desc":
+                query = query.order_by(*(col.desc() for col in sort_cols))
+            else:
+                query = query.order_by(*(col.asc() for col in sort_cols))
         if offset:
             query = query.offset(offset)
         if limit:
             query = query.limit(limit)
         return query.all()
 
+    def fetch_page(
+        self,
+        *,
+        sort_by: str = "date_added",
+        direction: str = "desc",
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        fields: Optional[Iterable[str]] = None,
+    ) -> Tuple[List[DbSong], Optional[str]]:
+        """
+        Fetch one page of songs ordered by (sort_by, id), continuing after
+        ``cursor`` instead of skipping rows, so the last page of a large
+        library costs the same as the first.
+
+        Args:
+            sort_by: Column to sort by
+            direction: 'asc' or 'desc'
+            limit: Maximum number of songs to return
+            cursor: The next_cursor of the previous page
+            fields: API fields to load (default: all, large text included)
+
+        Returns:
+            (songs, next_cursor); next_cursor is None on the last page
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        column = getattr(DbSong, sort_by)
+        descending = direction == "desc"
+        after = decode_cursor(cursor, 2) if cursor else None
+
+        # SQLite sorts NULLs first: they lead an ascending walk and end a
+        # descending one. Each group is read by its own index range query.
+        groups = ["values", "nulls"] if descending else ["nulls", "values"]
+        if not DbSong.__table__.c[sort_by].nullable:
+            groups = ["values"]
+        if after is not None:
+            groups = groups[
+                groups.index("values" if after[0] is not None else "nulls") :
+            ]
+
+        songs: List[DbSong] = []
+        for group in groups:
+            query = self.db.query(DbSong).options(*self.load_options(fields))
+            if group == "nulls":
+                query = query.filter(column.is_(None))
+                columns: Tuple[Any, ...] = (DbSong.id,)
+                sort_cols = columns
+            else:
+                query = query.filter(column.isnot(None))
+                columns = (column, DbSong.id)
+                sort_cols = (_sort_key(sort_by), DbSong.id)
+            if after is not None:
+                # A row value lets SQLite seek straight to the cursor in the
+                # index; it only does when the collation is on the cursor side
+                values = [
+                    literal(value, type_=col.type)
+                    for col, value in zip(columns, after[-len(columns) :])
+                ]
+                if len(columns) == 2 and sort_by in CASE_INSENSITIVE_SORTS:
+                    values[0] = values[0].collate("NOCASE")
+                bound, start = tuple_(*columns), tuple_(*values)
+                query = query.filter(bound < start if descending else bound > start)
+            order = [col.desc() if descending else col.asc() for col in sort_cols]
+            songs += query.order_by(*order).limit(limit + 1 - len(songs)).all()
+            if len(songs) > limit:
+                break
+            after = None  # Later groups are read from their start
+
+        next_cursor = None
+        if len(songs) > limit:
+            songs = songs[:limit]
+            last = songs[-1]
+            next_cursor = encode_cursor(getattr(last, sort_by), last.id)
+        return songs, next_cursor
+
+    def fetch_durations(self, song_ids: List[str]) -> Dict[str, Optional[int]]:
+        """
+        Fetch duration_ms for several songs in a single query.
+        """
+        if not song_ids:
+            return {}
+        rows = (
+            self.db.query(DbSong.id, DbSong.duration_ms)
+            .filter(DbSong.id.in_(set(song_ids)))
+            .all()
+        )
+        return {song_id: duration_ms for song_id, duration_ms in rows}
+
+    def fetch_ids_by_video_id(self, video_ids: List[str]) -> Dict[str, str]:
+        """
+        Map YouTube video IDs to the IDs of songs already in the library.
+        """
+        if not video_ids:
+            return {}
+        rows = (
+            self.db.query(DbSong.video_id, DbSong.id)
+            .filter(DbSong.video_id.in_(set(video_ids)))
+            .all()
+        )
+        return {video_id: song_id for video_id, song_id in rows}
+
     def update(self, song_id: str, **fields) -> Optional[DbSong]:
         """
         Update an existing song record.
@@ -132,12 +414,147 @@ class SongRepository:
         song = self.fetch(song_id)
         if not song:
             return None
+        old_artist = song.artist
         for key, value in fields.items():
             setattr(song, key, value)
+        if song.artist != old_artist:
+            adjust_artist_counts(self.db, Counter({old_artist: -1, song.artist: 1}))
+        bump_library_version(self.db)
         self.db.commit()
-        self.db.refresh(song)
+        self._refresh(song)
         return song
 
+    def bulk_create(
+        self, rows: Iterable[Dict[str, Any]], chunk_size: Optional[int] = None
+    ) -> int:
+        """
+        Insert many songs in a single transaction, one executemany per chunk.
+
+        Args:
+            rows: Column values of each new song (``id`` and ``title`` required)
+            chunk_size: Rows per statement (default: SONG_BULK_CHUNK_SIZE)
+
+        Returns:
+            Number of songs inserted
+
+        Raises:
+            sqlalchemy.exc.IntegrityError: If a song already exists; nothing
+                is inserted
+        """
+        return self._bulk(rows, chunk_size, self._insert_chunk)
+
+    def bulk_update(
+        self, rows: Iterable[Dict[str, Any]], chunk_size: Optional[int] = None
+    ) -> int:
+        """
+        Update many songs by ID in a single transaction, one executemany per
+        chunk. Only the columns present in each row are written; rows whose
+        song does not exist are skipped, as update() returns None for them.
+
+        Args:
+            rows: ``id`` plus the column values to set, per song
+            chunk_size: Rows per statement (default: SONG_BULK_CHUNK_SIZE)
+
+        Returns:
+            Number of songs updated
+        """
+        return self._bulk(rows, chunk_size, self._update_chunk)
+
+    def upsert_many(
+        self, rows: Iterable[Dict[str, Any]], chunk_size: Optional[int] = None
+    ) -> int:
+        """
+        Insert many songs, or update the given columns of those that already
+        exist, in a single transaction with INSERT ... ON CONFLICT (id).
+
+        Args:
+            rows: Column values of each song; SQLite checks NOT NULL columns
+                before the conflict, so ``id`` and ``title`` are required
+            chunk_size: Rows per statement (default: SONG_BULK_CHUNK_SIZE)
+
+        Returns:
+            Number of songs inserted or updated
+        """
+        return self._bulk(rows, chunk_size, self._upsert_chunk)
+
+    def _bulk(self, rows, chunk_size, write_chunk) -> int:
+        chunk_size = chunk_size or get_config().SONG_BULK_CHUNK_SIZE
+        written = 0
+        try:
+            for chunk in _chunks(rows, chunk_size):
+                written += write_chunk(chunk)
+            if written:
+                bump_library_version(self.db)
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+        return written
+
+    def _artists_by_id(self, chunk: List[Dict[str, Any]]) -> Dict[str, str]:
+        ids = {row["id"] for row in chunk}
+        return dict(
+            self.db.execute(
+                select(DbSong.id, DbSong.artist).where(DbSong.id.in_(ids))
+            ).all()
+        )
+
+    def _insert_chunk(self, chunk: List[Dict[str, Any]]) -> int:
+        songs, sides = _split_rows(chunk)
+        self.db.execute(insert(DbSong), songs)
+        self._write_side_rows(sides)
+        adjust_artist_counts(self.db, _artist_changes(chunk, {}))
+        return len(chunk)
+
+    def _update_chunk(self, chunk: List[Dict[str, Any]]) -> int:
+        # The ORM raises on rows that match nothing, so drop unknown IDs first
+        artists = self._artists_by_id(chunk)
+        chunk = [row for row in chunk if row["id"] in artists]
+        if chunk:
+            songs, sides = _split_rows(chunk)
+            songs = [row for row in songs if len(row) > 1]  # More than the id
+            if songs:
+                self.db.execute(update(DbSong), songs)
+            self._write_side_rows(sides)
+            adjust_artist_counts(self.db, _artist_changes(chunk, artists))
+        return len(chunk)
+
+    def _upsert_chunk(self, chunk: List[Dict[str, Any]]) -> int:
+        artists = self._artists_by_id(chunk)
+        songs, sides = _split_rows(chunk)
+        self._upsert(DbSong, DbSong.id, songs)
+        self._write_side_rows(sides)
+        adjust_artist_counts(self.db, _artist_changes(chunk, artists))
+        return len(chunk)
+
+    def _write_side_rows(self, sides: Dict[str, List[Dict[str, Any]]]) -> None:
+        # Side rows may not exist yet, even for songs that do
+        for name, rows in sides.items():
+            model = SIDE_TABLES[name]
+            self._upsert(model, model.song_id, rows)
+
+    def _upsert(self, model: type, key: Any, rows: List[Dict[str, Any]]) -> None:
+        for keys, group in _group_by_keys(rows).items():
+            statement = sqlite_insert(model)
+            columns = [column for column in keys if column != key.key]
+            if columns:
+                statement = statement.on_conflict_do_update(
+                    index_elements=[key],
+                    set_={column: statement.excluded[column] for column in columns},
+                )
+            else:
+                statement = statement.on_conflict_do_nothing(index_elements=[key])
+            self.db.execute(statement, group)
+
+    def _refresh(self, song: DbSong) -> None:
+        # Load the side tables too: callers serialize the song after its
+        # session is closed
+        self.db.refresh(
+            song,
+            [column.key for column in DbSong.__mapper__.column_attrs]
+            + [relationship.key for relationship in DbSong.field_relationships()],
+        )
+
     def delete(self, song_id: str) -> bool:
         """
         Delete a song record by its unique identifier.
@@ -146,5 +563,7 @@ class SongRepository:
         if not song:
             return False
         self.db.delete(song)
+        adjust_artist_counts(self.db, Counter({song.artist: -1}))
+        bump_library_version(self.db)
         self.db.commit()
         return True
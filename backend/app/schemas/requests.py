@@ -4,7 +4,7 @@ Request validation schemas for the karaoke application.
 
 from typing import List, Optional
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, field_validator, model_validator
 
 
 class CreateSongRequest(BaseModel):
@@ -129,6 +129,9 @@ class YouTubeDownloadRequest(BaseModel):
     searchThumbnailUrl: Optional[str] = Field(
         None, max_length=500, description="Original search result thumbnail URL"
     )
+    durationMs: Optional[int] = Field(
+        None, ge=0, description="Video length from the search result, if known"
+    )
 
     @field_validator("video_id", "song_id")
     def validate_required_ids(cls, v):
@@ -147,6 +150,32 @@ class YouTubeDownloadRequest(BaseModel):
         return v
 
 
+class YouTubeImportRequest(BaseModel):
+    """Schema for bulk YouTube import requests"""
+
+    playlistUrl: Optional[str] = Field(
+        None, max_length=500, description="YouTube playlist URL"
+    )
+    videoIds: Optional[List[str]] = Field(
+        None, min_length=1, max_length=1000, description="YouTube video IDs"
+    )
+
+    @field_validator("videoIds")
+    def validate_video_ids(cls, v):
+        if v is None:
+            return v
+        cleaned = [video_id.strip() for video_id in v]
+        if any(not video_id or len(video_id) > 100 for video_id in cleaned):
+            raise ValueError("Video IDs must be non-empty and at most 100 characters")
+        return cleaned
+
+    @model_validator(mode="after")
+    def validate_source(self):
+        if bool(self.playlistUrl) == bool(self.videoIds):
+            raise ValueError("Provide either playlistUrl or videoIds")
+        return self
+
+
 class SaveLyricsRequest(BaseModel):
     """Schema for saving song lyrics"""
 
@@ -0,0 +1,224 @@
+"""
+Admission control for job-creating endpoints.
+
+Every ingestion request is weighed against the separation backlog, measured
+in predicted seconds of processing work (song duration times recorded
+throughput, see ``job_timing.EtaPredictor``). Requests are refused with a
+retry hint once the backlog is full, a single client may only hold a bounded
+share of it, and requests for songs already on the karaoke queue may use a
+reserved band of headroom above the regular limit.
+"""
+
+import json
+import logging
+import math
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Optional
+
+from app.config import get_config
+from app.db.database import get_db_session
+from app.db.models import JobPhase, KaraokeQueueItem
+from app.exceptions import QueueFullError
+
+from .job_timing import EtaPredictor
+
+logger = logging.getLogger(__name__)
+
+
+def get_client_id(request, trusted_proxies: Optional[int] = None) -> str:
+    """
+    Identify the caller by its address. X-Forwarded-For is only read when
+    the app runs behind trusted reverse proxies (TRUSTED_PROXY_COUNT), and
+    then only the entry the nearest of them appended, which callers cannot
+    forge. Client-supplied ids are never trusted.
+    """
+    if trusted_proxies is None:
+        trusted_proxies = get_config().TRUSTED_PROXY_COUNT
+    if trusted_proxies > 0:
+        forwarded = [
+            address.strip()
+            for address in request.headers.get("X-Forwarded-For", "").split(",")
+            if address.strip()
+        ]
+        if len(forwarded) >= trusted_proxies:
+            return forwarded[-trusted_proxies]
+    return request.remote_addr or "unknown"
+
+
+def song_in_karaoke_queue(song_id: str) -> bool:
+    """Whether a song was put on the live karaoke queue (POST /api/karaoke-queue)."""
+    with get_db_session() as session:
+        return (
+            session.query(KaraokeQueueItem.id)
+            .filter(KaraokeQueueItem.song_id == song_id)
+            .first()
+            is not None
+        )
+
+
+def job_client_id(job_data: dict[str, Any]) -> Optional[str]:
+    """Read the submitting client id stored in a job's notes."""
+    try:
+        notes = json.loads(job_data.get("notes") or "{}")
+    except (TypeError, ValueError):
+        return None
+    return notes.get("client_id") if isinstance(notes, dict) else None
+
+
+@dataclass
+class AdmissionDecision:
+    """Outcome of an admission check."""
+
+    admitted: bool
+    pending_seconds: float
+    client_pending_seconds: float
+    cost_seconds: float
+    queue_wait_seconds: float
+    projected_start: datetime
+    retry_after_seconds: int = 0
+    reason: Optional[str] = None
+
+    def to_dict(self) -> dict[str, Any]:
+        """API representation (camelCase, like other response payloads)."""
+        return {
+            "pendingSeconds": round(self.pending_seconds),
+            "estimatedQueueWaitSeconds": round(self.queue_wait_seconds),
+            "projectedStartAt": self.projected_start.isoformat(),
+        }
+
+
+class AdmissionService:
+    """Decides whether new processing work may join the backlog."""
+
+    def __init__(
+        self,
+        eta_predictor: Optional[EtaPredictor] = None,
+        max_pending_seconds: Optional[int] = None,
+        queue_headroom_seconds: Optional[int] = None,
+        max_client_pending_seconds: Optional[int] = None,
+    ):
+        config = get_config()
+        self.eta_predictor = eta_predictor or EtaPredictor()
+        self.max_pending_seconds = (
+            config.ADMISSION_MAX_PENDING_SECONDS
+            if max_pending_seconds is None
+            else max_pending_seconds
+        )
+        self.queue_headroom_seconds = (
+            config.ADMISSION_QUEUE_HEADROOM_SECONDS
+            if queue_headroom_seconds is None
+            else queue_headroom_seconds
+        )
+        self.max_client_pending_seconds = (
+            config.ADMISSION_MAX_CLIENT_PENDING_SECONDS
+            if max_client_pending_seconds is None
+            else max_client_pending_seconds
+        )
+
+    def job_cost_seconds(self, song_duration_ms: Optional[int] = None) -> float:
+        """Predicted processing seconds for a new YouTube job."""
+        return sum(
+            self.eta_predictor.phase_seconds(phase, song_duration_ms)
+            for phase in JobPhase
+            if phase != JobPhase.QUEUE_WAIT
+        )
+
+    def check(
+        self,
+        client_id: str,
+        song_duration_ms: Optional[int] = None,
+        for_karaoke_queue: bool = False,
+        cost_seconds: Optional[float] = None,
+    ) -> AdmissionDecision:
+        """
+        Evaluate a request without raising.
+
+        Args:
+            client_id: Identity of the caller, see ``get_client_id``
+            song_duration_ms: Length of the song, if the client knows it
+            for_karaoke_queue: Whether the song is on the live karaoke queue
+                (see ``song_in_karaoke_queue``); such requests may use the
+                reserved headroom and are exempt from the per-client share
+            cost_seconds: Predicted work of the request, for requests that
+                create several jobs; defaults to one job of
+                ``song_duration_ms``
+        """
+        pending = self.eta_predictor.pending_work()
+        pending_seconds = sum(remaining for _, remaining in pending)
+        client_pending_seconds = sum(
+            remaining
+            for job_data, remaining in pending
+            if job_client_id(job_data) == client_id
+        )
+        cost = (
+            self.job_cost_seconds(song_duration_ms)
+            if cost_seconds is None
+            else cost_seconds
+        )
+        concurrency = self.eta_predictor.concurrency
+        queue_wait = pending_seconds / concurrency
+        decision = AdmissionDecision(
+            admitted=True,
+            pending_seconds=pending_seconds,
+            client_pending_seconds=client_pending_seconds,
+            cost_seconds=cost,
+            queue_wait_seconds=queue_wait,
+            projected_start=datetime.now(timezone.utc) + timedelta(seconds=queue_wait),
+        )
+
+        if self.max_pending_seconds <= 0:
+            return decision  # Admission control disabled
+
+        limit = self.max_pending_seconds
+        if for_karaoke_queue:
+            limit += self.queue_headroom_seconds
+        # An empty backlog always admits, even a song longer than the limit
+        overflow = pending_seconds + cost - limit
+        if pending_seconds > 0 and overflow > 0:
+            decision.admitted = False
+            decision.reason = "QUEUE_FULL"
+            decision.retry_after_seconds = math.ceil(overflow / concurrency)
+            return decision
+
+        if not for_karaoke_queue and self.max_client_pending_seconds > 0:
+            client_overflow = (
+                client_pending_seconds + cost - self.max_client_pending_seconds
+            )
+            if client_pending_seconds > 0 and client_overflow > 0:
+                decision.admitted = False
+                decision.reason = "CLIENT_QUEUE_FULL"
+                decision.retry_after_seconds = math.ceil(client_overflow / concurrency)
+        return decision
+
+    def admit(
+        self,
+        client_id: str,
+        song_duration_ms: Optional[int] = None,
+        for_karaoke_queue: bool = False,
+        cost_seconds: Optional[float] = None,
+    ) -> AdmissionDecision:
+        """Like ``check``, but raise ``QueueFullError`` when refused."""
+        decision = self.check(
+            client_id, song_duration_ms, for_karaoke_queue, cost_seconds
+        )
+        if decision.admitted:
+            return decision
+
+        logger.warning(
+            "Refused job for client %s (%s): %.0fs pending, %.0fs for client",
+            client_id,
+            decision.reason,
+            decision.pending_seconds,
+            decision.client_pending_seconds,
+        )
+        if decision.reason == "CLIENT_QUEUE_FULL":
+            message = "Too many of your songs are already waiting to be processed"
+        else:
+            message = "The processing queue is full, please try again later"
+        raise QueueFullError(
+            message,
+            decision.retry_after_seconds,
+            decision.reason,
+            {"pendingSeconds": round(decision.pending_seconds)},
+        )
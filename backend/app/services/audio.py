@@ -63,14 +63,24 @@ def init_separator(
 
 
 def make_progress_callback(
-    status_callback: Callable[[str], None], stop_event: Optional[threading.Event]
+    status_callback: Callable[[str], None],
+    stop_event: Optional[threading.Event],
+    on_start: Optional[Callable[[], None]] = None,
 ) -> Callable[[Dict[str, Any]], None]:
-    """Returns a Demucs progress callback with stop event and throttling."""
+    """Returns a Demucs progress callback with stop event and throttling.
+
+    ``on_start`` is called once, on the first progress report.
+    """
     last_update_time = [0.0]
+    started = [False]
 
     def _callback(data):
         if stop_event and stop_event.is_set():
             raise StopProcessingError("Processing stopped by user")
+        if not started[0]:
+            started[0] = True
+            if on_start:
+                on_start()
         current_time = time.time()
         if current_time - last_update_time[0] < 0.5 and data["state"] != "end":
             return
@@ -179,7 +189,13 @@ def save_stem(
 
 
 # --- Main Function ---
-def separate_audio(input_path: Path, song_dir: Path, status_callback, stop_event=None):
+def separate_audio(
+    input_path: Path,
+    song_dir: Path,
+    status_callback,
+    stop_event=None,
+    phase_callback: Optional[Callable[[str], None]] = None,
+):
     """
     Separates the audio file into vocals and instrumental tracks,
     matching the input file format and reporting progress.
@@ -189,6 +205,8 @@ def separate_audio(input_path: Path, song_dir: Path, status_callback, stop_event
         song_dir: Path to the directory where processed files will be saved.
         status_callback: Function to call with status updates.
         stop_event: A threading.Event to check for stop requests. Can be None.
+        phase_callback: Optional function called with "decode", "separation"
+            and "encode" as each phase begins, for job timing.
 
     Returns:
         True on success, False on failure.
@@ -203,9 +221,14 @@ def separate_audio(input_path: Path, song_dir: Path, status_callback, stop_event
         status_callback = default_status_callback
     if stop_event is None:
         stop_event = threading.Event()
+    if phase_callback is None:
+        phase_callback = lambda phase: None  # noqa: E731
     try:
         device = select_device_and_log(status_callback)
-        progress_callback = make_progress_callback(status_callback, stop_event)
+        # Demucs reports its first segment once decoding is done
+        progress_callback = make_progress_callback(
+            status_callback, stop_event, on_start=lambda: phase_callback("separation")
+        )
         config = get_config()
         model_name = config.DEFAULT_MODEL
         separator = init_separator(
@@ -220,12 +243,14 @@ def separate_audio(input_path: Path, song_dir: Path, status_callback, stop_event
         logger.info(format_msg)
         status_callback(format_msg)
         status_callback(f"Loading audio file: {input_path.name}...")
+        phase_callback("decode")
         origin_wave, separated = separator.separate_audio_file(input_path)
         status_callback("Separation models finished.")
         instrumental_tensor = calculate_instrumental(
             separated, status_callback, stop_event
         )
         vocals_path, instrumental_path = get_output_paths(song_dir, output_extension)
+        phase_callback("encode")
         vocals_tensor = separated.get("vocals")
         if vocals_tensor is not None:
             save_stem(
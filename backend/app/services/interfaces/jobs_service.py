@@ -6,7 +6,7 @@ This module defines the contract for jobs services, ensuring consistent
 behavior across different implementations.
 """
 
-from typing import Optional, Protocol
+from typing import Any, Optional, Protocol, Sequence
 
 from app.db.models import Job, JobStatus
 
@@ -23,6 +23,43 @@ class JobsServiceInterface(Protocol):
         """
         ...
 
+    def list_jobs(
+        self,
+        statuses: Optional[Sequence[JobStatus]] = None,
+        include_dismissed: bool = False,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        dismissed_only: bool = False,
+    ) -> tuple[list[Job], Optional[str]]:
+        """
+        Get one page of jobs, newest first.
+
+        Args:
+            statuses: Only jobs in one of these statuses (all when None)
+            include_dismissed: Include dismissed jobs
+            limit: Page size (JOBS_PAGE_SIZE when None, capped at JOBS_MAX_PAGE_SIZE)
+            cursor: Cursor returned with the previous page
+            dismissed_only: Only dismissed jobs
+
+        Returns:
+            (jobs, next_cursor); next_cursor is None on the last page
+        """
+        ...
+
+    def serialize_jobs(self, jobs: list[Job]) -> list[dict[str, Any]]:
+        """
+        Convert jobs to API/websocket dictionaries with completion estimates.
+
+        Args:
+            jobs: Jobs to serialize
+
+        Returns:
+            List of job dictionaries; unfinished jobs also carry
+            expected_completion, estimated_remaining_seconds and
+            queue_wait_seconds
+        """
+        ...
+
     def get_jobs_by_status(self, status: JobStatus) -> list[Job]:
         """
         Get all jobs with a specific status.
@@ -59,6 +96,18 @@ class JobsServiceInterface(Protocol):
         """
         ...
 
+    def get_job_events(self, job_id: str) -> dict[str, list[dict[str, Any]]]:
+        """
+        Get the journaled events of a job and the phases they span.
+
+        Args:
+            job_id: The unique identifier for the job
+
+        Returns:
+            Dictionary with the job's "events", oldest first, and "phases"
+        """
+        ...
+
     def cancel_job(self, job_id: str) -> bool:
         """
         Cancel a job by its ID.
@@ -46,6 +46,23 @@ class YouTubeServiceInterface(Protocol):
         artist: Optional[str] = None,
         title: Optional[str] = None,
         song_id: Optional[str] = None,
+        client_id: Optional[str] = None,
+        duration_ms: Optional[int] = None,
     ) -> str:
         """Download video and queue for audio processing, return job/song ID"""
         ...
+
+    def get_playlist_entries(
+        self, playlist_url: str, max_entries: Optional[int] = None
+    ) -> "list[dict[str, Any]]":
+        """List the videos of a playlist without downloading anything"""
+        ...
+
+    def import_videos_async(
+        self,
+        videos: "list[dict[str, Any]]",
+        client_id: Optional[str] = None,
+        source: Optional[str] = None,
+    ) -> "dict[str, Any]":
+        """Queue many videos under one parent job, return the created job IDs"""
+        ...
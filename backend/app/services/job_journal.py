@@ -0,0 +1,189 @@
+"""
+Append-only journal of job events.
+
+Every job event broadcast to clients is also appended to the ``job_events``
+table, so what happened to a job can be reconstructed after the fact and
+clients can catch up past the in-memory stream buffer. With an event
+transport, where every API node broadcasts every event, events are instead
+journaled once by the process they originate in. Appending only queues
+the event in memory; a background thread writes queued events in batches,
+so publishers such as ``update_progress`` never wait on an extra insert.
+Rows older than JOB_EVENT_RETENTION_DAYS are removed by the retention run.
+"""
+
+import logging
+import threading
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+from app.config import get_config
+from app.repositories import JobEventRepository
+from app.utils import fast_json
+
+logger = logging.getLogger(__name__)
+
+TERMINAL_STATUSES = ("completed", "failed", "cancelled")
+
+
+def _utcnow() -> datetime:
+    # Stored naive, like the other DateTime columns read back from SQLite
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+class JobEventJournal:
+    """Queues job events and writes them to the journal in batches."""
+
+    def __init__(
+        self,
+        repository: Optional[JobEventRepository] = None,
+        flush_interval: float = 1.0,
+        batch_size: int = 500,
+        max_pending: int = 10000,
+    ):
+        self.repository = repository or JobEventRepository()
+        self.flush_interval = flush_interval
+        self.batch_size = max(1, batch_size)
+        self.max_pending = max_pending
+        self.written = 0
+        self.dropped = 0
+        self._pending: List[Dict[str, Any]] = []
+        self._condition = threading.Condition()
+        self._write_lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._stopping = False
+
+    def append(
+        self, seq: Optional[int], event_name: str, job_data: Dict[str, Any]
+    ) -> None:
+        """Queue an event for the next batch; drops it when the queue is full."""
+        row = {
+            "seq": seq,
+            "job_id": job_data.get("id") or "",
+            "event": event_name,
+            "status": job_data.get("status"),
+            "phase": job_data.get("phase"),
+            "progress": job_data.get("progress"),
+            "data": fast_json.dumps(job_data),
+            "created_at": _utcnow(),
+        }
+        with self._condition:
+            if len(self._pending) >= self.max_pending:
+                self.dropped += 1
+                return
+            self._pending.append(row)
+            if len(self._pending) >= self.batch_size:
+                self._condition.notify()
+
+    def flush(self) -> int:
+        """Write every queued event now, returning how many were written."""
+        written = 0
+        with self._write_lock:
+            while True:
+                with self._condition:
+                    batch = self._pending[: self.batch_size]
+                    del self._pending[: self.batch_size]
+                if not batch:
+                    return written
+                try:
+                    self.repository.append_many(batch)
+                except Exception as e:
+                    self.dropped += len(batch)
+                    logger.warning("Failed to journal %d job events: %s", len(batch), e)
+                    continue
+                written += len(batch)
+                self.written += len(batch)
+
+    def start(self) -> None:
+        """Start the background writer (idempotent)."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stopping = False
+        self._thread = threading.Thread(
+            target=self._run, name="job-event-journal", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Stop the writer after writing what is still queued."""
+        with self._condition:
+            self._stopping = True
+            self._condition.notify()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        self.flush()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                if not self._stopping and len(self._pending) < self.batch_size:
+                    self._condition.wait(self.flush_interval)
+                stopping = self._stopping
+            self.flush()
+            if stopping:
+                return
+
+    def get_metrics(self) -> Dict[str, int]:
+        """Counters for the health endpoint."""
+        with self._condition:
+            pending = len(self._pending)
+        return {"written": self.written, "pending": pending, "dropped": self.dropped}
+
+
+def phase_spans(events: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    The phases a job went through, from its journaled events (oldest first).
+
+    Each span holds the phase, when it began and, once the next phase began
+    or the job finished, when it ended and how many seconds it took.
+    """
+    spans: List[Dict[str, Any]] = []
+    current: Optional[Dict[str, Any]] = None
+    for event in events:
+        at = event["created_at"]
+        phase = event.get("phase")
+        finished = event.get("status") in TERMINAL_STATUSES
+        if current is not None and (phase != current["phase"] or finished):
+            current["ended_at"] = at
+            current["seconds"] = round((at - current["started_at"]).total_seconds(), 3)
+            current = None
+        if current is None and phase and not finished:
+            current = {
+                "phase": phase,
+                "started_at": at,
+                "ended_at": None,
+                "seconds": None,
+            }
+            spans.append(current)
+    return spans
+
+
+_journal: Optional[JobEventJournal] = None
+_journal_lock = threading.Lock()
+
+
+def get_job_journal() -> Optional[JobEventJournal]:
+    """The journal of this process, if one was started."""
+    return _journal
+
+
+def start_job_journal() -> Optional[JobEventJournal]:
+    """Create and start this process's journal unless disabled (idempotent)."""
+    global _journal  # pylint: disable=global-statement
+    config = get_config()
+    if not config.JOB_EVENT_JOURNAL:
+        return None
+    with _journal_lock:
+        if _journal is None:
+            _journal = JobEventJournal(
+                flush_interval=config.JOB_EVENT_JOURNAL_FLUSH_MS / 1000,
+                batch_size=config.JOB_EVENT_JOURNAL_BATCH_SIZE,
+            )
+        _journal.start()
+    return _journal
+
+
+def stop_job_journal() -> None:
+    """Write what is still queued and stop this process's journal."""
+    if _journal is not None:
+        _journal.stop()
@@ -0,0 +1,410 @@
+"""
+Job phase timing and completion estimates.
+
+Every job is timed phase by phase (queue wait, download, decode, separation,
+encode, thumbnail, finalize) and the measurements are stored in the
+``job_phase_timings`` table. ``EtaPredictor`` turns that history into a
+per-phase throughput model, scaled by song duration, and uses it to predict
+when a job will start and finish.
+"""
+
+import json
+import logging
+import socket
+import statistics
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Optional
+
+from app.config import get_config
+from app.db.models import Job, JobPhase, JobStatus
+from app.repositories import JobRepository
+
+logger = logging.getLogger(__name__)
+
+# Phases run by process_youtube_job, in order
+YOUTUBE_PIPELINE = [
+    JobPhase.QUEUE_WAIT,
+    JobPhase.DOWNLOAD,
+    JobPhase.DECODE,
+    JobPhase.SEPARATION,
+    JobPhase.ENCODE,
+    JobPhase.THUMBNAIL,
+    JobPhase.FINALIZE,
+]
+
+# Phases run by process_audio_job, in order
+AUDIO_PIPELINE = [
+    JobPhase.QUEUE_WAIT,
+    JobPhase.DECODE,
+    JobPhase.SEPARATION,
+    JobPhase.ENCODE,
+    JobPhase.FINALIZE,
+]
+
+# Phases whose cost grows with the length of the song
+DURATION_SCALED_PHASES = {
+    JobPhase.DOWNLOAD,
+    JobPhase.DECODE,
+    JobPhase.SEPARATION,
+    JobPhase.ENCODE,
+}
+
+# Fallback estimates used until a phase has history. Duration-scaled phases
+# are expressed as seconds of work per second of audio, the rest in seconds.
+DEFAULT_PHASE_ESTIMATES = {
+    JobPhase.DOWNLOAD: 0.1,
+    JobPhase.DECODE: 0.02,
+    JobPhase.SEPARATION: 1.0,
+    JobPhase.ENCODE: 0.05,
+    JobPhase.THUMBNAIL: 2.0,
+    JobPhase.FINALIZE: 1.0,
+}
+
+DEFAULT_SONG_DURATION_MS = 210_000  # Used when the song length is still unknown
+TERMINAL_STATUSES = {
+    JobStatus.COMPLETED.value,
+    JobStatus.FAILED.value,
+    JobStatus.CANCELLED.value,
+}
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def _as_utc(value: Any) -> Optional[datetime]:
+    """Parse an ISO string or datetime, treating naive values as UTC."""
+    if value is None:
+        return None
+    if isinstance(value, str):
+        try:
+            value = datetime.fromisoformat(value)
+        except ValueError:
+            return None
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+
+class JobPhaseTimer:
+    """
+    Times the phases of a single running job.
+
+    Calling ``start`` closes the current phase, persists its duration and
+    marks the new phase on the job so API and websocket payloads can report
+    it. ``finish`` closes the last phase.
+    """
+
+    def __init__(
+        self,
+        job: Job,
+        job_repository: JobRepository,
+        song_duration_ms: Optional[int] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.job = job
+        self.job_repository = job_repository
+        self.song_duration_ms = song_duration_ms
+        self.host = socket.gethostname()
+        self._clock = clock
+        self._phase: Optional[JobPhase] = None
+        self._phase_started_wall: Optional[datetime] = None
+        self._phase_started_clock = 0.0
+
+    def record_queue_wait(self) -> None:
+        """Record the time between job creation and the worker picking it up."""
+        created_at = _as_utc(self.job.created_at)
+        if created_at is None:
+            return
+        waited = max(0.0, (_utcnow() - created_at).total_seconds())
+        self._record(JobPhase.QUEUE_WAIT, created_at, waited)
+
+    def start(self, phase: "JobPhase | str") -> None:
+        """End the current phase (if any) and begin ``phase``."""
+        phase = JobPhase(phase)
+        if phase == self._phase:
+            return
+        now = self._clock()
+        self._close_current(now)
+        self._phase = phase
+        self._phase_started_wall = _utcnow()
+        self._phase_started_clock = now
+        self.job.phase = phase.value
+        self.job.phase_started_at = self._phase_started_wall
+        self.job_repository.update(self.job)
+
+    def finish(self, record: bool = True) -> None:
+        """
+        End the current phase without starting another one.
+
+        Pass ``record=False`` when the job failed or was cancelled, so a
+        truncated phase does not skew the throughput history.
+        """
+        if record:
+            self._close_current(self._clock())
+        self._phase = None
+
+    def _close_current(self, now: float) -> None:
+        if self._phase is None or self._phase_started_wall is None:
+            return
+        elapsed = now - self._phase_started_clock
+        self._record(self._phase, self._phase_started_wall, elapsed)
+
+    def _record(self, phase: JobPhase, started_at: datetime, seconds: float) -> None:
+        self.job_repository.record_phase_timing(
+            job_id=self.job.id,
+            phase=phase.value,
+            started_at=started_at,
+            duration_seconds=seconds,
+            song_duration_ms=self.song_duration_ms,
+            host=self.host,
+        )
+
+
+@dataclass
+class JobEstimate:
+    """Predicted timing for one job."""
+
+    remaining_seconds: float
+    queue_wait_seconds: float
+    expected_completion: datetime
+
+
+class EtaPredictor:
+    """
+    Predicts job completion from recorded phase timings.
+
+    Each phase is modelled from the median of its recent history on this
+    host (falling back to all hosts, then to built-in defaults). Phases that
+    scale with song length use seconds-per-audio-second; the rest use plain
+    seconds. The model is cached for ``cache_ttl`` seconds so that annotating
+    frequent websocket events stays cheap.
+    """
+
+    _model_cache: dict[str, float] = {}
+    _model_loaded_at = 0.0
+    _model_lock = threading.Lock()
+
+    def __init__(
+        self,
+        job_repository: Optional[JobRepository] = None,
+        concurrency: Optional[int] = None,
+        history_size: Optional[int] = None,
+        cache_ttl: float = 60.0,
+    ):
+        config = get_config()
+        self.job_repository = job_repository or JobRepository()
+        self.concurrency = max(1, concurrency or config.JOB_WORKER_CONCURRENCY)
+        self.history_size = history_size or config.JOB_ETA_HISTORY_SIZE
+        self.cache_ttl = cache_ttl
+        self.host = socket.gethostname()
+
+    # --- Model ---
+
+    def phase_model(self) -> dict[str, float]:
+        """Return the per-phase estimate, rebuilding it when the cache is stale."""
+        cls = type(self)
+        with cls._model_lock:
+            if cls._model_cache and time.monotonic() - cls._model_loaded_at < (
+                self.cache_ttl
+            ):
+                return cls._model_cache
+            model = {phase.value: self._estimate_phase(phase) for phase in JobPhase}
+            cls._model_cache = model
+            cls._model_loaded_at = time.monotonic()
+            return model
+
+    @classmethod
+    def invalidate(cls) -> None:
+        """Drop the cached model so the next estimate re-reads history."""
+        with cls._model_lock:
+            cls._model_cache = {}
+            cls._model_loaded_at = 0.0
+
+    def _estimate_phase(self, phase: JobPhase) -> float:
+        if phase == JobPhase.QUEUE_WAIT:
+            return 0.0  # Derived from the jobs ahead, not from history
+        timings = self.job_repository.get_recent_phase_timings(
+            phase.value, limit=self.history_size, host=self.host
+        ) or self.job_repository.get_recent_phase_timings(
+            phase.value, limit=self.history_size
+        )
+        if phase in DURATION_SCALED_PHASES:
+            samples = [
+                t.duration_seconds / (t.song_duration_ms / 1000)
+                for t in timings
+                if t.song_duration_ms
+            ]
+        else:
+            samples = [t.duration_seconds for t in timings]
+        if not samples:
+            return DEFAULT_PHASE_ESTIMATES[phase]
+        return statistics.median(samples)
+
+    def phase_seconds(self, phase: JobPhase, song_duration_ms: Optional[int]) -> float:
+        """Predicted wall-clock seconds for ``phase`` on a song of this length."""
+        estimate = self.phase_model()[phase.value]
+        if phase in DURATION_SCALED_PHASES:
+            return estimate * (song_duration_ms or DEFAULT_SONG_DURATION_MS) / 1000
+        return estimate
+
+    # --- Per-job estimates ---
+
+    @staticmethod
+    def pipeline_for(job_data: dict[str, Any]) -> list[JobPhase]:
+        """
+        YouTube jobs store their video id in notes; uploads skip download.
+        Bulk import parents do no work of their own.
+        """
+        try:
+            notes = json.loads(job_data.get("notes") or "{}")
+        except (TypeError, ValueError):
+            notes = {}
+        if isinstance(notes, dict) and notes.get("import"):
+            return []
+        if isinstance(notes, dict) and notes.get("video_id"):
+            return YOUTUBE_PIPELINE
+        return AUDIO_PIPELINE
+
+    def remaining_seconds(
+        self,
+        job_data: dict[str, Any],
+        song_duration_ms: Optional[int],
+        now: Optional[datetime] = None,
+    ) -> float:
+        """Predicted processing time left for a job, excluding queue wait."""
+        now = now or _utcnow()
+        pipeline = self.pipeline_for(job_data)
+        current = job_data.get("phase")
+        phases = [p for p in pipeline if p != JobPhase.QUEUE_WAIT]
+        if current in {p.value for p in phases}:
+            index = [p.value for p in phases].index(current)
+            phase = phases[index]
+            started = _as_utc(job_data.get("phase_started_at")) or now
+            elapsed = max(0.0, (now - started).total_seconds())
+            in_phase = max(0.0, self.phase_seconds(phase, song_duration_ms) - elapsed)
+            later = phases[index + 1 :]
+        else:
+            in_phase = 0.0
+            later = phases
+        return in_phase + sum(self.phase_seconds(p, song_duration_ms) for p in later)
+
+    def annotate(self, jobs_data: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """
+        Add ``expected_completion``, ``estimated_remaining_seconds`` and
+        ``queue_wait_seconds`` to every unfinished job dict, in place.
+
+        Queue wait is the work still ahead of a pending job (every unfinished
+        job created before it) spread across the configured worker count.
+        """
+        unfinished = [j for j in jobs_data if j.get("status") not in TERMINAL_STATUSES]
+        if not unfinished:
+            return jobs_data
+        try:
+            queue = [job.to_dict() for job in self.job_repository.get_unfinished_jobs()]
+            known = {j["id"] for j in queue}
+            queue.extend(j for j in unfinished if j["id"] not in known)
+            queue.sort(key=lambda j: _as_utc(j.get("created_at")) or _utcnow())
+            durations = self._song_durations([j.get("song_id") for j in queue])
+            estimates = self._estimate_queue(queue, durations)
+        except Exception as e:
+            logger.warning("Failed to estimate job completion: %s", e)
+            return jobs_data
+
+        for job_data in unfinished:
+            estimate = estimates.get(job_data["id"])
+            if estimate:
+                job_data["expected_completion"] = (
+                    estimate.expected_completion.isoformat()
+                )
+                job_data["estimated_remaining_seconds"] = round(
+                    estimate.remaining_seconds
+                )
+                job_data["queue_wait_seconds"] = round(estimate.queue_wait_seconds)
+        return jobs_data
+
+    def pending_work(self) -> list[tuple[dict[str, Any], float]]:
+        """Every unfinished job with its predicted remaining processing seconds."""
+        queue = [job.to_dict() for job in self.job_repository.get_unfinished_jobs()]
+        durations = self._song_durations([j.get("song_id") for j in queue])
+        now = _utcnow()
+        return [
+            (
+                job_data,
+                self.remaining_seconds(
+                    job_data, durations.get(job_data.get("song_id")), now
+                ),
+            )
+            for job_data in queue
+        ]
+
+    def annotate_one(self, job_data: dict[str, Any]) -> dict[str, Any]:
+        """Annotate a single job dict (used for websocket events)."""
+        return self.annotate([job_data])[0]
+
+    def estimate(self, job: Job) -> Optional[JobEstimate]:
+        """Estimate a single job; None for jobs that have already finished."""
+        job_data = self.annotate_one(job.to_dict())
+        if "expected_completion" not in job_data:
+            return None
+        return JobEstimate(
+            remaining_seconds=job_data["estimated_remaining_seconds"],
+            queue_wait_seconds=job_data["queue_wait_seconds"],
+            expected_completion=datetime.fromisoformat(job_data["expected_completion"]),
+        )
+
+    def _estimate_queue(
+        self, queue: list[dict[str, Any]], durations: dict[str, Optional[int]]
+    ) -> dict[str, JobEstimate]:
+        now = _utcnow()
+        # Seconds until each worker slot frees up
+        slots = [0.0] * self.concurrency
+        estimates = {}
+        parents = [j for j in queue if not self.pipeline_for(j)]
+        workers = [j for j in queue if self.pipeline_for(j)]
+        running = [j for j in workers if j.get("status") != JobStatus.PENDING.value]
+        pending = [j for j in workers if j.get("status") == JobStatus.PENDING.value]
+        for job_data in running + pending:
+            remaining = self.remaining_seconds(
+                job_data, durations.get(job_data.get("song_id")), now
+            )
+            slot = min(range(len(slots)), key=slots.__getitem__)
+            # Running jobs already hold a worker; pending ones wait for the
+            # least-loaded slot to drain
+            is_pending = job_data.get("status") == JobStatus.PENDING.value
+            wait = slots[slot] if is_pending else 0.0
+            slots[slot] += remaining
+            estimates[job_data["id"]] = JobEstimate(
+                remaining_seconds=remaining,
+                queue_wait_seconds=wait,
+                expected_completion=now + timedelta(seconds=wait + remaining),
+            )
+        # A bulk import finishes with its last child
+        for job_data in parents:
+            children = [
+                estimates[j["id"]]
+                for j in workers
+                if j.get("parent_job_id") == job_data["id"]
+            ]
+            if children:
+                done = max(c.expected_completion for c in children)
+                estimates[job_data["id"]] = JobEstimate(
+                    remaining_seconds=(done - now).total_seconds(),
+                    queue_wait_seconds=min(c.queue_wait_seconds for c in children),
+                    expected_completion=done,
+                )
+        return estimates
+
+    @staticmethod
+    def _song_durations(song_ids: list[Optional[str]]) -> dict[str, Optional[int]]:
+        from app.db.database import get_db_session
+        from app.repositories.song_repository import SongRepository
+
+        ids = [song_id for song_id in song_ids if song_id]
+        if not ids:
+            return {}
+        with get_db_session() as session:
+            return SongRepository(session).fetch_durations(ids)
@@ -5,48 +5,78 @@ This module handles all jobs-related business logic, providing a clean
 separation between API controllers and data management.
 """
 
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional, Sequence
 
+from app.config import get_config
 from app.db.models import Job, JobStatus
-from app.repositories import JobRepository
+from app.repositories import JobEventRepository, JobRepository
+from app.utils import fast_json
 
 from . import file_management
 from .file_service import FileService
 from .interfaces.jobs_service import JobsServiceInterface
+from .job_journal import phase_spans
+from .job_timing import EtaPredictor
 
 
 class JobsService(JobsServiceInterface):
     """Service for managing jobs operations."""
 
-    def __init__(self, job_repository: Optional[JobRepository] = None):
+    def __init__(
+        self,
+        job_repository: Optional[JobRepository] = None,
+        event_repository: Optional[JobEventRepository] = None,
+    ):
         """
         Initialize the Jobs service.
 
         Args:
             job_repository: Optional JobRepository instance. If None, creates a new one.
+            event_repository: Optional JobEventRepository for the event journal.
         """
         self.job_repository = job_repository or JobRepository()
+        self.event_repository = event_repository or JobEventRepository()
         self.file_service = FileService()
+        self.eta_predictor = EtaPredictor(self.job_repository)
 
     def get_all_jobs(self, include_dismissed: bool = False) -> list[Job]:
         """Get all jobs sorted by creation time (newest first)."""
         if include_dismissed:
-            jobs = self.job_repository.get_all_jobs()
-        else:
-            jobs = self.job_repository.get_active_jobs()
-
-        def get_created_time(job):
-            if job.created_at is None:
-                # Return minimum datetime so None values sort last when reverse=True
-                return datetime.min.replace(tzinfo=timezone.utc)
+            return self.job_repository.get_all_jobs()
+        return self.job_repository.get_active_jobs()
+
+    def list_jobs(
+        self,
+        statuses: Optional[Sequence[JobStatus]] = None,
+        include_dismissed: bool = False,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        dismissed_only: bool = False,
+    ) -> tuple[list[Job], Optional[str]]:
+        """
+        Get one page of jobs, newest first, and the cursor of the next page.
 
-            if job.created_at.tzinfo is None:
-                return job.created_at.replace(tzinfo=timezone.utc)
-            return job.created_at
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        config = get_config()
+        limit = min(max(1, limit or config.JOBS_PAGE_SIZE), config.JOBS_MAX_PAGE_SIZE)
+        if dismissed_only:
+            dismissed: Optional[bool] = True
+        else:
+            dismissed = None if include_dismissed else False
+        return self.job_repository.list_jobs(
+            statuses=statuses, dismissed=dismissed, limit=limit, cursor=cursor
+        )
 
-        return sorted(jobs, key=get_created_time, reverse=True)
+    def serialize_jobs(self, jobs: list[Job]) -> list[dict[str, Any]]:
+        """
+        Convert jobs to dictionaries, adding completion and queue-wait
+        estimates to those that have not finished yet.
+        """
+        return self.eta_predictor.annotate([job.to_dict() for job in jobs])
 
     def get_active_jobs(self) -> list[Job]:
         """Get all non-dismissed jobs (for main queue display)."""
@@ -54,16 +84,7 @@ class JobsService(JobsServiceInterface):
 
     def get_dismissed_jobs(self) -> list[Job]:
         """Get all dismissed jobs."""
-        jobs = self.job_repository.get_dismissed_jobs()
-
-        def get_created_time(job):
-            if job.created_at is None:
-                return datetime.min.replace(tzinfo=timezone.utc)
-            if job.created_at.tzinfo is None:
-                return job.created_at.replace(tzinfo=timezone.utc)
-            return job.created_at
-
-        return sorted(jobs, key=get_created_time, reverse=True)
+        return self.job_repository.get_dismissed_jobs()
 
     def get_jobs_by_status(self, status: JobStatus) -> list[Job]:
         """Get all jobs with a specific status."""
@@ -84,8 +105,14 @@ class JobsService(JobsServiceInterface):
 
         response = job.to_dict()
 
+        # Bulk imports report their child jobs
+        if job.is_import:
+            response["children"] = self.serialize_jobs(
+                self.job_repository.get_child_jobs(job_id)
+            )
+
         # Add additional info for completed jobs
-        if job.status == JobStatus.COMPLETED:
+        elif job.status == JobStatus.COMPLETED:
             song_dir = self.file_service.get_song_directory(Path(job.filename).stem)
             vocals_path = file_management.get_vocals_path_stem(song_dir).with_suffix(
                 ".mp3"
@@ -101,13 +128,32 @@ class JobsService(JobsServiceInterface):
                 }
             )
 
-        # Estimate completion time if processing
-        if job.status == JobStatus.PROCESSING and job.started_at:
-            estimated_completion = self._estimate_completion_time(job)
-            if estimated_completion:
-                response["expected_completion"] = estimated_completion.isoformat()
+        # Estimate queue wait and completion time for unfinished jobs
+        return self.eta_predictor.annotate_one(response)
 
-        return response
+    def get_job_events(self, job_id: str) -> dict[str, list[dict[str, Any]]]:
+        """
+        Get the journaled events of a job, oldest first, and the phases they
+        span, for post-mortems of slow or failed jobs.
+        """
+        events = [
+            {
+                "seq": event.seq,
+                "event": event.event,
+                "status": event.status,
+                "phase": event.phase,
+                "progress": event.progress,
+                "created_at": event.created_at,
+                "data": fast_json.loads(event.data),
+            }
+            for event in self.event_repository.get_job_events(job_id)
+        ]
+        phases = phase_spans(events)
+        for item in [*events, *phases]:
+            for key in ("created_at", "started_at", "ended_at"):
+                if isinstance(item.get(key), datetime):
+                    item[key] = item[key].replace(tzinfo=timezone.utc).isoformat()
+        return {"events": events, "phases": phases}
 
     def cancel_job(self, job_id: str) -> bool:
         """
@@ -127,12 +173,14 @@ class JobsService(JobsServiceInterface):
 
         # Update job status
         job.status = JobStatus.CANCELLED
-        job.completed_at = datetime.now()
+        job.completed_at = datetime.now(timezone.utc)
         job.error = "Cancelled by user"
         self.job_repository.update(job)
 
-        # TODO: Implement actual job cancellation in Celery
-        # This would involve celery.control.revoke(task_id, terminate=True)
+        if job.task_id:
+            from app.jobs.dispatch import revoke_task
+
+            revoke_task(job.task_id, terminate=True)
 
         return True
 
@@ -178,27 +226,3 @@ class JobsService(JobsServiceInterface):
             "raw_cancelled": len([j for j in jobs if j.status == JobStatus.CANCELLED]),
         }
         return stats
-
-    def _estimate_completion_time(self, job: Job) -> Optional[datetime]:
-        """
-        Estimate completion time for a processing job based on current progress.
-
-        Args:
-            job: The job to estimate completion time for
-
-        Returns:
-            Estimated completion datetime, or None if cannot be estimated
-        """
-        if not job.started_at or job.progress <= 0:
-            return None
-
-        elapsed_time = (datetime.now() - job.started_at).total_seconds()
-        if elapsed_time <= 0:
-            return None
-
-        # Estimate based on current progress
-        time_per_percent = elapsed_time / job.progress
-        remaining_percent = 100 - job.progress
-        estimated_remaining = remaining_percent * time_per_percent
-
-        return datetime.now() + timedelta(seconds=estimated_remaining)
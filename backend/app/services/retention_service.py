@@ -0,0 +1,169 @@
+"""
+Retention and compaction for job data.
+
+Run periodically by the ``cleanup_old_jobs`` Celery task: finished jobs past
+their retention age leave the ``jobs`` table (archived or deleted), their
+Celery result-backend entries are forgotten, stale files under ``TEMP_DIR``
+that belong to no unfinished job are removed, the job status counters are
+reconciled with the jobs table and journaled job events past
+JOB_EVENT_RETENTION_DAYS are deleted and the SQLite file is compacted.
+"""
+
+import logging
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Iterable, Optional
+
+from app.config import get_config
+from app.repositories import JobEventRepository, JobRepository
+
+logger = logging.getLogger(__name__)
+
+
+class RetentionService:
+    """Applies the configured retention policy."""
+
+    def __init__(
+        self,
+        job_repository: Optional[JobRepository] = None,
+        celery_app=None,
+        config=None,
+        event_repository: Optional[JobEventRepository] = None,
+    ):
+        self.job_repository = job_repository or JobRepository()
+        self.event_repository = event_repository or JobEventRepository()
+        self.celery_app = celery_app
+        self.config = config or get_config()
+
+    def run(self) -> dict[str, Any]:
+        """Apply every retention step and report what was reclaimed."""
+        report = {
+            "jobs_removed": 0,
+            "jobs_archived": 0,
+            "results_forgotten": 0,
+            "temp_files_removed": 0,
+            "temp_bytes_reclaimed": 0,
+            "db_bytes_reclaimed": 0,
+            "stats_corrections": 0,
+            "events_removed": 0,
+        }
+
+        retention_days = self.config.JOB_RETENTION_DAYS
+        if retention_days > 0:
+            cutoff = datetime.now(timezone.utc) - timedelta(days=retention_days)
+            archive = self.config.JOB_RETENTION_ARCHIVE
+            task_ids = self.job_repository.purge_terminal_jobs(cutoff, archive=archive)
+            report["jobs_removed"] = len(task_ids)
+            report["jobs_archived"] = len(task_ids) if archive else 0
+            report["results_forgotten"] = self.forget_results(task_ids)
+
+        files, size = self.purge_temp_files(
+            Path(self.config.TEMP_DIR),
+            timedelta(hours=self.config.TEMP_FILE_MAX_AGE_HOURS),
+            self.unfinished_job_keys(),
+        )
+        report["temp_files_removed"] = files
+        report["temp_bytes_reclaimed"] = size
+
+        event_days = self.config.JOB_EVENT_RETENTION_DAYS
+        if event_days > 0:
+            report["events_removed"] = self.purge_events(
+                datetime.now(timezone.utc) - timedelta(days=event_days)
+            )
+
+        report["stats_corrections"] = self.reconcile_stats()
+        report["db_bytes_reclaimed"] = self.compact()
+
+        logger.info("Retention run complete: %s", report)
+        return report
+
+    def forget_results(self, task_ids: list[Optional[str]]) -> int:
+        """Delete the result-backend entries of removed jobs."""
+        if self.celery_app is None:
+            return 0
+        forgotten = 0
+        for task_id in task_ids:
+            if not task_id:
+                continue
+            try:
+                self.celery_app.backend.forget(task_id)
+                forgotten += 1
+            except Exception as e:
+                logger.warning("Failed to forget result for task %s: %s", task_id, e)
+        return forgotten
+
+    def unfinished_job_keys(self) -> set[str]:
+        """Ids, song ids and task ids of the jobs still pending or running."""
+        keys = set()
+        for job in self.job_repository.get_unfinished_jobs():
+            keys.update(key for key in (job.id, job.song_id, job.task_id) if key)
+        return keys
+
+    @staticmethod
+    def purge_temp_files(
+        temp_dir: Path, max_age: timedelta, keep: Iterable[str] = ()
+    ) -> tuple[int, int]:
+        """
+        Remove orphaned files under ``temp_dir``: those not modified within
+        ``max_age`` whose path does not name any of ``keep`` (the keys of
+        unfinished jobs), and directories that have stayed empty as long.
+
+        Returns:
+            (files removed, bytes reclaimed)
+        """
+        if not temp_dir.is_dir():
+            return 0, 0
+        cutoff = time.time() - max_age.total_seconds()
+        files = 0
+        size = 0
+        keep = [key for key in keep if key]
+        for path in sorted(temp_dir.rglob("*"), reverse=True):
+            relative = str(path.relative_to(temp_dir))
+            if any(key in relative for key in keep):
+                # Working files of a job that is still pending or running
+                continue
+            try:
+                if path.is_file() or path.is_symlink():
+                    stat = path.lstat()
+                    if stat.st_mtime < cutoff:
+                        path.unlink()
+                        files += 1
+                        size += stat.st_size
+                elif (
+                    path.is_dir()
+                    and path.stat().st_mtime < cutoff
+                    and not any(path.iterdir())
+                ):
+                    # Reverse order visits children before their parent
+                    path.rmdir()
+            except OSError as e:
+                logger.warning("Failed to remove temp path %s: %s", path, e)
+        return files, size
+
+    def purge_events(self, cutoff: datetime) -> int:
+        """Delete journaled job events recorded before ``cutoff``."""
+        try:
+            return self.event_repository.purge_before(cutoff.replace(tzinfo=None))
+        except Exception as e:
+            logger.warning("Job event journal purge failed: %s", e)
+            return 0
+
+    def reconcile_stats(self) -> int:
+        """Correct drifted job status counters, returning how many were off."""
+        try:
+            return len(self.job_repository.reconcile_stats())
+        except Exception as e:
+            logger.warning("Job statistics reconciliation failed: %s", e)
+            return 0
+
+    @staticmethod
+    def compact() -> int:
+        """Compact the database, returning the bytes reclaimed."""
+        from app.db.database import compact_database
+
+        try:
+            return compact_database()
+        except Exception as e:
+            logger.warning("Database compaction failed: %s", e)
+            return 0
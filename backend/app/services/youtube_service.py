@@ -2,7 +2,7 @@
 import logging
 import re
 import uuid
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from typing import Any, Optional
 
 import yt_dlp
@@ -253,6 +253,8 @@ class YouTubeService(YouTubeServiceInterface):
         artist: str = None,
         title: str = None,
         song_id: str = None,
+        client_id: str = None,
+        duration_ms: int = None,
     ) -> str:
         """Download video and queue for unified YouTube processing, return job ID"""
         try:
@@ -286,8 +288,8 @@ class YouTubeService(YouTubeServiceInterface):
                         "artist": artist or "Unknown Artist",
                         "source": "youtube",
                         "video_id": video_id,
-                        # Try to fetch duration_ms from YouTube metadata if available
-                        "duration_ms": None,  # Will be updated after download if possible
+                        # Client-reported length, updated after download if possible
+                        "duration_ms": duration_ms,
                     }
                     created_song = repo.create(song_data)
                     if created_song:
@@ -295,8 +297,10 @@ class YouTubeService(YouTubeServiceInterface):
                     else:
                         raise ServiceError(f"Failed to create song record {song_id}")
 
-            # Generate unique job ID
+            # Generate unique job ID, and the task ID up front so the job row
+            # never needs a second write that could race the worker
             job_id = str(uuid.uuid4())
+            task_id = str(uuid.uuid4())
 
             # Create and save job to database FIRST, before queuing Celery task
             import json
@@ -304,8 +308,12 @@ class YouTubeService(YouTubeServiceInterface):
             from app.db.models import Job, JobStatus
             from app.repositories import JobRepository
 
-            # Store video_id in notes for reference
-            job_notes = json.dumps({"video_id": video_id})
+            # Store video_id (and the submitting client, for admission
+            # fairness) in notes for reference
+            notes = {"video_id": video_id}
+            if client_id:
+                notes["client_id"] = client_id
+            job_notes = json.dumps(notes)
 
             job = Job(
                 id=job_id,
@@ -313,6 +321,7 @@ class YouTubeService(YouTubeServiceInterface):
                 status=JobStatus.PENDING,
                 status_message="Queued for YouTube processing",
                 progress=0,
+                task_id=task_id,
                 song_id=song_id,
                 title=title or "Unknown Title",
                 artist=artist or "Unknown Artist",
@@ -346,22 +355,19 @@ class YouTubeService(YouTubeServiceInterface):
                 video_id,
             )
 
-            # Use Celery app directly to avoid circular import
-            from app.jobs.celery_app import celery
+            # Imported here to avoid circular import
+            from app.jobs.dispatch import send_task
 
-            task = celery.send_task(
+            send_task(
                 "process_youtube_job",
-                args=[job_id, video_id, metadata_dict],
+                [job_id, video_id, metadata_dict],
+                task_id=task_id,
             )
 
-            # Update job with task ID
-            job.task_id = task.id
-            job_repository.update(job)
-
             logger.info(
                 "Unified YouTube processing job %s queued successfully with task %s",
                 job_id,
-                task.id,
+                task_id,
             )
 
             return job_id
@@ -372,6 +378,184 @@ class YouTubeService(YouTubeServiceInterface):
             )
             raise ServiceError(f"Failed to queue YouTube processing: {e}")
 
+    def get_playlist_entries(
+        self, playlist_url: str, max_entries: Optional[int] = None
+    ) -> list[dict[str, Any]]:
+        """List the videos of a playlist without downloading anything"""
+        try:
+            ydl_opts = {
+                "quiet": True,
+                "no_warnings": True,
+                "extract_flat": "in_playlist",
+            }
+            if max_entries:
+                ydl_opts["playlistend"] = max_entries
+
+            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+                info = ydl.extract_info(playlist_url, download=False)
+
+            entries = []
+            for entry in (info or {}).get("entries") or []:
+                if not entry or not entry.get("id"):
+                    continue
+                duration = entry.get("duration")
+                entries.append(
+                    {
+                        "video_id": entry["id"],
+                        "title": entry.get("title"),
+                        "artist": entry.get("channel") or entry.get("uploader"),
+                        "duration_ms": int(duration * 1000) if duration else None,
+                    }
+                )
+            logger.info("Found %s videos in playlist %s", len(entries), playlist_url)
+            return entries
+
+        except Exception as e:
+            logger.error("Failed to list playlist %s: %s", playlist_url, e)
+            raise ServiceError(f"Failed to read YouTube playlist: {e}")
+
+    def import_videos_async(
+        self,
+        videos: list[dict[str, Any]],
+        client_id: str = None,
+        source: str = None,
+    ) -> dict[str, Any]:
+        """
+        Queue many videos for processing under one parent job.
+
+        All song and job rows are written in a single transaction, then the
+        Celery tasks are released at ``BULK_IMPORT_RATE_PER_MINUTE`` using
+        countdowns so a large playlist does not hit YouTube all at once.
+        Videos already in the library are skipped.
+
+        Args:
+            videos: Dicts with ``video_id`` and optional ``title``, ``artist``
+                and ``duration_ms``
+            client_id: Submitting client, stored for admission fairness
+            source: Playlist URL the videos came from, if any
+
+        Returns:
+            Dict with the parent job ID, the queued child jobs and the
+            skipped videos
+        """
+        import json
+
+        from app.config import get_config
+        from app.db.database import get_db_session
+        from app.db.models import Job, JobStatus
+        from app.jobs.dispatch import send_task
+        from app.repositories import JobRepository
+        from app.repositories.song_repository import SongRepository
+
+        unique = {}
+        for video in videos:
+            unique.setdefault(video["video_id"], video)
+        if not unique:
+            raise ValidationError("No videos to import")
+
+        job_repository = JobRepository()
+        with get_db_session() as session:
+            song_repository = SongRepository(session)
+            existing = song_repository.fetch_ids_by_video_id(list(unique))
+            new_videos = [v for v in unique.values() if v["video_id"] not in existing]
+            skipped = [
+                {"videoId": video_id, "songId": song_id}
+                for video_id, song_id in existing.items()
+            ]
+            if not new_videos:
+                return {"parentJobId": None, "jobs": [], "skipped": skipped}
+
+            now = datetime.now(timezone.utc)
+            parent = Job(
+                id=str(uuid.uuid4()),
+                filename="import",
+                status=JobStatus.PENDING,
+                status_message=f"0/{len(new_videos)} imported",
+                title=f"Import of {len(new_videos)} videos",
+                notes=json.dumps(
+                    {"import": {"total": len(new_videos), "source": source}}
+                ),
+                created_at=now,
+            )
+            songs_data = []
+            children = []
+            for index, video in enumerate(new_videos):
+                song_id = str(uuid.uuid4())
+                title = video.get("title") or "Unknown Title"
+                artist = video.get("artist") or "Unknown Artist"
+                songs_data.append(
+                    {
+                        "id": song_id,
+                        "title": title,
+                        "artist": artist,
+                        "source": "youtube",
+                        "video_id": video["video_id"],
+                        "duration_ms": video.get("duration_ms"),
+                    }
+                )
+                notes = {"video_id": video["video_id"]}
+                if client_id:
+                    notes["client_id"] = client_id
+                children.append(
+                    Job(
+                        id=str(uuid.uuid4()),
+                        filename="original.mp3",
+                        status=JobStatus.PENDING,
+                        status_message="Queued for YouTube processing",
+                        # Task IDs are assigned up front so rows never need a
+                        # second write after the tasks are sent
+                        task_id=str(uuid.uuid4()),
+                        song_id=song_id,
+                        title=title,
+                        artist=artist,
+                        notes=json.dumps(notes),
+                        # Keep playlist order in the queue
+                        created_at=now + timedelta(microseconds=index + 1),
+                        parent_job_id=parent.id,
+                    )
+                )
+
+            song_repository.add_many(songs_data)
+            job_repository.create_many([parent] + children, session=session)
+
+        logger.info(
+            "Created import job %s with %s videos (%s already in library)",
+            parent.id,
+            len(children),
+            len(skipped),
+        )
+
+        rate = get_config().BULK_IMPORT_RATE_PER_MINUTE
+        interval = 60.0 / rate if rate > 0 else 0.0
+        for index, child in enumerate(children):
+            video_id = json.loads(child.notes)["video_id"]
+            try:
+                send_task(
+                    "process_youtube_job",
+                    [child.id, video_id, {"artist": child.artist, "title": child.title}],
+                    task_id=child.task_id,
+                    countdown=index * interval,
+                )
+            except Exception as e:
+                logger.error("Failed to queue import job %s: %s", child.id, e)
+                child.status = JobStatus.FAILED
+                child.error = f"Failed to queue YouTube processing: {e}"
+                child.completed_at = datetime.now(timezone.utc)
+                job_repository.update(child)
+
+        return {
+            "parentJobId": parent.id,
+            "jobs": [
+                {
+                    "jobId": child.id,
+                    "songId": child.song_id,
+                    "videoId": json.loads(child.notes)["video_id"],
+                }
+                for child in children
+            ],
+            "skipped": skipped,
+        }
+
     def _extract_metadata_from_youtube_info(
         self, video_info: "dict[str, Any]"
     ) -> "dict[str, Any]":
@@ -3,9 +3,11 @@ Cleanup utility for stuck jobs on startup.
 """
 
 import logging
-from datetime import datetime
+from datetime import datetime, timezone
 
 from app.db.models import JobStatus
+from app.jobs.dispatch import uses_local_executor
+from app.repositories import LocalTaskRepository
 from app.repositories.job_repository import JobRepository
 
 logger = logging.getLogger(__name__)
@@ -15,10 +17,14 @@ def cleanup_stuck_jobs():
     repo = JobRepository()
     jobs = repo.get_all_jobs()  # List[Job]
     terminal_statuses = {JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED}
-    now = datetime.now()
+    # The local executor resumes its persisted tasks, so their jobs are not stuck
+    resumable = set()
+    if uses_local_executor():
+        resumable = set(LocalTaskRepository().get_unfinished_task_ids())
+    now = datetime.now(timezone.utc)
     cleaned = 0
     for job in jobs:
-        if job.status not in terminal_statuses:
+        if job.status not in terminal_statuses and job.task_id not in resumable:
             job.status = JobStatus.FAILED
             job.error = "Job was stuck in non-terminal state on startup."
             job.completed_at = now
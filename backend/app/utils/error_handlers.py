@@ -14,6 +14,7 @@ from app.exceptions import (
     JobError,
     KaraokeBaseError,
     NotFoundError,
+    QueueFullError,
     ServiceError,
     ValidationError,
     YouTubeError,
@@ -149,6 +150,12 @@ def register_error_handlers(app: Flask) -> None:
     def handle_job_error(error: JobError):
         return create_error_response(error, 500)
 
+    @app.errorhandler(QueueFullError)
+    def handle_queue_full_error(error: QueueFullError):
+        response, status_code = create_error_response(error, 503)
+        response.headers["Retry-After"] = str(error.retry_after_seconds)
+        return response, status_code
+
     @app.errorhandler(ConfigurationError)
     def handle_configuration_error(error: ConfigurationError):
         return create_error_response(error, 500)
@@ -0,0 +1,428 @@
+"""
+Cross-process transport for job events.
+
+The event bus only reaches subscribers in its own process. With Celery,
+job state changes happen in worker processes while browsers are connected
+to one or more API processes, so job events travel between them over an
+``EventTransport``:
+
+- Workers publish their job events as compact deltas (only the fields that
+  changed since the job's previous message), batched every
+  EVENT_TRANSPORT_BATCH_MS, and no longer emit to Socket.IO themselves.
+- Every API node receives every batch, rebuilds the full job state and
+  publishes it on its own event bus, so its websocket layer broadcasts to
+  the clients connected to that node. API nodes also relay the job events
+  they originate (creations, cancellations) to the other nodes.
+
+EVENT_TRANSPORT selects Redis pub/sub (``redis``, for production), an
+append-only file shared by the processes of one machine (``file``, for tests
+and development), or ``socketio`` to keep workers emitting through the
+Socket.IO message queue as before.
+"""
+
+import logging
+import os
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from app.config import get_config
+
+from . import fast_json
+from .events import (
+    JobEvent,
+    event_bus,
+    job_event_name,
+    publish_job_event,
+    subscribe_to_job_events,
+)
+
+logger = logging.getLogger(__name__)
+
+TERMINAL_STATUSES = ("completed", "failed", "cancelled")
+RELAY_KEY = "event_transport.relay"
+
+
+class EventTransport:
+    """Delivers messages published by any process to every listening one."""
+
+    def publish(self, message: str) -> None:
+        raise NotImplementedError
+
+    def listen(self, callback: Callable[[str], None]) -> None:
+        """Call ``callback`` with every message published from now on."""
+        raise NotImplementedError
+
+    def close(self) -> None:
+        pass
+
+
+class RedisEventTransport(EventTransport):
+    """Redis pub/sub on one channel."""
+
+    def __init__(self, url: str, channel: str):
+        import redis
+
+        self.channel = channel
+        self._redis = redis.Redis.from_url(url)
+        self._pubsub = None
+        self._thread = None
+
+    def publish(self, message: str) -> None:
+        self._redis.publish(self.channel, message)
+
+    def listen(self, callback: Callable[[str], None]) -> None:
+        def handle(message: Dict[str, Any]) -> None:
+            try:
+                callback(message["data"].decode())
+            except Exception as e:
+                logger.warning("Event transport callback failed: %s", e)
+
+        self._pubsub = self._redis.pubsub(ignore_subscribe_messages=True)
+        self._pubsub.subscribe(**{self.channel: handle})
+        self._thread = self._pubsub.run_in_thread(
+            sleep_time=1.0, daemon=True, exception_handler=self._listener_failed
+        )
+
+    @staticmethod
+    def _listener_failed(error: Exception, pubsub, thread) -> None:
+        # Without a handler the listener thread dies; keep it polling, and
+        # reconnecting, after e.g. a lost connection
+        logger.warning("Event transport listener failed: %s", error)
+        time.sleep(1.0)
+
+    def close(self) -> None:
+        if self._thread is not None:
+            self._thread.stop()
+            self._thread = None
+        if self._pubsub is not None:
+            self._pubsub.close()
+            self._pubsub = None
+
+
+class FileEventTransport(EventTransport):
+    """
+    An append-only file of newline-delimited messages, tailed by listeners.
+
+    Appends of one short line are atomic on local filesystems, so several
+    processes on one machine can publish to the same file.
+    """
+
+    def __init__(self, path: str, poll_interval: float = 0.05):
+        self.path = path
+        self.poll_interval = poll_interval
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        open(self.path, "a").close()
+
+    def publish(self, message: str) -> None:
+        data = (message.replace("\n", " ") + "\n").encode()
+        fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            os.write(fd, data)
+        finally:
+            os.close(fd)
+
+    def listen(self, callback: Callable[[str], None]) -> None:
+        offset = os.path.getsize(self.path)
+        self._stopped.clear()
+        self._thread = threading.Thread(
+            target=self._tail,
+            args=(callback, offset),
+            name="event-transport-file",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def _tail(self, callback: Callable[[str], None], offset: int) -> None:
+        partial = b""
+        with open(self.path, "rb") as file:
+            file.seek(offset)
+            while not self._stopped.is_set():
+                chunk = file.read()
+                if not chunk:
+                    self._stopped.wait(self.poll_interval)
+                    continue
+                *lines, partial = (partial + chunk).split(b"\n")
+                for line in lines:
+                    try:
+                        callback(line.decode())
+                    except Exception as e:
+                        logger.warning("Event transport callback failed: %s", e)
+
+    def close(self) -> None:
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join(5)
+            self._thread = None
+
+
+class JobEventRelay:
+    """Sends this process's job events over a transport and receives others'."""
+
+    def __init__(
+        self,
+        transport: EventTransport,
+        batch_interval: float = 0.1,
+        publish: Callable[..., None] = publish_job_event,
+        load_job: Optional[Callable[[str], Optional[Dict[str, Any]]]] = None,
+        max_tracked_jobs: int = 1000,
+    ):
+        self.transport = transport
+        self.batch_interval = batch_interval
+        self.origin = uuid.uuid4().hex
+        self.max_tracked_jobs = max_tracked_jobs
+        self.messages_sent = 0
+        self.messages_received = 0
+        self._publish = publish
+        self._load_job = load_job or _load_job
+        self._lock = threading.Condition()
+        # Last state sent / received per job, least recently updated first
+        self._sent: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._received: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        # Entries of the next batch in order, and the latest entry of each
+        # job with the status it carries, which updates in that status join
+        self._outbox: List[Dict[str, Any]] = []
+        self._open: Dict[str, Tuple[Any, Dict[str, Any]]] = {}
+        self._thread: Optional[threading.Thread] = None
+        self._stopping = False
+
+    # --- Sending ---
+
+    def handle(self, event: JobEvent) -> None:
+        """Queue a local job event for the next batch."""
+        if event.remote or not event.job_id:
+            return
+        job_id, data = event.job_id, event.job_data
+        self._journal(job_id, data, event.was_created)
+        with self._lock:
+            previous = self._sent.pop(job_id, None)
+            full = (
+                previous is None
+                or event.was_created
+                or previous.get("status") != data.get("status")
+            )
+            if full:
+                delta = dict(data)
+            else:
+                delta = {
+                    key: value
+                    for key, value in data.items()
+                    if previous.get(key) != value
+                }
+                for key in previous.keys() - data.keys():
+                    delta[key] = None
+            if data.get("status") not in TERMINAL_STATUSES:
+                _remember(self._sent, job_id, dict(data), self.max_tracked_jobs)
+
+            status = data.get("status")
+            status_entry = self._open.get(job_id)
+            if status_entry is not None and status_entry[0] == status:
+                entry = status_entry[1]
+                entry["data"].update(delta)
+                entry["full"] = entry["full"] or full
+                entry["created"] = entry["created"] or event.was_created
+            else:
+                # A status change (e.g. the failure of a job created in this
+                # batch) is an entry of its own, so receivers announce both
+                entry = {
+                    "id": job_id,
+                    "data": delta,
+                    "full": full,
+                    "created": event.was_created,
+                }
+                self._outbox.append(entry)
+                self._open[job_id] = (status, entry)
+
+    @staticmethod
+    def _journal(job_id: str, data: Dict[str, Any], was_created: bool) -> None:
+        from app.services.job_journal import get_job_journal
+
+        journal = get_job_journal()
+        if journal is not None:
+            journal.append(None, job_event_name(data, was_created), data)
+
+    def flush(self) -> int:
+        """Send the queued job events as one message, returning how many."""
+        with self._lock:
+            batch, self._outbox = self._outbox, []
+            self._open.clear()
+        if not batch:
+            return 0
+        try:
+            self.transport.publish(
+                fast_json.dumps({"origin": self.origin, "events": batch})
+            )
+            self.messages_sent += 1
+        except Exception as e:
+            logger.warning("Failed to send %d job events: %s", len(batch), e)
+            # Receivers may now hold stale state; resend these jobs in full
+            with self._lock:
+                for entry in batch:
+                    self._sent.pop(entry["id"], None)
+        return len(batch)
+
+    def _run(self) -> None:
+        while True:
+            with self._lock:
+                if not self._stopping:
+                    self._lock.wait(self.batch_interval)
+                stopping = self._stopping
+            self.flush()
+            if stopping:
+                return
+
+    # --- Receiving ---
+
+    def receive(self, message: str) -> None:
+        """Publish the job events of another process's batch on this bus."""
+        payload = fast_json.loads(message)
+        if payload.get("origin") == self.origin:
+            return
+        self.messages_received += 1
+        for entry in payload.get("events", []):
+            job_id = entry["id"]
+            with self._lock:
+                state = self._received.pop(job_id, None)
+            if entry.get("full"):
+                state = dict(entry["data"])
+            else:
+                if state is None:
+                    # Joined after the job's last full message
+                    state = self._load_job(job_id)
+                    if state is None:
+                        continue
+                state.update(entry["data"])
+            with self._lock:
+                _remember(self._received, job_id, state, self.max_tracked_jobs)
+            self._publish(job_id, dict(state), entry.get("created", False), remote=True)
+
+    # --- Lifecycle ---
+
+    def start(self, receive: bool) -> None:
+        """Start sending batches, and receiving them on API nodes."""
+        self._stopping = False
+        self._thread = threading.Thread(
+            target=self._run, name="job-event-relay", daemon=True
+        )
+        self._thread.start()
+        if receive:
+            self.transport.listen(self.receive)
+
+    def is_alive(self) -> bool:
+        """Whether the sending thread runs (threads do not survive a fork)."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Send what is still queued and close the transport."""
+        with self._lock:
+            self._stopping = True
+            self._lock.notify()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        self.flush()
+        self.transport.close()
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Counters for the health endpoint."""
+        return {
+            "origin": self.origin,
+            "messages_sent": self.messages_sent,
+            "messages_received": self.messages_received,
+        }
+
+
+def _remember(
+    states: "OrderedDict[str, Dict[str, Any]]",
+    job_id: str,
+    state: Dict[str, Any],
+    limit: int,
+) -> None:
+    states[job_id] = state
+    while len(states) > limit:
+        states.popitem(last=False)
+
+
+def _load_job(job_id: str) -> Optional[Dict[str, Any]]:
+    from app.repositories import JobRepository
+
+    job = JobRepository().get_job(job_id)
+    return job.to_dict() if job is not None else None
+
+
+_relay: Optional[JobEventRelay] = None
+_relay_sends_only = False
+_relay_lock = threading.Lock()
+
+
+def uses_event_transport() -> bool:
+    """Whether job events cross processes over an EventTransport."""
+    config = get_config()
+    return config.JOB_EXECUTOR != "local" and config.EVENT_TRANSPORT in (
+        "redis",
+        "file",
+    )
+
+
+def relays_to_api_nodes() -> bool:
+    """
+    Whether this process hands its job events to the API nodes instead of
+    broadcasting them itself (a Celery worker with a transport).
+    """
+    return _relay_sends_only
+
+
+def create_event_transport() -> EventTransport:
+    """The transport selected by EVENT_TRANSPORT."""
+    config = get_config()
+    if config.EVENT_TRANSPORT == "file":
+        return FileEventTransport(config.EVENT_TRANSPORT_PATH)
+    return RedisEventTransport(
+        config.EVENT_TRANSPORT_URL, config.EVENT_TRANSPORT_CHANNEL
+    )
+
+
+def get_event_relay() -> Optional[JobEventRelay]:
+    """The relay of this process, if one was started."""
+    return _relay
+
+
+def start_event_relay(receive: bool) -> Optional[JobEventRelay]:
+    """
+    Relay this process's job events over the configured transport
+    (idempotent). API nodes pass ``receive`` to also broadcast other
+    processes' events; workers stop broadcasting their own. A relay whose
+    thread is gone, such as one inherited by a forked worker, is replaced.
+    """
+    global _relay, _relay_sends_only  # pylint: disable=global-statement
+    if not uses_event_transport():
+        return None
+    with _relay_lock:
+        if _relay is None or not _relay.is_alive():
+            _relay = JobEventRelay(
+                create_event_transport(),
+                batch_interval=get_config().EVENT_TRANSPORT_BATCH_MS / 1000,
+            )
+            _relay.start(receive)
+            _relay_sends_only = not receive
+            subscribe_to_job_events(_relay.handle, key=RELAY_KEY)
+            logger.info(
+                "Relaying job events over %s transport",
+                get_config().EVENT_TRANSPORT,
+            )
+    return _relay
+
+
+def stop_event_relay() -> None:
+    """Send queued job events and close this process's transport."""
+    global _relay, _relay_sends_only  # pylint: disable=global-statement
+    with _relay_lock:
+        if _relay is not None:
+            event_bus.unsubscribe("job_updated", key=RELAY_KEY)
+            _relay.stop()
+            _relay = None
+            _relay_sends_only = False
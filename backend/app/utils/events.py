@@ -4,12 +4,25 @@ Simple event system for decoupling application components.
 
 This prevents cyclic imports by allowing models to emit events
 without directly importing business logic modules.
+
+By default handlers run on the publishing thread. After ``start_async`` the
+bus instead queues events and runs handlers on a dispatcher thread, so
+publishers (e.g. JobRepository inside a database session) never wait for
+slow handlers such as websocket emits. Queued events for the same job are
+coalesced while its status stays the same, so a burst of progress updates
+is handled once.
 """
 
+import itertools
 import logging
+import threading
+import time
+from collections import OrderedDict
 from dataclasses import dataclass
 from threading import Lock
-from typing import Any, Callable, Dict, List
+from typing import Any, Callable, Dict, Hashable, Optional
+
+from app.config import get_config
 
 logger = logging.getLogger(__name__)
 
@@ -21,6 +34,19 @@ class Event:
     name: str
     data: Dict[str, Any]
 
+    @property
+    def coalesce_key(self) -> Optional[Hashable]:
+        """Queued events with the same name and key are merged (None: never)."""
+        return None
+
+    def merges_with(self, previous: "Event") -> bool:
+        """Whether this event may replace an earlier queued one with its key."""
+        return True
+
+    def merge(self, previous: "Event") -> "Event":
+        """Combine with an earlier queued event that has the same key."""
+        return self
+
 
 @dataclass
 class JobEvent(Event):
@@ -29,14 +55,20 @@ class JobEvent(Event):
     job_id: str = ""
     job_data: Dict[str, Any] = None
     was_created: bool = False
+    remote: bool = False  # Received from another process's event transport
 
     def __init__(
-        self, job_id: str, job_data: Dict[str, Any], was_created: bool = False
+        self,
+        job_id: str,
+        job_data: Dict[str, Any],
+        was_created: bool = False,
+        remote: bool = False,
     ):
         """Initialize JobEvent with proper parent initialization."""
         self.job_id = job_id
         self.job_data = job_data or {}
         self.was_created = was_created
+        self.remote = remote
 
         # Initialize parent Event class
         super().__init__(
@@ -48,6 +80,137 @@ class JobEvent(Event):
             },
         )
 
+    @property
+    def coalesce_key(self) -> Optional[Hashable]:
+        return self.job_id or None
+
+    def merges_with(self, previous: Event) -> bool:
+        # A status change (e.g. a creation followed by a failure) reaches
+        # subscribers as an event of its own, so terminal events are not lost
+        return not isinstance(previous, JobEvent) or (
+            previous.job_data.get("status") == self.job_data.get("status")
+        )
+
+    def merge(self, previous: Event) -> Event:
+        # The latest state wins, but a creation must still be announced and
+        # a local change still relayed to other processes
+        if not isinstance(previous, JobEvent):
+            return self
+        was_created = self.was_created or previous.was_created
+        remote = self.remote and previous.remote
+        if (was_created, remote) == (self.was_created, self.remote):
+            return self
+        return JobEvent(self.job_id, self.job_data, was_created, remote)
+
+
+@dataclass
+class EventBusMetrics:
+    """Counters describing event dispatch, for monitoring."""
+
+    published: int = 0
+    dispatched: int = 0
+    coalesced: int = 0
+    dropped: int = 0
+    handler_calls: int = 0
+    handler_seconds_total: float = 0.0
+    handler_seconds_max: float = 0.0
+
+    def record_handler(self, seconds: float) -> None:
+        self.handler_calls += 1
+        self.handler_seconds_total += seconds
+        self.handler_seconds_max = max(self.handler_seconds_max, seconds)
+
+
+class _AsyncDispatcher:
+    """Bounded, coalescing queue drained by a dedicated thread."""
+
+    def __init__(self, bus: "EventBus", coalesce_window: float, max_queue: int) -> None:
+        self.bus = bus
+        self.coalesce_window = coalesce_window
+        self.max_queue = max(1, max_queue)
+        self._pending: "OrderedDict[Hashable, Event]" = OrderedDict()
+        self._condition = threading.Condition()
+        self._unkeyed = itertools.count()
+        # Queued events of a key that could not merge are queued after the
+        # earlier ones under the next generation of the key
+        self._generations: Dict[Hashable, int] = {}
+        self._running = True
+        self._busy = False
+        self.thread = threading.Thread(
+            target=self._run, name="event-bus-dispatcher", daemon=True
+        )
+        self.thread.start()
+
+    @property
+    def depth(self) -> int:
+        return len(self._pending)
+
+    def submit(self, event: Event) -> None:
+        metrics = self.bus.metrics
+        key = event.coalesce_key
+        with self._condition:
+            if key is None:
+                queue_key: Hashable = ("", next(self._unkeyed))
+            else:
+                slot = (event.name, key)
+                generation = self._generations.get(slot, 0)
+                queue_key = (slot, generation)
+                previous = self._pending.get(queue_key)
+                if previous is not None:
+                    if event.merges_with(previous):
+                        self._pending[queue_key] = event.merge(previous)
+                        metrics.coalesced += 1
+                        return
+                    queue_key = (slot, generation + 1)
+                    self._generations[slot] = generation + 1
+            if len(self._pending) >= self.max_queue:
+                metrics.dropped += 1
+                logger.warning(f"Event queue full, dropped '{event.name}' event")
+                return
+            self._pending[queue_key] = event
+            self._condition.notify()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._pending and self._running:
+                    self._condition.wait()
+                if not self._pending:
+                    return
+            # Let further updates to the same jobs coalesce before dispatching
+            if self.coalesce_window and self._running:
+                time.sleep(self.coalesce_window)
+            with self._condition:
+                batch = list(self._pending.values())
+                self._pending.clear()
+                self._generations.clear()
+                self._busy = True
+            try:
+                for event in batch:
+                    self.bus._dispatch(event)  # pylint: disable=protected-access
+            finally:
+                with self._condition:
+                    self._busy = False
+                    self._condition.notify_all()
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Wait until every queued event has been handled."""
+        deadline = time.monotonic() + timeout
+        with self._condition:
+            while self._pending or self._busy:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._condition.wait(remaining)
+        return True
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Handle what is queued, then end the dispatcher thread."""
+        with self._condition:
+            self._running = False
+            self._condition.notify_all()
+        self.thread.join(timeout)
+
 
 class EventBus:
     """
@@ -58,8 +221,10 @@ class EventBus:
 
     _instance = None
     _lock = Lock()
-    _subscribers: Dict[str, List[Callable]] = {}
+    _subscribers: Dict[str, Dict[Hashable, Callable]] = {}
     _subscribers_lock = Lock()
+    _dispatcher: Optional[_AsyncDispatcher] = None
+    metrics = EventBusMetrics()
 
     def __new__(cls):
         if cls._instance is None:
@@ -68,35 +233,98 @@ class EventBus:
                     cls._instance = super().__new__(cls)
         return cls._instance
 
-    def subscribe(self, event_name: str, handler: Callable[[Event], None]) -> None:
+    def subscribe(
+        self,
+        event_name: str,
+        handler: Callable[[Event], None],
+        key: Optional[Hashable] = None,
+    ) -> None:
         """
         Subscribe to events of a specific type.
 
+        Subscriptions are idempotent: subscribing again with the same key
+        replaces the earlier handler instead of adding a second one.
+
         Args:
             event_name: Name of the event to subscribe to
             handler: Function to call when event is published
+            key: Identity of the subscription (defaults to the handler)
         """
         with self._subscribers_lock:
-            if event_name not in self._subscribers:
-                self._subscribers[event_name] = []
-            self._subscribers[event_name].append(handler)
+            handlers = self._subscribers.setdefault(event_name, {})
+            handlers[handler if key is None else key] = handler
             logger.debug(f"Subscribed handler to '{event_name}' event")
 
-    def unsubscribe(self, event_name: str, handler: Callable[[Event], None]) -> None:
+    def unsubscribe(
+        self,
+        event_name: str,
+        handler: Optional[Callable[[Event], None]] = None,
+        key: Optional[Hashable] = None,
+    ) -> None:
         """
         Unsubscribe from events of a specific type.
 
         Args:
             event_name: Name of the event to unsubscribe from
             handler: Handler function to remove
+            key: Key the handler was subscribed with, instead of the handler
         """
         with self._subscribers_lock:
-            if event_name in self._subscribers:
-                try:
-                    self._subscribers[event_name].remove(handler)
-                    logger.debug(f"Unsubscribed handler from '{event_name}' event")
-                except ValueError:
-                    logger.warning(f"Handler not found for '{event_name}' event")
+            handlers = self._subscribers.get(event_name, {})
+            if handlers.pop(handler if key is None else key, None) is not None:
+                logger.debug(f"Unsubscribed handler from '{event_name}' event")
+            else:
+                logger.warning(f"Handler not found for '{event_name}' event")
+
+    def start_async(
+        self, coalesce_window: float = 0.05, max_queue: int = 10000
+    ) -> None:
+        """
+        Dispatch events on a background thread from now on (idempotent).
+
+        Args:
+            coalesce_window: Seconds to wait for further events for the same
+                job before handling a batch
+            max_queue: Maximum distinct queued events; newer ones are dropped
+        """
+        with self._lock:
+            dispatcher = EventBus._dispatcher
+            if dispatcher is not None and dispatcher.thread.is_alive():
+                return
+            EventBus._dispatcher = _AsyncDispatcher(self, coalesce_window, max_queue)
+            logger.info("Event bus dispatching asynchronously")
+
+    def stop_async(self, timeout: float = 5.0) -> None:
+        """Handle queued events and return to synchronous dispatch."""
+        with self._lock:
+            dispatcher = EventBus._dispatcher
+            EventBus._dispatcher = None
+        if dispatcher is not None:
+            dispatcher.stop(timeout)
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Wait for queued events to be handled (no-op when synchronous)."""
+        dispatcher = EventBus._dispatcher
+        return dispatcher.flush(timeout) if dispatcher is not None else True
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Dispatch counters, queue depth and handler latency."""
+        metrics = self.metrics
+        dispatcher = EventBus._dispatcher
+        calls = metrics.handler_calls
+        return {
+            "mode": "async" if dispatcher is not None else "sync",
+            "queue_depth": dispatcher.depth if dispatcher is not None else 0,
+            "published": metrics.published,
+            "dispatched": metrics.dispatched,
+            "coalesced": metrics.coalesced,
+            "dropped": metrics.dropped,
+            "handler_calls": calls,
+            "handler_avg_ms": (
+                round(metrics.handler_seconds_total / calls * 1000, 3) if calls else 0.0
+            ),
+            "handler_max_ms": round(metrics.handler_seconds_max * 1000, 3),
+        }
 
     def publish(self, event: Event) -> None:
         """
@@ -105,20 +333,33 @@ class EventBus:
         Args:
             event: Event to publish
         """
+        self.metrics.published += 1
+        dispatcher = EventBus._dispatcher
+        if dispatcher is not None:
+            dispatcher.submit(event)
+        else:
+            self._dispatch(event)
+
+    def _dispatch(self, event: Event) -> None:
+        """Run the subscribers of an event on the current thread."""
+        self.metrics.dispatched += 1
         with self._subscribers_lock:
-            subscribers = self._subscribers.get(event.name, []).copy()
+            subscribers = list(self._subscribers.get(event.name, {}).values())
 
         if subscribers:
             logger.debug(
                 f"Publishing '{event.name}' event to {len(subscribers)} subscribers"
             )
             for handler in subscribers:
+                started = time.perf_counter()
                 try:
                     handler(event)
                 except Exception as e:
                     logger.error(
                         f"Error in event handler for '{event.name}': {e}", exc_info=True
                     )
+                finally:
+                    self.metrics.record_handler(time.perf_counter() - started)
         else:
             logger.debug(f"No subscribers for '{event.name}' event")
 
@@ -142,9 +383,33 @@ class EventBus:
 event_bus = EventBus()
 
 
+def start_event_dispatcher() -> None:
+    """Switch this process's bus to asynchronous dispatch if EVENT_BUS_ASYNC."""
+    config = get_config()
+    if config.EVENT_BUS_ASYNC:
+        event_bus.start_async(
+            coalesce_window=config.EVENT_BUS_COALESCE_MS / 1000,
+            max_queue=config.EVENT_BUS_MAX_QUEUE,
+        )
+
+
 # Convenience functions for common operations
+def job_event_name(job_data: Dict[str, Any], was_created: bool = False) -> str:
+    """The client-facing name of a job event (job_created, job_updated, ...)."""
+    if was_created:
+        return "job_created"
+    return {
+        "completed": "job_completed",
+        "failed": "job_failed",
+        "cancelled": "job_cancelled",
+    }.get(job_data.get("status"), "job_updated")
+
+
 def publish_job_event(
-    job_id: str, job_data: Dict[str, Any], was_created: bool = False
+    job_id: str,
+    job_data: Dict[str, Any],
+    was_created: bool = False,
+    remote: bool = False,
 ) -> None:
     """
     Convenience function to publish job events.
@@ -152,8 +417,11 @@ def publish_job_event(
         job_id: ID of the job
         job_data: Job data dictionary
         was_created: Whether this is a new job creation
+        remote: Whether the event was received from another process
     """
-    event = JobEvent(job_id=job_id, job_data=job_data, was_created=was_created)
+    event = JobEvent(
+        job_id=job_id, job_data=job_data, was_created=was_created, remote=remote
+    )
     print(
         f"📢 Publishing job event: {job_id} - created={was_created} - "
         f"status={job_data.get('status', 'unknown')}"
@@ -161,16 +429,20 @@ def publish_job_event(
     event_bus.publish(event)
 
 
-def subscribe_to_job_events(handler: Callable[[JobEvent], None]) -> None:
+def subscribe_to_job_events(
+    handler: Callable[[JobEvent], None], key: Optional[Hashable] = None
+) -> None:
     """
     Convenience function to subscribe to job events.
 
     Args:
         handler: Function to handle job events
+        key: Identity of the subscription (defaults to the handler), so
+            repeated calls do not add duplicate handlers
     """
 
     def wrapper(event: Event) -> None:
         if isinstance(event, JobEvent):
             handler(event)
 
-    event_bus.subscribe("job_updated", wrapper)
+    event_bus.subscribe("job_updated", wrapper, key=handler if key is None else key)
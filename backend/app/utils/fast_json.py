@@ -0,0 +1,43 @@
+"""
+Fast JSON encoding for hot responses (job lists and job events).
+
+Uses orjson when it is installed and falls back to the standard library
+with compact separators otherwise. ``dumps`` and ``loads`` accept (and
+ignore) the standard library's keyword arguments, so this module can stand
+in for ``json`` where a json-like module is expected (e.g. Socket.IO).
+"""
+
+import json
+from typing import Any
+
+from flask import Response
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def dumps(obj: Any, **_kwargs: Any) -> str:
+    """Serialize ``obj`` to a JSON string; unknown types become strings."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(obj, default=str, separators=(",", ":"))
+
+
+def loads(data: Any, **_kwargs: Any) -> Any:
+    """Deserialize a JSON string or bytes."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_response(data: Any, status: int = 200) -> Response:
+    """A JSON response encoded with ``dumps``, for large payloads."""
+    if ORJSON_AVAILABLE:
+        body: Any = orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS)
+    else:
+        body = dumps(data)
+    return Response(body, status=status, mimetype="application/json")
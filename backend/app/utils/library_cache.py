@@ -0,0 +1,130 @@
+"""
+Conditional and cached responses for endpoints that read the song library.
+
+``@library_cached`` gives every response an ETag made of the library
+version (see library_version_repository) and the request path and query
+parameters. A request whose If-None-Match holds that ETag gets a bodiless
+304, and other requests for the same ETag are answered from a small LRU
+cache of response bodies; neither runs the view.
+
+The version is read from the database at most every LIBRARY_VERSION_TTL_MS,
+and again right after this process commits a song write. Writes committed
+by other processes (job workers) show up within that interval.
+"""
+
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+from typing import Callable, Optional, Tuple
+
+from app.db.database import get_db_session
+from app.repositories.library_version_repository import (
+    local_library_commits,
+    read_library_version,
+)
+from flask import Flask, current_app, request
+
+logger = logging.getLogger(__name__)
+
+
+class LibraryCache:
+    """The library version last read and the responses cached for it."""
+
+    def __init__(self, ttl_seconds: float, size: int):
+        self.ttl_seconds = ttl_seconds
+        self.size = size
+        self._lock = threading.Lock()
+        self._version: Optional[int] = None
+        self._read_at = 0.0
+        self._local_commits = -1
+        self._responses: "OrderedDict[str, Tuple[bytes, str]]" = OrderedDict()
+
+    def version(self) -> int:
+        """The library version, read again once expired or written locally."""
+        commits = local_library_commits()
+        if (
+            self._version is not None
+            and self._local_commits == commits
+            and time.monotonic() - self._read_at < self.ttl_seconds
+        ):
+            return self._version
+        with get_db_session() as session:
+            version = read_library_version(session)
+        with self._lock:
+            if version != self._version:
+                # Responses of older versions can no longer be requested
+                self._responses.clear()
+            self._version = version
+            self._read_at = time.monotonic()
+            self._local_commits = commits
+        return version
+
+    def get(self, etag: str) -> Optional[Tuple[bytes, str]]:
+        with self._lock:
+            cached = self._responses.get(etag)
+            if cached is not None:
+                self._responses.move_to_end(etag)
+            return cached
+
+    def put(self, etag: str, body: bytes, mimetype: str) -> None:
+        if self.size <= 0:
+            return
+        with self._lock:
+            self._responses[etag] = (body, mimetype)
+            self._responses.move_to_end(etag)
+            while len(self._responses) > self.size:
+                self._responses.popitem(last=False)
+
+
+def get_library_cache(app: Flask) -> LibraryCache:
+    """The app's library cache, created on first use."""
+    cache = app.extensions.get("library_cache")
+    if cache is None:
+        cache = app.extensions["library_cache"] = LibraryCache(
+            ttl_seconds=app.config.get("LIBRARY_VERSION_TTL_MS", 1000) / 1e3,
+            size=app.config.get("LIBRARY_RESPONSE_CACHE_SIZE", 128),
+        )
+    return cache
+
+
+def library_etag(version: int) -> str:
+    """ETag of the current request's response at a library version."""
+    params = sorted(request.args.items(multi=True))
+    digest = hashlib.sha1(f"{request.path}?{params}".encode()).hexdigest()
+    return f"{version}-{digest[:16]}"
+
+
+def library_cached(view: Callable) -> Callable:
+    """Answer a library read with 304 or a cached body when the ETag matches."""
+
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        cache = get_library_cache(current_app)
+        try:
+            etag = library_etag(cache.version())
+        except Exception as e:  # pylint: disable=broad-except
+            # Without a version the response cannot be validated; serve it
+            logger.warning("Library version unavailable, not caching: %s", e)
+            return view(*args, **kwargs)
+
+        if request.if_none_match.contains_weak(etag):
+            response = current_app.response_class(status=304)
+        else:
+            cached = cache.get(etag)
+            if cached is None:
+                response = current_app.make_response(view(*args, **kwargs))
+                if response.status_code != 200:
+                    return response
+                cache.put(etag, response.get_data(), response.mimetype)
+            else:
+                body, mimetype = cached
+                response = current_app.response_class(body, mimetype=mimetype)
+        response.set_etag(etag)
+        # Clients may keep the body but must revalidate it before each use
+        response.cache_control.no_cache = True
+        return response
+
+    return wrapper
@@ -0,0 +1,162 @@
+"""
+Per-request SQL statistics and query budgets.
+
+Opt-in with SQL_STATS: ``install_query_stats`` hooks the engine's cursor
+events and ``register_query_stats`` collects, for each request, the number
+of statements, the time spent in them and how often each statement shape
+ran. A shape is the SQL with its ``IN (?, ?, ...)`` lists collapsed, so a
+query issued in a loop shows up as one shape run many times. Every response
+then carries::
+
+    Server-Timing: db;dur=3.1;desc="12 queries"
+    X-SQL-Queries: 12
+    X-SQL-Repeated: 9
+
+(X-SQL-Repeated is the run count of the most repeated shape), and a request
+repeating a shape SQL_STATS_REPEAT_WARN times or more is logged as a warning.
+
+Views declare the statements they may run with ``@query_budget(n)``. With
+SQL_QUERY_BUDGET_ENFORCE (set by the testing config) a request over budget
+raises QueryBudgetExceeded, which the test client propagates to fail the test
+that made it; otherwise it is logged.
+"""
+
+import logging
+import re
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from typing import Callable, Iterator, Optional
+
+from flask import Flask, Response, current_app, g, request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+_IN_LIST = re.compile(r"\(\?(?:, \?)+\)")
+_WHITESPACE = re.compile(r"\s+")
+
+# Stats of the request being handled by this thread (green thread under
+# eventlet), None outside of requests
+_local = threading.local()
+
+
+class QueryBudgetExceeded(AssertionError):
+    """A request ran more SQL statements than its view's query budget."""
+
+
+def statement_shape(statement: str) -> str:
+    """SQL of a statement with whitespace and IN lists normalized."""
+    return _IN_LIST.sub("(?)", _WHITESPACE.sub(" ", statement).strip())
+
+
+class QueryStats:
+    """SQL statements run while collecting, with their total time."""
+
+    __slots__ = ("count", "seconds", "shapes")
+
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+        self.shapes: "Counter[str]" = Counter()
+
+    def record(self, statement: str, seconds: float) -> None:
+        self.count += 1
+        self.seconds += seconds
+        self.shapes[statement_shape(statement)] += 1
+
+    def repeated(self) -> "Counter[str]":
+        """Shapes run more than once, by number of runs."""
+        return Counter({shape: n for shape, n in self.shapes.items() if n > 1})
+
+    def max_repeats(self) -> int:
+        return max(self.shapes.values(), default=0)
+
+
+@contextmanager
+def collect_query_stats() -> Iterator[QueryStats]:
+    """Collect the statements this thread runs on instrumented engines."""
+    previous = getattr(_local, "stats", None)
+    stats = _local.stats = QueryStats()
+    try:
+        yield stats
+    finally:
+        _local.stats = previous
+
+
+def install_query_stats(engine: Engine) -> None:
+    """Time every statement ``engine`` runs, for collect_query_stats."""
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before(conn, _cursor, _statement, _parameters, _context, _executemany):
+        conn.info.setdefault("query_stats_started", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after(conn, _cursor, statement, _parameters, _context, _executemany):
+        started = conn.info["query_stats_started"].pop()
+        stats: Optional[QueryStats] = getattr(_local, "stats", None)
+        if stats is not None:
+            stats.record(statement, time.perf_counter() - started)
+
+    logger.info("SQL statistics enabled")
+
+
+def query_budget(statements: int) -> Callable:
+    """Declare the most SQL statements a view may run per request."""
+
+    def decorator(view: Callable) -> Callable:
+        view.query_budget = statements  # type: ignore[attr-defined]
+        return view
+
+    return decorator
+
+
+def register_query_stats(app: Flask) -> None:
+    """Collect SQL statistics per request and report them on the response."""
+
+    @app.before_request
+    def _start_query_stats():
+        _local.stats = g.query_stats = QueryStats()
+
+    @app.after_request
+    def _report_query_stats(response: Response) -> Response:
+        stats: Optional[QueryStats] = g.pop("query_stats", None)
+        _local.stats = None
+        if stats is None:
+            return response
+
+        response.headers["Server-Timing"] = (
+            f'db;dur={stats.seconds * 1e3:.1f};desc="{stats.count} queries"'
+        )
+        response.headers["X-SQL-Queries"] = str(stats.count)
+        response.headers["X-SQL-Repeated"] = str(stats.max_repeats())
+
+        threshold = current_app.config.get("SQL_STATS_REPEAT_WARN", 10)
+        for shape, runs in stats.repeated().items():
+            if runs >= threshold:
+                logger.warning(
+                    "%s %s ran the same query %s times: %s",
+                    request.method,
+                    request.path,
+                    runs,
+                    shape[:200],
+                )
+
+        view = current_app.view_functions.get(request.endpoint)
+        budget = getattr(view, "query_budget", None)
+        if budget is not None and stats.count > budget:
+            message = (
+                f"{request.method} {request.full_path.rstrip('?')} ran {stats.count} "
+                f"SQL statements, over its budget of {budget}; most repeated: "
+                f"{stats.repeated().most_common(3)}"
+            )
+            if current_app.config.get("SQL_QUERY_BUDGET_ENFORCE", False):
+                raise QueryBudgetExceeded(message)
+            logger.warning(message)
+        return response
+
+    @app.teardown_request
+    def _stop_query_stats(_exc):
+        _local.stats = None
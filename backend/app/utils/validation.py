@@ -5,9 +5,9 @@ Request validation utilities using Pydantic schemas
 
 import logging
 from functools import wraps
-from typing import Any, Dict, Optional, Type
+from typing import Any, Dict, Iterable, List, Optional, Type
 
-from app.exceptions import RequestValidationError
+from app.exceptions import RequestValidationError, ValidationError
 from flask import jsonify, request
 from pydantic import BaseModel
 from pydantic import ValidationError as PydanticValidationError
@@ -145,6 +145,30 @@ def validate_form_data(schema_class: Type[BaseModel]):
     return validate_json_request(schema_class, location="form")
 
 
+def parse_fields_param(
+    value: Optional[str], allowed: Iterable[str]
+) -> Optional[List[str]]:
+    """
+    Parse a sparse fieldset query parameter such as ``fields=id,title,artist``
+
+    Returns None when the parameter is absent, meaning all fields.
+
+    Raises:
+        ValidationError: If it names a field not in ``allowed``
+    """
+    if value is None:
+        return None
+    fields = list(dict.fromkeys(f.strip() for f in value.split(",") if f.strip()))
+    unknown = [field for field in fields if field not in allowed]
+    if unknown or not fields:
+        raise ValidationError(
+            f"Invalid fields: {', '.join(unknown) or value!r}",
+            "INVALID_FIELDS",
+            {"allowed": list(allowed)},
+        )
+    return fields
+
+
 def validate_path_params(**param_schemas):
     """
     Decorator to validate path parameters
@@ -0,0 +1,119 @@
+"""
+Sequenced delta stream of job events for the /jobs namespace.
+
+Every job event emitted to clients gets a sequence number and carries only
+the fields that changed since the previous event for the same job (plus
+``id`` and ``status``). Recent events are kept in a bounded ring buffer so
+a reconnecting client can send the last sequence number it saw and receive
+only what it missed; if that part of the stream has already been evicted,
+the client gets a fresh snapshot instead.
+"""
+
+import threading
+import time
+from collections import OrderedDict, deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from app.config import get_config
+
+# Fields sent with every event, changed or not
+ALWAYS_SENT = ("id", "status")
+
+StreamEntry = Tuple[int, str, Dict[str, Any]]
+
+
+class JobEventStream:
+    """Assigns sequence numbers, computes deltas and buffers recent events."""
+
+    def __init__(self, capacity: int = 1000):
+        self.capacity = max(1, capacity)
+        self._lock = threading.Lock()
+        # Start from the clock so numbers keep increasing across restarts and
+        # a client's sequence number from an earlier process reads as a gap
+        self._seq = int(time.time() * 1000)
+        self._events: Deque[StreamEntry] = deque(maxlen=self.capacity)
+        # Last full state sent per job, least recently updated first
+        self._states: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+    @property
+    def seq(self) -> int:
+        """Sequence number of the latest event."""
+        return self._seq
+
+    def record(self, event_name: str, job_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Sequence a job event and return the payload to emit.
+
+        The payload holds the changed fields, ``id``, ``status`` and ``seq``;
+        ``full`` is set when it carries the whole job because no earlier
+        state is known.
+        """
+        job_id = job_data.get("id")
+        with self._lock:
+            previous = self._states.pop(job_id, None) if job_id else None
+            if previous is None:
+                payload = dict(job_data, full=True)
+            else:
+                payload = {
+                    key: value
+                    for key, value in job_data.items()
+                    if key in ALWAYS_SENT or previous.get(key) != value
+                }
+                # Fields that are gone (e.g. estimates of a finished job)
+                for key in previous.keys() - job_data.keys():
+                    payload[key] = None
+            if job_id:
+                self._states[job_id] = dict(job_data)
+                if len(self._states) > self.capacity:
+                    self._states.popitem(last=False)
+
+            self._seq += 1
+            payload["seq"] = self._seq
+            self._events.append((self._seq, event_name, payload))
+            return payload
+
+    def since(self, seq: int) -> Optional[List[StreamEntry]]:
+        """
+        Events after ``seq``, oldest first.
+
+        Returns:
+            The missed (seq, event name, payload) entries, or None if some
+            of them have been evicted (or ``seq`` is from another stream)
+            and the client needs a snapshot
+        """
+        with self._lock:
+            if seq > self._seq:
+                return None  # Not from this stream
+            if seq == self._seq:
+                return []
+            if not self._events or self._events[0][0] > seq + 1:
+                return None
+            return [entry for entry in self._events if entry[0] > seq]
+
+
+def is_authoritative_stream() -> bool:
+    """
+    Whether this process's stream sees every job event, so its sequence
+    numbers and deltas are consistent for clients: with the local executor,
+    or on an API node receiving the other processes' events over an event
+    transport. Celery workers emitting through the Socket.IO message queue
+    each have a stream of their own, whose numbers would interleave.
+    """
+    from app.jobs.dispatch import uses_local_executor
+    from app.utils.event_transport import uses_event_transport
+
+    return uses_local_executor() or uses_event_transport()
+
+
+_stream: Optional[JobEventStream] = None
+_stream_lock = threading.Lock()
+
+
+def get_job_stream() -> JobEventStream:
+    """This process's job event stream."""
+    global _stream  # pylint: disable=global-statement
+    if _stream is None:
+        with _stream_lock:
+            if _stream is None:
+                _stream = JobEventStream(get_config().JOB_EVENT_BUFFER_SIZE)
+    return _stream
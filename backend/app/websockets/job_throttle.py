@@ -0,0 +1,234 @@
+"""
+Per-job rate limiting of job broadcasts.
+
+Progress callbacks (e.g. during separation) can update a job far more often
+than any client needs. The throttle emits at most ``max_hz`` updates per job
+per second with latest-value semantics: an update arriving too soon is held,
+replaced by any newer one, and emitted when the job's interval has passed.
+Creations, status changes and terminal states are never held back.
+
+It also counts the events and bytes broadcast for each job, so the cost of
+a song's broadcasts can be compared across settings.
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from app.config import get_config
+from app.utils import fast_json
+
+logger = logging.getLogger(__name__)
+
+TERMINAL_EVENTS = ("job_completed", "job_failed", "job_cancelled")
+
+# Emits a job event, returning the payload actually sent (None if nothing was)
+Emit = Callable[[str, Dict[str, Any]], Optional[Dict[str, Any]]]
+
+
+@dataclass
+class _JobState:
+    last_emit: Optional[float] = None
+    last_status: Optional[str] = None
+    pending: Optional[Tuple[str, Dict[str, Any]]] = None
+    timer: Optional[Any] = None
+    # Which scheduled flush is current; a cancelled timer that still fires
+    # finds another number and does nothing
+    timer_slot: int = 0
+    # Held across deciding and sending, so a job's events go out in order
+    send_lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+@dataclass
+class BroadcastStats:
+    """Events and payload bytes broadcast, in total and per finished job."""
+
+    events: int = 0
+    bytes: int = 0
+    superseded: int = 0
+    jobs_finished: int = 0
+    finished_job_events: int = 0
+    finished_job_bytes: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        finished = self.jobs_finished
+        return {
+            "events": self.events,
+            "bytes": self.bytes,
+            "superseded": self.superseded,
+            "jobs_finished": finished,
+            "avg_events_per_job": (
+                round(self.finished_job_events / finished, 1) if finished else 0.0
+            ),
+            "avg_bytes_per_job": (
+                round(self.finished_job_bytes / finished) if finished else 0
+            ),
+        }
+
+
+class JobBroadcastThrottle:
+    """Limits how often each job is broadcast, always delivering the latest."""
+
+    def __init__(
+        self,
+        emit: Emit,
+        max_hz: float = 2.0,
+        clock: Callable[[], float] = time.monotonic,
+        schedule: Optional[Callable[[float, Callable[[], None]], Any]] = None,
+        max_tracked_jobs: int = 1000,
+    ):
+        self._emit = emit
+        self.interval = 1.0 / max_hz if max_hz > 0 else 0.0
+        self._clock = clock
+        self._schedule = schedule or self._start_timer
+        self.max_tracked_jobs = max_tracked_jobs
+        self._lock = threading.Lock()
+        self._jobs: "OrderedDict[str, _JobState]" = OrderedDict()
+        self._usage: "OrderedDict[str, Tuple[int, int]]" = OrderedDict()
+        self.stats = BroadcastStats()
+
+    @staticmethod
+    def _start_timer(delay: float, callback: Callable[[], None]) -> threading.Timer:
+        timer = threading.Timer(delay, callback)
+        timer.daemon = True
+        timer.start()
+        return timer
+
+    def submit(self, event_name: str, job_data: Dict[str, Any]) -> None:
+        """Broadcast a job event now, or hold it until the job's next slot."""
+        job_id = job_data.get("id")
+        status = job_data.get("status")
+        if not job_id or not self.interval:
+            self._send(event_name, job_data)
+            return
+
+        evicted = []
+        with self._lock:
+            state = self._jobs.get(job_id)
+            if state is None:
+                state = self._jobs[job_id] = _JobState()
+                while len(self._jobs) > self.max_tracked_jobs:
+                    evicted.append(self._jobs.popitem(last=False)[1])
+        for old_state in evicted:
+            # Untracked jobs have no slot left to send their held update in
+            self._send_pending(old_state)
+
+        with state.send_lock:
+            now = self._clock()
+            with self._lock:
+                urgent = (
+                    state.last_emit is None
+                    or event_name != "job_updated"
+                    or status != state.last_status
+                    or now - state.last_emit >= self.interval
+                )
+                if urgent:
+                    # A held update is superseded by this one; its timer
+                    # finds nothing to send
+                    if state.pending is not None:
+                        self.stats.superseded += 1
+                        state.pending = None
+                    self._cancel_timer(state)
+                    state.last_emit = now
+                    state.last_status = status
+                else:
+                    if state.pending is not None:
+                        self.stats.superseded += 1
+                    state.pending = (event_name, job_data)
+                    if state.timer is None:
+                        delay = state.last_emit + self.interval - now
+                        slot = state.timer_slot
+                        state.timer = self._schedule(
+                            delay, lambda: self._flush(job_id, slot)
+                        )
+                    return
+            self._send(event_name, job_data)
+
+    def _flush(self, job_id: str, slot: int) -> None:
+        with self._lock:
+            state = self._jobs.get(job_id)
+        if state is None:
+            return
+        with state.send_lock:
+            with self._lock:
+                if state.timer_slot != slot:
+                    return  # Cancelled by an urgent send
+                state.timer = None
+                state.timer_slot += 1
+                # Empty if a newer or terminal event was sent meanwhile
+                pending, state.pending = state.pending, None
+                if pending is None:
+                    return
+                state.last_emit = self._clock()
+            self._send(*pending)
+
+    def _send_pending(self, state: _JobState) -> None:
+        """Send a job's held update now, e.g. when the job stops being tracked."""
+        with state.send_lock:
+            with self._lock:
+                self._cancel_timer(state)
+                pending, state.pending = state.pending, None
+            if pending is not None:
+                self._send(*pending)
+
+    @staticmethod
+    def _cancel_timer(state: _JobState) -> None:
+        # Called with the lock held
+        if state.timer is not None:
+            cancel = getattr(state.timer, "cancel", None)
+            if cancel is not None:
+                cancel()
+            state.timer = None
+        state.timer_slot += 1
+
+    def _send(self, event_name: str, job_data: Dict[str, Any]) -> None:
+        payload = self._emit(event_name, job_data)
+        if payload is not None:
+            self._count(
+                job_data.get("id") or "", payload, event_name in TERMINAL_EVENTS
+            )
+
+    def _count(self, job_id: str, payload: Dict[str, Any], terminal: bool) -> None:
+        size = len(fast_json.dumps(payload).encode())
+        with self._lock:
+            self.stats.events += 1
+            self.stats.bytes += size
+            events, total = self._usage.pop(job_id, (0, 0))
+            events, total = events + 1, total + size
+            if terminal:
+                self._jobs.pop(job_id, None)
+                self.stats.jobs_finished += 1
+                self.stats.finished_job_events += events
+                self.stats.finished_job_bytes += total
+            else:
+                self._usage[job_id] = (events, total)
+                while len(self._usage) > self.max_tracked_jobs:
+                    self._usage.popitem(last=False)
+        if terminal:
+            logger.info(
+                "Broadcast %d events (%d bytes) for job %s", events, total, job_id
+            )
+
+
+_throttle: Optional[JobBroadcastThrottle] = None
+_throttle_lock = threading.Lock()
+
+
+def get_broadcast_stats() -> Dict[str, Any]:
+    """Broadcast counters of this process (empty before the first event)."""
+    return _throttle.stats.to_dict() if _throttle is not None else {}
+
+
+def get_job_throttle(emit: Emit) -> JobBroadcastThrottle:
+    """This process's throttle, created with ``emit`` on first use."""
+    global _throttle  # pylint: disable=global-statement
+    if _throttle is None:
+        with _throttle_lock:
+            if _throttle is None:
+                _throttle = JobBroadcastThrottle(
+                    emit, max_hz=get_config().JOB_BROADCAST_MAX_HZ
+                )
+    return _throttle
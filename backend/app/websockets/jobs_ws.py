@@ -5,7 +5,9 @@ This module provides real-time job status updates via WebSocket connections,
 replacing the need for HTTP polling.
 """
 
-from typing import Any, Dict
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional, Tuple
 
 from flask import request
 from flask_socketio import emit, join_room, leave_room
@@ -26,19 +28,108 @@ def handle_disconnect():
     print("Client disconnected from jobs namespace")
 
 
-@socketio.on("subscribe_to_jobs", namespace="/jobs")
-def handle_subscribe_to_jobs():
-    """Handle client subscription to job updates."""
-    join_room("jobs_updates")
-    emit("subscribed", {"status": "subscribed to job updates"})
+def _jobs_snapshot(options: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    First (or next) page of active jobs for a jobs_list message.
 
-    # Send the current jobs list to the newly subscribed client
+    ``options`` may hold ``status`` (comma-separated or a list), ``limit``
+    and ``cursor``, as in the jobs API.
+    """
     # Use lazy import to avoid circular dependency
+    from app.db.models import JobStatus
     from app.services.jobs_service import JobsService
 
+    options = options if isinstance(options, dict) else {}
+    statuses = options.get("status")
+    if isinstance(statuses, str):
+        statuses = statuses.split(",")
+    limit = options.get("limit")
+
     jobs_service = JobsService()
-    jobs = jobs_service.get_all_jobs()
-    broadcast_all_jobs([job.to_dict() for job in jobs], room=request.sid)
+    try:
+        jobs, next_cursor = jobs_service.list_jobs(
+            statuses=[JobStatus(status.strip()) for status in statuses or []],
+            limit=limit if isinstance(limit, int) else None,
+            cursor=options.get("cursor") or None,
+        )
+    except ValueError as e:
+        return {"jobs": [], "nextCursor": None, "error": str(e)}
+    return {"jobs": jobs_service.serialize_jobs(jobs), "nextCursor": next_cursor}
+
+
+def _missed_events(since: Any) -> Optional[list]:
+    """Buffered events after ``since``, or None if a snapshot is needed."""
+    from .job_stream import get_job_stream, is_authoritative_stream
+
+    # Resume only where this process's stream holds every event: with the
+    # local executor, or with an event transport bringing the workers' events
+    if not isinstance(since, int) or not is_authoritative_stream():
+        return None
+    missed = get_job_stream().since(since)
+    if missed is None:
+        missed = _journaled_events(since)
+    return missed
+
+
+def _journaled_events(since: int) -> Optional[list]:
+    """
+    Catch up from the job event journal when the memory buffer no longer
+    reaches back to ``since``: the latest state of every job changed after
+    it, or None if a snapshot is cheaper or the journal has a gap.
+    """
+    from app.config import get_config
+    from app.services.job_journal import get_job_journal
+    from app.utils import fast_json
+
+    journal = get_job_journal()
+    if journal is None:
+        return None
+    try:
+        journal.flush()
+        if not journal.repository.has_seq(since):
+            return None
+        events = journal.repository.latest_since(
+            since, get_config().JOB_EVENT_REPLAY_LIMIT
+        )
+    except Exception as e:
+        logger.warning(f"Failed to read job event journal: {e}")
+        return None
+    if events is None:
+        return None
+    return [
+        (
+            event.seq,
+            event.event,
+            dict(fast_json.loads(event.data), seq=event.seq, full=True),
+        )
+        for event in events
+    ]
+
+
+@socketio.on("subscribe_to_jobs", namespace="/jobs")
+def handle_subscribe_to_jobs(data=None):
+    """
+    Handle client subscription to job updates.
+
+    A reconnecting client may send ``{"since": <seq>}``, the sequence number
+    of the last job event it received, to get just the events it missed.
+    """
+    from .job_stream import get_job_stream
+
+    join_room("jobs_updates")
+    seq = get_job_stream().seq
+    since = data.get("since") if isinstance(data, dict) else None
+    missed = _missed_events(since)
+    emit("subscribed", {"status": "subscribed to job updates", "seq": seq})
+
+    if missed is not None:
+        for _, event_name, payload in missed:
+            emit(event_name, payload, room=request.sid)
+        return
+
+    # Send the newest page of jobs to the newly subscribed client; events
+    # after ``seq`` are deltas against this snapshot
+    emit("jobs_list", dict(_jobs_snapshot(), seq=seq), room=request.sid)
 
 
 @socketio.on("unsubscribe_from_jobs", namespace="/jobs")
@@ -49,20 +140,107 @@ def handle_unsubscribe_from_jobs():
 
 
 @socketio.on("request_jobs_list", namespace="/jobs")
-def handle_request_jobs_list():
-    """Handle client request for the current jobs list."""
-    # Use lazy import to avoid circular dependency
-    from app.services.jobs_service import JobsService
-
-    jobs_service = JobsService()
-    jobs = jobs_service.get_all_jobs()
-    emit("jobs_list", {"jobs": [job.to_dict() for job in jobs]}, room=request.sid)
+def handle_request_jobs_list(data=None):
+    """Handle client request for a page of the jobs list."""
+    emit("jobs_list", _jobs_snapshot(data), room=request.sid)
 
 
 import logging
 
 logger = logging.getLogger(__name__)
 
+_eta_predictor = None
+
+_ETA_FIELDS = (
+    "expected_completion",
+    "estimated_remaining_seconds",
+    "queue_wait_seconds",
+)
+
+# Last estimate of each unfinished job with the (status, phase) it was made
+# for: progress-only updates reuse it instead of reading the queue again.
+# The least recently estimated jobs are forgotten past _ETA_MAX_TRACKED_JOBS,
+# in case a job's terminal event never comes.
+_ETA_MAX_TRACKED_JOBS = 1000
+_eta_by_job: "OrderedDict[str, Tuple[Tuple[Any, Any], Dict[str, Any]]]" = OrderedDict()
+
+
+def _with_eta(job_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Return a copy of job_data with queue-wait and completion estimates."""
+    global _eta_predictor  # pylint: disable=global-statement
+    job_id = job_data.get("id")
+    stage = (job_data.get("status"), job_data.get("phase"))
+    cached = _eta_by_job.get(job_id)
+    if cached is not None and cached[0] == stage:
+        _eta_by_job.move_to_end(job_id)
+        return {**job_data, **_aged_estimate(cached[1])}
+    try:
+        if _eta_predictor is None:
+            from app.services.job_timing import EtaPredictor
+
+            _eta_predictor = EtaPredictor()
+        annotated = _eta_predictor.annotate_one(dict(job_data))
+    except Exception as e:
+        logger.debug(f"Could not estimate completion for job event: {e}")
+        return job_data
+    estimate = {field: annotated[field] for field in _ETA_FIELDS if field in annotated}
+    if estimate:
+        _eta_by_job[job_id] = (stage, estimate)
+        _eta_by_job.move_to_end(job_id)
+        while len(_eta_by_job) > _ETA_MAX_TRACKED_JOBS:
+            _eta_by_job.popitem(last=False)
+    else:
+        _eta_by_job.pop(job_id, None)
+    return annotated
+
+
+def _aged_estimate(estimate: Dict[str, Any]) -> Dict[str, Any]:
+    """A cached estimate with the time left counted down to now."""
+    try:
+        expected = datetime.fromisoformat(estimate["expected_completion"])
+    except (KeyError, TypeError, ValueError):
+        return estimate
+    remaining = (expected - datetime.now(timezone.utc)).total_seconds()
+    return {**estimate, "estimated_remaining_seconds": max(0, round(remaining))}
+
+
+def _forget_eta(job_data: Dict[str, Any]) -> None:
+    _eta_by_job.pop(job_data.get("id"), None)
+
+
+def _emit_job_event(event_name: str, job_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Sequence a job event, emit its delta to all subscribers, queue it for
+    the journal and return the payload. Outside an authoritative stream
+    the whole job is emitted without a sequence number.
+    """
+    from app.services.job_journal import get_job_journal
+    from app.utils.event_transport import uses_event_transport
+
+    from .job_stream import get_job_stream, is_authoritative_stream
+
+    if is_authoritative_stream():
+        payload = get_job_stream().record(event_name, job_data)
+    else:
+        # Sequence numbers and deltas from several streams would interleave
+        # at the client; send the whole job, unsequenced
+        payload = dict(job_data, full=True)
+    # Every API node receives every job event over the event transport and
+    # emits it to its own clients, bypassing the Socket.IO message queue
+    socketio.emit(
+        event_name,
+        payload,
+        room="jobs_updates",
+        namespace="/jobs",
+        ignore_queue=uses_event_transport(),
+    )
+    # With an event transport every node broadcasts every event, so events
+    # are journaled once, where they originate (see JobEventRelay.handle)
+    journal = get_job_journal()
+    if journal is not None and not uses_event_transport():
+        journal.append(payload.get("seq"), event_name, job_data)
+    return payload
+
 
 def broadcast_job_update(job_data: Dict[str, Any]):
     """
@@ -74,7 +252,7 @@ def broadcast_job_update(job_data: Dict[str, Any]):
         if socketio is None:
             logger.warning("SocketIO not available for job_updated broadcast")
             return
-        socketio.emit("job_updated", job_data, room="jobs_updates", namespace="/jobs")
+        return _emit_job_event("job_updated", _with_eta(job_data))
     except Exception as e:
         logger.warning(f"Failed to broadcast job_updated: {e}")
         # Silently fail in worker context where socketio may not be available
@@ -91,7 +269,7 @@ def broadcast_job_created(job_data: Dict[str, Any]):
         if socketio is None:
             logger.warning("SocketIO not available for job_created broadcast")
             return
-        socketio.emit("job_created", job_data, room="jobs_updates", namespace="/jobs")
+        return _emit_job_event("job_created", _with_eta(job_data))
     except Exception as e:
         logger.warning(f"Failed to broadcast job_created: {e}")
         # Silently fail in worker context where socketio may not be available
@@ -109,7 +287,8 @@ def broadcast_job_completed(job_data: Dict[str, Any]):
         if socketio is None:
             logger.warning("SocketIO not available for job_completed broadcast")
             return
-        socketio.emit("job_completed", job_data, room="jobs_updates", namespace="/jobs")
+        _forget_eta(job_data)
+        return _emit_job_event("job_completed", job_data)
     except Exception as e:
         logger.warning(f"Failed to broadcast job_completed: {e}")
         # Silently fail in worker context where socketio may not be available
@@ -127,7 +306,8 @@ def broadcast_job_failed(job_data: Dict[str, Any]):
         if socketio is None:
             logger.warning("SocketIO not available for job_failed broadcast")
             return
-        socketio.emit("job_failed", job_data, room="jobs_updates", namespace="/jobs")
+        _forget_eta(job_data)
+        return _emit_job_event("job_failed", job_data)
     except Exception as e:
         logger.warning(f"Failed to broadcast job_failed: {e}")
         # Silently fail in worker context where socketio may not be available
@@ -145,7 +325,8 @@ def broadcast_job_cancelled(job_data: Dict[str, Any]):
         if socketio is None:
             logger.warning("SocketIO not available for job_cancelled broadcast")
             return
-        socketio.emit("job_cancelled", job_data, room="jobs_updates", namespace="/jobs")
+        _forget_eta(job_data)
+        return _emit_job_event("job_cancelled", job_data)
     except Exception as e:
         logger.warning(f"Failed to broadcast job_cancelled: {e}")
         # Silently fail in worker context where socketio may not be available
@@ -173,6 +354,14 @@ def broadcast_all_jobs(jobs_data: list, room: str = "jobs_updates"):
 def _handle_job_event(event) -> None:
     """Handle job events from the event system and broadcast via WebSocket."""
     try:
+        from app.utils.event_transport import relays_to_api_nodes
+        from app.utils.events import job_event_name
+
+        from .job_throttle import get_job_throttle
+
+        # Workers with an event transport leave broadcasting to the API nodes
+        if relays_to_api_nodes():
+            return
         job_data = event.data.get("job_data", {})
         was_created = event.data.get("was_created", False)
         job_id = job_data.get("id", "unknown")
@@ -183,42 +372,41 @@ def _handle_job_event(event) -> None:
             f"WebSocket handler received job event: {job_id} - created={was_created} - status={status}"
         )
 
-        if was_created:
-            broadcast_job_created(job_data)
-        else:
-            # Determine the appropriate broadcast based on job status
-            if status == "completed":
-                broadcast_job_completed(job_data)
-            elif status == "failed":
-                broadcast_job_failed(job_data)
-            elif status == "cancelled":
-                broadcast_job_cancelled(job_data)
-            else:
-                broadcast_job_update(job_data)
+        get_job_throttle(_broadcast).submit(
+            job_event_name(job_data, was_created), job_data
+        )
     except Exception as e:
         logger.warning(f"Failed to handle job event: {e}")
 
 
-# Set up event subscription
-def _setup_event_subscriptions():
-    """Set up event subscriptions for job events."""
+def _broadcast(event_name: str, job_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    return _BROADCASTS[event_name](job_data)
+
+
+_BROADCASTS = {
+    "job_created": broadcast_job_created,
+    "job_updated": broadcast_job_update,
+    "job_completed": broadcast_job_completed,
+    "job_failed": broadcast_job_failed,
+    "job_cancelled": broadcast_job_cancelled,
+}
+
+
+def subscribe_job_broadcasts():
+    """
+    Subscribe the websocket broadcaster to job events.
+
+    This is the only path from job events to socket emits. The subscription
+    is keyed, so calling this again (on import, from
+    initialize_jobs_websocket or from the jobs module) never duplicates it.
+    """
     try:
         from app.utils.events import subscribe_to_job_events
 
-        subscribe_to_job_events(_handle_job_event)
-        print("✅ Jobs WebSocket event subscriptions initialized")
-        import logging
-
-        logging.getLogger(__name__).debug(
-            "Jobs WebSocket event subscriptions initialized"
-        )
+        subscribe_to_job_events(_handle_job_event, key="jobs_ws.broadcast")
+        logger.debug("Jobs WebSocket event subscriptions initialized")
     except Exception as e:
-        import logging
-
-        print(f"❌ Failed to set up job event subscriptions: {e}")
-        logging.getLogger(__name__).warning(
-            f"Failed to set up job event subscriptions: {e}"
-        )
+        logger.warning(f"Failed to set up job event subscriptions: {e}")
 
 
 def initialize_jobs_websocket():
@@ -227,8 +415,8 @@ def initialize_jobs_websocket():
     Should be called after Flask app and SocketIO are fully initialized.
     """
     print("🔌 Initializing Jobs WebSocket handlers...")
-    _setup_event_subscriptions()
+    subscribe_job_broadcasts()
 
 
 # Initialize event subscriptions when module is imported
-_setup_event_subscriptions()
+subscribe_job_broadcasts()
@@ -5,11 +5,21 @@ SocketIO instance and initialization for Open Karaoke Studio.
 # Create the SocketIO instance (do not bind to app yet)
 import os
 
+from app.config import get_config
+from app.utils import fast_json
 from flask_socketio import SocketIO
 
 # Get the Redis URL from environment or use default
 REDIS_URL = os.environ.get("SOCKETIO_REDIS_URL", "redis://localhost:6379/0")
-socketio = SocketIO(message_queue=REDIS_URL)
+
+# With the local job executor every event is emitted by this process, so the
+# Redis message queue that lets Celery workers emit is not needed (the same
+# check as app.jobs.dispatch.uses_local_executor, which cannot be imported
+# here without loading Celery)
+if get_config().JOB_EXECUTOR == "local":
+    socketio = SocketIO(json=fast_json)
+else:
+    socketio = SocketIO(message_queue=REDIS_URL, json=fast_json)
 
 
 def init_socketio(app):
@@ -26,7 +26,9 @@ if [ ! -z "$CELERY_BROKER_URL" ]; then
     echo "Using broker URL: $CELERY_BROKER_URL"
 fi
 
+# --beat runs the periodic tasks (job retention) inside this worker
 celery -A app.jobs.celery_app.celery worker \
     --loglevel=info \
     --concurrency=1 \
-    --pool=threads
+    --pool=threads \
+    --beat
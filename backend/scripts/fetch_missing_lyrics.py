@@ -3,7 +3,7 @@
 Fetch Missing Lyrics Script for Open Karaoke Studio
 
 This script finds all songs missing lyrics in the database and attempts to fetch them
-using the backend lyrics search endpoint, then saves them if found.
+using the backend lyrics search endpoint, then saves those found in one transaction.
 
 Usage:
     python fetch_missing_lyrics.py
@@ -25,9 +25,6 @@ from app.services.lyrics_service import LyricsService
 API_URL = (
     "http://localhost:5123/api/lyrics/search"  # Adjust if your backend runs elsewhere
 )
-SONG_PATCH_URL = (
-    "http://localhost:5123/api/songs/{song_id}"  # PATCH endpoint to update song fields
-)
 
 
 def find_best_lyrics_result(results, target_durationMs):
@@ -58,11 +55,14 @@ def find_best_lyrics_result(results, target_durationMs):
 def fetch_and_save_lyrics():
     with get_db_session() as session:
         repo = SongRepository(session)
-        songs = repo.fetch_all()
+        songs = repo.fetch_all(
+            fields=["id", "title", "artist", "album", "durationMs", "syncedLyrics"]
+        )
     total = len(songs)
     missing = [s for s in songs if not s.synced_lyrics or not s.synced_lyrics.strip()]
     print(f"Found {len(missing)} songs missing lyrics out of {total} total.")
 
+    updates = []
     for song in missing:
         params = {
             "track_name": song.title,
@@ -76,7 +76,7 @@ def fetch_and_save_lyrics():
                 results = resp.json()
                 if results:
                     # Pick the result with the closest duration to our song
-                    best_result = find_best_lyrics_result(results, song.durationMs)
+                    best_result = find_best_lyrics_result(results, song.duration_ms)
                     if best_result:
                         plain_lyrics = (
                             best_result.get("plainLyrics")
@@ -91,26 +91,14 @@ def fetch_and_save_lyrics():
                             or best_result.get("body")
                             or best_result.get("content")
                         )
-                        if (plain_lyrics and str(plain_lyrics).strip()) or (
-                            synced_lyrics and str(synced_lyrics).strip()
-                        ):
-                            print(f"  Found lyrics (closest duration), saving...")
-                            payload = {}
+                        update = {"id": song.id}
                         if plain_lyrics and str(plain_lyrics).strip():
-                            payload["lyrics"] = plain_lyrics
+                            update["plain_lyrics"] = plain_lyrics
                         if synced_lyrics and str(synced_lyrics).strip():
-                            payload["synced_lyrics"] = synced_lyrics
-                            save_resp = requests.patch(
-                                SONG_PATCH_URL.format(song_id=song.id),
-                                json=payload,
-                                timeout=10,
-                            )
-                            if save_resp.status_code == 200:
-                                print(f"  Lyrics saved for {song.id}")
-                            else:
-                                print(
-                                    f"  Failed to save lyrics: {save_resp.status_code} {save_resp.text}"
-                                )
+                            update["synced_lyrics"] = synced_lyrics
+                        if len(update) > 1:
+                            print("  Found lyrics (closest duration)")
+                            updates.append(update)
                         else:
                             print("  No usable lyrics in result.")
                     else:
@@ -120,7 +108,12 @@ def fetch_and_save_lyrics():
             else:
                 print(f"  Search failed: {resp.status_code} {resp.text}")
         except Exception as e:
-            print(f"  Error searching/saving lyrics: {e}")
+            print(f"  Error searching lyrics: {e}")
+
+    # Save everything found in one transaction
+    with get_db_session() as session:
+        saved = SongRepository(session).bulk_update(updates)
+    print(f"Lyrics saved for {saved} songs.")
 
 
 if __name__ == "__main__":
@@ -1,5 +1,15 @@
 import os
 import sqlite3
+import sys
+
+# Add the backend directory to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from app.db.models import DbSong
+from app.db.models.song import SIDE_COLUMNS
+from app.repositories.song_repository import SongRepository
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
 
 # Paths
 CURRENT_DB = os.path.abspath(os.path.join(os.path.dirname(__file__), "../karaoke.db"))
@@ -55,35 +65,28 @@ COLUMN_MAP = {
     "plain_lyrics": "plain_lyrics",
 }
 
-# Open connections
+# Read all rows from the backup
 src = sqlite3.connect(BACKUP_DB)
-dst = sqlite3.connect(CURRENT_DB)
 src.row_factory = sqlite3.Row
-
-# Get all rows from backup
 rows = src.execute("SELECT * FROM songs").fetchall()
+src.close()
 
-# Prepare insert/update
-for row in rows:
-    data = {
+
+def to_song(row):
+    # Columns dropped since the backup (e.g. lyrics) are left behind
+    return {
         dst_col: row[src_col]
         for src_col, dst_col in COLUMN_MAP.items()
         if src_col in row.keys()
+        and (dst_col in DbSong.__table__.columns or dst_col in SIDE_COLUMNS)
     }
-    # Upsert by id
-    placeholders = ", ".join([f"{col} = ?" for col in data.keys()])
-    values = list(data.values())
-    values.append(row["id"])
-    sql = f"UPDATE songs SET {placeholders} WHERE id = ?"
-    cur = dst.execute(sql, values)
-    if cur.rowcount == 0:
-        # Insert if not exists
-        cols = ", ".join(data.keys())
-        qs = ", ".join(["?"] * len(data))
-        dst.execute(f"INSERT INTO songs ({cols}) VALUES ({qs})", list(data.values()))
 
-dst.commit()
-src.close()
-dst.close()
+
+# Upsert by id: existing songs get the mapped columns, missing ones are
+# inserted, all in one transaction
+engine = create_engine(f"sqlite:///{CURRENT_DB}")
+with sessionmaker(bind=engine)() as session:
+    SongRepository(session).upsert_many(to_song(row) for row in rows)
+engine.dispose()
 
 print("Song table restored from backup with explicit column mapping.")
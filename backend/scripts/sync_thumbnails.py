@@ -16,6 +16,7 @@ import logging
 
 from app.db import database
 from app.db.database import get_db_session
+from app.repositories.song_repository import SongRepository
 from app.services.file_service import FileService
 
 logging.basicConfig(level=logging.INFO)
@@ -34,10 +35,10 @@ def sync_thumbnails():
     # Get all songs
     with get_db_session() as session:
         repo = SongRepository(session)
-        songs = repo.fetch_all()
+        songs = repo.fetch_all(fields=["id", "title", "thumbnail"])
         logger.info(f"Found {len(songs)} songs in database")
 
-    updated_count = 0
+    updates = []
     found_count = 0
 
     for song in songs:
@@ -68,16 +69,15 @@ def sync_thumbnails():
         if thumbnail_found:
             # Update database with relative path
             relative_path = f"{song.id}/{thumbnail_found}"
-            success = repo.update(song.id, relative_path)
-
-            if success:
-                updated_count += 1
-                logger.info(f"✅ Updated {song.id}: {relative_path}")
-            else:
-                logger.error(f"❌ Failed to update {song.id}")
+            updates.append({"id": song.id, "thumbnail_path": relative_path})
         else:
             logger.debug(f"No thumbnail found for {song.id} ({song.title})")
 
+    # Save all thumbnail paths in one transaction
+    with get_db_session() as session:
+        updated_count = SongRepository(session).bulk_update(updates)
+    logger.info(f"✅ Updated {updated_count} songs")
+
     logger.info(
         f"""
 🎯 Thumbnail Sync Complete!
@@ -14,6 +14,7 @@ from app.db.models import Base, DbSong
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 from tests.fixtures.test_data import create_test_db_song, create_test_song
+from tests.utils.db_utils import create_shared_memory_engine, session_scope
 
 
 @pytest.fixture(scope="function")
@@ -93,6 +94,20 @@ def db_session():
         session.close()
 
 
+@pytest.fixture
+def memory_engine():
+    """In-memory database shared by every session the code under test opens"""
+    engine = create_shared_memory_engine()
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def get_db_session(memory_engine):
+    """get_db_session over memory_engine, to patch into the modules under test"""
+    return session_scope(memory_engine)
+
+
 @pytest.fixture(scope="function")
 def temp_library_dir():
     """Create temporary directory for file operations"""
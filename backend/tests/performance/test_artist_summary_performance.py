@@ -0,0 +1,62 @@
+"""
+Benchmark: a page of the artist browser over 50k songs, grouped from the
+songs table versus read from the artist summaries.
+
+Run with ``pytest tests/performance -m performance -s`` to see the timings.
+"""
+
+import time
+
+import pytest
+from app.db.models import Base, DbSong
+from app.repositories.artist_repository import ArtistRepository
+from app.repositories.song_repository import SongRepository
+from sqlalchemy import create_engine, func
+from sqlalchemy.orm import sessionmaker
+
+pytestmark = [pytest.mark.performance, pytest.mark.slow]
+
+SONGS = 50_000
+ARTISTS = 5_000
+REPEATS = 20
+
+
+def page_ms(func_):
+    started = time.perf_counter()
+    for _ in range(REPEATS):
+        func_()
+    return (time.perf_counter() - started) / REPEATS * 1e3
+
+
+def test_artist_page_from_summaries(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'songs.db'}")
+    Base.metadata.create_all(engine)
+    with sessionmaker(bind=engine)() as session:
+        SongRepository(session).bulk_create(
+            {"id": f"song-{i:06d}", "title": "Song", "artist": f"Artist {i % ARTISTS}"}
+            for i in range(SONGS)
+        )
+        artists = ArtistRepository(session)
+        artists.reconcile()
+
+        def grouped():
+            # What get_artists ran before the summaries
+            query = session.query(
+                DbSong.artist, func.count(DbSong.id)  # pylint: disable=not-callable
+            ).group_by(DbSong.artist)
+            page = query.order_by(DbSong.artist).offset(2_500).limit(100).all()
+            total = session.query(DbSong.artist).distinct().count()
+            return page, total
+
+        def summarized():
+            return artists.fetch_page(offset=2_500, limit=100)
+
+        timings = {"grouped": page_ms(grouped), "summaries": page_ms(summarized)}
+        assert summarized()[1] == grouped()[1] == ARTISTS
+    engine.dispose()
+
+    print(
+        f"\nArtist page at {SONGS} songs: "
+        + ", ".join(f"{name} {ms:.2f}ms" for name, ms in timings.items())
+    )
+    assert timings["summaries"] * 3 < timings["grouped"]
@@ -0,0 +1,83 @@
+"""
+Benchmark: job lookups stay flat as the jobs table grows.
+
+Run with ``pytest tests/performance -m performance -s`` to see the timings.
+"""
+
+import statistics
+import time
+from datetime import datetime, timedelta
+
+import pytest
+from app.db.models import Base, DbJob, JobStatus
+from app.repositories import JobRepository
+from sqlalchemy import create_engine, insert, text
+from tests.utils.db_utils import session_scope
+
+pytestmark = [pytest.mark.performance, pytest.mark.slow]
+
+STATUSES = [status.value for status in JobStatus]
+
+
+def make_repository(db_path, rows):
+    engine = create_engine(f"sqlite:///{db_path}")
+    Base.metadata.create_all(engine)
+    start = datetime(2024, 1, 1)
+    with engine.begin() as connection:
+        connection.execute(
+            insert(DbJob),
+            [
+                {
+                    "id": f"job-{i:06d}",
+                    "filename": "original.mp3",
+                    "status": STATUSES[i % len(STATUSES)],
+                    "song_id": f"song-{i:06d}",
+                    "created_at": start + timedelta(seconds=i),
+                    "dismissed": i % 3 == 0,
+                    "phase": "created",
+                }
+                for i in range(rows)
+            ],
+        )
+    repo = JobRepository()
+    repo.get_db_session = session_scope(engine)
+    repo.diagnostics = False
+    return repo, engine
+
+
+def median_lookup_seconds(repo, rows, samples=300):
+    timings = []
+    for i in range(samples):
+        job_id = f"job-{(i * 7919) % rows:06d}"
+        started = time.perf_counter()
+        assert repo.get_job(job_id) is not None
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings)
+
+
+def test_get_job_is_flat_from_1k_to_100k_rows(tmp_path):
+    small, _ = make_repository(tmp_path / "small.db", 1_000)
+    large, engine = make_repository(tmp_path / "large.db", 100_000)
+
+    small_time = median_lookup_seconds(small, 1_000)
+    large_time = median_lookup_seconds(large, 100_000)
+    print(
+        f"\nget_job median: {small_time * 1e6:.0f}us at 1k rows, "
+        f"{large_time * 1e6:.0f}us at 100k rows"
+    )
+
+    # A count plus an ID scan per lookup would be ~100x slower at 100k rows
+    assert large_time < small_time * 3
+
+    # The common list filters are served by the new indexes
+    with engine.connect() as connection:
+        for where in (
+            "status = 'pending'",
+            "dismissed = 0",
+            "song_id = 'song-000001'",
+            "created_at > '2024-01-02'",
+        ):
+            plan = connection.execute(
+                text(f"EXPLAIN QUERY PLAN SELECT id FROM jobs WHERE {where}")
+            ).fetchall()
+            assert any("USING INDEX" in row[-1] for row in plan), (where, plan)
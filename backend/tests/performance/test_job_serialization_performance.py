@@ -0,0 +1,107 @@
+"""
+Benchmark: per-job serialization cost for job lists and events at 10k jobs.
+
+Run with ``pytest tests/performance -m performance -s`` to see the timings.
+"""
+
+import gc
+import json
+import time
+from dataclasses import asdict
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from app.db.models import Base, DbJob, JobStatus
+from app.utils import fast_json
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+
+pytestmark = [pytest.mark.performance, pytest.mark.slow]
+
+JOBS = 10_000
+
+
+def make_session(db_path):
+    engine = create_engine(f"sqlite:///{db_path}")
+    Base.metadata.create_all(engine)
+    start = datetime(2024, 1, 1)
+    with engine.begin() as connection:
+        connection.execute(
+            insert(DbJob),
+            [
+                {
+                    "id": f"job-{i:06d}",
+                    "filename": "original.mp3",
+                    "status": JobStatus.PROCESSING.value,
+                    "progress": i % 100,
+                    "status_message": "Separating vocals",
+                    "title": f"Song {i}",
+                    "artist": "Artist",
+                    "created_at": start + timedelta(seconds=i),
+                    "started_at": start + timedelta(seconds=i + 1),
+                    "dismissed": False,
+                    "phase": "separation",
+                }
+                for i in range(JOBS)
+            ],
+        )
+    return sessionmaker(bind=engine)()
+
+
+def asdict_to_dict(job):
+    """The previous Job.to_dict: a recursive asdict plus datetime formatting."""
+    data = asdict(job)
+    data.pop("_wire")
+    for key in ["created_at", "started_at", "completed_at", "phase_started_at"]:
+        if isinstance(data[key], datetime):
+            if data[key].tzinfo is None:
+                data[key] = data[key].replace(tzinfo=timezone.utc)
+            data[key] = data[key].isoformat()
+    data["status"] = job.status.value
+    return data
+
+
+def per_job_us(func):
+    # Like timeit: a collection triggered by other tests' garbage is noise
+    gc.collect()
+    gc.disable()
+    try:
+        started = time.perf_counter()
+        func()
+        return (time.perf_counter() - started) / JOBS * 1e6
+    finally:
+        gc.enable()
+
+
+def test_job_serialization_at_10k_jobs(tmp_path):
+    session = make_session(tmp_path / "jobs.db")
+    jobs = [DbJob.row_to_job(row) for row in session.query(*DbJob.job_columns()).all()]
+
+    entities = per_job_us(lambda: [job.to_job() for job in session.query(DbJob).all()])
+    session.expunge_all()
+    columns = per_job_us(
+        lambda: [
+            DbJob.row_to_job(row) for row in session.query(*DbJob.job_columns()).all()
+        ]
+    )
+    baseline = per_job_us(lambda: [asdict_to_dict(job) for job in jobs])
+    cold = per_job_us(lambda: [job.to_dict() for job in jobs])
+    cached = per_job_us(lambda: [job.to_dict() for job in jobs])
+    payload = {"jobs": [job.to_dict() for job in jobs]}
+    stdlib = per_job_us(lambda: json.dumps(payload))
+    fast = per_job_us(lambda: fast_json.dumps(payload))
+    print(
+        f"\nper job at {JOBS} jobs: load entities {entities:.2f}us, "
+        f"load columns {columns:.2f}us, "
+        f"asdict to_dict {baseline:.2f}us, to_dict {cold:.2f}us "
+        f"({cached:.2f}us cached), json.dumps {stdlib:.2f}us, "
+        f"fast_json.dumps {fast:.2f}us"
+    )
+
+    session.close()
+
+    assert [asdict_to_dict(job) for job in jobs[:10]] == payload["jobs"][:10]
+    assert columns < entities
+    assert cold < baseline
+    assert cached < cold
+    assert fast <= stdlib * 1.5
@@ -0,0 +1,73 @@
+"""
+Benchmark: polling the full song list of a 5k-song library, rendered every
+time versus revalidated with If-None-Match or served from the response cache.
+
+Run with ``pytest tests/performance -m performance -s`` to see the timings.
+"""
+
+import time
+from unittest.mock import patch
+
+import pytest
+from app.api.songs import song_bp
+from app.db.models import Base
+from app.repositories.song_repository import SongRepository
+from flask import Flask
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from tests.utils.db_utils import session_scope
+
+pytestmark = [pytest.mark.performance, pytest.mark.slow]
+
+SONGS = 5_000
+REPEATS = 20
+
+
+def request_ms(func):
+    started = time.perf_counter()
+    for _ in range(REPEATS):
+        func()
+    return (time.perf_counter() - started) / REPEATS * 1e3
+
+
+def test_polling_an_unchanged_library(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'songs.db'}")
+    Base.metadata.create_all(engine)
+    factory = sessionmaker(bind=engine)
+    with factory() as session:
+        SongRepository(session).bulk_create(
+            {
+                "id": f"song-{i:05d}",
+                "title": f"Song {i}",
+                "artist": f"Artist {i % 500}",
+                "plain_lyrics": "la " * 200,
+            }
+            for i in range(SONGS)
+        )
+
+    get_db_session = session_scope(factory)
+    app = Flask(__name__)
+    app.config.update(LIBRARY_VERSION_TTL_MS=60_000)
+    app.register_blueprint(song_bp)
+    client = app.test_client()
+    with patch("app.api.songs.core.get_db_session", get_db_session), patch(
+        "app.utils.library_cache.get_db_session", get_db_session
+    ):
+        etag = client.get("/api/songs").headers["ETag"]
+        # A new query parameter each time misses the cache
+        uncached = (f"/api/songs?poll={i}" for i in range(REPEATS))
+        timings = {
+            "rendered": request_ms(lambda: client.get(next(uncached))),
+            "cached": request_ms(lambda: client.get("/api/songs")),
+            "304": request_ms(
+                lambda: client.get("/api/songs", headers={"If-None-Match": etag})
+            ),
+        }
+    engine.dispose()
+
+    print(
+        f"\nGET /api/songs at {SONGS} songs: "
+        + ", ".join(f"{name} {ms:.2f}ms" for name, ms in timings.items())
+    )
+    assert timings["304"] * 10 < timings["rendered"]
+    assert timings["cached"] * 5 < timings["rendered"]
@@ -0,0 +1,56 @@
+"""
+Benchmark: saving a field on 2k songs one update() at a time versus one
+bulk_update(), as sync_thumbnails.py and fetch_missing_lyrics.py do.
+
+Run with ``pytest tests/performance -m performance -s`` to see the timings.
+"""
+
+import time
+
+import pytest
+from app.db.models import Base
+from app.repositories.song_repository import SongRepository
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+pytestmark = [pytest.mark.performance, pytest.mark.slow]
+
+SONGS = 2_000
+
+
+def test_bulk_update_of_2k_songs(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'songs.db'}")
+    Base.metadata.create_all(engine)
+    factory = sessionmaker(bind=engine)
+    ids = [f"song-{i:05d}" for i in range(SONGS)]
+
+    with factory() as session:
+        started = time.perf_counter()
+        SongRepository(session).bulk_create(
+            {"id": song_id, "title": f"Song {song_id}"} for song_id in ids
+        )
+        create_s = time.perf_counter() - started
+
+    with factory() as session:
+        repo = SongRepository(session)
+        started = time.perf_counter()
+        for song_id in ids:
+            repo.update(song_id, thumbnail_path=f"{song_id}/thumbnail.jpg")
+        single_s = time.perf_counter() - started
+
+    with factory() as session:
+        started = time.perf_counter()
+        updated = SongRepository(session).bulk_update(
+            {"id": song_id, "thumbnail_path": f"{song_id}/thumbnail.webp"}
+            for song_id in ids
+        )
+        bulk_s = time.perf_counter() - started
+    engine.dispose()
+
+    print(
+        f"\n{SONGS} songs: bulk_create {create_s * 1e3:.0f}ms, "
+        f"update() per song {single_s * 1e3:.0f}ms, "
+        f"bulk_update {bulk_s * 1e3:.0f}ms"
+    )
+    assert updated == SONGS
+    assert bulk_s * 10 < single_s
@@ -0,0 +1,61 @@
+"""
+Benchmark: full song list versus a sparse fieldset for a library grid.
+
+Run with ``pytest tests/performance -m performance -s`` to see the timings.
+"""
+
+import time
+
+import pytest
+from app.db.models import Base
+from app.repositories.song_repository import SongRepository
+from app.utils import fast_json
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+pytestmark = [pytest.mark.performance, pytest.mark.slow]
+
+SONGS = 5_000
+GRID_FIELDS = ["id", "title", "artist", "thumbnail"]
+
+
+def list_songs(factory, fields):
+    started = time.perf_counter()
+    with factory() as session:
+        songs = SongRepository(session).fetch_all(sort_by="title", fields=fields)
+        payload = fast_json.dumps([song.to_dict(fields) for song in songs])
+    return time.perf_counter() - started, len(payload)
+
+
+def test_sparse_fieldset_on_5k_songs(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'songs.db'}")
+    Base.metadata.create_all(engine)
+    factory = sessionmaker(bind=engine)
+    with factory() as session:
+        SongRepository(session).bulk_create(
+            [
+                {
+                    "id": f"song-{i:05d}",
+                    "title": f"Song {i}",
+                    "artist": f"Artist {i % 500}",
+                    "thumbnail_path": f"song-{i:05d}/thumbnail.webp",
+                    "description": "A music video. " * 40,
+                    "plain_lyrics": "la la la\n" * 150,
+                    "synced_lyrics": "[00:01.00] la la la\n" * 150,
+                    "youtube_raw_metadata": '{"formats": []}' * 100,
+                }
+                for i in range(SONGS)
+            ]
+        )
+
+    full_s, full_bytes = list_songs(factory, None)
+    grid_s, grid_bytes = list_songs(factory, GRID_FIELDS)
+    engine.dispose()
+
+    print(
+        f"\nList of {SONGS} songs: all fields {full_s * 1e3:.0f}ms "
+        f"{full_bytes / 1e6:.1f}MB, {','.join(GRID_FIELDS)} "
+        f"{grid_s * 1e3:.0f}ms {grid_bytes / 1e6:.2f}MB"
+    )
+    assert grid_bytes * 10 < full_bytes
+    assert grid_s < full_s
@@ -0,0 +1,85 @@
+"""
+Benchmark: first and last page of a 50k-song library, by offset and by cursor.
+
+Run with ``pytest tests/performance -m performance -s`` to see the timings.
+"""
+
+import time
+
+import pytest
+from app.db.models import Base, DbSong
+from app.repositories.pagination import encode_cursor
+from app.repositories.song_repository import SongRepository
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+
+pytestmark = [pytest.mark.performance, pytest.mark.slow]
+
+SONGS = 50_000
+PAGE = 50
+REPEATS = 20
+FIELDS = ["id", "title", "artist", "thumbnail"]
+
+
+def page_ms(func):
+    started = time.perf_counter()
+    for _ in range(REPEATS):
+        songs = func()
+    assert len(songs) == PAGE
+    return (time.perf_counter() - started) / REPEATS * 1e3
+
+
+def test_last_page_costs_the_same_as_the_first(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'songs.db'}")
+    Base.metadata.create_all(engine)
+    with engine.begin() as connection:
+        connection.execute(
+            insert(DbSong),
+            [
+                {
+                    "id": f"song-{i:06d}",
+                    "title": f"Song {i % 20_000}",
+                    "artist": f"Artist {i % 2_000}",
+                    "thumbnail_path": f"song-{i:06d}/thumbnail.webp",
+                }
+                for i in range(SONGS)
+            ],
+        )
+    session = sessionmaker(bind=engine)()
+    repo = SongRepository(session)
+
+    # A cursor pointing just before the last page
+    last_offset = SONGS - PAGE
+    before_last = repo.fetch_all(
+        sort_by="title", direction="asc", offset=last_offset - 1, limit=1
+    )[0]
+    cursor = encode_cursor(before_last.title, before_last.id)
+    session.expunge_all()
+
+    def by_offset(offset):
+        return lambda: repo.fetch_all(
+            sort_by="title", direction="asc", offset=offset, limit=PAGE, fields=FIELDS
+        )
+
+    def by_cursor(cursor):
+        return lambda: repo.fetch_page(
+            sort_by="title", direction="asc", limit=PAGE, cursor=cursor, fields=FIELDS
+        )[0]
+
+    timings = {
+        "offset first": page_ms(by_offset(0)),
+        "offset last": page_ms(by_offset(last_offset)),
+        "cursor first": page_ms(by_cursor(None)),
+        "cursor last": page_ms(by_cursor(cursor)),
+    }
+    last_ids = [song.id for song in by_cursor(cursor)()]
+    assert last_ids == [song.id for song in by_offset(last_offset)()]
+    session.close()
+    engine.dispose()
+
+    print(
+        f"\nPages of {PAGE} at {SONGS} songs by title: "
+        + ", ".join(f"{name} {ms:.2f}ms" for name, ms in timings.items())
+    )
+    assert timings["cursor last"] < timings["offset last"]
+    assert timings["cursor last"] < timings["cursor first"] * 1.5
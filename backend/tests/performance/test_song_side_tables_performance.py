@@ -0,0 +1,88 @@
+"""
+Benchmark: pages a full scan of a 5k-song library pulls through SQLite's
+cache, with the lyrics and YouTube metadata in the songs rows (as before the
+side tables) and after they have been moved out (ensure_db_schema with
+MIGRATE_SONG_SIDE_COLUMNS_ON_BOOT, the same steps as the Alembic migration).
+
+Run with ``pytest tests/performance -m performance -s`` to see the timings.
+"""
+
+import sqlite3
+import time
+from unittest.mock import patch
+
+import pytest
+from app.db import database
+from app.db.database import ensure_db_schema
+from app.db.models import Base
+from sqlalchemy import create_engine
+
+pytestmark = [pytest.mark.performance, pytest.mark.slow]
+
+SONGS = 5_000
+REPEATS = 5
+LEGACY_COLUMNS = [
+    "description",
+    "plain_lyrics",
+    "synced_lyrics",
+    "youtube_raw_metadata",
+]
+
+
+def scan(db_path):
+    """songs b-tree pages, and ms for a cold scan of the library columns."""
+    connection = sqlite3.connect(db_path)
+    pages = connection.execute(
+        "SELECT count(*) FROM dbstat WHERE name = 'songs'"
+    ).fetchone()[0]
+    connection.close()
+    started = time.perf_counter()
+    for _ in range(REPEATS):
+        # A new connection starts with an empty page cache
+        connection = sqlite3.connect(db_path)
+        rows = connection.execute("SELECT id, title, artist FROM songs").fetchall()
+        connection.close()
+    assert len(rows) == SONGS
+    return pages, (time.perf_counter() - started) / REPEATS * 1e3
+
+
+def test_side_tables_shrink_library_scans(tmp_path):
+    db_path = tmp_path / "karaoke.db"
+    engine = create_engine(f"sqlite:///{db_path}")
+    # The songs table as it was, with its cold columns filled in
+    Base.metadata.create_all(engine)
+    with engine.begin() as connection:
+        connection.exec_driver_sql("DROP TABLE song_lyrics")
+        connection.exec_driver_sql("DROP TABLE song_details")
+        for column in LEGACY_COLUMNS:
+            connection.exec_driver_sql(f"ALTER TABLE songs ADD COLUMN {column} TEXT")
+        connection.exec_driver_sql(
+            "INSERT INTO songs (id, title, artist, "
+            + ", ".join(LEGACY_COLUMNS)
+            + ") VALUES (?, ?, ?, ?, ?, ?, ?)",
+            [
+                (
+                    f"song-{i:05d}",
+                    f"Song {i}",
+                    f"Artist {i % 500}",
+                    "A music video. " * 40,
+                    "la la la\n" * 150,
+                    "[00:01.00] la la la\n" * 150,
+                    '{"formats": []}' * 100,
+                )
+                for i in range(SONGS)
+            ],
+        )
+    wide_pages, wide_ms = scan(db_path)
+
+    with patch.object(database.config, "MIGRATE_SONG_SIDE_COLUMNS_ON_BOOT", True):
+        ensure_db_schema(engine)
+    engine.dispose()
+    narrow_pages, narrow_ms = scan(db_path)
+
+    print(
+        f"\nScan of {SONGS} songs: in-row cold columns {wide_pages} pages "
+        f"{wide_ms:.1f}ms, side tables {narrow_pages} pages {narrow_ms:.1f}ms"
+    )
+    assert narrow_pages * 10 < wide_pages
+    assert narrow_ms < wide_ms
@@ -0,0 +1,120 @@
+"""
+Benchmark: read and write cost of each SQLite profile on a 50k-song library.
+
+Run with ``pytest tests/performance -m performance -s`` to see the timings.
+"""
+
+import random
+import time
+
+import pytest
+from app.db.models import Base, DbSong, DbSongLyrics
+from app.db.sqlite_profiles import SQLITE_PROFILES, install_profile
+from sqlalchemy import create_engine, insert, select, update
+
+pytestmark = [pytest.mark.performance, pytest.mark.slow]
+
+SONGS = 50_000
+COMMITS = 500
+LOOKUPS = 2_000
+PAGES = 50
+
+
+def song_rows():
+    return [
+        {
+            "id": f"song-{i:06d}",
+            "title": f"Song {i}",
+            "artist": f"Artist {i % 2_000}",
+            "album": f"Album {i % 5_000}",
+            "duration_ms": 180_000 + i % 120_000,
+            "plain_lyrics": "la " * 200,
+        }
+        for i in range(SONGS)
+    ]
+
+
+def run_profile(db_path, profile, rows):
+    engine = create_engine(f"sqlite:///{db_path}")
+    install_profile(engine, profile)
+    Base.metadata.create_all(engine)
+    rng = random.Random(42)
+    timings = {}
+
+    started = time.perf_counter()
+    with engine.begin() as connection:
+        for start in range(0, SONGS, 5_000):
+            batch = rows[start : start + 5_000]
+            connection.execute(
+                insert(DbSong),
+                [
+                    {k: v for k, v in row.items() if k != "plain_lyrics"}
+                    for row in batch
+                ],
+            )
+            connection.execute(
+                insert(DbSongLyrics),
+                [
+                    {"song_id": row["id"], "plain_lyrics": row["plain_lyrics"]}
+                    for row in batch
+                ],
+            )
+    timings["bulk insert s"] = time.perf_counter() - started
+
+    # Small transactions, as when jobs and the queue update one row at a time
+    started = time.perf_counter()
+    for i in range(COMMITS):
+        with engine.begin() as connection:
+            connection.execute(
+                update(DbSong)
+                .where(DbSong.id == f"song-{rng.randrange(SONGS):06d}")
+                .values(genre=f"Genre {i}")
+            )
+    timings["commit us"] = (time.perf_counter() - started) / COMMITS * 1e6
+
+    with engine.connect() as connection:
+        started = time.perf_counter()
+        for _ in range(LOOKUPS):
+            song_id = f"song-{rng.randrange(SONGS):06d}"
+            connection.execute(select(DbSong).where(DbSong.id == song_id)).one()
+        timings["lookup us"] = (time.perf_counter() - started) / LOOKUPS * 1e6
+
+        started = time.perf_counter()
+        for _ in range(PAGES):
+            page = connection.execute(
+                select(DbSong.id)
+                .order_by(DbSong.artist, DbSong.title)
+                .limit(50)
+                .offset(rng.randrange(SONGS - 50))
+            ).all()
+            assert len(page) == 50
+        timings["page ms"] = (time.perf_counter() - started) / PAGES * 1e3
+
+        count = connection.execute(
+            select(DbSong.id).where(DbSong.title.like("%Song 4999%"))
+        ).all()
+
+    engine.dispose()
+    return timings, len(count)
+
+
+def test_sqlite_profiles_on_50k_songs(tmp_path):
+    rows = song_rows()
+    results = {}
+    matches = set()
+    for profile in SQLITE_PROFILES:
+        timings, found = run_profile(tmp_path / f"{profile}.db", profile, rows)
+        results[profile] = timings
+        matches.add(found)
+
+    print(f"\nSQLite profiles at {SONGS} songs:")
+    for profile, timings in results.items():
+        print(
+            f"  {profile:<10} "
+            + ", ".join(f"{name} {value:.2f}" for name, value in timings.items())
+        )
+
+    # Every profile sees the same data
+    assert matches == {11}
+    # Skipping the fsync of every commit must not make commits slower
+    assert results["throughput"]["commit us"] <= results["durable"]["commit us"] * 1.2
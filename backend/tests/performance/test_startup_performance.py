@@ -0,0 +1,56 @@
+"""
+Benchmark: schema check at startup and JobRepository construction.
+
+Run with ``pytest tests/performance -m performance -s`` to see the timings.
+"""
+
+import time
+
+import pytest
+from app.db.database import ensure_db_schema
+from app.db.models import Base, DbJob, DbJobStatusCount
+from app.repositories import JobRepository
+from sqlalchemy import create_engine
+
+pytestmark = [pytest.mark.performance, pytest.mark.slow]
+
+STARTS = 20
+REPOSITORIES = 1_000
+
+
+def per_call_ms(func, calls):
+    started = time.perf_counter()
+    for _ in range(calls):
+        func()
+    return (time.perf_counter() - started) / calls * 1e3
+
+
+def test_startup_schema_check(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'karaoke.db'}")
+    ensure_db_schema(engine)
+
+    def unstamped_start():
+        # What every start did before the stamp: full introspection
+        with engine.begin() as connection:
+            connection.exec_driver_sql("PRAGMA user_version = 0")
+        ensure_db_schema(engine)
+
+    def old_repository():
+        JobRepository()
+        DbJob.__table__.create(bind=engine, checkfirst=True)
+        DbJobStatusCount.__table__.create(bind=engine, checkfirst=True)
+
+    timings = {
+        "introspecting start": per_call_ms(unstamped_start, STARTS),
+        "stamped start": per_call_ms(lambda: ensure_db_schema(engine), STARTS),
+        "repository with DDL check": per_call_ms(old_repository, REPOSITORIES),
+        "repository": per_call_ms(JobRepository, REPOSITORIES),
+    }
+    engine.dispose()
+
+    print(
+        f"\nSchema check over {len(Base.metadata.tables)} tables: "
+        + ", ".join(f"{name} {ms:.3f}ms" for name, ms in timings.items())
+    )
+    assert timings["stamped start"] * 5 < timings["introspecting start"]
+    assert timings["repository"] * 5 < timings["repository with DDL check"]
@@ -0,0 +1,180 @@
+"""
+Tests for the library version and the conditional, cached library reads.
+"""
+
+from contextlib import contextmanager
+from unittest.mock import patch
+
+import pytest
+from app.api.songs import song_bp
+from app.repositories.library_version_repository import (
+    bump_library_version,
+    local_library_commits,
+    read_library_version,
+)
+from app.repositories.song_repository import SongRepository
+from app.utils.error_handlers import register_error_handlers
+from flask import Flask
+from sqlalchemy import event
+from sqlalchemy.orm import sessionmaker
+from tests.utils.db_utils import session_scope
+
+
+@pytest.fixture
+def engine(memory_engine):
+    return memory_engine
+
+
+@pytest.fixture
+def factory(engine):
+    factory = sessionmaker(bind=engine)
+    with factory() as session:
+        SongRepository(session).bulk_create(
+            {"id": f"song-{i}", "title": f"Song {i}", "artist": "Band"}
+            for i in range(3)
+        )
+    return factory
+
+
+@contextmanager
+def make_client(factory, **config):
+    get_db_session = session_scope(factory)
+    app = Flask(__name__)
+    app.config.update(config)
+    register_error_handlers(app)
+    app.register_blueprint(song_bp)
+    with patch("app.api.songs.core.get_db_session", get_db_session), patch(
+        "app.api.songs.artists.get_db_session", get_db_session
+    ), patch("app.api.songs.search.get_db_session", get_db_session), patch(
+        "app.utils.library_cache.get_db_session", get_db_session
+    ):
+        yield app.test_client()
+
+
+@pytest.fixture
+def client(factory):
+    with make_client(factory) as client:
+        yield client
+
+
+@pytest.fixture
+def statements(engine):
+    executed = []
+    event.listen(
+        engine,
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: executed.append(statement),
+    )
+    return executed
+
+
+def test_song_writes_bump_the_version(factory):
+    with factory() as session:
+        repo = SongRepository(session)
+        versions = [read_library_version(session)]
+        repo.create({"id": "new", "title": "New"})
+        versions.append(read_library_version(session))
+        repo.update("new", title="Renamed")
+        versions.append(read_library_version(session))
+        repo.bulk_update([{"id": "new", "year": 2001}, {"id": "song-0", "year": 1999}])
+        versions.append(read_library_version(session))
+        repo.delete("new")
+        versions.append(read_library_version(session))
+
+    assert versions == [1, 2, 3, 4, 5]
+
+
+def test_rolled_back_writes_keep_the_version(factory):
+    commits = local_library_commits()
+    with factory() as session:
+        bump_library_version(session)
+        session.rollback()
+        assert read_library_version(session) == 1
+        session.commit()
+
+    assert local_library_commits() == commits
+
+
+@pytest.mark.parametrize(
+    "url",
+    ["/api/songs", "/api/songs/artists", "/api/songs/search?q=Song"],
+)
+def test_matching_etag_gets_304_without_queries(client, statements, url):
+    first = client.get(url)
+    etag = first.headers["ETag"]
+    statements.clear()
+
+    response = client.get(url, headers={"If-None-Match": etag})
+
+    assert first.status_code == 200
+    assert "no-cache" in first.headers["Cache-Control"]
+    assert response.status_code == 304
+    assert response.headers["ETag"] == etag
+    assert response.data == b""
+    assert statements == []
+
+
+def test_etag_depends_on_query_parameters(client):
+    etags = {
+        client.get(url).headers["ETag"]
+        for url in [
+            "/api/songs",
+            "/api/songs?limit=1",
+            "/api/songs?limit=1&sort_by=title",
+            "/api/songs?sort_by=title&limit=1",
+        ]
+    }
+
+    assert len(etags) == 3
+
+
+def test_repeated_read_is_served_from_the_cache(client, statements):
+    first = client.get("/api/songs?fields=id,title")
+    statements.clear()
+
+    second = client.get("/api/songs?fields=id,title")
+
+    assert second.status_code == 200
+    assert second.get_json() == first.get_json()
+    assert second.headers["ETag"] == first.headers["ETag"]
+    assert statements == []
+
+
+def test_local_write_changes_the_etag_at_once(client, factory):
+    first = client.get("/api/songs?fields=id")
+    with factory() as session:
+        SongRepository(session).create({"id": "song-9", "title": "Song 9"})
+
+    response = client.get(
+        "/api/songs?fields=id", headers={"If-None-Match": first.headers["ETag"]}
+    )
+
+    assert response.status_code == 200
+    assert response.headers["ETag"] != first.headers["ETag"]
+    assert {"id": "song-9"} in response.get_json()
+
+
+def test_other_process_writes_show_once_the_version_expires(factory, engine):
+    def bump_elsewhere():
+        # As a job worker would: this process commits nothing
+        with engine.begin() as connection:
+            connection.exec_driver_sql(
+                "UPDATE library_version SET version = version + 1"
+            )
+
+    with make_client(factory, LIBRARY_VERSION_TTL_MS=60_000) as trusting:
+        etag = trusting.get("/api/songs").headers["ETag"]
+        bump_elsewhere()
+        assert trusting.get("/api/songs").headers["ETag"] == etag
+
+    with make_client(factory, LIBRARY_VERSION_TTL_MS=0) as expiring:
+        etag = expiring.get("/api/songs").headers["ETag"]
+        bump_elsewhere()
+        assert expiring.get("/api/songs").headers["ETag"] != etag
+
+
+def test_errors_are_not_cached(client):
+    responses = [client.get("/api/songs?cursor=garbage") for _ in range(2)]
+
+    assert [response.status_code for response in responses] == [400, 400]
+    assert not any("ETag" in response.headers for response in responses)
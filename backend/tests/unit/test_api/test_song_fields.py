@@ -0,0 +1,98 @@
+"""
+Tests for the fields= sparse fieldset of the song endpoints.
+"""
+
+from unittest.mock import patch
+
+import pytest
+from app.api.songs import song_bp
+from app.db.models import DbSong
+from app.utils.error_handlers import register_error_handlers
+from flask import Flask
+from sqlalchemy.orm import sessionmaker
+from tests.utils.db_utils import recorded_queries
+
+
+@pytest.fixture
+def engine(memory_engine):
+    engine = memory_engine
+    with sessionmaker(bind=engine)() as session:
+        session.add_all(
+            DbSong(
+                id=f"song-{i}",
+                title=f"Song {i}",
+                artist="Artist",
+                thumbnail_path=f"song-{i}/thumbnail.webp",
+                plain_lyrics="la " * 1000,
+                synced_lyrics="[00:01.00] la\n" * 200,
+                description="words " * 500,
+            )
+            for i in range(3)
+        )
+        session.commit()
+    return engine
+
+
+@pytest.fixture
+def client(engine, get_db_session):
+    app = Flask(__name__)
+    register_error_handlers(app)
+    app.register_blueprint(song_bp)
+    with patch("app.api.songs.core.get_db_session", get_db_session), patch(
+        "app.api.songs.artists.get_db_session", get_db_session
+    ), patch("app.api.songs.search.get_db_session", get_db_session), patch(
+        "app.utils.library_cache.get_db_session", get_db_session
+    ):
+        yield app.test_client()
+
+
+def selects_heavy_columns(queries):
+    return any(
+        "plain_lyrics" in statement or "description" in statement
+        for statement, _ in queries
+    )
+
+
+def test_list_returns_and_loads_only_requested_fields(engine, client):
+    with recorded_queries(engine) as queries:
+        response = client.get("/api/songs?fields=id,title,thumbnail")
+
+    assert response.status_code == 200
+    assert response.get_json()[0] == {
+        "id": "song-2",
+        "title": "Song 2",
+        "thumbnail": "song-2/thumbnail.webp",
+    }
+    assert not selects_heavy_columns(queries)
+
+
+def test_list_without_fields_is_unchanged(client):
+    song = client.get("/api/songs").get_json()[0]
+
+    assert song["plainLyrics"].startswith("la la")
+    assert song["description"].startswith("words")
+    assert song["releaseTitle"] is None
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "/api/songs/song-1?fields=title,syncedLyrics",
+        "/api/songs/search?q=Song 1&fields=title,syncedLyrics",
+        "/api/songs/by-artist/Artist?fields=title,syncedLyrics",
+    ],
+)
+def test_song_endpoints_accept_fields(client, url):
+    response = client.get(url)
+
+    assert response.status_code == 200
+    data = response.get_json()
+    song = data["songs"][0] if "songs" in data else data
+    assert set(song) == {"title", "syncedLyrics"}
+
+
+def test_unknown_field_is_rejected(client):
+    response = client.get("/api/songs?fields=title,lyrics")
+
+    assert response.status_code == 400
+    assert "lyrics" in response.get_json()["error"]
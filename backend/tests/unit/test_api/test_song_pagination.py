@@ -0,0 +1,101 @@
+"""
+Tests for cursor pagination of the song library.
+"""
+
+import random
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+from app.api.songs import song_bp
+from app.db.models import DbSong
+from app.repositories.song_repository import SongRepository
+from app.utils.error_handlers import register_error_handlers
+from flask import Flask
+from sqlalchemy import insert
+from sqlalchemy.orm import sessionmaker
+
+
+@pytest.fixture
+def engine(memory_engine):
+    engine = memory_engine
+    # Few distinct values, mixed case and NULLs: lots of ties to break
+    rng = random.Random(7)
+    added = [None, datetime(2024, 1, 1), datetime(2024, 1, 1, 12, 0, 0, 500)]
+    with engine.begin() as connection:
+        connection.execute(
+            insert(DbSong),
+            [
+                {
+                    "id": f"song-{i:03d}",
+                    "title": rng.choice(["abba", "ABBA", "Beat", "cello"]),
+                    "artist": rng.choice(["Artist", "artist", "Band"]),
+                    "album": rng.choice([None, "Album", "album", "Zoo"]),
+                    "year": rng.choice([None, 1990, 2001]),
+                    "date_added": rng.choice(added),
+                }
+                for i in range(83)
+            ],
+        )
+    return engine
+
+
+@pytest.fixture
+def client(engine, get_db_session):
+    app = Flask(__name__)
+    register_error_handlers(app)
+    app.register_blueprint(song_bp)
+    with patch("app.api.songs.core.get_db_session", get_db_session), patch(
+        "app.utils.library_cache.get_db_session", get_db_session
+    ):
+        yield app.test_client()
+
+
+def collect_pages(client, query):
+    pages, cursor = [], ""
+    while cursor is not None:
+        data = client.get(f"/api/songs?{query}&fields=id&cursor={cursor}").get_json()
+        pages.append([song["id"] for song in data["songs"]])
+        cursor = data["nextCursor"]
+    return pages
+
+
+@pytest.mark.parametrize("sort_by", ["date_added", "title", "artist", "album", "year"])
+@pytest.mark.parametrize("direction", ["asc", "desc"])
+def test_pages_follow_offset_order(engine, client, sort_by, direction):
+    with sessionmaker(bind=engine)() as session:
+        expected = [
+            song.id
+            for song in SongRepository(session).fetch_all(
+                sort_by=sort_by, direction=direction, fields=["id"]
+            )
+        ]
+
+    pages = collect_pages(client, f"sort_by={sort_by}&direction={direction}&limit=10")
+
+    assert [len(page) for page in pages] == [10] * 8 + [3]
+    assert [song_id for page in pages for song_id in page] == expected
+
+
+def test_text_sorts_group_case_variants(client):
+    titles = [
+        song["title"]
+        for song in client.get(
+            "/api/songs?sort_by=title&direction=asc&cursor=&limit=100"
+        ).get_json()["songs"]
+    ]
+
+    assert [title.lower() for title in titles] == sorted(t.lower() for t in titles)
+
+
+def test_offset_listing_is_unchanged(client):
+    response = client.get("/api/songs?limit=5&offset=5")
+
+    assert isinstance(response.get_json(), list)
+    assert len(response.get_json()) == 5
+
+
+def test_invalid_cursor(client):
+    response = client.get("/api/songs?cursor=not-a-cursor")
+
+    assert response.status_code == 400
@@ -0,0 +1,142 @@
+"""
+Tests for the artist summaries that SongRepository maintains on song writes.
+"""
+
+import pytest
+from app.db.models import Base, DbArtistSummary, DbSong
+from app.repositories.artist_repository import ArtistRepository
+from app.repositories.song_repository import SongRepository
+from sqlalchemy import create_engine, func
+from sqlalchemy.orm import sessionmaker
+
+
+@pytest.fixture
+def session():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with sessionmaker(bind=engine)() as session:
+        yield session
+    engine.dispose()
+
+
+def summaries(session):
+    return {
+        row.name: row.song_count
+        for row in session.query(DbArtistSummary).order_by(DbArtistSummary.name)
+    }
+
+
+def actual_counts(session):
+    return dict(
+        session.query(DbSong.artist, func.count(DbSong.id)).group_by(DbSong.artist)
+    )
+
+
+@pytest.fixture
+def seeded(session):
+    songs = SongRepository(session)
+    songs.bulk_create(
+        [
+            {"id": "s1", "title": "One", "artist": "ABBA"},
+            {"id": "s2", "title": "Two", "artist": "ABBA"},
+            {"id": "s3", "title": "Three", "artist": "beatles"},
+        ]
+    )
+    ArtistRepository(session).reconcile()
+    return songs
+
+
+def test_first_read_seeds_from_songs(session):
+    SongRepository(session).create({"id": "s1", "title": "One", "artist": "Queen"})
+    assert summaries(session) == {}
+
+    artists, total = ArtistRepository(session).fetch_page()
+
+    assert [artist.to_dict() for artist in artists] == [
+        {"name": "Queen", "songCount": 1, "firstLetter": "Q"}
+    ]
+    assert total == 1
+
+
+def test_single_song_writes(session, seeded):
+    seeded.create({"id": "s4", "title": "Four"})
+    seeded.update("s1", artist="Queen")
+    seeded.update("s2", title="Renamed")
+    seeded.delete("s3")
+
+    assert summaries(session) == {"ABBA": 1, "Queen": 1, "Unknown Artist": 1}
+    assert summaries(session) == actual_counts(session)
+
+
+def test_bulk_writes(session, seeded):
+    seeded.bulk_create(
+        [{"id": f"n{i}", "title": "New", "artist": "Cher"} for i in range(3)]
+    )
+    seeded.bulk_update([{"id": "n0", "artist": "ABBA"}, {"id": "s3", "year": 1999}])
+    seeded.upsert_many(
+        [
+            {"id": "s1", "title": "One", "artist": "Cher"},
+            {"id": "s3", "title": "Three", "artist": "Cher"},
+            {"id": "n9", "title": "Upserted"},
+        ]
+    )
+
+    assert summaries(session) == {"ABBA": 2, "Cher": 4, "Unknown Artist": 1}
+    assert summaries(session) == actual_counts(session)
+
+
+def test_rolled_back_write_leaves_summaries(session, seeded):
+    with pytest.raises(Exception):
+        seeded.bulk_create(
+            [
+                {"id": "n1", "title": "New", "artist": "Cher"},
+                {"id": "s1", "title": "Duplicate", "artist": "Cher"},
+            ]
+        )
+
+    assert summaries(session) == {"ABBA": 2, "beatles": 1}
+
+
+def test_reconcile_corrects_drift(session, seeded):
+    session.query(DbArtistSummary).filter_by(name="ABBA").update({"song_count": 7})
+    session.add(
+        DbArtistSummary(
+            name="Ghost", normalized_name="ghost", first_letter="G", song_count=1
+        )
+    )
+    session.commit()
+
+    corrections = ArtistRepository(session).reconcile()
+
+    assert corrections == {"ABBA": -5, "Ghost": -1}
+    assert summaries(session) == actual_counts(session)
+
+
+def test_listing_search_and_letters(session):
+    SongRepository(session).bulk_create(
+        [
+            {"id": f"s{i}", "title": "Song", "artist": artist}
+            for i, artist in enumerate(
+                ["beatles", "ABBA", "Aerosmith", "Blur", "  cher ", "The  Beatles"]
+            )
+        ]
+    )
+    artists = ArtistRepository(session)
+
+    names = [artist.name for artist in artists.fetch_page()[0]]
+    assert names == ["ABBA", "Aerosmith", "beatles", "Blur", "  cher ", "The  Beatles"]
+    assert [artist.name for artist in artists.fetch_page(letter="b")[0]] == [
+        "beatles",
+        "Blur",
+    ]
+    found, total = artists.fetch_page(search="BEATLES")
+    assert ([artist.name for artist in found], total) == (
+        ["beatles", "The  Beatles"],
+        2,
+    )
+    assert artists.fetch_letters() == [
+        {"letter": "A", "artistCount": 2, "offset": 0},
+        {"letter": "B", "artistCount": 2, "offset": 2},
+        {"letter": "C", "artistCount": 1, "offset": 4},
+        {"letter": "T", "artistCount": 1, "offset": 5},
+    ]
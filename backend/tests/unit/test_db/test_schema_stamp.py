@@ -0,0 +1,152 @@
+"""
+Tests for the schema version stamp that lets ensure_db_schema skip
+introspection when the database already matches the models.
+"""
+
+from unittest.mock import patch
+
+import pytest
+from app.db import database
+from app.db.database import ensure_db_schema, read_schema_stamp, schema_version
+from app.db.models import Base
+from sqlalchemy import (
+    Column,
+    Index,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    create_engine,
+    inspect,
+)
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'karaoke.db'}")
+    yield engine
+    engine.dispose()
+
+
+def test_new_database_is_created_and_stamped(engine):
+    ensure_db_schema(engine)
+
+    assert set(inspect(engine).get_table_names()) == set(Base.metadata.tables)
+    assert read_schema_stamp(engine) == schema_version()
+
+
+def test_current_stamp_skips_introspection(engine):
+    ensure_db_schema(engine)
+
+    with patch.object(database, "inspect") as inspector, patch.object(
+        Base.metadata, "create_all"
+    ) as create_all:
+        ensure_db_schema(engine)
+
+    inspector.assert_not_called()
+    create_all.assert_not_called()
+
+
+def test_stale_stamp_adds_missing_schema(engine):
+    # A database from before the album column, its indexes and the jobs table
+    Base.metadata.create_all(engine)
+    with engine.begin() as connection:
+        for statement in [
+            "DROP INDEX ix_songs_artist_album",
+            "DROP INDEX ix_songs_album_nocase_id",
+            "DROP INDEX ix_songs_video_id",
+            "ALTER TABLE songs DROP COLUMN album",
+            "DROP TABLE jobs",
+            "PRAGMA user_version = 12345",
+        ]:
+            connection.exec_driver_sql(statement)
+
+    ensure_db_schema(engine)
+
+    inspector = inspect(engine)
+    assert "album" in {column["name"] for column in inspector.get_columns("songs")}
+    assert "ix_songs_video_id" in {
+        index["name"] for index in inspector.get_indexes("songs")
+    }
+    assert "jobs" in inspector.get_table_names()
+    assert read_schema_stamp(engine) == schema_version()
+
+
+def test_stale_stamp_drops_superseded_indexes(engine):
+    # A database from before the sort indexes ended with id
+    Base.metadata.create_all(engine)
+    with engine.begin() as connection:
+        for statement in [
+            "CREATE INDEX ix_songs_title_nocase ON songs (title COLLATE NOCASE)",
+            "CREATE INDEX ix_songs_year ON songs (year)",
+            "PRAGMA user_version = 12345",
+        ]:
+            connection.exec_driver_sql(statement)
+
+    ensure_db_schema(engine)
+
+    indexes = {index["name"] for index in inspect(engine).get_indexes("songs")}
+    assert not indexes & set(database.SUPERSEDED_INDEXES["songs"])
+    assert {"ix_songs_title_nocase_id", "ix_songs_year_id"} <= indexes
+    assert read_schema_stamp(engine) == schema_version()
+
+
+def test_version_follows_model_changes():
+    def version(*extra):
+        metadata = MetaData()
+        Table("songs", metadata, Column("id", String, primary_key=True), *extra)
+        return schema_version(metadata)
+
+    assert version() == version()
+    assert version() != version(Column("year", Integer))
+    assert version(Column("year", Integer)) != version(
+        Column("year", Integer), Index("ix_songs_year", "year")
+    )
+
+
+def create_database_before_side_tables(engine):
+    Base.metadata.create_all(engine)
+    with engine.begin() as connection:
+        for statement in [
+            "DROP TABLE song_lyrics",
+            "DROP TABLE song_details",
+            "ALTER TABLE songs ADD COLUMN plain_lyrics TEXT",
+            "ALTER TABLE songs ADD COLUMN synced_lyrics TEXT",
+            "ALTER TABLE songs ADD COLUMN description TEXT",
+            "INSERT INTO songs (id, title, artist, plain_lyrics, description) "
+            "VALUES ('s1', 'One', 'A', 'la la', 'A video')",
+            "INSERT INTO songs (id, title, artist) VALUES ('s2', 'Two', 'A')",
+            "PRAGMA user_version = 12345",
+        ]:
+            connection.exec_driver_sql(statement)
+
+
+def test_stale_stamp_leaves_cold_columns_to_alembic(engine, caplog):
+    create_database_before_side_tables(engine)
+
+    with patch.object(database.config, "MIGRATE_SONG_SIDE_COLUMNS_ON_BOOT", False):
+        ensure_db_schema(engine)
+
+    columns = {column["name"] for column in inspect(engine).get_columns("songs")}
+    assert {"plain_lyrics", "synced_lyrics", "description"} <= columns
+    assert "alembic upgrade head" in caplog.text
+    # Not stamped, so the next start checks again
+    assert read_schema_stamp(engine) == 12345
+
+
+def test_opt_in_moves_cold_columns_to_side_tables(engine):
+    create_database_before_side_tables(engine)
+
+    with patch.object(database.config, "MIGRATE_SONG_SIDE_COLUMNS_ON_BOOT", True):
+        ensure_db_schema(engine)
+
+    columns = {column["name"] for column in inspect(engine).get_columns("songs")}
+    assert not {"plain_lyrics", "synced_lyrics", "description"} & columns
+    with engine.connect() as connection:
+        assert connection.exec_driver_sql("SELECT * FROM song_lyrics").all() == [
+            ("s1", "la la", None)
+        ]
+        assert connection.exec_driver_sql(
+            "SELECT song_id, description FROM song_details"
+        ).all() == [("s1", "A video")]
+    assert read_schema_stamp(engine) == schema_version()
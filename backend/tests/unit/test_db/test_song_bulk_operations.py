@@ -0,0 +1,142 @@
+"""
+Tests for the bulk song writes used by the maintenance scripts.
+"""
+
+from datetime import datetime
+
+import pytest
+from app.db.models import Base, DbSong
+from app.repositories.song_repository import SongRepository
+from sqlalchemy import create_engine, event, func, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import sessionmaker
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def session(engine):
+    with sessionmaker(bind=engine)() as session:
+        yield session
+
+
+@pytest.fixture
+def commits(engine):
+    counted = []
+    event.listen(engine, "commit", lambda connection: counted.append(connection))
+    return counted
+
+
+def songs(session):
+    return {
+        song.id: song
+        for song in session.scalars(select(DbSong).order_by(DbSong.id)).all()
+    }
+
+
+def test_bulk_create_commits_once(session, commits):
+    rows = [{"id": f"song-{i}", "title": f"Song {i}"} for i in range(25)]
+
+    assert SongRepository(session).bulk_create(rows, chunk_size=10) == 25
+
+    assert len(commits) == 1
+    assert len(songs(session)) == 25
+    assert songs(session)["song-3"].artist == "Unknown Artist"
+
+
+def test_bulk_create_is_all_or_nothing(session):
+    SongRepository(session).bulk_create([{"id": "song-1", "title": "Old"}])
+    rows = [{"id": "song-0", "title": "New"}, {"id": "song-1", "title": "Clash"}]
+
+    with pytest.raises(IntegrityError):
+        SongRepository(session).bulk_create(rows, chunk_size=1)
+
+    assert set(songs(session)) == {"song-1"}
+
+
+def test_bulk_update_sets_only_given_columns(session, commits):
+    repo = SongRepository(session)
+    repo.bulk_create(
+        [{"id": f"song-{i}", "title": f"Song {i}", "album": "Album"} for i in range(3)]
+    )
+
+    updated = repo.bulk_update(
+        [
+            {"id": "song-0", "thumbnail_path": "song-0/thumbnail.webp"},
+            {"id": "song-1", "title": "Renamed", "album": None},
+            {"id": "missing", "title": "Ghost"},
+        ],
+        chunk_size=2,
+    )
+
+    assert updated == 2
+    assert len(commits) == 2
+    stored = songs(session)
+    assert stored["song-0"].thumbnail_path == "song-0/thumbnail.webp"
+    assert stored["song-0"].title == "Song 0"
+    assert (stored["song-1"].title, stored["song-1"].album) == ("Renamed", None)
+    assert "missing" not in stored
+
+
+def test_bulk_update_uses_one_statement_per_chunk(engine, session):
+    repo = SongRepository(session)
+    repo.bulk_create([{"id": f"song-{i}", "title": "Song"} for i in range(100)])
+    updates = [{"id": f"song-{i}", "year": 2000 + i} for i in range(100)]
+
+    statements = []
+    event.listen(
+        engine,
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: statements.append(statement),
+    )
+    repo.bulk_update(updates, chunk_size=50)
+
+    # The ID check and the executemany UPDATE of each chunk, then one bump
+    # of the library version
+    assert [statement.split()[0] for statement in statements] == [
+        "SELECT",
+        "UPDATE",
+    ] * 2 + ["INSERT"]
+    assert session.scalar(select(func.sum(DbSong.year))) == sum(
+        2000 + i for i in range(100)
+    )
+
+
+def test_upsert_many_inserts_and_updates(session):
+    repo = SongRepository(session)
+    repo.bulk_create([{"id": "song-1", "title": "Old", "album": "Kept"}])
+
+    written = repo.upsert_many(
+        [
+            {"id": "song-1", "title": "New"},
+            {"id": "song-2", "title": "Added", "artist": "Band"},
+        ]
+    )
+
+    assert written == 2
+    stored = songs(session)
+    assert (stored["song-1"].title, stored["song-1"].album) == ("New", "Kept")
+    assert (stored["song-2"].title, stored["song-2"].artist) == ("Added", "Band")
+
+
+def test_date_strings_are_parsed(session):
+    SongRepository(session).upsert_many(
+        [
+            {
+                "id": "song-1",
+                "title": "Song",
+                "date_added": "2024-05-01 10:20:30.123456",
+                "upload_date": "2024-04-30T00:00:00",
+            }
+        ]
+    )
+
+    song = songs(session)["song-1"]
+    assert song.date_added == datetime(2024, 5, 1, 10, 20, 30)
+    assert song.upload_date == datetime(2024, 4, 30)
@@ -0,0 +1,152 @@
+"""
+Query-plan regression tests for the hot song queries.
+
+Each test runs an endpoint or repository method against an in-memory
+library, records the SQL it issues and fails if SQLite plans any of it as a
+full scan of the songs table, i.e. if a change to the query or to the
+DbSong indexes stops the query from using an index.
+
+Substring search (``/api/songs/search`` and the artists ``search`` filter)
+is not covered: ``LIKE '%term%'`` cannot use a B-tree index.
+"""
+
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+from app.api.songs import song_bp
+from app.db.models import DbSong
+from app.repositories.song_repository import SongRepository
+from flask import Flask
+from sqlalchemy.orm import sessionmaker
+from tests.utils.db_utils import (
+    assert_no_full_table_scans,
+    explain_query_plan,
+    full_table_scans,
+    recorded_queries,
+)
+
+
+@pytest.fixture
+def engine(memory_engine):
+    engine = memory_engine
+    started = datetime(2024, 1, 1)
+    with sessionmaker(bind=engine)() as session:
+        session.add_all(
+            DbSong(
+                id=f"song-{i}",
+                title=f"Song {i}",
+                artist=f"Artist {i % 20}",
+                album=f"Album {i % 50}",
+                year=1960 + i % 60,
+                date_added=started + timedelta(hours=i),
+                video_id=f"video-{i}",
+            )
+            for i in range(500)
+        )
+        session.commit()
+    return engine
+
+
+@pytest.fixture
+def session(engine):
+    with sessionmaker(bind=engine)() as session:
+        yield session
+
+
+@pytest.fixture
+def client(engine, get_db_session):
+    app = Flask(__name__)
+    app.register_blueprint(song_bp)
+    with patch("app.api.songs.core.get_db_session", get_db_session), patch(
+        "app.api.songs.artists.get_db_session", get_db_session
+    ), patch("app.utils.library_cache.get_db_session", get_db_session):
+        yield app.test_client()
+
+
+def test_detects_full_table_scan(engine):
+    plan = explain_query_plan(engine, "SELECT id FROM songs WHERE genre = ?", ("Rock",))
+
+    assert full_table_scans(plan, "songs") == plan
+
+
+@pytest.mark.parametrize("sort_by", ["date_added", "title", "artist", "album", "year"])
+@pytest.mark.parametrize("direction", ["asc", "desc"])
+def test_library_page(engine, client, sort_by, direction):
+    with recorded_queries(engine) as queries:
+        response = client.get(
+            f"/api/songs?limit=50&sort_by={sort_by}&direction={direction}"
+        )
+
+    assert response.status_code == 200
+    assert_no_full_table_scans(engine, queries, "songs")
+
+
+@pytest.mark.parametrize("sort_by", ["date_added", "title", "artist", "album", "year"])
+@pytest.mark.parametrize("direction", ["asc", "desc"])
+def test_library_page_after_cursor(engine, client, sort_by, direction):
+    url = f"/api/songs?limit=200&sort_by={sort_by}&direction={direction}&fields=id"
+    cursor = client.get(f"{url}&cursor=").get_json()["nextCursor"]
+
+    with recorded_queries(engine) as queries:
+        response = client.get(f"{url}&cursor={cursor}")
+
+    assert response.status_code == 200
+    assert_no_full_table_scans(engine, queries, "songs")
+    # Seeks to the cursor rather than walking the index from its start
+    plans = [explain_query_plan(engine, *query) for query in queries]
+    assert all(step.startswith("SEARCH songs") for plan in plans for step in plan)
+
+
+def test_artist_list(engine, client):
+    with recorded_queries(engine) as queries:
+        response = client.get("/api/songs/artists?limit=50")
+
+    assert response.status_code == 200
+    assert response.get_json()["pagination"]["total"] == 20
+    assert_no_full_table_scans(engine, queries, "songs")
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "/api/songs/artists?limit=5&offset=10",
+        "/api/songs/artists?letter=A",
+        "/api/songs/artists/letters",
+    ],
+)
+def test_artist_browser_reads_summaries_only(engine, client, url):
+    client.get("/api/songs/artists")  # Seeds the artist summaries
+
+    with recorded_queries(engine) as queries:
+        response = client.get(url)
+
+    assert response.status_code == 200
+    assert not [query for query, _ in queries if " songs" in query]
+    assert_no_full_table_scans(engine, queries, "artist_summaries")
+
+
+@pytest.mark.parametrize("sort", ["title", "album", "year"])
+def test_songs_by_artist(engine, client, sort):
+    with recorded_queries(engine) as queries:
+        response = client.get(f"/api/songs/by-artist/Artist 3?sort={sort}")
+
+    assert response.status_code == 200
+    assert_no_full_table_scans(engine, queries, "songs")
+
+
+def test_duplicate_video_lookup(engine, session):
+    with recorded_queries(engine) as queries:
+        found = SongRepository(session).fetch_ids_by_video_id(["video-7", "new"])
+
+    assert found == {"video-7": "song-7"}
+    assert_no_full_table_scans(engine, queries, "songs")
+
+
+def test_text_sorts_ignore_case(session):
+    session.add(DbSong(id="lower", title="a song", artist="artist 0"))
+    session.commit()
+
+    songs = SongRepository(session).fetch_all(sort_by="title", direction="asc")
+
+    assert songs[0].id == "lower"
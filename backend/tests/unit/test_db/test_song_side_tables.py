@@ -0,0 +1,105 @@
+"""
+Tests for the song columns kept in side tables (song_lyrics, song_details).
+"""
+
+import re
+
+import pytest
+from app.db.models import Base, DbSong, DbSongDetails, DbSongLyrics
+from app.repositories.song_repository import SongRepository
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+
+from tests.utils.db_utils import recorded_queries
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def session(engine):
+    with sessionmaker(bind=engine)() as session:
+        yield session
+
+
+def side_rows(session):
+    return (
+        session.execute(select(DbSongLyrics.song_id, DbSongLyrics.plain_lyrics)).all(),
+        session.execute(select(DbSongDetails.song_id, DbSongDetails.description)).all(),
+    )
+
+
+def test_side_columns_read_and_write_like_columns(session):
+    repo = SongRepository(session)
+    song = repo.create({"id": "s1", "title": "One", "plain_lyrics": "la la"})
+
+    assert (song.plain_lyrics, song.synced_lyrics, song.description) == (
+        "la la",
+        None,
+        None,
+    )
+    assert side_rows(session) == ([("s1", "la la")], [])
+
+    repo.update("s1", description="A video", synced_lyrics="[00:01.00] la")
+
+    assert side_rows(session) == ([("s1", "la la")], [("s1", "A video")])
+    assert repo.fetch("s1").to_dict()["syncedLyrics"] == "[00:01.00] la"
+
+
+def test_deleting_a_song_deletes_its_side_rows(session):
+    repo = SongRepository(session)
+    repo.create({"id": "s1", "title": "One", "plain_lyrics": "la", "description": "d"})
+
+    repo.delete("s1")
+
+    assert side_rows(session) == ([], [])
+
+
+def test_listing_without_side_fields_skips_side_tables(engine, session):
+    SongRepository(session).create(
+        {"id": "s1", "title": "One", "plain_lyrics": "la", "description": "d"}
+    )
+    session.expunge_all()
+
+    with recorded_queries(engine) as queries:
+        songs = SongRepository(session).fetch_all(fields=["id", "title"])
+        lyrics = SongRepository(session).fetch_all(fields=["plainLyrics"])
+
+    assert [song.to_dict(["id", "title"]) for song in songs] == [
+        {"id": "s1", "title": "One"}
+    ]
+    assert lyrics[0].to_dict(["plainLyrics"]) == {"plainLyrics": "la"}
+    tables = [re.search(r"FROM (\w+)", sql).group(1) for sql, _ in queries]
+    assert tables == ["songs", "songs", "song_lyrics"]
+
+
+def test_bulk_writes_split_side_columns(session):
+    repo = SongRepository(session)
+    repo.bulk_create(
+        [
+            {"id": "s1", "title": "One", "plain_lyrics": "la"},
+            {"id": "s2", "title": "Two", "description": "d"},
+        ]
+    )
+    repo.bulk_update(
+        [
+            {"id": "s1", "description": "new"},
+            {"id": "s2", "title": "Renamed", "plain_lyrics": "lo"},
+        ]
+    )
+    repo.upsert_many([{"id": "s3", "title": "Three", "plain_lyrics": "li"}])
+
+    songs = {song.id: song for song in repo.fetch_all()}
+    assert {
+        song_id: (song.title, song.plain_lyrics, song.description)
+        for song_id, song in songs.items()
+    } == {
+        "s1": ("One", "la", "new"),
+        "s2": ("Renamed", "lo", "d"),
+        "s3": ("Three", "li", None),
+    }
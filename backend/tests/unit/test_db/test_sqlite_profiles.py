@@ -0,0 +1,43 @@
+"""
+Tests for per-connection SQLite profiles.
+"""
+
+import pytest
+from app.db.sqlite_profiles import install_profile, profile_pragmas
+from sqlalchemy import create_engine, text
+
+
+def read_pragmas(connection):
+    return {
+        name: connection.execute(text(f"PRAGMA {name}")).scalar()
+        for name in ("journal_mode", "synchronous", "foreign_keys", "cache_size")
+    }
+
+
+@pytest.mark.parametrize(
+    "profile, synchronous, cache_size",
+    [("durable", 2, -16384), ("balanced", 1, -65536), ("throughput", 0, -262144)],
+)
+def test_profile_applies_to_every_pooled_connection(
+    tmp_path, profile, synchronous, cache_size
+):
+    engine = create_engine(f"sqlite:///{tmp_path / 'profile.db'}")
+    install_profile(engine, profile)
+
+    # Two connections checked out at once are two separate DB-API connections
+    with engine.connect() as first, engine.connect() as second:
+        pragmas = [read_pragmas(first), read_pragmas(second)]
+
+    expected = {
+        "journal_mode": "wal",
+        "synchronous": synchronous,
+        # Profiles are about durability and speed, not integrity checks
+        "foreign_keys": 0,
+        "cache_size": cache_size,
+    }
+    assert pragmas == [expected, expected]
+
+
+def test_unknown_profile_is_rejected():
+    with pytest.raises(ValueError, match="Unknown SQLite profile"):
+        profile_pragmas("reckless")
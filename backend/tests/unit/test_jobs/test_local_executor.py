@@ -0,0 +1,94 @@
+"""
+Tests for the brokerless local job executor.
+"""
+
+import time
+
+import pytest
+from app.db.models import DbLocalTask, LocalTaskStatus
+from app.jobs.local_executor import LocalExecutor
+from app.repositories import LocalTaskRepository
+from app.utils.events import event_bus
+
+
+def fake_worker(task_id, name, args, event_queue):
+    """Stands in for _worker_main: forwards one job event, fails on request."""
+    event_queue.put((args[0], {"id": args[0], "status": "completed"}, False))
+    event_queue.close()
+    event_queue.join_thread()
+    if name == "failing_task":
+        raise SystemExit(3)
+
+
+@pytest.fixture
+def repository(get_db_session):
+    repo = LocalTaskRepository()
+    repo.get_db_session = get_db_session
+    return repo
+
+
+@pytest.fixture
+def received_events():
+    events = []
+
+    def handler(event):
+        events.append(event)
+
+    event_bus.subscribe("job_updated", handler)
+    yield events
+    event_bus.unsubscribe("job_updated", handler)
+
+
+class TestLocalTaskRepository:
+    """Test the persistent queue."""
+
+    def test_claims_due_tasks_in_order_once(self, repository):
+        repository.enqueue("later", "task", [], countdown=3600)
+        repository.enqueue("first", "task", [1])
+        repository.enqueue("second", "task", [2])
+
+        assert repository.claim_next().id == "first"
+        assert repository.claim_next().id == "second"
+        assert repository.claim_next() is None
+        assert repository.get_status("first") == LocalTaskStatus.RUNNING
+
+    def test_requeue_and_revoke(self, repository):
+        repository.enqueue("a", "task", [])
+        repository.enqueue("b", "task", [])
+        repository.claim_next()
+
+        assert repository.requeue_running() == 1
+        assert repository.revoke("b") == LocalTaskStatus.QUEUED.value
+        assert repository.revoke("b") is None
+        assert repository.get_unfinished_task_ids() == ["a"]
+
+
+class TestLocalExecutor:
+    """Test dispatching to worker processes."""
+
+    def test_runs_tasks_within_pool_bound_and_relays_events(
+        self, repository, received_events
+    ):
+        executor = LocalExecutor(
+            workers=1,
+            repository=repository,
+            poll_interval=0,
+            cleanup_interval=0,
+            worker_target=fake_worker,
+        )
+        executor.submit("working_task", ["job-1"], task_id="t1")
+        executor.submit("failing_task", ["job-2"], task_id="t2")
+
+        deadline = time.monotonic() + 60
+        while repository.get_unfinished_task_ids() and time.monotonic() < deadline:
+            executor.run_once()
+            assert len(executor._running) <= 1
+            time.sleep(0.05)
+        executor.run_once()  # Relay events of the last worker
+
+        assert repository.get_status("t1") == LocalTaskStatus.DONE
+        assert repository.get_status("t2") == LocalTaskStatus.FAILED
+        with repository.get_db_session() as session:
+            error = session.get(DbLocalTask, "t2").error
+        assert error == "Worker exited with code 3"
+        assert [e.job_id for e in received_events] == ["job-1", "job-2"]
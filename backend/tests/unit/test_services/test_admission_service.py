@@ -0,0 +1,123 @@
+"""
+Tests for backlog-based admission control.
+"""
+
+import json
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+import pytest
+from app.db.models import DbSong, KaraokeQueueItem
+from app.exceptions import QueueFullError
+from app.services.admission_service import (
+    AdmissionService,
+    get_client_id,
+    song_in_karaoke_queue,
+)
+from app.services.job_timing import EtaPredictor
+
+
+def pending_job(client_id=None):
+    notes = {"video_id": "abc123"}
+    if client_id:
+        notes["client_id"] = client_id
+    return {"status": "pending", "notes": json.dumps(notes)}
+
+
+def make_service(pending, cost=100.0, concurrency=1):
+    predictor = Mock(spec=EtaPredictor)
+    predictor.concurrency = concurrency
+    predictor.pending_work.return_value = pending
+    # Spread the cost over the six non-queue phases
+    predictor.phase_seconds.return_value = cost / 6
+    return AdmissionService(
+        predictor,
+        max_pending_seconds=1000,
+        queue_headroom_seconds=300,
+        max_client_pending_seconds=400,
+    )
+
+
+class TestAdmissionService:
+    """Test admission decisions."""
+
+    def test_admits_with_projected_start(self):
+        service = make_service([(pending_job("other"), 200.0)], concurrency=2)
+
+        decision = service.admit("me")
+
+        assert decision.admitted
+        assert decision.queue_wait_seconds == 100.0
+        assert decision.to_dict()["estimatedQueueWaitSeconds"] == 100
+
+    def test_refuses_when_backlog_full(self):
+        service = make_service([(pending_job("other"), 950.0)])
+
+        with pytest.raises(QueueFullError) as exc_info:
+            service.admit("me")
+
+        assert exc_info.value.error_code == "QUEUE_FULL"
+        assert exc_info.value.retry_after_seconds == 50
+
+    def test_karaoke_queue_requests_use_headroom(self):
+        service = make_service([(pending_job("other"), 950.0)])
+
+        assert service.check("me", for_karaoke_queue=True).admitted
+
+    def test_empty_backlog_always_admits(self):
+        service = make_service([], cost=5000.0)
+
+        assert service.check("me").admitted
+
+    def test_per_client_share(self):
+        service = make_service(
+            [(pending_job("me"), 350.0), (pending_job("other"), 100.0)]
+        )
+
+        decision = service.check("me")
+
+        assert not decision.admitted
+        assert decision.reason == "CLIENT_QUEUE_FULL"
+        assert service.check("other").admitted
+        assert service.check("me", for_karaoke_queue=True).admitted
+
+    def test_zero_limit_disables(self):
+        service = make_service([(pending_job("other"), 10**6)])
+        service.max_pending_seconds = 0
+
+        assert service.check("me").admitted
+
+
+def test_get_client_id_uses_the_remote_address():
+    request = SimpleNamespace(
+        headers={"X-Client-Id": "tablet-1", "X-Forwarded-For": "1.2.3.4"},
+        remote_addr="10.0.0.2",
+    )
+
+    assert get_client_id(request, trusted_proxies=0) == "10.0.0.2"
+
+
+def test_get_client_id_reads_forwarded_for_behind_trusted_proxies():
+    # The client forged the first entry; the proxy appended the real address
+    request = SimpleNamespace(
+        headers={"X-Forwarded-For": "6.6.6.6, 203.0.113.7"}, remote_addr="10.0.0.1"
+    )
+
+    assert get_client_id(request, trusted_proxies=1) == "203.0.113.7"
+    assert get_client_id(request, trusted_proxies=2) == "6.6.6.6"
+    assert get_client_id(request, trusted_proxies=3) == "10.0.0.1"
+
+
+def test_karaoke_queue_priority_comes_from_the_queue(get_db_session):
+    with get_db_session() as session:
+        session.add_all(
+            [
+                DbSong(id="song-1", title="Song"),
+                KaraokeQueueItem(song_id="song-1", singer_name="Ann", position=1),
+            ]
+        )
+        session.commit()
+
+    with patch("app.services.admission_service.get_db_session", get_db_session):
+        assert song_in_karaoke_queue("song-1")
+        assert not song_in_karaoke_queue("song-2")
@@ -0,0 +1,121 @@
+"""
+Tests for the append-only job event journal.
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+from app.repositories import JobEventRepository
+from app.services.job_journal import JobEventJournal, phase_spans
+
+
+@pytest.fixture
+def event_repository(get_db_session):
+    """JobEventRepository backed by an in-memory database"""
+    repo = JobEventRepository()
+    repo.get_db_session = get_db_session
+    return repo
+
+
+def job_data(job_id, status="processing", phase=None, progress=0):
+    return {"id": job_id, "status": status, "phase": phase, "progress": progress}
+
+
+class TestJobEventJournal:
+    """Test batching of journal writes."""
+
+    def test_append_only_queues_until_flushed(self, event_repository):
+        journal = JobEventJournal(event_repository, batch_size=2)
+
+        journal.append(1, "job_created", job_data("job1"))
+        journal.append(2, "job_updated", job_data("job1", progress=50))
+        journal.append(3, "job_created", job_data("job2"))
+        assert event_repository.get_job_events("job1") == []
+
+        assert journal.flush() == 3
+        events = event_repository.get_job_events("job1")
+        assert [(e.seq, e.event, e.progress) for e in events] == [
+            (1, "job_created", 0),
+            (2, "job_updated", 50),
+        ]
+        assert journal.get_metrics() == {"written": 3, "pending": 0, "dropped": 0}
+
+    def test_full_queue_drops_new_events(self, event_repository):
+        journal = JobEventJournal(event_repository, max_pending=1)
+
+        journal.append(1, "job_created", job_data("job1"))
+        journal.append(2, "job_updated", job_data("job1"))
+
+        assert journal.flush() == 1
+        assert journal.dropped == 1
+
+    def test_stop_writes_queued_events(self, event_repository):
+        journal = JobEventJournal(event_repository, flush_interval=60)
+        journal.start()
+        journal.append(1, "job_created", job_data("job1"))
+
+        journal.stop()
+
+        assert len(event_repository.get_job_events("job1")) == 1
+
+
+class TestJobEventRepository:
+    """Test catch-up reads and retention of journaled events."""
+
+    def test_latest_since_returns_newest_event_per_job(self, event_repository):
+        journal = JobEventJournal(event_repository)
+        journal.append(10, "job_created", job_data("job1"))
+        journal.append(11, "job_created", job_data("job2"))
+        journal.append(12, "job_updated", job_data("job1", progress=40))
+        journal.append(13, "job_completed", job_data("job2", status="completed"))
+        journal.flush()
+
+        assert event_repository.has_seq(11)
+        assert not event_repository.has_seq(9)
+        events = event_repository.latest_since(11, limit=10)
+        assert [(e.job_id, e.seq) for e in events] == [("job1", 12), ("job2", 13)]
+        assert event_repository.latest_since(11, limit=1) is None
+
+    def test_purge_before_removes_old_events(self, event_repository):
+        now = datetime(2024, 1, 10)
+        rows = [
+            {
+                "seq": seq,
+                "job_id": "job1",
+                "event": "job_updated",
+                "data": "{}",
+                "created_at": now - timedelta(days=days),
+            }
+            for seq, days in [(1, 20), (2, 15), (3, 1)]
+        ]
+        event_repository.append_many(rows)
+
+        assert event_repository.purge_before(now - timedelta(days=14)) == 2
+        assert [e.seq for e in event_repository.get_job_events("job1")] == [3]
+
+
+def test_phase_spans_from_journaled_events():
+    start = datetime(2024, 1, 1)
+
+    def event(seconds, phase, status="processing"):
+        return {
+            "created_at": start + timedelta(seconds=seconds),
+            "phase": phase,
+            "status": status,
+        }
+
+    spans = phase_spans(
+        [
+            event(0, None, "pending"),
+            event(5, "download"),
+            event(20, "download"),
+            event(35, "separation"),
+            event(95, "separation", "completed"),
+        ]
+    )
+
+    assert [(s["phase"], s["seconds"]) for s in spans] == [
+        ("download", 30.0),
+        ("separation", 60.0),
+    ]
+    assert spans[0]["started_at"] == start + timedelta(seconds=5)
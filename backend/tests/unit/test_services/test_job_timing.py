@@ -0,0 +1,162 @@
+"""
+Tests for job phase timing and the ETA predictor.
+"""
+
+import json
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+import pytest
+from app.db.models import Job, JobPhase, JobStatus
+from app.repositories import JobRepository
+from app.services.job_timing import (
+    DEFAULT_PHASE_ESTIMATES,
+    EtaPredictor,
+    JobPhaseTimer,
+)
+
+YOUTUBE_NOTES = json.dumps({"video_id": "abc123"})
+
+
+def timing(duration_seconds, song_duration_ms=None):
+    return SimpleNamespace(
+        duration_seconds=duration_seconds, song_duration_ms=song_duration_ms
+    )
+
+
+@pytest.fixture(autouse=True)
+def fresh_model():
+    EtaPredictor.invalidate()
+    yield
+    EtaPredictor.invalidate()
+
+
+@pytest.fixture
+def job_repository():
+    repo = Mock(spec=JobRepository)
+    repo.get_recent_phase_timings.return_value = []
+    repo.get_unfinished_jobs.return_value = []
+    return repo
+
+
+class TestJobPhaseTimer:
+    """Test recording of per-phase durations."""
+
+    def test_records_each_phase_when_next_starts(self, job_repository):
+        job = Job(id="job-1", filename="original.mp3", status=JobStatus.PROCESSING)
+        clock = Mock(side_effect=[10.0, 25.0, 85.0])
+        timer = JobPhaseTimer(job, job_repository, song_duration_ms=180000, clock=clock)
+
+        timer.start(JobPhase.DECODE)
+        timer.start("separation")
+        timer.finish()
+
+        recorded = [
+            (c.kwargs["phase"], c.kwargs["duration_seconds"])
+            for c in job_repository.record_phase_timing.call_args_list
+        ]
+        assert recorded == [("decode", 15.0), ("separation", 60.0)]
+        assert job.phase == "separation"
+        assert job_repository.update.call_count == 2
+
+    def test_finish_without_record_drops_partial_phase(self, job_repository):
+        job = Job(id="job-1", filename="original.mp3", status=JobStatus.PROCESSING)
+        timer = JobPhaseTimer(job, job_repository, clock=Mock(return_value=1.0))
+
+        timer.start(JobPhase.SEPARATION)
+        timer.finish(record=False)
+
+        job_repository.record_phase_timing.assert_not_called()
+
+    def test_record_queue_wait_uses_created_at(self, job_repository):
+        created = datetime.now(timezone.utc) - timedelta(seconds=30)
+        job = Job(
+            id="job-1",
+            filename="original.mp3",
+            status=JobStatus.PENDING,
+            created_at=created.replace(tzinfo=None),  # As read back from SQLite
+        )
+        JobPhaseTimer(job, job_repository).record_queue_wait()
+
+        kwargs = job_repository.record_phase_timing.call_args.kwargs
+        assert kwargs["phase"] == "queue_wait"
+        assert 29 <= kwargs["duration_seconds"] < 60
+
+
+class TestEtaPredictor:
+    """Test the history-based completion estimates."""
+
+    def test_phase_model_uses_median_per_audio_second(self, job_repository):
+        def history(phase, limit=20, host=None):
+            if phase == "separation":
+                return [timing(100, 100000), timing(300, 100000), timing(200, 100000)]
+            if phase == "thumbnail":
+                return [timing(4), timing(6)]
+            return []
+
+        job_repository.get_recent_phase_timings.side_effect = history
+        predictor = EtaPredictor(job_repository, concurrency=1)
+
+        assert predictor.phase_seconds(JobPhase.SEPARATION, 200000) == 400.0
+        assert predictor.phase_seconds(JobPhase.THUMBNAIL, 200000) == 5.0
+        assert predictor.phase_seconds(JobPhase.DECODE, 100000) == pytest.approx(
+            DEFAULT_PHASE_ESTIMATES[JobPhase.DECODE] * 100
+        )
+
+    def test_remaining_subtracts_elapsed_time_in_current_phase(self, job_repository):
+        predictor = EtaPredictor(job_repository, concurrency=1)
+        now = datetime.now(timezone.utc)
+        job_data = {
+            "status": "processing",
+            "notes": YOUTUBE_NOTES,
+            "phase": "separation",
+            "phase_started_at": (now - timedelta(seconds=60)).isoformat(),
+        }
+
+        remaining = predictor.remaining_seconds(job_data, 100000, now)
+
+        # 100s separation - 60s elapsed + encode, thumbnail and finalize
+        expected = 40 + 0.05 * 100 + 2.0 + 1.0
+        assert remaining == pytest.approx(expected)
+
+    def test_annotate_adds_queue_wait_behind_running_job(self, job_repository):
+        now = datetime.now(timezone.utc)
+        running = Job(
+            id="running",
+            filename="original.mp3",
+            status=JobStatus.PROCESSING,
+            song_id="song-1",
+            notes=YOUTUBE_NOTES,
+            created_at=now - timedelta(minutes=5),
+            phase="separation",
+            phase_started_at=now,
+        )
+        pending = Job(
+            id="pending",
+            filename="original.mp3",
+            status=JobStatus.PENDING,
+            song_id="song-2",
+            notes=YOUTUBE_NOTES,
+            created_at=now - timedelta(minutes=1),
+        )
+        done = Job(id="done", filename="original.mp3", status=JobStatus.COMPLETED)
+        job_repository.get_unfinished_jobs.return_value = [running, pending]
+        predictor = EtaPredictor(job_repository, concurrency=1)
+
+        with patch.object(
+            EtaPredictor,
+            "_song_durations",
+            return_value={"song-1": 100000, "song-2": 100000},
+        ):
+            result = predictor.annotate(
+                [pending.to_dict(), running.to_dict(), done.to_dict()]
+            )
+
+        pending_data, running_data, done_data = result
+        assert running_data["queue_wait_seconds"] == 0
+        assert pending_data["queue_wait_seconds"] == pytest.approx(
+            running_data["estimated_remaining_seconds"], abs=1
+        )
+        assert "expected_completion" in pending_data
+        assert "expected_completion" not in done_data
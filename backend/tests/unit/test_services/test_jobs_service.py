@@ -5,12 +5,14 @@ This module verifies that the JobsService correctly implements the business logi
 that was extracted from the API controllers.
 """
 
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from unittest.mock import Mock, patch
 
-from app.db.models import Job, JobStatus
+import pytest
+from app.db.models import DbJob, Job, JobStatus
 from app.repositories import JobRepository
+from app.repositories.job_repository import _transition_status
 from app.services.jobs_service import JobsService
 
 
@@ -29,42 +31,22 @@ class TestJobsService:
         service = JobsService(job_repository=mock_job_store)
         assert service.job_repository is mock_job_store
 
-    def test_get_all_jobs_sorting(self):
-        """Test that get_all_jobs returns jobs sorted by creation time."""
+    def test_get_all_jobs_keeps_repository_order(self):
+        """Test that get_all_jobs returns jobs as sorted by the database."""
         mock_job_store = Mock(spec=JobRepository)
-
-        # Create mock jobs with different creation times
-        job1 = Job(
-            id="job1",
-            filename="test1.mp3",
-            status=JobStatus.PENDING,
-            created_at=datetime(2023, 1, 1, tzinfo=timezone.utc),
-        )
-        job2 = Job(
-            id="job2",
-            filename="test2.mp3",
-            status=JobStatus.PENDING,
-            created_at=datetime(2023, 1, 2, tzinfo=timezone.utc),
-        )
-        job3 = Job(
-            id="job3",
-            filename="test3.mp3",
-            status=JobStatus.PENDING,
-            created_at=datetime(2022, 12, 31, tzinfo=timezone.utc),  # Older date
-        )
-
-        # Mock both methods that could be called
-        mock_job_store.get_active_jobs.return_value = [job1, job3, job2]
-        mock_job_store.get_all_jobs.return_value = [job1, job3, job2]
+        jobs = [
+            Job(id=f"job{i}", filename=f"test{i}.mp3", status=JobStatus.PENDING)
+            for i in range(3)
+        ]
+        mock_job_store.get_active_jobs.return_value = jobs
+        mock_job_store.get_all_jobs.return_value = jobs
 
         service = JobsService(job_repository=mock_job_store)
-        result = service.get_all_jobs()
 
-        # Should be sorted newest first
-        assert len(result) == 3
-        assert result[0].id == "job2"  # Most recent (2023-01-02)
-        assert result[1].id == "job1"  # Older (2023-01-01)
-        assert result[2].id == "job3"  # Oldest (2022-12-31)  # Oldest (2022-12-31)
+        assert service.get_all_jobs() == jobs
+        mock_job_store.get_active_jobs.assert_called_once_with()
+        assert service.get_all_jobs(include_dismissed=True) == jobs
+        mock_job_store.get_all_jobs.assert_called_once_with()
 
     def test_get_job_with_details_completed_job(self):
         """Test that get_job_with_details adds file paths for completed jobs."""
@@ -165,3 +147,146 @@ class TestJobsService:
 
         assert result == expected_stats
         mock_job_store.get_stats.assert_called_once()
+
+
+@pytest.fixture
+def job_repository(get_db_session):
+    """JobRepository backed by an in-memory database"""
+    repo = JobRepository()
+    repo.get_db_session = get_db_session
+    return repo
+
+
+class TestJobPagination:
+    """Test SQL-side filtering and keyset pagination of jobs."""
+
+    @pytest.fixture
+    def jobs(self, job_repository):
+        start = datetime(2024, 1, 1)
+        statuses = [JobStatus.PENDING, JobStatus.COMPLETED, JobStatus.FAILED]
+        minutes = [0, 1, 2, 3, 3, 4, 5]  # job3 and job4 share a timestamp
+        with job_repository.get_db_session() as session:
+            for i in range(7):
+                session.add(
+                    DbJob.from_job(
+                        Job(
+                            id=f"job{i}",
+                            filename="test.mp3",
+                            status=statuses[i % 3],
+                            created_at=start + timedelta(minutes=minutes[i]),
+                            dismissed=i == 6,
+                        )
+                    )
+                )
+            session.commit()
+        return job_repository
+
+    def collect_pages(self, repo, **kwargs):
+        pages = []
+        cursor = None
+        while True:
+            jobs, cursor = repo.list_jobs(cursor=cursor, **kwargs)
+            pages.append([job.id for job in jobs])
+            if cursor is None:
+                return pages
+
+    def test_pages_are_newest_first_and_disjoint(self, jobs):
+        pages = self.collect_pages(jobs, dismissed=False, limit=2)
+
+        assert pages == [["job5", "job4"], ["job3", "job2"], ["job1", "job0"]]
+
+    def test_status_filter(self, jobs):
+        pages = self.collect_pages(
+            jobs, statuses=[JobStatus.PENDING, JobStatus.FAILED], limit=10
+        )
+
+        assert pages == [["job6", "job5", "job3", "job2", "job0"]]
+
+    def test_invalid_cursor(self, jobs):
+        with pytest.raises(ValueError):
+            jobs.list_jobs(cursor="not-a-cursor")
+
+    def test_service_applies_default_page_size(self, jobs, patch_config):
+        patch_config.JOBS_PAGE_SIZE = 4
+        patch_config.JOBS_MAX_PAGE_SIZE = 5
+
+        with patch("app.services.jobs_service.get_config", return_value=patch_config):
+            service = JobsService(job_repository=jobs)
+            first, cursor = service.list_jobs()
+            everything, _ = service.list_jobs(include_dismissed=True, limit=100)
+
+        assert [job.id for job in first] == ["job5", "job4", "job3", "job2"]
+        assert cursor is not None
+        assert len(everything) == 5
+
+
+class TestJobStatistics:
+    """Test the maintained job status counters."""
+
+    def test_counters_follow_transitions(self, job_repository):
+        with job_repository.get_db_session() as session:
+            # Rows from before the counters existed are counted by the seed
+            session.add(
+                DbJob.from_job(
+                    Job(id="old", filename="a.mp3", status=JobStatus.COMPLETED)
+                )
+            )
+            session.commit()
+        assert job_repository.get_stats()["completed_jobs"] == 1
+
+        job = Job(id="new", filename="b.mp3", status=JobStatus.PENDING)
+        job_repository.create(job)
+        assert job_repository.get_stats()["queue_length"] == 1
+
+        job.status = JobStatus.FAILED
+        job_repository.update(job)
+        stats = job_repository.get_stats()
+        assert stats["queue_length"] == 0
+        assert stats["failed_jobs"] == stats["raw_failed"] == 1
+        assert stats["total"] == 2
+
+        job_repository.delete_job("old")
+        assert job_repository.get_stats()["completed_jobs"] == 0
+
+    @pytest.mark.parametrize("new_status", ["failed", "completed", None])
+    def test_transition_from_a_stale_status_counts_once(
+        self, job_repository, new_status
+    ):
+        job = Job(id="job", filename="a.mp3", status=JobStatus.PENDING)
+        job_repository.create(job)
+        assert job_repository.get_stats()["queue_length"] == 1
+        job.status = JobStatus.PROCESSING
+        job_repository.update(job)
+
+        # A second writer that read the job while it was still pending
+        with job_repository.get_db_session() as session:
+            _transition_status(session, "job", "pending", new_status)
+            session.commit()
+
+        assert job_repository.reconcile_stats() == {}
+
+    def test_repeated_transition_counts_once(self, job_repository):
+        job = Job(id="job", filename="a.mp3", status=JobStatus.PROCESSING)
+        job_repository.create(job)
+        job.status = JobStatus.COMPLETED
+        job_repository.update(job)
+
+        with job_repository.get_db_session() as session:
+            _transition_status(session, "job", "processing", "completed")
+            session.commit()
+
+        assert job_repository.reconcile_stats() == {}
+
+    def test_reconcile_corrects_drift(self, job_repository):
+        job_repository.create(
+            Job(id="job", filename="a.mp3", status=JobStatus.PROCESSING)
+        )
+        assert job_repository.reconcile_stats() == {}
+
+        with job_repository.get_db_session() as session:
+            session.query(DbJob).delete()
+            session.commit()
+
+        assert job_repository.get_stats()["active_jobs"] == 1
+        assert job_repository.reconcile_stats() == {"processing": -1}
+        assert job_repository.get_stats()["active_jobs"] == 0
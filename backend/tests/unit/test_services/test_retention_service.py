@@ -0,0 +1,174 @@
+"""
+Tests for job retention and database compaction.
+"""
+
+import os
+import time
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+import pytest
+from app.db.database import compact_database
+from app.db.models import DbJob, DbJobArchive, Job, JobStatus
+from app.repositories import JobEventRepository, JobRepository
+from app.services.jobs_service import JobsService
+from app.services.retention_service import RetentionService
+from sqlalchemy import create_engine
+
+
+@pytest.fixture
+def job_repository(get_db_session):
+    repo = JobRepository()
+    repo.get_db_session = get_db_session
+    return repo
+
+
+def add_job(repo, job_id, status, age_days):
+    ended = datetime.now(timezone.utc) - timedelta(days=age_days)
+    with repo.get_db_session() as session:
+        session.add(
+            DbJob.from_job(
+                Job(
+                    id=job_id,
+                    filename="original.mp3",
+                    status=status,
+                    task_id=f"task-{job_id}",
+                    created_at=ended,
+                    completed_at=ended if status != JobStatus.PENDING else None,
+                )
+            )
+        )
+        session.commit()
+
+
+class TestPurgeTerminalJobs:
+    """Test removal of expired jobs."""
+
+    @pytest.mark.parametrize("archive", [True, False])
+    def test_only_old_finished_jobs_are_removed(self, job_repository, archive):
+        add_job(job_repository, "old-done", JobStatus.COMPLETED, 40)
+        add_job(job_repository, "old-failed", JobStatus.FAILED, 40)
+        add_job(job_repository, "old-pending", JobStatus.PENDING, 40)
+        add_job(job_repository, "new-done", JobStatus.COMPLETED, 1)
+        cutoff = datetime.now(timezone.utc) - timedelta(days=30)
+
+        task_ids = job_repository.purge_terminal_jobs(
+            cutoff, archive=archive, batch_size=1
+        )
+
+        assert sorted(task_ids) == ["task-old-done", "task-old-failed"]
+        with job_repository.get_db_session() as session:
+            remaining = {job_id for (job_id,) in session.query(DbJob.id)}
+            archived = {job_id for (job_id,) in session.query(DbJobArchive.id)}
+        assert remaining == {"old-pending", "new-done"}
+        assert archived == ({"old-done", "old-failed"} if archive else set())
+
+    def test_end_times_compare_in_utc(self, job_repository, monkeypatch):
+        # Twelve hours behind UTC, a local end time would already look stale
+        monkeypatch.setenv("TZ", "Etc/GMT+12")
+        time.tzset()
+        try:
+            job_repository.create(
+                Job(id="just-cancelled", filename="a.mp3", status=JobStatus.PENDING)
+            )
+            JobsService(job_repository=job_repository).cancel_job("just-cancelled")
+        finally:
+            monkeypatch.undo()
+            time.tzset()
+
+        cutoff = datetime.now(timezone.utc) - timedelta(hours=1)
+        assert job_repository.purge_terminal_jobs(cutoff) == []
+
+
+class TestRetentionService:
+    """Test the individual retention steps."""
+
+    def test_purge_temp_files_by_age(self, tmp_path):
+        stale = tmp_path / "job-1" / "partial.webm"
+        stale.parent.mkdir()
+        stale.write_bytes(b"x" * 100)
+        fresh = tmp_path / "current.part"
+        fresh.write_bytes(b"y" * 10)
+        old = time.time() - 3 * 3600
+        os.utime(stale, (old, old))
+
+        files, size = RetentionService.purge_temp_files(tmp_path, timedelta(hours=1))
+
+        assert (files, size) == (1, 100)
+        assert fresh.exists()
+        assert not stale.exists()
+
+    def test_purge_temp_files_keeps_unfinished_jobs(self, tmp_path):
+        running = tmp_path / "job-2" / "vocals.wav"
+        running.parent.mkdir()
+        running.write_bytes(b"x" * 100)
+        queued = tmp_path / "song-3.webm.part"
+        queued.write_bytes(b"y" * 10)
+        old = time.time() - 3 * 3600
+        for path in (running, running.parent, queued):
+            os.utime(path, (old, old))
+
+        files, _ = RetentionService.purge_temp_files(
+            tmp_path, timedelta(hours=1), keep={"job-2", "song-3"}
+        )
+
+        assert files == 0
+        assert running.exists()
+        assert queued.exists()
+
+    def test_unfinished_job_keys(self):
+        repo = Mock(spec=JobRepository)
+        repo.get_unfinished_jobs.return_value = [
+            Job(
+                id="job-2",
+                filename="a.mp3",
+                status=JobStatus.PROCESSING,
+                song_id="song-2",
+                task_id="task-2",
+            ),
+            Job(id="job-3", filename="b.mp3", status=JobStatus.PENDING),
+        ]
+        service = RetentionService(repo, config=SimpleNamespace())
+
+        assert service.unfinished_job_keys() == {"job-2", "song-2", "task-2", "job-3"}
+
+    def test_run_forgets_results_of_removed_jobs(self, tmp_path):
+        repo = Mock(spec=JobRepository)
+        repo.purge_terminal_jobs.return_value = ["task-1", None, "task-2"]
+        repo.reconcile_stats.return_value = {"completed": -3}
+        repo.get_unfinished_jobs.return_value = []
+        celery_app = Mock()
+        config = SimpleNamespace(
+            JOB_RETENTION_DAYS=30,
+            JOB_RETENTION_ARCHIVE=False,
+            TEMP_DIR=tmp_path,
+            TEMP_FILE_MAX_AGE_HOURS=24,
+            JOB_EVENT_RETENTION_DAYS=14,
+        )
+        event_repo = Mock(spec=JobEventRepository)
+        event_repo.purge_before.return_value = 120
+
+        with patch.object(RetentionService, "compact", return_value=4096):
+            report = RetentionService(repo, celery_app, config, event_repo).run()
+
+        assert report["jobs_removed"] == 3
+        assert report["jobs_archived"] == 0
+        assert report["results_forgotten"] == 2
+        assert report["db_bytes_reclaimed"] == 4096
+        assert report["stats_corrections"] == 1
+        assert report["events_removed"] == 120
+        assert celery_app.backend.forget.call_count == 2
+
+
+def test_compact_database_reports_reclaimed_bytes(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'compact.db'}")
+    with engine.begin() as connection:
+        connection.exec_driver_sql("CREATE TABLE blobs (data BLOB)")
+        for _ in range(50):
+            connection.exec_driver_sql("INSERT INTO blobs VALUES (?)", (b"\0" * 8192,))
+    with engine.begin() as connection:
+        connection.exec_driver_sql("DELETE FROM blobs")
+
+    assert compact_database(engine) > 50 * 4096
+    assert compact_database(engine) == 0
@@ -0,0 +1,101 @@
+"""
+Bulk Import Tests
+
+Tests for importing many videos under one parent job.
+"""
+
+import json
+from unittest.mock import patch
+
+import pytest
+from app.db.models import DbJob, DbSong, JobStatus
+from app.jobs.celery_app import celery
+from app.repositories import JobRepository
+from sqlalchemy.orm import sessionmaker
+
+
+@pytest.fixture
+def session_factory(memory_engine, get_db_session):
+    with patch("app.db.database.get_db_session", get_db_session):
+        yield sessionmaker(bind=memory_engine)
+
+
+@pytest.fixture
+def send_task():
+    with patch.object(celery, "send_task") as mock:
+        yield mock
+
+
+class TestBulkImport:
+    """Test import_videos_async and parent job aggregation"""
+
+    def test_creates_rows_and_staggers_tasks(
+        self, youtube_service, session_factory, send_task, patch_config
+    ):
+        patch_config.BULK_IMPORT_RATE_PER_MINUTE = 6
+        session = session_factory()
+        session.add(DbSong(id="existing", title="Old", artist="A", video_id="vid0"))
+        session.commit()
+
+        result = youtube_service.import_videos_async(
+            [
+                {"video_id": "vid0"},
+                {"video_id": "vid1", "title": "One", "duration_ms": 1000},
+                {"video_id": "vid2"},
+                {"video_id": "vid1"},
+            ],
+            client_id="tablet-1",
+        )
+
+        assert result["skipped"] == [{"videoId": "vid0", "songId": "existing"}]
+        assert [job["videoId"] for job in result["jobs"]] == ["vid1", "vid2"]
+        assert session.query(DbSong).count() == 3
+        children = (
+            session.query(DbJob)
+            .filter(DbJob.parent_job_id == result["parentJobId"])
+            .all()
+        )
+        assert len(children) == 2
+        assert all(json.loads(c.notes)["client_id"] == "tablet-1" for c in children)
+
+        countdowns = [c.kwargs["countdown"] for c in send_task.call_args_list]
+        assert countdowns == [0.0, 10.0]
+        task_ids = {c.kwargs["task_id"] for c in send_task.call_args_list}
+        assert task_ids == {c.task_id for c in children}
+
+    def test_nothing_new_creates_no_parent(
+        self, youtube_service, session_factory, send_task
+    ):
+        session = session_factory()
+        session.add(DbSong(id="existing", title="Old", artist="A", video_id="vid0"))
+        session.commit()
+
+        result = youtube_service.import_videos_async([{"video_id": "vid0"}])
+
+        assert result["parentJobId"] is None
+        assert session.query(DbJob).count() == 0
+        send_task.assert_not_called()
+
+    def test_parent_progress_follows_children(
+        self, youtube_service, session_factory, send_task, patch_config
+    ):
+        patch_config.BULK_IMPORT_RATE_PER_MINUTE = 0
+        result = youtube_service.import_videos_async(
+            [{"video_id": "vid1"}, {"video_id": "vid2"}]
+        )
+        job_repository = JobRepository()
+        first, second = job_repository.get_child_jobs(result["parentJobId"])
+
+        first.status = JobStatus.COMPLETED
+        first.progress = 100
+        job_repository.update(first)
+        parent = job_repository.get_job(result["parentJobId"])
+        assert parent.status == JobStatus.PROCESSING
+        assert parent.progress == 50
+        assert parent.status_message == "1/2 imported"
+
+        second.status = JobStatus.FAILED
+        job_repository.update(second)
+        parent = job_repository.get_job(result["parentJobId"])
+        assert parent.status == JobStatus.COMPLETED
+        assert parent.status_message == "1/2 imported, 1 failed"
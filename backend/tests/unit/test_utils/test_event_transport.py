@@ -0,0 +1,198 @@
+"""
+Tests for relaying job events between processes over an event transport.
+"""
+
+import time
+from unittest.mock import patch
+
+import pytest
+from app.utils import event_transport, fast_json
+from app.utils.event_transport import (
+    FileEventTransport,
+    JobEventRelay,
+    start_event_relay,
+    stop_event_relay,
+)
+from app.utils.events import JobEvent, job_event_name
+
+
+class RecordingTransport:
+    """Keeps published messages instead of sending them."""
+
+    def __init__(self):
+        self.messages = []
+
+    def publish(self, message):
+        self.messages.append(fast_json.loads(message))
+
+    def close(self):
+        pass
+
+
+def job(job_id="job1", status="processing", progress=0, **fields):
+    return dict(
+        {"id": job_id, "status": status, "progress": progress, "title": "Song"},
+        **fields,
+    )
+
+
+@pytest.fixture
+def published():
+    return []
+
+
+@pytest.fixture
+def api_relay(published):
+    return JobEventRelay(
+        RecordingTransport(),
+        publish=lambda *args, **kwargs: published.append((args, kwargs)),
+        load_job=lambda job_id: None,
+    )
+
+
+class TestSending:
+    """Test batching and delta encoding of outgoing job events."""
+
+    def test_batches_only_changed_fields(self):
+        transport = RecordingTransport()
+        relay = JobEventRelay(transport)
+
+        relay.handle(JobEvent("job1", job(status="pending"), was_created=True))
+        relay.flush()
+        relay.handle(JobEvent("job1", job(status="pending", progress=10)))
+        relay.handle(JobEvent("job1", job(status="pending", progress=20)))
+        relay.handle(JobEvent("job2", job("job2"), was_created=True))
+        relay.flush()
+
+        first, second = transport.messages
+        assert first["events"] == [
+            {
+                "id": "job1",
+                "data": job(status="pending"),
+                "full": True,
+                "created": True,
+            }
+        ]
+        # Two updates of job1 coalesced into one delta, job2 sent in full
+        assert second["events"] == [
+            {"id": "job1", "data": {"progress": 20}, "full": False, "created": False},
+            {"id": "job2", "data": job("job2"), "full": True, "created": True},
+        ]
+
+    def test_status_change_is_sent_in_full(self):
+        transport = RecordingTransport()
+        relay = JobEventRelay(transport)
+
+        relay.handle(JobEvent("job1", job(), was_created=True))
+        relay.flush()
+        relay.handle(JobEvent("job1", job(status="completed", progress=100)))
+        relay.flush()
+
+        assert transport.messages[1]["events"][0]["full"] is True
+
+    def test_creation_and_failure_in_one_batch_stay_separate(
+        self, api_relay, published
+    ):
+        transport = RecordingTransport()
+        relay = JobEventRelay(transport)
+
+        relay.handle(JobEvent("job1", job(status="pending"), was_created=True))
+        relay.handle(JobEvent("job1", job(status="failed", error="No worker")))
+        relay.flush()
+        api_relay.receive(fast_json.dumps(transport.messages[0]))
+
+        assert [entry["created"] for entry in transport.messages[0]["events"]] == [
+            True,
+            False,
+        ]
+        assert [
+            job_event_name(job_data, created) for (_, job_data, created), _ in published
+        ] == ["job_created", "job_failed"]
+
+    def test_remote_events_are_not_sent_back(self):
+        transport = RecordingTransport()
+        relay = JobEventRelay(transport)
+
+        relay.handle(JobEvent("job1", job(), remote=True))
+
+        assert relay.flush() == 0
+        assert transport.messages == []
+
+
+class TestReceiving:
+    """Test rebuilding job state from received batches."""
+
+    def message(self, origin, *events):
+        return fast_json.dumps({"origin": origin, "events": list(events)})
+
+    def test_applies_deltas_to_full_state(self, api_relay, published):
+        api_relay.receive(
+            self.message(
+                "worker", {"id": "job1", "data": job(), "full": True, "created": True}
+            )
+        )
+        api_relay.receive(
+            self.message(
+                "worker",
+                {"id": "job1", "data": {"progress": 40}, "full": False},
+            )
+        )
+
+        assert published == [
+            (("job1", job(), True), {"remote": True}),
+            (("job1", job(progress=40), False), {"remote": True}),
+        ]
+
+    def test_unknown_job_delta_loads_state(self, published):
+        relay = JobEventRelay(
+            RecordingTransport(),
+            publish=lambda *args, **kwargs: published.append(args),
+            load_job=lambda job_id: job(job_id, progress=30),
+        )
+
+        relay.receive(self.message("worker", {"id": "job1", "data": {"progress": 50}}))
+
+        assert published == [("job1", job(progress=50), False)]
+
+    def test_ignores_own_messages(self, api_relay, published):
+        api_relay.receive(
+            self.message(api_relay.origin, {"id": "job1", "data": job(), "full": True})
+        )
+
+        assert published == []
+
+
+def test_file_transport_delivers_across_instances(tmp_path):
+    path = str(tmp_path / "events.ndjson")
+    publisher = FileEventTransport(path)
+    listener = FileEventTransport(path, poll_interval=0.01)
+    received = []
+    publisher.publish("before listening")
+    listener.listen(received.append)
+
+    publisher.publish('{"n": 1}')
+    publisher.publish('{"n": 2}')
+    deadline = time.monotonic() + 2
+    while len(received) < 2 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    listener.close()
+
+    assert received == ['{"n": 1}', '{"n": 2}']
+
+
+def test_relay_without_a_running_thread_is_replaced(patch_config):
+    patch_config.EVENT_TRANSPORT_BATCH_MS = 100
+    # As a forked worker inherits it: the relay is set, its thread is not
+    inherited = JobEventRelay(RecordingTransport())
+    with patch.object(event_transport, "_relay", inherited), patch.object(
+        event_transport, "uses_event_transport", return_value=True
+    ), patch.object(
+        event_transport, "create_event_transport", side_effect=RecordingTransport
+    ):
+        relay = start_event_relay(receive=False)
+        try:
+            assert relay is not inherited
+            assert relay.is_alive()
+            assert start_event_relay(receive=False) is relay
+        finally:
+            stop_event_relay()
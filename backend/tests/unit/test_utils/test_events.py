@@ -0,0 +1,108 @@
+"""
+Tests for the event bus dispatch modes.
+"""
+
+import threading
+
+import pytest
+from app.utils.events import (
+    Event,
+    EventBus,
+    EventBusMetrics,
+    JobEvent,
+    event_bus,
+    job_event_name,
+)
+
+
+@pytest.fixture
+def bus():
+    """Event bus with only a recording handler subscribed"""
+    EventBus.metrics = EventBusMetrics()
+    saved = dict(EventBus._subscribers)
+    event_bus.clear_subscribers()
+    received = []
+    event_bus.subscribe("job_updated", received.append)
+    event_bus.subscribe("test_event", received.append)
+    yield received
+    event_bus.stop_async()
+    event_bus.clear_subscribers()
+    EventBus._subscribers.update(saved)
+
+
+class TestAsyncDispatch:
+    """Test queued dispatch on the background thread."""
+
+    def test_handlers_run_off_the_publishing_thread(self, bus):
+        threads = []
+        event_bus.subscribe(
+            "test_event", lambda _: threads.append(threading.get_ident())
+        )
+        try:
+            event_bus.start_async(coalesce_window=0)
+            event_bus.publish(Event("test_event", {}))
+            assert event_bus.flush()
+        finally:
+            event_bus.clear_subscribers("test_event")
+            event_bus.subscribe("test_event", bus.append)
+
+        assert len(bus) == 1
+        assert threads and threads[0] != threading.get_ident()
+
+    def test_updates_to_one_job_are_coalesced(self, bus):
+        event_bus.start_async(coalesce_window=0.2)
+        event_bus.publish(JobEvent("job1", {"progress": 0}, was_created=True))
+        for progress in (10, 20, 30):
+            event_bus.publish(JobEvent("job1", {"progress": progress}))
+        event_bus.publish(JobEvent("job2", {"progress": 5}))
+        assert event_bus.flush()
+
+        assert [(e.job_id, e.job_data["progress"], e.was_created) for e in bus] == [
+            ("job1", 30, True),
+            ("job2", 5, False),
+        ]
+        metrics = event_bus.get_metrics()
+        assert metrics["published"] == 5
+        assert metrics["coalesced"] == 3
+        assert metrics["dispatched"] == 2
+        assert metrics["handler_calls"] == 2
+
+    def test_status_changes_are_not_coalesced(self, bus):
+        event_bus.start_async(coalesce_window=0.2)
+        event_bus.publish(JobEvent("job1", {"status": "pending"}, was_created=True))
+        event_bus.publish(JobEvent("job1", {"status": "failed", "progress": 0}))
+        event_bus.publish(JobEvent("job1", {"status": "failed", "progress": 1}))
+        assert event_bus.flush()
+
+        assert [job_event_name(event.job_data, event.was_created) for event in bus] == [
+            "job_created",
+            "job_failed",
+        ]
+        assert bus[-1].job_data["progress"] == 1
+
+    def test_full_queue_drops_new_events(self, bus):
+        release = threading.Event()
+        event_bus.subscribe("blocking", lambda _: release.wait(5))
+        try:
+            event_bus.start_async(coalesce_window=0, max_queue=2)
+            event_bus.publish(Event("blocking", {}))
+            # Wait until the dispatcher is busy with the blocking event
+            while event_bus.get_metrics()["dispatched"] == 0:
+                pass
+            for _ in range(3):
+                event_bus.publish(Event("test_event", {}))
+            assert event_bus.get_metrics()["queue_depth"] == 2
+            release.set()
+            assert event_bus.flush()
+        finally:
+            release.set()
+            event_bus.clear_subscribers("blocking")
+
+        assert len(bus) == 2
+        assert event_bus.get_metrics()["dropped"] == 1
+
+    def test_sync_mode_dispatches_inline(self, bus):
+        event_bus.publish(Event("test_event", {}))
+
+        assert len(bus) == 1
+        assert event_bus.get_metrics()["mode"] == "sync"
@@ -0,0 +1,165 @@
+"""
+Tests for per-request SQL statistics and query budgets.
+"""
+
+from unittest.mock import patch
+
+import pytest
+from app.api.songs import song_bp
+from app.db.models import DbSong
+from app.utils.error_handlers import register_error_handlers
+from app.utils.query_stats import (
+    QueryBudgetExceeded,
+    collect_query_stats,
+    install_query_stats,
+    query_budget,
+    register_query_stats,
+    statement_shape,
+)
+from flask import Flask, jsonify
+from sqlalchemy import text
+from sqlalchemy.orm import sessionmaker
+from tests.utils.db_utils import create_shared_memory_engine, session_scope
+
+
+def make_engine(songs):
+    engine = create_shared_memory_engine()
+    with sessionmaker(bind=engine)() as session:
+        session.add_all(
+            DbSong(
+                id=f"song-{i:03d}",
+                title=f"Song {i}",
+                artist=f"Artist {i % 25}",
+                plain_lyrics="la la",
+                description="A video",
+            )
+            for i in range(songs)
+        )
+        session.commit()
+    install_query_stats(engine)
+    return engine
+
+
+def make_client(engine, enforce=True):
+    get_db_session = session_scope(engine)
+    app = Flask(__name__)
+    app.config.update(
+        TESTING=True, SQL_QUERY_BUDGET_ENFORCE=enforce, SQL_STATS_REPEAT_WARN=10
+    )
+    register_error_handlers(app)
+    app.register_blueprint(song_bp)
+    register_query_stats(app)
+
+    @app.route("/per-song")
+    @query_budget(2)
+    def per_song():
+        with get_db_session() as session:
+            ids = [row.id for row in session.query(DbSong.id)]
+            titles = [session.get(DbSong, song_id).title for song_id in ids]
+        return jsonify(titles)
+
+    return app, get_db_session
+
+
+@pytest.fixture
+def client():
+    engine = make_engine(100)
+    app, get_db_session = make_client(engine)
+    with patch("app.api.songs.core.get_db_session", get_db_session), patch(
+        "app.api.songs.artists.get_db_session", get_db_session
+    ), patch("app.api.songs.search.get_db_session", get_db_session), patch(
+        "app.utils.library_cache.get_db_session", get_db_session
+    ):
+        yield app.test_client()
+    engine.dispose()
+
+
+def test_shape_collapses_whitespace_and_in_lists():
+    assert statement_shape("SELECT *\n  FROM songs WHERE id IN (?, ?, ?)") == (
+        statement_shape("SELECT * FROM songs WHERE id IN (?, ?)")
+    )
+    assert statement_shape("SELECT * FROM songs WHERE id IN (?, ?)") == (
+        "SELECT * FROM songs WHERE id IN (?)"
+    )
+
+
+def test_collects_only_inside_the_block():
+    engine = make_engine(0)
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+        with collect_query_stats() as stats:
+            for _ in range(3):
+                connection.execute(text("SELECT 1"))
+        connection.execute(text("SELECT 1"))
+    engine.dispose()
+
+    assert stats.count == 3
+    assert stats.seconds > 0
+    assert stats.repeated() == {"SELECT 1": 3}
+
+
+def test_response_reports_queries(client):
+    response = client.get("/api/songs/song-001")
+
+    assert response.status_code == 200
+    assert response.headers["X-SQL-Queries"] == "3"
+    assert response.headers["X-SQL-Repeated"] == "1"
+    assert response.headers["Server-Timing"].startswith("db;dur=")
+    assert response.headers["Server-Timing"].endswith('desc="3 queries"')
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "/api/songs",
+        "/api/songs?cursor=",
+        "/api/songs/song-001",
+        "/api/songs/search?q=Song",
+        "/api/songs/search?q=Song&group_by_artist=true",
+        "/api/songs/artists",
+        "/api/songs/artists/letters",
+        "/api/songs/by-artist/Artist%201",
+    ],
+)
+def test_song_endpoints_stay_within_their_budgets(client, url):
+    # Budgets are enforced: a request over budget raises instead of answering
+    response = client.get(url)
+
+    assert response.status_code == 200
+    assert int(response.headers["X-SQL-Repeated"]) == 1
+
+
+def test_group_by_artist_lists_songs_of_each_artist(client):
+    response = client.get(
+        "/api/songs/search?q=Song&group_by_artist=true&limit=3&fields=id,artist"
+    )
+
+    artists = response.get_json()["artists"]
+    assert [artist["artist"] for artist in artists] == [
+        "Artist 0",
+        "Artist 1",
+        "Artist 10",
+    ]
+    assert [artist["songCount"] for artist in artists] == [4, 4, 4]
+    assert artists[0]["songs"] == [
+        {"id": f"song-{i:03d}", "artist": "Artist 0"} for i in (0, 25, 50, 75)
+    ]
+
+
+def test_request_over_budget_fails(client):
+    with pytest.raises(QueryBudgetExceeded, match="ran 101 SQL statements"):
+        client.get("/per-song")
+
+
+def test_request_over_budget_is_logged_without_enforcement(caplog):
+    engine = make_engine(20)
+    app, _ = make_client(engine, enforce=False)
+
+    response = app.test_client().get("/per-song")
+    engine.dispose()
+
+    assert response.status_code == 200
+    assert response.headers["X-SQL-Repeated"] == "20"
+    messages = [record.getMessage() for record in caplog.records]
+    assert any("ran the same query 20 times" in message for message in messages)
+    assert any("over its budget of 2" in message for message in messages)
@@ -0,0 +1,67 @@
+"""
+Tests for the sequenced job event stream.
+"""
+
+from app.websockets.job_stream import JobEventStream
+
+
+def job(status="processing", progress=0, **extra):
+    return {
+        "id": "job1",
+        "status": status,
+        "progress": progress,
+        "title": "Song",
+        **extra,
+    }
+
+
+class TestJobEventStream:
+    """Test sequencing, deltas and resume."""
+
+    def test_first_event_is_full_then_deltas(self):
+        stream = JobEventStream()
+        start = stream.seq
+
+        first = stream.record("job_created", job(eta=30))
+        second = stream.record("job_updated", job(progress=50, eta=10))
+        third = stream.record("job_completed", job(status="completed", progress=100))
+
+        assert first == dict(job(eta=30), full=True, seq=start + 1)
+        assert second == {
+            "id": "job1",
+            "status": "processing",
+            "progress": 50,
+            "eta": 10,
+            "seq": start + 2,
+        }
+        assert third == {
+            "id": "job1",
+            "status": "completed",
+            "progress": 100,
+            "eta": None,
+            "seq": start + 3,
+        }
+
+    def test_since_returns_missed_events(self):
+        stream = JobEventStream()
+        start = stream.seq
+        for progress in (10, 20, 30):
+            stream.record("job_updated", job(progress=progress))
+
+        missed = stream.since(start + 1)
+
+        assert [seq for seq, _, _ in missed] == [start + 2, start + 3]
+        assert missed[-1][2]["progress"] == 30
+        assert stream.since(stream.seq) == []
+
+    def test_evicted_gap_needs_snapshot(self):
+        stream = JobEventStream(capacity=2)
+        start = stream.seq
+        for progress in (10, 20, 30):
+            stream.record("job_updated", job(progress=progress))
+
+        assert stream.since(start) is None
+        assert len(stream.since(start + 1)) == 2
+        # A sequence number from an earlier process or another stream
+        assert stream.since(start - 5) is None
+        assert stream.since(stream.seq + 1) is None
@@ -0,0 +1,163 @@
+"""
+Tests for per-job broadcast throttling.
+"""
+
+import threading
+import time
+
+import pytest
+from app.websockets.job_throttle import JobBroadcastThrottle
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+        self.timers = []
+
+    def __call__(self):
+        return self.now
+
+    def schedule(self, delay, callback):
+        self.timers.append((self.now + delay, callback))
+
+    def advance(self, seconds):
+        self.now += seconds
+        due = [t for t in self.timers if t[0] <= self.now]
+        self.timers = [t for t in self.timers if t[0] > self.now]
+        for _, callback in due:
+            callback()
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def sent():
+    return []
+
+
+@pytest.fixture
+def throttle(clock, sent):
+    def emit(event_name, job_data):
+        sent.append((event_name, job_data.get("progress")))
+        return job_data
+
+    return JobBroadcastThrottle(emit, max_hz=2, clock=clock, schedule=clock.schedule)
+
+
+def update(progress, status="processing"):
+    return {"id": "job1", "status": status, "progress": progress}
+
+
+class TestJobBroadcastThrottle:
+    """Test rate limiting with latest-value semantics."""
+
+    def test_bursts_collapse_to_latest(self, throttle, clock, sent):
+        throttle.submit("job_updated", update(1))
+        for progress in range(2, 10):
+            clock.now += 0.01
+            throttle.submit("job_updated", update(progress))
+        assert sent == [("job_updated", 1)]
+
+        clock.advance(0.5)
+
+        assert sent == [("job_updated", 1), ("job_updated", 9)]
+        assert throttle.stats.superseded == 7
+
+    def test_terminal_and_status_changes_are_never_held(self, throttle, clock, sent):
+        throttle.submit("job_updated", update(1, status="downloading"))
+        throttle.submit("job_updated", update(2, status="processing"))
+        throttle.submit("job_updated", update(50))
+        throttle.submit("job_completed", update(100, status="completed"))
+        clock.advance(1)
+
+        assert sent == [
+            ("job_updated", 1),
+            ("job_updated", 2),
+            ("job_completed", 100),
+        ]
+
+    def test_held_update_never_follows_the_terminal_event(self, clock):
+        sent = []
+        flushing, release = threading.Event(), threading.Event()
+
+        def emit(event_name, job_data):
+            if job_data["progress"] == 20:
+                # The timer thread is sending the held update
+                flushing.set()
+                release.wait(1)
+            sent.append(event_name)
+            return job_data
+
+        throttle = JobBroadcastThrottle(
+            emit, max_hz=2, clock=clock, schedule=clock.schedule
+        )
+        throttle.submit("job_updated", update(10))
+        throttle.submit("job_updated", update(20))
+        clock.now += 1
+        flusher = threading.Thread(target=clock.advance, args=(0,))
+        flusher.start()
+        assert flushing.wait(1)
+        completer = threading.Thread(
+            target=throttle.submit,
+            args=("job_completed", update(100, status="completed")),
+        )
+        completer.start()
+        time.sleep(0.05)
+        release.set()
+        flusher.join(1)
+        completer.join(1)
+
+        assert sent == ["job_updated", "job_updated", "job_completed"]
+
+    def test_urgent_send_restarts_the_interval(self, throttle, clock, sent):
+        throttle.submit("job_updated", update(1, status="downloading"))
+        clock.now += 0.1
+        throttle.submit("job_updated", update(2, status="downloading"))
+        clock.now += 0.1
+        throttle.submit("job_updated", update(3))
+        clock.now += 0.1
+        throttle.submit("job_updated", update(4))
+
+        # The held update waits a whole interval after the urgent send
+        clock.advance(0.25)
+        assert sent == [("job_updated", 1), ("job_updated", 3)]
+        clock.advance(0.2)
+        assert sent == [("job_updated", 1), ("job_updated", 3), ("job_updated", 4)]
+
+    def test_untracked_job_sends_its_held_update(self, clock, sent):
+        throttle = JobBroadcastThrottle(
+            lambda name, data: sent.append((data["id"], data["progress"])) or data,
+            max_hz=2,
+            clock=clock,
+            schedule=clock.schedule,
+            max_tracked_jobs=1,
+        )
+        throttle.submit("job_updated", update(1))
+        throttle.submit("job_updated", update(2))
+        throttle.submit("job_created", {"id": "job2", "progress": 0})
+
+        assert sent == [("job1", 1), ("job1", 2), ("job2", 0)]
+        clock.advance(1)
+        assert len(sent) == 3
+
+    def test_bytes_are_counted_per_finished_job(self, throttle, clock):
+        throttle.submit("job_created", update(0, status="pending"))
+        throttle.submit("job_completed", update(100, status="completed"))
+
+        stats = throttle.stats.to_dict()
+        assert stats["events"] == 2
+        assert stats["jobs_finished"] == 1
+        assert stats["avg_events_per_job"] == 2
+        assert stats["avg_bytes_per_job"] == stats["bytes"] > 0
+
+    def test_disabled_throttle_sends_everything(self, sent):
+        throttle = JobBroadcastThrottle(
+            lambda name, data: sent.append(name) or data, max_hz=0
+        )
+        for progress in range(3):
+            throttle.submit("job_updated", update(progress))
+
+        assert len(sent) == 3
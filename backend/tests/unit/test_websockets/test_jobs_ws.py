@@ -0,0 +1,156 @@
+"""
+Tests for broadcasting job events on the /jobs namespace.
+"""
+
+from collections import OrderedDict
+from unittest.mock import MagicMock, patch
+
+import pytest
+from app.db.models import Job, JobStatus
+from app.repositories import JobEventRepository, JobRepository
+from app.services.job_journal import JobEventJournal
+from app.utils.events import event_bus
+from app.websockets import job_stream, job_throttle, jobs_ws
+from app.websockets.job_stream import JobEventStream
+from app.websockets.job_throttle import JobBroadcastThrottle
+
+
+@pytest.fixture
+def job_repository(get_db_session):
+    repo = JobRepository()
+    repo.get_db_session = get_db_session
+    return repo
+
+
+@pytest.fixture
+def socketio():
+    event_bus.stop_async()
+    with patch.object(jobs_ws, "socketio") as mock, patch.object(
+        jobs_ws, "_with_eta", side_effect=lambda job_data: job_data
+    ), patch.object(
+        job_throttle, "_throttle", JobBroadcastThrottle(jobs_ws._broadcast)
+    ), patch.object(
+        job_stream, "_stream", JobEventStream()
+    ), patch(
+        "app.utils.event_transport.uses_event_transport", return_value=False
+    ):
+        yield mock
+
+
+def test_one_emit_per_transition(job_repository, socketio):
+    # Every module that sets up broadcasting does so again here
+    jobs_ws.initialize_jobs_websocket()
+    jobs_ws.initialize_jobs_websocket()
+    jobs_ws.subscribe_job_broadcasts()
+
+    job = Job(id="job1", filename="song.mp3", status=JobStatus.PENDING)
+    job_repository.create(job)
+    assert [c.args[0] for c in socketio.emit.call_args_list] == ["job_created"]
+
+    job.status = JobStatus.PROCESSING
+    job_repository.update(job)
+    job.status = JobStatus.COMPLETED
+    job_repository.update(job)
+
+    assert [c.args[0] for c in socketio.emit.call_args_list] == [
+        "job_created",
+        "job_updated",
+        "job_completed",
+    ]
+
+
+def test_resume_past_memory_buffer_replays_from_journal(
+    socketio, patch_config, get_db_session
+):
+    patch_config.JOB_EVENT_REPLAY_LIMIT = 500
+    event_repository = JobEventRepository()
+    event_repository.get_db_session = get_db_session
+    journal = JobEventJournal(event_repository)
+    stream = JobEventStream(capacity=2)
+
+    with patch("app.websockets.job_stream.get_job_stream", return_value=stream), patch(
+        "app.services.job_journal.get_job_journal", return_value=journal
+    ), patch("app.jobs.dispatch.uses_local_executor", return_value=True):
+        seen = jobs_ws._emit_job_event("job_created", {"id": "a", "status": "pending"})
+        for job_id, status in [("b", "pending"), ("a", "processing"), ("c", "pending")]:
+            jobs_ws._emit_job_event("job_updated", {"id": job_id, "status": status})
+        assert stream.since(seen["seq"]) is None  # Evicted from memory
+
+        missed = jobs_ws._missed_events(seen["seq"])
+
+    assert [
+        (name, payload["id"], payload["status"]) for _, name, payload in missed
+    ] == [
+        ("job_updated", "b", "pending"),
+        ("job_updated", "a", "processing"),
+        ("job_updated", "c", "pending"),
+    ]
+    assert all(payload["full"] for _, _, payload in missed)
+
+
+def test_progress_updates_reuse_the_estimate_of_their_phase():
+    predictor = MagicMock()
+    predictor.annotate_one.side_effect = lambda job_data: {
+        **job_data,
+        "expected_completion": "2999-01-01T00:00:00+00:00",
+        "estimated_remaining_seconds": 60,
+        "queue_wait_seconds": 0,
+    }
+    job = {"id": "job1", "status": "processing", "phase": "separation"}
+    with patch.object(jobs_ws, "_eta_predictor", predictor), patch.object(
+        jobs_ws, "_eta_by_job", OrderedDict()
+    ):
+        for progress in (10, 20, 30):
+            annotated = jobs_ws._with_eta({**job, "progress": progress})
+        assert predictor.annotate_one.call_count == 1
+        assert annotated["progress"] == 30
+        assert annotated["expected_completion"] == "2999-01-01T00:00:00+00:00"
+        assert annotated["estimated_remaining_seconds"] > 60
+
+        jobs_ws._with_eta({**job, "phase": "encode", "progress": 80})
+        assert predictor.annotate_one.call_count == 2
+
+        jobs_ws._forget_eta(job)
+        jobs_ws._with_eta({**job, "phase": "encode", "progress": 90})
+        assert predictor.annotate_one.call_count == 3
+
+
+def test_estimates_of_unfinished_jobs_are_bounded():
+    predictor = MagicMock()
+    predictor.annotate_one.side_effect = lambda job_data: {
+        **job_data,
+        "expected_completion": "2999-01-01T00:00:00+00:00",
+    }
+    with patch.object(jobs_ws, "_eta_predictor", predictor), patch.object(
+        jobs_ws, "_eta_by_job", OrderedDict()
+    ), patch.object(jobs_ws, "_ETA_MAX_TRACKED_JOBS", 2):
+        for job_id in ("job1", "job2", "job1", "job3"):
+            jobs_ws._with_eta({"id": job_id, "status": "processing"})
+
+        assert list(jobs_ws._eta_by_job) == ["job1", "job3"]
+
+
+def test_events_outside_an_authoritative_stream_are_unsequenced(socketio):
+    # A Celery worker emitting through the Socket.IO message queue
+    with patch("app.jobs.dispatch.uses_local_executor", return_value=False):
+        first = jobs_ws._emit_job_event("job_created", {"id": "a", "status": "pending"})
+        second = jobs_ws._emit_job_event(
+            "job_updated", {"id": "a", "status": "pending", "progress": 5}
+        )
+
+    assert "seq" not in first and "seq" not in second
+    assert second == {"id": "a", "status": "pending", "progress": 5, "full": True}
+
+
+@pytest.mark.parametrize("local, transport", [(True, False), (False, True)])
+def test_resume_with_every_event_in_the_stream(local, transport):
+    stream = JobEventStream()
+    seen = stream.record("job_created", {"id": "a", "status": "pending"})
+    stream.record("job_updated", {"id": "a", "status": "processing"})
+
+    with patch("app.websockets.job_stream.get_job_stream", return_value=stream), patch(
+        "app.jobs.dispatch.uses_local_executor", return_value=local
+    ), patch("app.utils.event_transport.uses_event_transport", return_value=transport):
+        missed = jobs_ws._missed_events(seen["seq"])
+
+    assert [name for _, name, _ in missed] == ["job_updated"]
@@ -2,13 +2,17 @@
 Database utilities for testing.
 """
 
+import re
 import tempfile
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Callable, ContextManager, Dict, Iterator, List, Tuple
 from unittest.mock import Mock
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
 
 
 def create_test_database():
@@ -17,6 +21,38 @@ def create_test_database():
     return engine
 
 
+def create_shared_memory_engine() -> Engine:
+    """
+    In-memory database with the app schema, shared by every connection and
+    thread that uses the engine (one StaticPool connection)
+    """
+    from app.db.models import Base
+
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    Base.metadata.create_all(engine)
+    return engine
+
+
+def session_scope(bind) -> Callable[[], ContextManager[Session]]:
+    """
+    A stand-in for app.db.database.get_db_session over ``bind`` (an engine
+    or a sessionmaker), to patch into the modules under test
+    """
+    factory = bind if isinstance(bind, sessionmaker) else sessionmaker(bind=bind)
+
+    @contextmanager
+    def get_db_session() -> Iterator[Session]:
+        session = factory()
+        try:
+            yield session
+        finally:
+            session.close()
+
+    return get_db_session
+
+
 def create_test_session(engine):
     """Create a test database session"""
     SessionLocal = sessionmaker(bind=engine)
@@ -42,6 +78,51 @@ def populate_test_database(session, songs_data: List[Dict[str, Any]] = None):
         pass
 
 
+@contextmanager
+def recorded_queries(engine: Engine) -> Iterator[List[Tuple[str, Any]]]:
+    """Record the SELECT statements ``engine`` executes inside the block"""
+    queries: List[Tuple[str, Any]] = []
+
+    def record(_conn, _cursor, statement, parameters, _context, _executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            queries.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        yield queries
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+
+def explain_query_plan(engine: Engine, statement: str, parameters=()) -> List[str]:
+    """The details of SQLite's EXPLAIN QUERY PLAN for a statement"""
+    with engine.connect() as connection:
+        rows = connection.exec_driver_sql(
+            f"EXPLAIN QUERY PLAN {statement}", parameters
+        ).all()
+    return [row[-1] for row in rows]
+
+
+def full_table_scans(plan: List[str], table: str) -> List[str]:
+    """
+    Plan steps that read every row of ``table`` without an index. Walking an
+    index ("SCAN songs USING INDEX ...") is fine: it is how ORDER BY ...
+    LIMIT queries avoid sorting the table.
+    """
+    pattern = re.compile(rf"^SCAN (TABLE )?{re.escape(table)}\b(?!.* USING )")
+    return [step for step in plan if pattern.match(step)]
+
+
+def assert_no_full_table_scans(engine: Engine, queries, table: str):
+    """Assert that none of the recorded queries scans ``table`` row by row"""
+    assert queries, "No queries were recorded"
+    for statement, parameters in queries:
+        plan = explain_query_plan(engine, statement, parameters)
+        assert not full_table_scans(
+            plan, table
+        ), f"Full scan of {table}:\n{statement}\nPlan:\n" + "\n".join(plan)
+
+
 def cleanup_test_database(session):
     """Clean up test database"""
     session.rollback()
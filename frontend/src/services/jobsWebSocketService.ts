@@ -19,13 +19,41 @@ interface JobData {
   title?: string;
 }
 
+/**
+ * Job events carry the fields that changed since the previous event for the
+ * same job, plus id, status and a sequence number; `full` marks complete jobs.
+ */
+type JobEventPayload = Partial<JobData> & {
+  id: string;
+  seq?: number;
+  full?: boolean;
+};
+
+/**
+ * One page of the jobs list; `nextCursor` requests the following page
+ */
+interface JobsListPayload {
+  jobs: JobData[];
+  nextCursor?: string | null;
+  seq?: number;
+  error?: string;
+}
+
+const JOB_EVENTS = [
+  'job_created',
+  'job_updated',
+  'job_completed',
+  'job_failed',
+  'job_cancelled',
+] as const;
+
 interface JobsWebSocketEvents {
   job_created: (data: JobData) => void;
   job_updated: (data: JobData) => void;
   job_completed: (data: JobData) => void;
   job_failed: (data: JobData) => void;
   job_cancelled: (data: JobData) => void;
-  jobs_list: (data: { jobs: JobData[] }) => void;
+  jobs_list: (data: JobsListPayload) => void;
 }
 
 class JobsWebSocketService {
@@ -33,6 +61,12 @@ class JobsWebSocketService {
   private listeners: Map<string, Set<(data: unknown) => void>> = new Map();
   private isConnected = false;
   private maxReconnectAttempts = 5;
+  // Latest known state of each job, which job event deltas are merged into
+  private jobs: Map<string, JobData> = new Map();
+  // Sequence number of the last job event, sent on reconnect to resume
+  private lastSeq: number | null = null;
+  // Pages of the jobs list received so far, while the rest are requested
+  private jobsListPages: JobData[] | null = null;
 
   constructor() {
     this.initializeConnection();
@@ -77,9 +111,13 @@ class JobsWebSocketService {
     this.socket.on('connect', () => {
       console.log('Connected to jobs WebSocket');
       this.isConnected = true;
+      this.jobsListPages = null;
       
-      // Subscribe to job updates
-      this.socket?.emit('subscribe_to_jobs');
+      // Subscribe to job updates, resuming after the last event seen
+      this.socket?.emit(
+        'subscribe_to_jobs',
+        this.lastSeq !== null ? { since: this.lastSeq } : {}
+      );
     });
 
     this.socket.on('disconnect', () => {
@@ -97,35 +135,45 @@ class JobsWebSocketService {
     });
 
     // Set up job event listeners
-    this.socket.on('job_created', (data: JobData) => {
-      console.log('Received job_created event:', data);
-      this.emit('job_created', data);
-    });
-
-    this.socket.on('job_updated', (data: JobData) => {
-      console.log('Received job_updated event:', data);
-      this.emit('job_updated', data);
-    });
-
-    this.socket.on('job_completed', (data: JobData) => {
-      console.log('Received job_completed event:', data);
-      this.emit('job_completed', data);
+    JOB_EVENTS.forEach(eventName => {
+      this.socket?.on(eventName, (data: JobEventPayload) => {
+        console.log(`Received ${eventName} event:`, data);
+        this.emit(eventName, this.applyJobEvent(data));
+      });
     });
 
-    this.socket.on('job_failed', (data: JobData) => {
-      console.log('Received job_failed event:', data);
-      this.emit('job_failed', data);
-    });
+    this.socket.on('jobs_list', (data: JobsListPayload) => {
+      console.log('Received jobs_list event:', data);
+      data.jobs.forEach(job => this.jobs.set(job.id, job));
+      if (data.seq !== undefined) {
+        this.lastSeq = data.seq;
+      }
 
-    this.socket.on('job_cancelled', (data: JobData) => {
-      console.log('Received job_cancelled event:', data);
-      this.emit('job_cancelled', data);
+      // The server sends one page at a time: follow the cursor and hand
+      // listeners the whole list once the last page has arrived
+      const jobs = [...(this.jobsListPages ?? []), ...data.jobs];
+      if (data.nextCursor) {
+        this.jobsListPages = jobs;
+        this.socket?.emit('request_jobs_list', { cursor: data.nextCursor });
+        return;
+      }
+      this.jobsListPages = null;
+      this.emit('jobs_list', { ...data, jobs });
     });
+  }
 
-    this.socket.on('jobs_list', (data: { jobs: JobData[] }) => {
-      console.log('Received jobs_list event:', data);
-      this.emit('jobs_list', data);
-    });
+  /**
+   * Merge a job event into the known job state and return the full job
+   */
+  private applyJobEvent(data: JobEventPayload): JobData {
+    const { seq, full, ...fields } = data;
+    if (seq !== undefined) {
+      this.lastSeq = seq;
+    }
+    const previous = full ? undefined : this.jobs.get(fields.id);
+    const job = { ...previous, ...fields } as JobData;
+    this.jobs.set(job.id, job);
+    return job;
   }
 
   private emit(eventName: string, data: unknown) {
@@ -208,10 +256,11 @@ class JobsWebSocketService {
   }
 
   /**
-   * Request an updated list of all jobs from the server
+   * Request an updated list of all jobs from the server, page by page
    */
   requestJobsList() {
     if (this.socket && this.isConnected) {
+      this.jobsListPages = null;
       this.socket.emit('request_jobs_list');
     } else {
       console.warn('Cannot request jobs list: WebSocket not connected');